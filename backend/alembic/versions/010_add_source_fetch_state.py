@@ -0,0 +1,32 @@
+"""Add source_fetch_state table for conditional GETs in the change monitor.
+
+Revision ID: 010_add_source_fetch_state
+Revises: 009_widen_id_columns
+Create Date: 2026-10-19
+"""
+import sqlalchemy as sa
+from alembic import op
+
+revision = "010_add_source_fetch_state"
+down_revision = "009_widen_id_columns"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "source_fetch_state",
+        sa.Column("source_id", sa.String(255), primary_key=True),
+        sa.Column("manifest_id", sa.String(255), primary_key=True),
+        sa.Column("etag", sa.String(255), nullable=True),
+        sa.Column("last_modified", sa.String(64), nullable=True),
+        sa.Column("content_length", sa.Integer(), nullable=True),
+        sa.Column("content_hash", sa.String(80), nullable=True),
+        sa.Column("last_status", sa.Integer(), nullable=True),
+        sa.Column("checked_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("changed_at", sa.DateTime(timezone=True), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("source_fetch_state")
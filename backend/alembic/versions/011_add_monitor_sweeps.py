@@ -0,0 +1,56 @@
+"""Add monitor_sweeps and monitor_sweep_shards for sharded, resumable monitor sweeps.
+
+Revision ID: 011_add_monitor_sweeps
+Revises: 010_add_source_fetch_state
+Create Date: 2026-10-19
+"""
+import sqlalchemy as sa
+from alembic import op
+
+revision = "011_add_monitor_sweeps"
+down_revision = "010_add_source_fetch_state"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "monitor_sweeps",
+        sa.Column("id", sa.String(100), primary_key=True),
+        sa.Column("status", sa.String(20), nullable=False, server_default="running"),
+        sa.Column("shard_count", sa.Integer(), nullable=False),
+        sa.Column("sources_checked", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("changes_detected", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("not_modified", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("bytes_downloaded", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column("errors", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("duration_s", sa.Float(), nullable=False, server_default="0"),
+        sa.Column("sources_per_sec", sa.Float(), nullable=False, server_default="0"),
+        sa.Column("started_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("completed_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.create_index("ix_monitor_sweeps_status", "monitor_sweeps", ["status"])
+
+    op.create_table(
+        "monitor_sweep_shards",
+        sa.Column("sweep_id", sa.String(100), primary_key=True),
+        sa.Column("shard", sa.Integer(), primary_key=True),
+        sa.Column("status", sa.String(20), nullable=False, server_default="pending"),
+        sa.Column("worker_id", sa.String(100), nullable=True),
+        sa.Column("cursor_manifest_id", sa.String(255), nullable=True),
+        sa.Column("cursor_source_id", sa.String(255), nullable=True),
+        sa.Column("sources_total", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("sources_checked", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("changes_detected", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("not_modified", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("bytes_downloaded", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column("errors", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("heartbeat_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("completed_at", sa.DateTime(timezone=True), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("monitor_sweep_shards")
+    op.drop_index("ix_monitor_sweeps_status", table_name="monitor_sweeps")
+    op.drop_table("monitor_sweeps")
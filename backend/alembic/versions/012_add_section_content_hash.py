@@ -0,0 +1,24 @@
+"""Add content_hash to document_sections for incremental re-ingestion.
+
+Revision ID: 012_add_section_content_hash
+Revises: 011_add_monitor_sweeps
+Create Date: 2026-10-19
+"""
+import sqlalchemy as sa
+from alembic import op
+
+revision = "012_add_section_content_hash"
+down_revision = "011_add_monitor_sweeps"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "document_sections",
+        sa.Column("content_hash", sa.String(80), nullable=False, server_default=""),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("document_sections", "content_hash")
@@ -0,0 +1,42 @@
+"""Add MinHash fingerprints, LSH bands and duplicate links for near-duplicate detection.
+
+Revision ID: 013_add_near_duplicate_index
+Revises: 012_add_section_content_hash
+Create Date: 2026-10-19
+"""
+import sqlalchemy as sa
+from alembic import op
+
+revision = "013_add_near_duplicate_index"
+down_revision = "012_add_section_content_hash"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "document_fingerprints",
+        sa.Column("document_id", sa.String(150), primary_key=True),
+        sa.Column("signature", sa.LargeBinary(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+    )
+    op.create_table(
+        "document_lsh_bands",
+        sa.Column("band_key", sa.String(24), primary_key=True),
+        sa.Column("document_id", sa.String(150), primary_key=True),
+    )
+    op.create_index("ix_document_lsh_bands_document_id", "document_lsh_bands", ["document_id"])
+    op.add_column("internal_documents", sa.Column("duplicate_of", sa.String(150), nullable=True))
+    op.add_column(
+        "internal_documents", sa.Column("duplicate_similarity", sa.Float(), nullable=True)
+    )
+    op.create_index("ix_internal_documents_duplicate_of", "internal_documents", ["duplicate_of"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_internal_documents_duplicate_of", table_name="internal_documents")
+    op.drop_column("internal_documents", "duplicate_similarity")
+    op.drop_column("internal_documents", "duplicate_of")
+    op.drop_index("ix_document_lsh_bands_document_id", table_name="document_lsh_bands")
+    op.drop_table("document_lsh_bands")
+    op.drop_table("document_fingerprints")
@@ -0,0 +1,32 @@
+"""Add per-source ingestion checkpoints so failed runs can be resumed.
+
+Revision ID: 014_add_ingestion_checkpoints
+Revises: 013_add_near_duplicate_index
+Create Date: 2026-10-19
+"""
+import sqlalchemy as sa
+from alembic import op
+
+revision = "014_add_ingestion_checkpoints"
+down_revision = "013_add_near_duplicate_index"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "ingestion_checkpoints",
+        sa.Column(
+            "ingestion_run_id", sa.String(100), sa.ForeignKey("ingestion_runs.id"),
+            primary_key=True,
+        ),
+        sa.Column("source_id", sa.String(100), primary_key=True),
+        sa.Column("document_id", sa.String(150), nullable=False),
+        sa.Column("status", sa.String(20), nullable=False),
+        sa.Column("error", sa.Text(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("ingestion_checkpoints")
@@ -0,0 +1,33 @@
+"""Add feedback_rollups: running feedback counts per (type, status).
+
+Backfilled from response_feedback in one GROUP BY pass.
+
+Revision ID: 015_add_feedback_rollups
+Revises: 014_add_ingestion_checkpoints
+Create Date: 2026-10-19
+"""
+import sqlalchemy as sa
+from alembic import op
+
+revision = "015_add_feedback_rollups"
+down_revision = "014_add_ingestion_checkpoints"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "feedback_rollups",
+        sa.Column("feedback_type", sa.String(20), primary_key=True),
+        sa.Column("status", sa.String(20), primary_key=True),
+        sa.Column("count", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.execute(
+        "INSERT INTO feedback_rollups (feedback_type, status, count) "
+        "SELECT feedback_type, status, COUNT(*) FROM response_feedback "
+        "GROUP BY feedback_type, status"
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("feedback_rollups")
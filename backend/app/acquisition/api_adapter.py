@@ -3,9 +3,8 @@
 import logging
 import time
 
-import httpx
-
 from app.acquisition.staging import stage_document
+from app.http_client import USER_AGENT, get_http_client
 
 logger = logging.getLogger(__name__)
 
@@ -29,7 +28,7 @@ async def fetch_api_source(
     """
     start = time.monotonic()
 
-    headers = {"User-Agent": "RARIS/0.1 Regulatory Research Bot"}
+    headers = {"User-Agent": USER_AGENT}
     params: dict[str, str] = {}
 
     # Configure authentication
@@ -46,37 +45,36 @@ async def fetch_api_source(
     all_content = []
     next_url: str | None = url
 
-    async with httpx.AsyncClient(follow_redirects=True) as client:
-        for page in range(max_pages):
-            if not next_url:
+    client = get_http_client()
+    for page in range(max_pages):
+        if not next_url:
+            break
+
+        response = await client.get(
+            next_url, headers=headers, params=params if page == 0 else {},
+        )
+        response.raise_for_status()
+
+        all_content.append(response.text)
+
+        # Handle pagination
+        if pagination == "link":
+            next_url = _parse_link_header(response.headers.get("link", ""))
+        elif pagination == "offset":
+            data = response.json()
+            if isinstance(data, dict) and data.get("next"):
+                next_url = data["next"]
+            else:
                 break
-
-            response = await client.get(
-                next_url, headers=headers, params=params if page == 0 else {},
-                timeout=60.0,
-            )
-            response.raise_for_status()
-
-            all_content.append(response.text)
-
-            # Handle pagination
-            if pagination == "link":
-                next_url = _parse_link_header(response.headers.get("link", ""))
-            elif pagination == "offset":
-                data = response.json()
-                if isinstance(data, dict) and data.get("next"):
-                    next_url = data["next"]
-                else:
-                    break
-            elif pagination == "cursor":
-                data = response.json()
-                cursor = data.get("next_cursor") or data.get("cursor")
-                if cursor:
-                    next_url = f"{url}{'&' if '?' in url else '?'}cursor={cursor}"
-                else:
-                    break
+        elif pagination == "cursor":
+            data = response.json()
+            cursor = data.get("next_cursor") or data.get("cursor")
+            if cursor:
+                next_url = f"{url}{'&' if '?' in url else '?'}cursor={cursor}"
             else:
                 break
+        else:
+            break
 
     combined_content = "\n".join(all_content)
     content_bytes = combined_content.encode("utf-8")
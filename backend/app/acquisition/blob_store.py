@@ -0,0 +1,250 @@
+"""Blob Store — content-addressed storage for staged documents.
+
+Each distinct body is stored once, named by its SHA-256 and sharded by the
+first four hex digits; it is optionally zstd-compressed:
+
+    staging/.blobs/objects/3f/a9/3fa9…e1[.zst]
+
+Every (manifest, source) that staged a body holds a reference to it:
+
+    staging/.blobs/refs/3f/3fa9…e1/<manifest_id>/<source_id>
+
+References are plain files, so adding or dropping one is a single atomic
+filesystem operation and the refcount is the number of reference files.
+When the last reference is dropped the blob is deleted.
+
+Compression needs the optional ``zstandard`` package; without it blobs are
+stored uncompressed (a warning is logged) and compressed blobs cannot be read.
+
+Usage:
+    store = BlobStore(STAGING_ROOT / ".blobs", compression="zstd")
+    put = await store.put_stream(response.aiter_bytes())
+    store.add_ref(put.content_hash, manifest_id, source_id)
+    content = store.read_bytes(put.content_hash)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import shutil
+import tempfile
+from collections.abc import AsyncIterable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO
+
+logger = logging.getLogger(__name__)
+
+COMPRESSIONS = ("none", "zstd")
+_ZSTD_SUFFIX = ".zst"
+_ZSTD_LEVEL = 3
+
+
+def _zstandard():
+    try:
+        import zstandard
+    except ImportError:
+        return None
+    return zstandard
+
+
+@dataclass
+class PutResult:
+    content_hash: str  # "sha256:<hex>"
+    byte_size: int  # Uncompressed size
+    stored_bytes: int  # Size on disk
+    created: bool  # False if the blob already existed
+
+
+class BlobStore:
+    """Content-addressed, reference-counted blob store on the local filesystem.
+
+    Parameters:
+        root: Directory holding ``objects/``, ``refs/`` and ``tmp/``.
+        compression: "none" or "zstd" — applies to newly written blobs only.
+    """
+
+    def __init__(self, root: Path, compression: str = "none") -> None:
+        if compression not in COMPRESSIONS:
+            raise ValueError(
+                f"Unknown blob compression: {compression}. Available: {', '.join(COMPRESSIONS)}"
+            )
+        if compression == "zstd" and _zstandard() is None:
+            logger.warning("zstandard is not installed; storing blobs uncompressed")
+            compression = "none"
+        self.root = root
+        self.compression = compression
+
+    # ── Blobs ─────────────────────────────────────────────────────────────
+
+    def path(self, content_hash: str) -> Path | None:
+        """On-disk path of the blob, or None if it is not stored."""
+        base = self._object_base(content_hash)
+        for candidate in (base, base.with_name(base.name + _ZSTD_SUFFIX)):
+            if candidate.exists():
+                return candidate
+        return None
+
+    def exists(self, content_hash: str) -> bool:
+        return self.path(content_hash) is not None
+
+    async def put_stream(self, chunks: AsyncIterable[bytes]) -> PutResult:
+        """Store a body from an async chunk iterator, hashing it as it is written."""
+        digest = hashlib.sha256()
+        byte_size = 0
+        tmp_dir = self.root / "tmp"
+        tmp_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=tmp_dir, suffix=".part")
+        try:
+            with os.fdopen(fd, "wb") as f, self._writer(f) as out:
+                async for chunk in chunks:
+                    byte_size += len(chunk)
+                    digest.update(chunk)
+                    out.write(chunk)
+            return self._commit(Path(tmp_name), f"sha256:{digest.hexdigest()}", byte_size)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+    def put_bytes(self, content: bytes) -> PutResult:
+        """Store a body already held in memory."""
+        tmp_dir = self.root / "tmp"
+        tmp_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=tmp_dir, suffix=".part")
+        try:
+            with os.fdopen(fd, "wb") as f, self._writer(f) as out:
+                out.write(content)
+            content_hash = f"sha256:{hashlib.sha256(content).hexdigest()}"
+            return self._commit(Path(tmp_name), content_hash, len(content))
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+    def open(self, content_hash: str) -> BinaryIO:
+        """Open a blob for reading its original (decompressed) bytes."""
+        path = self.path(content_hash)
+        if path is None:
+            raise FileNotFoundError(f"Blob not found: {content_hash}")
+        if path.suffix != _ZSTD_SUFFIX:
+            return open(path, "rb")
+        zstandard = _zstandard()
+        if zstandard is None:
+            raise RuntimeError(f"zstandard is required to read compressed blob {content_hash}")
+        return zstandard.ZstdDecompressor().stream_reader(open(path, "rb"), closefd=True)
+
+    def read_bytes(self, content_hash: str) -> bytes:
+        with self.open(content_hash) as f:
+            return f.read()
+
+    # ── References ────────────────────────────────────────────────────────
+
+    def add_ref(self, content_hash: str, manifest_id: str, source_id: str) -> None:
+        """Record that a manifest source points at this blob (idempotent)."""
+        ref = self._ref_dir(content_hash) / manifest_id / source_id
+        ref.parent.mkdir(parents=True, exist_ok=True)
+        ref.touch(exist_ok=True)
+
+    def remove_ref(self, content_hash: str, manifest_id: str, source_id: str) -> int:
+        """Drop a reference; deletes the blob when none remain. Returns the new refcount."""
+        ref_dir = self._ref_dir(content_hash)
+        ref = ref_dir / manifest_id / source_id
+        ref.unlink(missing_ok=True)
+        try:
+            ref.parent.rmdir()
+        except OSError:
+            pass  # Other sources of this manifest still refer to the blob
+
+        remaining = self.refcount(content_hash)
+        if remaining == 0:
+            shutil.rmtree(ref_dir, ignore_errors=True)
+            path = self.path(content_hash)
+            if path is not None:
+                path.unlink(missing_ok=True)
+                logger.debug("Blob %s released", content_hash)
+        return remaining
+
+    def refs(self, content_hash: str) -> list[tuple[str, str]]:
+        """(manifest_id, source_id) pairs referring to the blob."""
+        ref_dir = self._ref_dir(content_hash)
+        if not ref_dir.exists():
+            return []
+        return sorted(
+            (ref.parent.name, ref.name) for ref in ref_dir.glob("*/*") if ref.is_file()
+        )
+
+    def refcount(self, content_hash: str) -> int:
+        return len(self.refs(content_hash))
+
+    def stats(self) -> dict:
+        """Blob count and sizes for the admin API and migration reports."""
+        blobs = 0
+        stored_bytes = 0
+        objects = self.root / "objects"
+        if objects.exists():
+            for path in objects.glob("*/*/*"):
+                blobs += 1
+                stored_bytes += path.stat().st_size
+        refs_root = self.root / "refs"
+        refs = 0
+        if refs_root.exists():
+            refs = sum(1 for ref in refs_root.glob("*/*/*/*") if ref.is_file())
+        return {
+            "compression": self.compression,
+            "blobs": blobs,
+            "stored_bytes": stored_bytes,
+            "references": refs,
+        }
+
+    # ── Internals ─────────────────────────────────────────────────────────
+
+    @staticmethod
+    def _hex(content_hash: str) -> str:
+        return content_hash.split(":", 1)[-1]
+
+    def _object_base(self, content_hash: str) -> Path:
+        hex_digest = self._hex(content_hash)
+        return self.root / "objects" / hex_digest[:2] / hex_digest[2:4] / hex_digest
+
+    def _ref_dir(self, content_hash: str) -> Path:
+        hex_digest = self._hex(content_hash)
+        return self.root / "refs" / hex_digest[:2] / hex_digest
+
+    def _writer(self, f: BinaryIO):
+        if self.compression == "zstd":
+            return _zstandard().ZstdCompressor(level=_ZSTD_LEVEL).stream_writer(f, closefd=False)
+        return _Passthrough(f)
+
+    def _commit(self, tmp_path: Path, content_hash: str, byte_size: int) -> PutResult:
+        """Move a finished temp file into place unless the blob already exists."""
+        existing = self.path(content_hash)
+        if existing is not None:
+            tmp_path.unlink(missing_ok=True)
+            return PutResult(content_hash, byte_size, existing.stat().st_size, created=False)
+
+        final = self._object_base(content_hash)
+        if self.compression == "zstd":
+            final = final.with_name(final.name + _ZSTD_SUFFIX)
+        final.parent.mkdir(parents=True, exist_ok=True)
+        stored_bytes = tmp_path.stat().st_size
+        # Two writers racing on the same hash produce identical files, so a
+        # plain replace is safe; the loser's copy simply overwrites the winner's.
+        os.replace(tmp_path, final)
+        return PutResult(content_hash, byte_size, stored_bytes, created=True)
+
+
+class _Passthrough:
+    """Uncompressed counterpart of ``ZstdCompressor.stream_writer``."""
+
+    def __init__(self, f: BinaryIO) -> None:
+        self._f = f
+
+    def write(self, data: bytes) -> int:
+        return self._f.write(data)
+
+    def __enter__(self) -> _Passthrough:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._f.flush()
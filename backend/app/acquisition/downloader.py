@@ -5,12 +5,12 @@ import time
 
 import httpx
 
-from app.acquisition.staging import stage_document
+from app.acquisition.staging import stage_stream
+from app.config import settings
+from app.http_client import get_http_client
 
 logger = logging.getLogger(__name__)
 
-MAX_REDIRECTS = 5
-
 
 async def download_source(
     manifest_id: str,
@@ -18,33 +18,52 @@ async def download_source(
     url: str,
     expected_format: str | None = None,
 ) -> dict:
-    """Download a file from a URL and stage it.
+    """Download a file from a URL and stream it into staging.
 
-    Returns a dict with staged document info or raises on failure.
+    The body is written to disk as it arrives, so memory stays bounded for
+    large PDFs and bulk XML. Returns a dict with staged document info or
+    raises on failure.
     """
     start = time.monotonic()
+    max_bytes = max_download_bytes()
 
-    async with httpx.AsyncClient(follow_redirects=True, max_redirects=MAX_REDIRECTS) as client:
-        response = await client.get(url, timeout=60.0)
+    async with get_http_client().stream("GET", url) as response:
         response.raise_for_status()
+        check_content_length(response, max_bytes, url)
+        content_type = response.headers.get("content-type", "application/octet-stream")
+        content_type = content_type.split(";")[0]
 
-    content_type = response.headers.get("content-type", "application/octet-stream").split(";")[0]
-    content = response.content
-    duration_ms = int((time.monotonic() - start) * 1000)
+        result = await stage_stream(
+            manifest_id=manifest_id,
+            source_id=source_id,
+            chunks=response.aiter_bytes(),
+            content_type=content_type,
+            provenance={
+                "source_url": url,
+                "scraping_tool": "httpx",
+                "tool_version": httpx.__version__,
+                "http_status": response.status_code,
+            },
+            max_bytes=max_bytes,
+            started_at=start,
+        )
 
-    result = stage_document(
-        manifest_id=manifest_id,
-        source_id=source_id,
-        content=content,
-        content_type=content_type,
-        provenance={
-            "source_url": url,
-            "scraping_tool": "httpx",
-            "tool_version": httpx.__version__,
-            "acquisition_duration_ms": duration_ms,
-            "http_status": response.status_code,
-        },
-    )
+    duration_ms = int((time.monotonic() - start) * 1000)
     result["duration_ms"] = duration_ms
     result["content_type"] = content_type
     return result
+
+
+def max_download_bytes() -> int:
+    """Configured per-download size limit in bytes (0 = unlimited)."""
+    return settings.acquisition_max_download_mb * 1024 * 1024
+
+
+def check_content_length(response: httpx.Response, max_bytes: int, url: str) -> None:
+    """Reject an oversized body up front when the server declares its length."""
+    declared = response.headers.get("content-length")
+    if max_bytes and declared and declared.isdigit() and int(declared) > max_bytes:
+        raise ValueError(
+            f"Download exceeds staging size limit ({max_bytes} bytes): {url} "
+            f"declares {declared} bytes"
+        )
@@ -1,6 +1,11 @@
-"""Acquisition Orchestrator — routes sources to adapters, manages job queue and retries."""
+"""Acquisition Orchestrator — routes sources to adapters, manages job queue and retries.
+
+Sources are fetched concurrently by ``AcquisitionScheduler`` (global and
+per-host concurrency limits, per-host politeness, delayed retries). Workers
+only fetch and stage; all DB updates are applied here, one outcome at a time,
+so the run's single ``AsyncSession`` is never used concurrently.
+"""
 
-import asyncio
 import logging
 from collections.abc import AsyncGenerator
 from datetime import UTC, datetime
@@ -8,9 +13,13 @@ from datetime import UTC, datetime
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.acquisition import scheduler as sched
 from app.acquisition.api_adapter import fetch_api_source
 from app.acquisition.downloader import download_source
+from app.acquisition.scheduler import AcquisitionJob, AcquisitionScheduler
 from app.acquisition.scraper import scrape_source
+from app.config import settings
+from app.metrics import ACQUISITION_BYTES, ACQUISITION_SECONDS
 from app.models.acquisition import (
     AcquisitionRun,
     AcquisitionSource,
@@ -25,14 +34,27 @@ logger = logging.getLogger(__name__)
 MAX_RETRIES = 3
 BACKOFF_BASE = 1  # seconds: 1, 4, 16
 
+_SUPPORTED_METHODS = ("scrape", "download", "api")
+
 
 class AcquisitionOrchestrator:
     """Coordinates acquisition of all sources from an approved manifest."""
 
-    def __init__(self, db: AsyncSession, acquisition_id: str, rate_limit_ms: int = 2000):
+    def __init__(
+        self,
+        db: AsyncSession,
+        acquisition_id: str,
+        rate_limit_ms: int = 2000,
+        max_concurrency: int | None = None,
+        per_host_concurrency: int | None = None,
+    ):
         self.db = db
         self.acquisition_id = acquisition_id
         self.rate_limit_ms = rate_limit_ms
+        self.max_concurrency = max_concurrency or settings.acquisition_concurrency
+        self.per_host_concurrency = (
+            per_host_concurrency or settings.acquisition_per_host_concurrency
+        )
 
     async def run(self) -> AsyncGenerator[dict, None]:
         """Execute acquisition for all sources, yielding SSE events."""
@@ -45,34 +67,72 @@ class AcquisitionOrchestrator:
         await self.db.commit()
 
         # Load all acquisition sources
-        result = await self.db.execute(
-            select(AcquisitionSource).where(
-                AcquisitionSource.acquisition_id == self.acquisition_id
-            )
-        )
-        sources = list(result.scalars().all())
+        sources = await self._load_sources()
 
         completed = 0
         failed = 0
+        jobs: list[AcquisitionJob] = []
 
         for source in sources:
             if source.access_method == "manual":
                 source.status = SourceAcqStatus.skipped
+                continue
+            if source.access_method not in _SUPPORTED_METHODS:
+                source.status = SourceAcqStatus.skipped
+                failed += 1
+                yield self._source_start(source)
+                yield {
+                    "event": "source_failed",
+                    "data": {
+                        "source_id": source.source_id,
+                        "error": f"Unsupported access method: {source.access_method}",
+                        "retry_count": source.retry_count,
+                    },
+                }
+                continue
+            jobs.append(AcquisitionJob(key=source.source_id, url=source.url, payload=source))
+        await self.db.commit()
+        # Unsupported sources already counted as failed never become jobs
+        pending = len(jobs)
+
+        scheduler = AcquisitionScheduler(
+            self._fetch,
+            max_concurrency=self.max_concurrency,
+            per_host_concurrency=self.per_host_concurrency,
+            politeness_ms=self.rate_limit_ms,
+            max_retries=MAX_RETRIES,
+            backoff_base=BACKOFF_BASE,
+        )
+
+        async for outcome in scheduler.run(jobs):
+            source: AcquisitionSource = outcome.job.payload
+
+            if outcome.kind == sched.START:
+                source.status = SourceAcqStatus.running
+                source.last_attempt_at = datetime.now(UTC)
                 await self.db.commit()
+                if outcome.job.attempt == 0:
+                    yield self._source_start(source)
                 continue
 
-            yield {
-                "event": "source_start",
-                "data": {
-                    "source_id": source.source_id,
-                    "name": source.name,
-                    "method": source.access_method,
-                },
-            }
+            if outcome.kind == sched.RETRY:
+                source.retry_count = outcome.job.attempt + 1
+                source.error_message = outcome.error
+                source.status = SourceAcqStatus.retrying
+                await self.db.commit()
+                logger.warning(
+                    "Acquisition failed for %s (attempt %d/%d): %s — retrying in %.0fs",
+                    source.source_id, outcome.job.attempt + 1, MAX_RETRIES,
+                    outcome.error, outcome.retry_in_s,
+                )
+                continue
 
-            success = await self._acquire_source(source)
+            if outcome.kind == sched.SUCCESS:
+                error = await self._try_stage(source, outcome.result)
+            else:
+                error = outcome.error
 
-            if success:
+            if error is None:
                 completed += 1
                 yield {
                     "event": "source_complete",
@@ -80,10 +140,18 @@ class AcquisitionOrchestrator:
                         "source_id": source.source_id,
                         "staged_id": source.staged_document_id,
                         "duration_ms": source.duration_ms,
-                        "byte_size": 0,
+                        "byte_size": outcome.result.get("byte_size", 0),
                     },
                 }
             else:
+                source.retry_count = outcome.job.attempt + 1
+                source.error_message = error
+                source.status = SourceAcqStatus.failed
+                await self.db.commit()
+                logger.warning(
+                    "Acquisition failed for %s (attempt %d/%d): %s",
+                    source.source_id, outcome.job.attempt + 1, MAX_RETRIES, error,
+                )
                 failed += 1
                 yield {
                     "event": "source_failed",
@@ -94,7 +162,7 @@ class AcquisitionOrchestrator:
                     },
                 }
 
-            pending = len(sources) - completed - failed
+            pending -= 1
             retrying = sum(1 for s in sources if s.status == SourceAcqStatus.retrying)
             yield {
                 "event": "progress",
@@ -118,85 +186,90 @@ class AcquisitionOrchestrator:
                 "completed": completed,
                 "failed": failed,
                 "total": len(sources),
+                "scheduler": scheduler.stats(),
             },
         }
 
-    async def _acquire_source(self, source: AcquisitionSource) -> bool:
-        """Attempt to acquire a single source with retries."""
-        for attempt in range(MAX_RETRIES):
-            source.status = SourceAcqStatus.running
-            source.last_attempt_at = datetime.now(UTC)
-            await self.db.commit()
-
-            try:
-                if source.access_method == "scrape":
-                    result = await scrape_source(
-                        manifest_id=source.manifest_id,
-                        source_id=source.source_id,
-                        url=source.url,
-                        rate_limit_ms=self.rate_limit_ms,
-                    )
-                elif source.access_method == "download":
-                    result = await download_source(
-                        manifest_id=source.manifest_id,
-                        source_id=source.source_id,
-                        url=source.url,
-                    )
-                elif source.access_method == "api":
-                    result = await fetch_api_source(
-                        manifest_id=source.manifest_id,
-                        source_id=source.source_id,
-                        url=source.url,
-                    )
-                else:
-                    source.status = SourceAcqStatus.skipped
-                    await self.db.commit()
-                    return False
-
-                # Stage the document
-                staged_id = f"stg-{source.source_id}"
-                is_duplicate = result.get("is_duplicate", False)
-
-                staged_doc = StagedDocument(
-                    id=staged_id,
-                    manifest_id=source.manifest_id,
-                    source_id=source.source_id,
-                    acquisition_method=source.access_method,
-                    content_hash=result["content_hash"],
-                    content_type=result.get("content_type", "application/octet-stream"),
-                    raw_content_path=result["raw_content_path"],
-                    byte_size=result["byte_size"],
-                    status=StagedDocStatus.duplicate if is_duplicate else StagedDocStatus.staged,
-                    provenance={
-                        "source_url": source.url,
-                        "duration_ms": result.get("duration_ms", 0),
-                    },
-                )
-                self.db.add(staged_doc)
+    @staticmethod
+    def _source_start(source: AcquisitionSource) -> dict:
+        return {
+            "event": "source_start",
+            "data": {
+                "source_id": source.source_id,
+                "name": source.name,
+                "method": source.access_method,
+            },
+        }
 
-                source.status = SourceAcqStatus.complete
-                source.staged_document_id = staged_id
-                source.duration_ms = result.get("duration_ms", 0)
-                source.error_message = None
-                await self.db.commit()
-                return True
+    async def _fetch(self, job: AcquisitionJob) -> dict:
+        """One acquisition attempt. Politeness is enforced by the scheduler."""
+        source: AcquisitionSource = job.payload
+        if source.access_method == "scrape":
+            return await scrape_source(
+                manifest_id=source.manifest_id,
+                source_id=source.source_id,
+                url=source.url,
+                rate_limit_ms=0,
+            )
+        if source.access_method == "download":
+            return await download_source(
+                manifest_id=source.manifest_id,
+                source_id=source.source_id,
+                url=source.url,
+            )
+        return await fetch_api_source(
+            manifest_id=source.manifest_id,
+            source_id=source.source_id,
+            url=source.url,
+        )
 
-            except Exception as e:
-                source.retry_count = attempt + 1
-                source.error_message = str(e)
-                logger.warning(
-                    "Acquisition failed for %s (attempt %d/%d): %s",
-                    source.source_id, attempt + 1, MAX_RETRIES, e,
-                )
+    async def _load_sources(self) -> list[AcquisitionSource]:
+        result = await self.db.execute(
+            select(AcquisitionSource).where(
+                AcquisitionSource.acquisition_id == self.acquisition_id
+            )
+        )
+        return list(result.scalars().all())
+
+    async def _try_stage(self, source: AcquisitionSource, result: dict) -> str | None:
+        """Stage a fetched source; returns an error message instead of raising."""
+        source_id = source.source_id
+        try:
+            await self._stage(source, result)
+        except Exception as exc:
+            logger.warning("Staging failed for %s", source_id, exc_info=True)
+            await self.db.rollback()
+            # The rollback expired every loaded row; reload this run's sources
+            await self._load_sources()
+            return f"Staging failed: {type(exc).__name__}: {exc}"
+        return None
 
-                if attempt < MAX_RETRIES - 1:
-                    source.status = SourceAcqStatus.retrying
-                    await self.db.commit()
-                    backoff = BACKOFF_BASE * (4 ** attempt)  # 1s, 4s, 16s
-                    await asyncio.sleep(backoff)
-                else:
-                    source.status = SourceAcqStatus.failed
-                    await self.db.commit()
-                    return False
-
-        return False
+    async def _stage(self, source: AcquisitionSource, result: dict) -> None:
+        """Record the staged document for a successfully acquired source."""
+        staged_id = f"stg-{source.source_id}"
+        is_duplicate = result.get("is_duplicate", False)
+
+        staged_doc = StagedDocument(
+            id=staged_id,
+            manifest_id=source.manifest_id,
+            source_id=source.source_id,
+            acquisition_method=source.access_method,
+            content_hash=result["content_hash"],
+            content_type=result.get("content_type", "application/octet-stream"),
+            raw_content_path=result["raw_content_path"],
+            byte_size=result["byte_size"],
+            status=StagedDocStatus.duplicate if is_duplicate else StagedDocStatus.staged,
+            provenance={
+                "source_url": source.url,
+                "duration_ms": result.get("duration_ms", 0),
+            },
+        )
+        self.db.add(staged_doc)
+
+        source.status = SourceAcqStatus.complete
+        source.staged_document_id = staged_id
+        source.duration_ms = result.get("duration_ms", 0)
+        source.error_message = None
+        await self.db.commit()
+        ACQUISITION_BYTES.inc(result["byte_size"], method=source.access_method)
+        ACQUISITION_SECONDS.inc(result.get("duration_ms", 0) / 1000, method=source.access_method)
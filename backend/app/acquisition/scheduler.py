@@ -0,0 +1,250 @@
+"""Acquisition Scheduler — concurrent fetching with per-host politeness.
+
+Runs acquisition jobs on a pool of workers under three limits:
+
+- a global concurrency limit (``max_concurrency`` workers);
+- a per-host concurrency limit (``per_host_concurrency`` in-flight requests);
+- a per-host politeness delay (minimum spacing between request starts).
+
+A job that cannot start yet — its host is busy or still inside its politeness
+window — is set aside and the worker moves on to another host. Failed jobs are
+re-queued with exponential backoff (1s, 4s, 16s) instead of holding a worker
+while they wait.
+
+Workers only fetch; outcomes are reported in order of occurrence through
+``run()`` so the caller can apply DB updates from a single coroutine.
+
+Usage:
+    scheduler = AcquisitionScheduler(fetch, max_concurrency=8, politeness_ms=2000)
+    async for outcome in scheduler.run(jobs):
+        if outcome.kind == "success":
+            ...  # outcome.result is what fetch() returned
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import logging
+import time
+from collections import defaultdict, deque
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+from dataclasses import dataclass, field
+from typing import Any
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+# Outcome kinds
+START = "start"
+RETRY = "retry"
+SUCCESS = "success"
+FAILURE = "failure"
+
+
+def host_of(url: str) -> str:
+    return urlparse(url).netloc.lower()
+
+
+class HostPoliteness:
+    """Minimum spacing between request starts to the same host.
+
+    A start slot is reserved *before* any await, so concurrent callers for one
+    host are spaced out instead of all reading the same stale timestamp.
+    """
+
+    def __init__(self) -> None:
+        self._next_start: dict[str, float] = {}
+
+    def next_start(self, host: str) -> float:
+        """Monotonic time at which the host may be contacted again."""
+        return self._next_start.get(host, 0.0)
+
+    def reserve(self, host: str, delay_ms: int) -> float:
+        """Claim the host's next start slot; returns seconds to wait for it."""
+        now = time.monotonic()
+        start_at = max(now, self.next_start(host))
+        self._next_start[host] = start_at + max(delay_ms, 0) / 1000.0
+        return start_at - now
+
+    async def wait(self, url: str, delay_ms: int) -> None:
+        """Sleep until this caller's reserved start slot for the URL's host."""
+        if delay_ms <= 0:
+            return
+        wait = self.reserve(host_of(url), delay_ms)
+        if wait > 0:
+            logger.debug("Rate limit: waiting %.1fs before requesting %s", wait, host_of(url))
+            await asyncio.sleep(wait)
+
+    def clear(self) -> None:
+        self._next_start.clear()
+
+
+@dataclass
+class AcquisitionJob:
+    """One source to fetch. ``payload`` is passed through to the fetch callable."""
+
+    key: str
+    url: str
+    payload: Any = None
+    attempt: int = 0  # zero-based attempt currently (or next) running
+    host: str = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.host = host_of(self.url)
+
+
+@dataclass
+class JobOutcome:
+    kind: str  # START | RETRY | SUCCESS | FAILURE
+    job: AcquisitionJob
+    result: Any = None
+    error: str | None = None
+    retry_in_s: float = 0.0
+
+
+class AcquisitionScheduler:
+    """Worker pool with global/per-host concurrency and politeness limits.
+
+    Parameters:
+        fetch: Coroutine performing one attempt; raising marks the attempt failed.
+        max_concurrency: Jobs in flight across all hosts.
+        per_host_concurrency: Jobs in flight per host.
+        politeness_ms: Minimum delay between request starts to one host.
+        max_retries: Attempts per job before it is reported as failed.
+        backoff_base: Seconds before the first retry; multiplied by 4 per attempt.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[AcquisitionJob], Awaitable[Any]],
+        *,
+        max_concurrency: int = 8,
+        per_host_concurrency: int = 2,
+        politeness_ms: int = 2000,
+        max_retries: int = 3,
+        backoff_base: float = 1.0,
+    ) -> None:
+        self.fetch = fetch
+        self.max_concurrency = max(max_concurrency, 1)
+        self.per_host_concurrency = max(per_host_concurrency, 1)
+        self.politeness_ms = politeness_ms
+        self.max_retries = max(max_retries, 1)
+        self.backoff_base = backoff_base
+        self.politeness = HostPoliteness()
+
+        # (ready_at, seq, job) — jobs waiting for their start time
+        self._ready: list[tuple[float, int, AcquisitionJob]] = []
+        # Jobs whose host was at its concurrency limit when they came up
+        self._parked: dict[str, deque[AcquisitionJob]] = defaultdict(deque)
+        self._in_flight: dict[str, int] = defaultdict(int)
+        self._seq = 0
+        self._unfinished = 0
+        self._wakeup = asyncio.Event()
+        self._outcomes: asyncio.Queue[JobOutcome] = asyncio.Queue()
+
+        self.peak_in_flight = 0
+        self.retries = 0
+
+    async def run(self, jobs: Iterable[AcquisitionJob]) -> AsyncGenerator[JobOutcome, None]:
+        """Run all jobs, yielding outcomes as they happen.
+
+        Every job yields one START per attempt, a RETRY for each failed
+        attempt that will be retried, and exactly one SUCCESS or FAILURE.
+        """
+        for job in jobs:
+            self._push(job, time.monotonic())
+            self._unfinished += 1
+        if not self._unfinished:
+            return
+
+        workers = [
+            asyncio.create_task(self._worker())
+            for _ in range(min(self.max_concurrency, self._unfinished))
+        ]
+        try:
+            finished = 0
+            total = self._unfinished
+            while finished < total:
+                outcome = await self._outcomes.get()
+                if outcome.kind in (SUCCESS, FAILURE):
+                    finished += 1
+                yield outcome
+        finally:
+            for worker in workers:
+                worker.cancel()
+
+    def stats(self) -> dict:
+        return {
+            "max_concurrency": self.max_concurrency,
+            "per_host_concurrency": self.per_host_concurrency,
+            "politeness_ms": self.politeness_ms,
+            "peak_in_flight": self.peak_in_flight,
+            "retries": self.retries,
+            "hosts": len(self._in_flight),
+        }
+
+    # ── Internals ─────────────────────────────────────────────────────────
+
+    def _push(self, job: AcquisitionJob, ready_at: float) -> None:
+        self._seq += 1
+        heapq.heappush(self._ready, (ready_at, self._seq, job))
+        self._wakeup.set()
+
+    def _take(self) -> AcquisitionJob | float | None:
+        """Next startable job; else seconds until one may be, or None if idle."""
+        now = time.monotonic()
+        while self._ready:
+            ready_at, _, job = self._ready[0]
+            if ready_at > now:
+                return ready_at - now
+            heapq.heappop(self._ready)
+            if self._in_flight[job.host] >= self.per_host_concurrency:
+                self._parked[job.host].append(job)
+                continue
+            host_next = self.politeness.next_start(job.host)
+            if host_next > now:
+                self._push(job, host_next)
+                continue
+            self.politeness.reserve(job.host, self.politeness_ms)
+            return job
+        return None
+
+    async def _worker(self) -> None:
+        while self._unfinished > 0:
+            job = self._take()
+            if not isinstance(job, AcquisitionJob):
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=job)
+                except TimeoutError:
+                    pass
+                continue
+            await self._attempt(job)
+
+    async def _attempt(self, job: AcquisitionJob) -> None:
+        self._in_flight[job.host] += 1
+        self.peak_in_flight = max(self.peak_in_flight, sum(self._in_flight.values()))
+        await self._outcomes.put(JobOutcome(START, job))
+        try:
+            result = await self.fetch(job)
+        except Exception as exc:
+            if job.attempt + 1 < self.max_retries:
+                delay = self.backoff_base * (4 ** job.attempt)
+                self.retries += 1
+                await self._outcomes.put(JobOutcome(RETRY, job, error=str(exc), retry_in_s=delay))
+                job.attempt += 1
+                self._push(job, time.monotonic() + delay)
+            else:
+                self._unfinished -= 1
+                await self._outcomes.put(JobOutcome(FAILURE, job, error=str(exc)))
+        else:
+            self._unfinished -= 1
+            await self._outcomes.put(JobOutcome(SUCCESS, job, result=result))
+        finally:
+            self._in_flight[job.host] -= 1
+            parked = self._parked.get(job.host)
+            if parked:
+                self._push(parked.popleft(), time.monotonic())
+            # Idle workers re-check: a host slot freed or the run is finished
+            self._wakeup.set()
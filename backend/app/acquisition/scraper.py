@@ -1,37 +1,28 @@
 """Web Scraping Engine — Firecrawl for JS-rendered, httpx+BeautifulSoup for static."""
 
-import asyncio
 import logging
 import time
-from urllib.parse import urlparse
 
 import httpx
 
-from app.acquisition.staging import stage_document
+from app.acquisition.downloader import check_content_length, max_download_bytes
+from app.acquisition.scheduler import HostPoliteness
+from app.acquisition.staging import stage_document, stage_stream
+from app.http_client import USER_AGENT, get_http_client
 
 logger = logging.getLogger(__name__)
 
-# Per-domain last-request timestamps for rate limiting
-_domain_last_request: dict[str, float] = {}
+# Per-domain start-slot reservations, shared by all scrapes in this process
+_politeness = HostPoliteness()
 
 
 async def _enforce_rate_limit(url: str, rate_limit_ms: int) -> None:
-    """Wait if needed to enforce minimum delay between requests to the same domain."""
-    if rate_limit_ms <= 0:
-        return
+    """Wait if needed to enforce minimum delay between requests to the same domain.
 
-    domain = urlparse(url).netloc
-    now = time.monotonic()
-    last = _domain_last_request.get(domain, 0.0)
-    delay_s = rate_limit_ms / 1000.0
-    elapsed = now - last
-
-    if elapsed < delay_s:
-        wait = delay_s - elapsed
-        logger.debug("Rate limit: waiting %.1fs before requesting %s", wait, domain)
-        await asyncio.sleep(wait)
-
-    _domain_last_request[domain] = time.monotonic()
+    Each caller reserves its slot before sleeping, so concurrent scrapes of one
+    domain are spaced ``rate_limit_ms`` apart rather than released together.
+    """
+    await _politeness.wait(url, rate_limit_ms)
 
 
 async def scrape_source(
@@ -56,34 +47,31 @@ async def scrape_source(
 
 
 async def _scrape_static(manifest_id: str, source_id: str, url: str) -> dict:
-    """Fetch static HTML content using httpx."""
+    """Fetch static HTML content using httpx, streaming it into staging."""
     start = time.monotonic()
+    max_bytes = max_download_bytes()
 
-    async with httpx.AsyncClient(follow_redirects=True, max_redirects=5) as client:
-        response = await client.get(
-            url,
-            timeout=60.0,
-            headers={"User-Agent": "RARIS/0.1 Regulatory Research Bot"},
-        )
+    async with get_http_client().stream("GET", url, headers={"User-Agent": USER_AGENT}) as response:
         response.raise_for_status()
+        check_content_length(response, max_bytes, url)
+        content_type = response.headers.get("content-type", "text/html").split(";")[0]
+
+        result = await stage_stream(
+            manifest_id=manifest_id,
+            source_id=source_id,
+            chunks=response.aiter_bytes(),
+            content_type=content_type,
+            provenance={
+                "source_url": url,
+                "scraping_tool": "httpx-static",
+                "tool_version": httpx.__version__,
+                "http_status": response.status_code,
+            },
+            max_bytes=max_bytes,
+            started_at=start,
+        )
 
-    content = response.content
-    content_type = response.headers.get("content-type", "text/html").split(";")[0]
     duration_ms = int((time.monotonic() - start) * 1000)
-
-    result = stage_document(
-        manifest_id=manifest_id,
-        source_id=source_id,
-        content=content,
-        content_type=content_type,
-        provenance={
-            "source_url": url,
-            "scraping_tool": "httpx-static",
-            "tool_version": httpx.__version__,
-            "acquisition_duration_ms": duration_ms,
-            "http_status": response.status_code,
-        },
-    )
     result["duration_ms"] = duration_ms
     result["content_type"] = content_type
     return result
@@ -103,14 +91,13 @@ async def _scrape_firecrawl(manifest_id: str, source_id: str, url: str) -> dict:
 
     start = time.monotonic()
 
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
-            "https://api.firecrawl.dev/v1/scrape",
-            json={"url": url, "formats": ["html"]},
-            headers={"Authorization": f"Bearer {api_key}"},
-            timeout=120.0,
-        )
-        response.raise_for_status()
+    response = await get_http_client().post(
+        "https://api.firecrawl.dev/v1/scrape",
+        json={"url": url, "formats": ["html"]},
+        headers={"Authorization": f"Bearer {api_key}"},
+        timeout=120.0,
+    )
+    response.raise_for_status()
 
     data = response.json()
     html_content = data.get("data", {}).get("html", "")
@@ -1,10 +1,29 @@
-"""Raw Staging Layer — stores acquired content with full provenance metadata."""
+"""Raw Staging Layer — stores acquired content with full provenance metadata.
+
+Content bytes live in a content-addressed blob store under
+``staging/.blobs``: each distinct body is stored once however many manifests
+fetch it. ``staging/<manifest_id>/<source_id>/provenance.yaml`` is the
+source's pointer into the store (its ``content_hash``), and the store keeps a
+reference back to every (manifest, source) using a blob.
+
+``stage_document`` stages content already held in memory. ``stage_stream``
+stages a response body chunk by chunk, hashing it as it is written, so memory
+use stays at one chunk regardless of size.
+"""
 
 import hashlib
+import shutil
+import tempfile
+import time
+from collections.abc import AsyncIterable, AsyncIterator, Iterator
+from contextlib import contextmanager
 from pathlib import Path
 
 import yaml
 
+from app.acquisition.blob_store import BlobStore, PutResult
+from app.config import settings
+
 STAGING_ROOT = Path("staging")
 
 
@@ -12,6 +31,11 @@ def compute_hash(content: bytes) -> str:
     return f"sha256:{hashlib.sha256(content).hexdigest()}"
 
 
+def get_blob_store() -> BlobStore:
+    """Blob store under the current staging root."""
+    return BlobStore(STAGING_ROOT / ".blobs", compression=settings.staging_compression)
+
+
 def stage_document(
     manifest_id: str,
     source_id: str,
@@ -19,59 +43,122 @@ def stage_document(
     content_type: str,
     provenance: dict,
 ) -> dict:
-    """Write content and provenance to the staging directory.
+    """Store content in the blob store and write provenance for the source.
 
     Returns a dict with path, hash, byte_size, and duplicate status.
     """
-    content_hash = compute_hash(content)
-
-    # Determine file extension from content type
-    ext_map = {
-        "text/html": "html",
-        "application/pdf": "pdf",
-        "application/xml": "xml",
-        "text/xml": "xml",
-        "text/plain": "txt",
-    }
-    ext = ext_map.get(content_type, "bin")
+    put = get_blob_store().put_bytes(content)
+    return _finish(manifest_id, source_id, put, content_type, provenance)
+
+
+async def stage_stream(
+    manifest_id: str,
+    source_id: str,
+    chunks: AsyncIterable[bytes],
+    content_type: str,
+    provenance: dict,
+    max_bytes: int = 0,
+    started_at: float | None = None,
+) -> dict:
+    """Stream content into the blob store, hashing as it is written.
+
+    Args:
+        max_bytes: Abort with ValueError once the body exceeds this size (0 = no limit).
+        started_at: ``time.monotonic()`` when the fetch began; recorded in
+            provenance as ``acquisition_duration_ms`` once the body is written.
+
+    Returns the same dict as ``stage_document``.
+    """
+    label = provenance.get("source_url", source_id)
+    put = await get_blob_store().put_stream(_limited(chunks, max_bytes, label))
+    if started_at is not None:
+        provenance["acquisition_duration_ms"] = int((time.monotonic() - started_at) * 1000)
+    return _finish(manifest_id, source_id, put, content_type, provenance)
+
+
+def read_staged_content(content_hash: str) -> bytes:
+    """Original bytes of a staged document."""
+    return get_blob_store().read_bytes(content_hash)
+
 
+@contextmanager
+def staged_file(content_hash: str) -> Iterator[Path]:
+    """Filesystem path to a staged document's original bytes.
+
+    Uncompressed blobs are used in place; a compressed blob is decompressed to
+    a temporary file that is removed on exit.
+    """
+    store = get_blob_store()
+    path = store.path(content_hash)
+    if path is None:
+        raise FileNotFoundError(f"Blob not found: {content_hash}")
+    if path.suffix != ".zst":
+        yield path
+        return
+
+    tmp_dir = store.root / "tmp"
+    tmp_dir.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile(dir=tmp_dir, suffix=".blob") as tmp:
+        with store.open(content_hash) as src:
+            shutil.copyfileobj(src, tmp)
+        tmp.flush()
+        yield Path(tmp.name)
+
+
+async def _limited(
+    chunks: AsyncIterable[bytes], max_bytes: int, label: str
+) -> AsyncIterator[bytes]:
+    total = 0
+    async for chunk in chunks:
+        total += len(chunk)
+        if max_bytes and total > max_bytes:
+            raise ValueError(f"Download exceeds staging size limit ({max_bytes} bytes): {label}")
+        yield chunk
+
+
+def _finish(
+    manifest_id: str,
+    source_id: str,
+    put: PutResult,
+    content_type: str,
+    provenance: dict,
+) -> dict:
+    """Point the source at its blob and write provenance.
+
+    The source's previous blob, if different, loses this source's reference.
+    """
     target_dir = STAGING_ROOT / manifest_id / source_id
     target_dir.mkdir(parents=True, exist_ok=True)
-
-    content_path = target_dir / f"content.{ext}"
     provenance_path = target_dir / "provenance.yaml"
 
-    # Check for duplicates across staging
-    is_duplicate = _check_duplicate(content_hash)
-
-    if not is_duplicate:
-        content_path.write_bytes(content)
+    store = get_blob_store()
+    previous_hash = _previous_hash(provenance_path)
+    # A source re-staging its own unchanged content counts as a duplicate
+    is_duplicate = not put.created
+    store.add_ref(put.content_hash, manifest_id, source_id)
+    if previous_hash and previous_hash != put.content_hash:
+        store.remove_ref(previous_hash, manifest_id, source_id)
 
-    # Always write provenance
-    provenance["content_hash"] = content_hash
+    provenance["content_hash"] = put.content_hash
     provenance["content_type"] = content_type
-    provenance["byte_size"] = len(content)
+    provenance["byte_size"] = put.byte_size
+    provenance["stored_bytes"] = put.stored_bytes
     with open(provenance_path, "w") as f:
         yaml.dump(provenance, f, default_flow_style=False)
 
     return {
         "raw_content_path": str(target_dir),
-        "content_hash": content_hash,
-        "byte_size": len(content),
+        "content_hash": put.content_hash,
+        "byte_size": put.byte_size,
         "is_duplicate": is_duplicate,
     }
 
 
-def _check_duplicate(content_hash: str) -> bool:
-    """Check if a document with this hash already exists in staging."""
-    if not STAGING_ROOT.exists():
-        return False
-    for prov_file in STAGING_ROOT.rglob("provenance.yaml"):
-        try:
-            with open(prov_file) as f:
-                prov = yaml.safe_load(f)
-                if prov and prov.get("content_hash") == content_hash:
-                    return True
-        except Exception:
-            continue
-    return False
+def _previous_hash(provenance_path: Path) -> str | None:
+    if not provenance_path.exists():
+        return None
+    try:
+        with open(provenance_path) as f:
+            return (yaml.safe_load(f) or {}).get("content_hash")
+    except Exception:
+        return None
@@ -0,0 +1,99 @@
+"""Call Budget — shared LLM call allowance for one discovery run.
+
+Every discovery phase (L1 sector calls, L2 node expansion, resumed runs)
+reserves from the same ``CallBudget`` *before* calling the LLM, so phases
+running concurrently can never overshoot ``max_api_calls`` between them.
+
+``try_reserve`` checks and decrements in one synchronous step; with no await
+in between, no other coroutine on the event loop can interleave, which makes
+a reservation atomic without a lock. A reservation is spent whether the call
+succeeds or fails; ``release`` returns one that was never used.
+
+Usage:
+    budget = CallBudget(limit=settings.max_api_calls)
+    if not budget.try_reserve("l2"):
+        ...  # budget exhausted — stop expanding
+    result = await llm.complete(...)
+    budget.stats()  # {"limit": ..., "used": ..., "remaining": ..., "burn_down": [...]}
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+# Maximum burn-down points reported in stats()
+_BURN_DOWN_POINTS = 25
+
+
+class CallBudget:
+    """Atomic, per-phase-accounted LLM call budget.
+
+    Parameters:
+        limit: Maximum calls for the run.
+        used: Calls already spent (e.g. by the run a resume continues).
+    """
+
+    def __init__(self, limit: int, *, used: int = 0) -> None:
+        self.limit = limit
+        self._used = used
+        self._by_phase: dict[str, int] = {}
+        self._denied = 0
+        self._started = time.monotonic()
+        # (elapsed seconds, calls used) after each reservation
+        self._burn_down: list[tuple[float, int]] = []
+
+    @property
+    def used(self) -> int:
+        return self._used
+
+    @property
+    def remaining(self) -> int:
+        return max(self.limit - self._used, 0)
+
+    @property
+    def exhausted(self) -> bool:
+        return self._used >= self.limit
+
+    def try_reserve(self, phase: str, n: int = 1) -> bool:
+        """Reserve ``n`` calls for ``phase``; all or nothing.
+
+        Returns False (and reserves nothing) if fewer than ``n`` calls remain.
+        """
+        if self._used + n > self.limit:
+            self._denied += n
+            return False
+        self._used += n
+        self._by_phase[phase] = self._by_phase.get(phase, 0) + n
+        self._burn_down.append((time.monotonic() - self._started, self._used))
+        return True
+
+    def release(self, phase: str, n: int = 1) -> None:
+        """Return ``n`` reserved calls that were never made."""
+        n = min(n, self._by_phase.get(phase, 0))
+        self._used -= n
+        self._by_phase[phase] -= n
+
+    def stats(self) -> dict:
+        """Budget usage for logging and SSE ``queue_stats``."""
+        step = max(1, -(-len(self._burn_down) // _BURN_DOWN_POINTS))
+        points = self._burn_down[step - 1::step]
+        if self._burn_down and points[-1] != self._burn_down[-1]:
+            points.append(self._burn_down[-1])
+        return {
+            "limit": self.limit,
+            "used": self._used,
+            "remaining": self.remaining,
+            "denied": self._denied,
+            "by_phase": dict(sorted(self._by_phase.items())),
+            "burn_down": [
+                {
+                    "elapsed_s": round(elapsed, 1),
+                    "used": used,
+                    "remaining": max(self.limit - used, 0),
+                }
+                for elapsed, used in points
+            ],
+        }
@@ -1,7 +1,10 @@
 """Discovery Queue — Priority BFS frontier for the RLM engine.
 
 Provides a priority queue with a visited set for deduplication.
-Items are processed breadth-first: at equal priority, shallower depth wins.
+Pop order comes from a pluggable ``SchedulingPolicy`` (see queue_policies.py);
+the default processes items breadth-first: at equal priority, shallower depth
+wins. When the queue is full, the lowest-value pending item is evicted to
+make room for a better one.
 
 Usage:
     queue = DiscoveryQueue(max_depth=3)
@@ -10,6 +13,7 @@ Usage:
     while not queue.is_empty():
         item = queue.pop()
         ...  # process item, enqueue children
+        queue.record(item, sources=3, new_sources=1, programs=2)
 """
 
 from __future__ import annotations
@@ -20,6 +24,9 @@ from collections import Counter
 from dataclasses import dataclass, field
 from typing import Any
 
+from app.agent.queue_policies import SchedulingPolicy, get_policy
+from app.metrics import track_discovery_queue
+
 logger = logging.getLogger(__name__)
 
 
@@ -41,6 +48,7 @@ class QueueItem:
     target_id: str = field(compare=False)
     discovered_from: str = field(compare=False, default="")
     metadata: dict[str, Any] = field(compare=False, default_factory=dict)
+    lane: str = field(compare=False, default="")  # L1 sector the item descends from
 
     def to_dict(self) -> dict[str, Any]:
         return {
@@ -50,23 +58,40 @@ class QueueItem:
             "depth": self.depth,
             "discovered_from": self.discovered_from,
             "metadata": self.metadata,
+            "lane": self.lane,
         }
 
 
+# Maximum points reported per yield curve in stats()
+_CURVE_POINTS = 25
+
+
 class DiscoveryQueue:
     """Priority queue with visited-set dedup for BFS discovery.
 
     Parameters:
         max_depth: Maximum depth allowed. Items beyond this are silently rejected.
-        max_size: Maximum queue size. Items beyond this are silently rejected.
+        max_size: Maximum queue size. When full, a new item replaces the
+            lowest-value pending item if it ranks higher, else it is rejected.
+        policy: Scheduling policy deciding pop order (default: priority BFS).
     """
 
-    def __init__(self, max_depth: int = 3, max_size: int = 2000) -> None:
-        self._heap: list[QueueItem] = []
+    def __init__(
+        self,
+        max_depth: int = 3,
+        max_size: int = 2000,
+        policy: SchedulingPolicy | None = None,
+    ) -> None:
+        # Heap entries are (policy key, seq, item); seq keeps FIFO stability
+        self._heap: list[tuple[tuple, int, QueueItem]] = []
         self._visited: set[str] = set()
+        self._lanes: dict[str, str] = {}
         self._seq: int = 0
         self.max_depth = max_depth
         self.max_size = max_size
+        self.policy = policy or SchedulingPolicy()
+        self._epoch = self.policy.epoch
+        track_discovery_queue(self)
 
         # Counters for stats
         self._enqueued_total: int = 0
@@ -74,6 +99,10 @@ class DiscoveryQueue:
         self._rejected_depth: int = 0
         self._rejected_visited: int = 0
         self._rejected_full: int = 0
+        self._evicted: int = 0
+
+        # Cumulative (api_calls, sources, new_sources, programs) after each record()
+        self._curve: list[tuple[int, int, int, int]] = []
 
     def enqueue(
         self,
@@ -87,7 +116,8 @@ class DiscoveryQueue:
     ) -> bool:
         """Add an item to the queue.
 
-        Returns True if enqueued, False if rejected (visited/depth/full).
+        Returns True if enqueued, False if rejected (visited/depth, or full
+        with nothing of lower value to evict).
         """
         if depth > self.max_depth:
             self._rejected_depth += 1
@@ -101,40 +131,122 @@ class DiscoveryQueue:
             self._rejected_visited += 1
             return False
 
-        if len(self._heap) >= self.max_size:
-            self._rejected_full += 1
-            logger.warning(
-                "[queue] at capacity (%d) — rejecting %s:%s",
-                self.max_size, target_type, target_id,
-            )
-            return False
-
-        self._seq += 1
         item = QueueItem(
             priority=priority,
             depth=depth,
-            _seq=self._seq,
+            _seq=self._seq + 1,
             target_type=target_type,
             target_id=target_id,
             discovered_from=discovered_from,
             metadata=metadata or {},
+            lane=self._lane_for(discovered_from, metadata or {}),
         )
-        heapq.heappush(self._heap, item)
+
+        if len(self._heap) >= self.max_size:
+            self._rekey_if_stale()
+            entry = (self.policy.key(item), item._seq, item)
+            worst = max(self._heap)
+            if entry >= worst:
+                self._rejected_full += 1
+                logger.warning(
+                    "[queue] at capacity (%d) — rejecting %s:%s",
+                    self.max_size, target_type, target_id,
+                )
+                return False
+            # Evicted items may be rediscovered later through another path
+            self._heap.remove(worst)
+            heapq.heapify(self._heap)
+            self._visited.discard(worst[2].target_id)
+            self._evicted += 1
+            logger.debug(
+                "[queue] at capacity (%d) — evicted %s:%s for %s:%s",
+                self.max_size, worst[2].target_type, worst[2].target_id, target_type, target_id,
+            )
+
+        self._push(item)
         self._visited.add(target_id)
+        self._lanes[target_id] = item.lane
         self._enqueued_total += 1
         return True
 
     def pop(self) -> QueueItem | None:
-        """Remove and return the highest-priority (lowest number) item.
+        """Remove and return the item the policy ranks first.
 
         Returns None if the queue is empty.
         """
         if not self._heap:
             return None
-        item = heapq.heappop(self._heap)
+        self._rekey_if_stale()
+        _, _, item = heapq.heappop(self._heap)
         self._dequeued_total += 1
+        self.policy.on_pop(item)
         return item
 
+    def record(
+        self,
+        item: QueueItem,
+        *,
+        sources: int = 0,
+        new_sources: int = 0,
+        programs: int = 0,
+        api_calls: int = 1,
+    ) -> None:
+        """Report the outcome of expanding ``item``.
+
+        Feeds the policy's estimates and extends the yield curve. Replays
+        that cost no call pass ``api_calls=0``.
+        """
+        self.policy.observe(
+            item, sources=sources, new_sources=new_sources, programs=programs, api_calls=api_calls,
+        )
+        calls, total_sources, total_new, total_programs = (
+            self._curve[-1] if self._curve else (0, 0, 0, 0)
+        )
+        self._curve.append((
+            calls + api_calls,
+            total_sources + sources,
+            total_new + new_sources,
+            total_programs + programs,
+        ))
+
+    def yield_curve(self, max_points: int = _CURVE_POINTS) -> list[dict[str, int]]:
+        """Cumulative sources/programs found vs API calls, downsampled."""
+        if not self._curve:
+            return []
+        step = max(1, -(-len(self._curve) // max_points))
+        points = self._curve[step - 1::step]
+        if points[-1] != self._curve[-1]:
+            points.append(self._curve[-1])
+        return [
+            {"api_calls": c, "sources": s, "new_sources": n, "programs": p}
+            for c, s, n, p in points
+        ]
+
+    def _lane_for(self, discovered_from: str, metadata: dict[str, Any]) -> str:
+        # discovered_from is "sector:<key>", "<node_type>:<parent_id>",
+        # "prior:<origin>" or a bare parent ID
+        kind, _, parent = discovered_from.partition(":")
+        if kind == "sector":
+            return parent
+        if kind == "prior" and metadata.get("sector_key"):
+            return metadata["sector_key"]
+        if discovered_from in self._lanes:
+            return self._lanes[discovered_from]
+        return self._lanes.get(parent, discovered_from)
+
+    def _push(self, item: QueueItem) -> None:
+        self._seq = max(self._seq, item._seq)
+        heapq.heappush(self._heap, (self.policy.key(item), item._seq, item))
+
+    def _rekey_if_stale(self) -> None:
+        # Learned policies change keys as yields come in; one O(n) re-heapify
+        # per expansion is negligible next to the LLM call it schedules.
+        if self.policy.epoch == self._epoch:
+            return
+        self._heap = [(self.policy.key(item), seq, item) for _, seq, item in self._heap]
+        heapq.heapify(self._heap)
+        self._epoch = self.policy.epoch
+
     def is_empty(self) -> bool:
         return len(self._heap) == 0
 
@@ -152,7 +264,7 @@ class DiscoveryQueue:
         """Return queue statistics for logging and SSE events."""
         depth_counts: Counter[int] = Counter()
         type_counts: Counter[str] = Counter()
-        for item in self._heap:
+        for _, _, item in self._heap:
             depth_counts[item.depth] += 1
             type_counts[item.target_type] += 1
 
@@ -164,8 +276,12 @@ class DiscoveryQueue:
             "rejected_depth": self._rejected_depth,
             "rejected_visited": self._rejected_visited,
             "rejected_full": self._rejected_full,
+            "evicted": self._evicted,
             "by_depth": dict(sorted(depth_counts.items())),
             "by_type": dict(sorted(type_counts.items())),
+            "policy": self.policy.name,
+            "policy_state": self.policy.state(),
+            "yield_curve": self.yield_curve(),
         }
 
     def to_snapshot(self) -> dict[str, Any]:
@@ -175,24 +291,29 @@ class DiscoveryQueue:
         queue can be fully rehydrated by ``from_snapshot()``.
         """
         return {
-            "queue_items": [item.to_dict() for item in self._heap],
+            "queue_items": [item.to_dict() for _, _, item in sorted(self._heap)],
             "visited": list(self._visited),
             "seq": self._seq,
             "max_depth": self.max_depth,
             "max_size": self.max_size,
+            "policy": self.policy.name,
         }
 
     @classmethod
-    def from_snapshot(cls, snapshot: dict[str, Any]) -> "DiscoveryQueue":
+    def from_snapshot(
+        cls, snapshot: dict[str, Any], policy: SchedulingPolicy | None = None,
+    ) -> "DiscoveryQueue":
         """Rehydrate a ``DiscoveryQueue`` from a snapshot dict.
 
         The queue is rebuilt from the serialized heap items and visited set,
         restoring heap order. ``seq`` counter is also restored so new items
-        continue from the correct ordinal.
+        continue from the correct ordinal. The snapshot's policy is used unless
+        one is given; learned yield estimates start afresh.
         """
         q = cls(
             max_depth=snapshot.get("max_depth", 3),
             max_size=snapshot.get("max_size", 2000),
+            policy=policy or get_policy(snapshot.get("policy")),
         )
         q._visited = set(snapshot.get("visited", []))
         q._seq = snapshot.get("seq", 0)
@@ -206,8 +327,10 @@ class DiscoveryQueue:
                 target_id=item_dict["target_id"],
                 discovered_from=item_dict.get("discovered_from", ""),
                 metadata=item_dict.get("metadata", {}),
+                lane=item_dict.get("lane", ""),
             )
-            heapq.heappush(q._heap, item)
+            q._push(item)
+            q._lanes[item.target_id] = item.lane
         q._enqueued_total = len(q._heap)
         logger.info(
             "[queue] restored from snapshot — %d items, %d visited",
@@ -0,0 +1,180 @@
+"""Entity resolution index — fuzzy dedup of regulatory-body names.
+
+Different LLM calls name the same body differently ("NJ Dept. of Banking &
+Insurance" vs "New Jersey Department of Banking and Insurance"). Each spelling
+that slips past ``EntityRegistry`` becomes its own queue node and costs one
+expansion call.
+
+Names are normalized (punctuation, ``&``, abbreviation and state-code
+expansion, stopwords) and embedded as L2-normalized hashed character-trigram
+vectors. Similarity against every indexed name of the same jurisdiction is a
+single NumPy matrix product, and a batch of names (one sector response) is
+scored against the index and against itself in two products.
+
+Usage:
+    index = EntityResolutionIndex(threshold=0.85)
+    vecs = index.vectorize(["NJ Dept. of Banking & Insurance"])
+    best, scores = index.query(vecs, ["NJ"])
+    if best[0] < 0 or scores[0] < index.threshold:
+        index.add(vecs[0], "NJ", "nj-dobi")
+"""
+
+from __future__ import annotations
+
+import re
+import zlib
+
+import numpy as np
+
+# Hashed trigram space. An entity name yields ~30-60 trigrams, so 1024 buckets
+# keeps collisions rare while a 2,000-row index stays ~8 MB in float32.
+_DIM = 1024
+_NGRAM = 3
+
+_ABBREVIATIONS: dict[str, str] = {
+    "dept": "department",
+    "dep": "department",
+    "dpt": "department",
+    "div": "division",
+    "comm": "commission",
+    "commn": "commission",
+    "cmsn": "commission",
+    "commr": "commissioner",
+    "admin": "administration",
+    "adm": "administration",
+    "assn": "association",
+    "assoc": "association",
+    "natl": "national",
+    "nat": "national",
+    "fed": "federal",
+    "govt": "government",
+    "gov": "government",
+    "ins": "insurance",
+    "bd": "board",
+    "ofc": "office",
+    "off": "office",
+    "svc": "services",
+    "svcs": "services",
+    "serv": "services",
+    "auth": "authority",
+    "agcy": "agency",
+    "corp": "corporation",
+    "dev": "development",
+    "devel": "development",
+    "fin": "finance",
+    "hsg": "housing",
+    "reg": "regulation",
+    "regs": "regulations",
+    "us": "united states",
+    "usa": "united states",
+}
+
+_STATE_CODES: dict[str, str] = {
+    "AL": "alabama", "AK": "alaska", "AZ": "arizona", "AR": "arkansas",
+    "CA": "california", "CO": "colorado", "CT": "connecticut", "DE": "delaware",
+    "DC": "district columbia", "FL": "florida", "GA": "georgia", "HI": "hawaii",
+    "ID": "idaho", "IL": "illinois", "IN": "indiana", "IA": "iowa",
+    "KS": "kansas", "KY": "kentucky", "LA": "louisiana", "ME": "maine",
+    "MD": "maryland", "MA": "massachusetts", "MI": "michigan", "MN": "minnesota",
+    "MS": "mississippi", "MO": "missouri", "MT": "montana", "NE": "nebraska",
+    "NV": "nevada", "NH": "new hampshire", "NJ": "new jersey", "NM": "new mexico",
+    "NY": "new york", "NC": "north carolina", "ND": "north dakota", "OH": "ohio",
+    "OK": "oklahoma", "OR": "oregon", "PA": "pennsylvania", "RI": "rhode island",
+    "SC": "south carolina", "SD": "south dakota", "TN": "tennessee", "TX": "texas",
+    "UT": "utah", "VT": "vermont", "VA": "virginia", "WA": "washington",
+    "WV": "west virginia", "WI": "wisconsin", "WY": "wyoming", "PR": "puerto rico",
+}
+
+_STOPWORDS: frozenset[str] = frozenset({"of", "the", "and", "for", "on", "in", "a", "an"})
+
+
+def normalize_entity_name(name: str) -> str:
+    """Canonical token string for an entity name.
+
+    State postal codes are expanded only when written in upper case, so words
+    like "in" or "or" are never mistaken for Indiana or Oregon.
+    """
+    # Parenthetical acronyms add noise: "Department of Labor (DOL)"
+    text = re.sub(r"\([^)]*\)", " ", name or "").replace("&", " and ")
+    # Drop periods/apostrophes inside abbreviations: "U.S." → "US", "Nat'l" → "Natl"
+    text = re.sub(r"[.']", "", text)
+    tokens: list[str] = []
+    for raw in re.split(r"[^A-Za-z0-9]+", text):
+        if not raw:
+            continue
+        if raw.isupper() and raw in _STATE_CODES:
+            tokens.extend(_STATE_CODES[raw].split())
+            continue
+        token = raw.lower()
+        token = _ABBREVIATIONS.get(token, token)
+        tokens.extend(t for t in token.split() if t not in _STOPWORDS)
+    return " ".join(tokens)
+
+
+def _trigram_buckets(normalized: str) -> list[int]:
+    padded = f" {normalized} "
+    return [
+        zlib.crc32(padded[i:i + _NGRAM].encode("utf-8")) % _DIM
+        for i in range(max(len(padded) - _NGRAM + 1, 1))
+    ]
+
+
+class EntityResolutionIndex:
+    """Jurisdiction-blocked cosine-similarity index over entity names.
+
+    Parameters:
+        threshold: Minimum cosine similarity for two names to be the same entity.
+        initial_capacity: Rows preallocated; the matrix doubles when full.
+    """
+
+    def __init__(self, threshold: float = 0.85, initial_capacity: int = 256) -> None:
+        self.threshold = threshold
+        self._vectors = np.zeros((initial_capacity, _DIM), dtype=np.float32)
+        self._jcodes: list[str] = []
+        self._labels: list[str] = []
+
+    def __len__(self) -> int:
+        return len(self._labels)
+
+    @staticmethod
+    def vectorize(names: list[str]) -> np.ndarray:
+        """Return an (n, DIM) float32 matrix of L2-normalized trigram vectors."""
+        vecs = np.zeros((len(names), _DIM), dtype=np.float32)
+        for row, name in enumerate(names):
+            np.add.at(vecs[row], _trigram_buckets(normalize_entity_name(name)), 1.0)
+        norms = np.linalg.norm(vecs, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return vecs / norms
+
+    def query(self, vecs: np.ndarray, jcodes: list[str]) -> tuple[np.ndarray, np.ndarray]:
+        """Best indexed match per query row, restricted to the same jurisdiction.
+
+        Returns (best_row, best_score); best_row is -1 where no candidate exists.
+        """
+        n = vecs.shape[0]
+        size = len(self._labels)
+        if n == 0 or size == 0:
+            return np.full(n, -1, dtype=np.int64), np.zeros(n, dtype=np.float32)
+        scores = vecs @ self._vectors[:size].T
+        index_jcodes = np.asarray(self._jcodes)
+        same_jurisdiction = np.asarray(jcodes)[:, None] == index_jcodes[None, :]
+        scores = np.where(same_jurisdiction, scores, -1.0)
+        best = scores.argmax(axis=1)
+        best_scores = scores[np.arange(n), best]
+        best = np.where(best_scores >= 0, best, -1)
+        return best, np.maximum(best_scores, 0.0)
+
+    def add(self, vec: np.ndarray, jcode: str, label: str) -> int:
+        """Index one name vector under ``label``; returns its row."""
+        size = len(self._labels)
+        if size == self._vectors.shape[0]:
+            grown = np.zeros((size * 2, _DIM), dtype=np.float32)
+            grown[:size] = self._vectors
+            self._vectors = grown
+        self._vectors[size] = vec
+        self._jcodes.append(jcode)
+        self._labels.append(label)
+        return size
+
+    def label(self, row: int) -> str:
+        return self._labels[row]
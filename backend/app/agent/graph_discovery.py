@@ -9,6 +9,8 @@ V6 architecture (ported from prepop1 recursive BFS pattern):
   Each entity expansion call finds programs, sources, and sub-entities.
   Newly discovered entities are enqueued at depth+1 if within max_depth.
 - Safety caps: max_api_calls, max_discovery_depth, max_entities_per_sector enforce limits.
+  Every LLM call reserves from one shared CallBudget first (see call_budget.py),
+  so concurrent L1 prompts/sectors and L2 expansion cannot overshoot the cap.
 
 Sector list is supplied at runtime from the uploaded sector JSON file.
 If no sector file is provided, the engine builds neutral runtime sectors so it
@@ -33,14 +35,21 @@ import re
 import time
 import urllib.request
 from collections import Counter
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Callable
+from datetime import UTC, datetime
+from typing import Any
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import async_session as _async_session_factory
 
 from app.agent.discovery import _extract_json, _safe_enum
+from app.agent.call_budget import CallBudget
 from app.agent.discovery_queue import DiscoveryQueue
+from app.agent.entity_resolution import EntityResolutionIndex
+from app.agent.prior_knowledge import PriorKnowledge
+from app.agent.queue_policies import get_policy
+from app.agent.stream_json import StreamingJSONParser
 from app.agent.prompts import L0_ORCHESTRATOR_SYSTEM, SECTOR_SCOPE_HEADER, DISCOVERY_OUTPUT_SCHEMA, build_expansion_prompt, build_sibling_context, resolve_jurisdiction_code, JURISDICTION_CITATION_HINTS, DOMAIN_CHAPTER_HINTS, _derive_domain_key
 from app.config import settings
 from app.llm.base import LLMProvider
@@ -61,6 +70,7 @@ from app.models.manifest import (
     SourceFormat,
     SourceType,
 )
+from app.tracing import span
 
 logger = logging.getLogger(__name__)
 
@@ -80,42 +90,127 @@ class EntityRegistry:
     have their ID rewritten to the canonical one before DB insertion or queue enqueue.
     An alias map (any_seen_id → canonical_id) lets source regulatory_body references
     be resolved even when the LLM returns a body reference by a non-canonical ID.
+
+    Names that differ only in spelling ("NJ Dept. of Banking & Insurance" vs
+    "New Jersey Department of Banking and Insurance") are folded onto the same
+    canonical ID by an ``EntityResolutionIndex`` when their similarity reaches
+    ``settings.entity_fuzzy_threshold`` (0 disables fuzzy matching). Each fold is
+    one queue node — and one expansion call — that the run no longer spends.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, fuzzy_threshold: float | None = None) -> None:
         self._name_to_canonical: dict[str, str] = {}  # key → canonical_id
         self._alias_to_canonical: dict[str, str] = {}  # any_seen_id → canonical_id
+        threshold = settings.entity_fuzzy_threshold if fuzzy_threshold is None else fuzzy_threshold
+        self._index = EntityResolutionIndex(threshold=threshold) if threshold > 0 else None
+        self.merges: list[dict] = []  # one entry per fuzzy-folded name variant
 
     def _key(self, entity: dict) -> str:
         jcode = (entity.get("jurisdiction_code") or "XX").upper()
         name = entity.get("name", "").lower().strip()
         return f"{jcode}:{name}"
 
-    def resolve(self, entity: dict) -> str:
-        """Return the canonical ID for entity, registering it on first sight."""
-        key = self._key(entity)
-        proposed_id = (
+    @staticmethod
+    def _proposed_id(entity: dict) -> str:
+        return (
             entity.get("id")
             or re.sub(r"[^a-z0-9]+", "-", entity.get("name", "unknown").lower()).strip("-")[:40]
         )
-        if key not in self._name_to_canonical:
-            self._name_to_canonical[key] = proposed_id
-            # Seed the alias map so the proposed ID resolves to itself
-            self._alias_to_canonical.setdefault(proposed_id, proposed_id)
-        canonical = self._name_to_canonical[key]
-        # Register any new alias (e.g. 'nj-dobi' when canonical is 'new-jersey-doi')
-        if proposed_id != canonical:
-            self._alias_to_canonical[proposed_id] = canonical
-        return canonical
+
+    def resolve(self, entity: dict) -> str:
+        """Return the canonical ID for entity, registering it on first sight."""
+        return self.resolve_many([entity])[0]
+
+    def resolve_many(self, entities: list[dict]) -> list[str]:
+        """Batch ``resolve()``: fuzzy scores for the whole batch come from two
+        matrix products (batch × index and batch × batch) instead of one
+        comparison per pair.
+        """
+        keys = [self._key(e) for e in entities]
+        jcodes = [k.split(":", 1)[0] for k in keys]
+        # Nameless entities share the key "XX:" — never fuzzy-match them
+        fuzzy = [bool(e.get("name", "").strip()) for e in entities]
+        new_keys = [k for k in keys if k not in self._name_to_canonical]
+        if self._index is not None and new_keys:
+            vecs = self._index.vectorize([e.get("name", "") for e in entities])
+            best, scores = self._index.query(vecs, jcodes)
+            intra = vecs @ vecs.T
+        batch_rows: list[int] = []  # rows of this batch added to the index
+
+        canonical_ids: list[str] = []
+        for i, entity in enumerate(entities):
+            key = keys[i]
+            proposed_id = self._proposed_id(entity)
+            if key not in self._name_to_canonical:
+                canonical = None
+                if self._index is not None and fuzzy[i]:
+                    match_id, score = None, 0.0
+                    if best[i] >= 0:
+                        match_id, score = self._index.label(int(best[i])), float(scores[i])
+                    for j in batch_rows:
+                        if jcodes[j] == jcodes[i] and float(intra[i, j]) > score:
+                            match_id, score = self._name_to_canonical[keys[j]], float(intra[i, j])
+                    if match_id is not None and score >= self._index.threshold:
+                        canonical = match_id
+                        self.merges.append({
+                            "name": entity.get("name", ""),
+                            "proposed_id": proposed_id,
+                            "canonical_id": canonical,
+                            "score": round(score, 3),
+                        })
+                if canonical is None:
+                    canonical = proposed_id
+                    if self._index is not None and fuzzy[i]:
+                        self._index.add(vecs[i], jcodes[i], canonical)
+                        batch_rows.append(i)
+                self._name_to_canonical[key] = canonical
+                # Seed the alias map so the canonical ID resolves to itself
+                self._alias_to_canonical.setdefault(canonical, canonical)
+            canonical = self._name_to_canonical[key]
+            # Register any new alias (e.g. 'nj-dobi' when canonical is 'new-jersey-doi')
+            if proposed_id != canonical:
+                self._alias_to_canonical[proposed_id] = canonical
+            canonical_ids.append(canonical)
+        return canonical_ids
 
     def rewrite(self, entity: dict) -> dict:
         """Return a copy of entity with id set to the canonical ID."""
         return {**entity, "id": self.resolve(entity)}
 
+    def rewrite_many(self, entities: list[dict]) -> list[dict]:
+        """Batch ``rewrite()`` — one vectorized resolution pass per LLM response."""
+        return [
+            {**entity, "id": canonical}
+            for entity, canonical in zip(entities, self.resolve_many(entities))
+        ]
+
     def resolve_id(self, entity_id: str) -> str:
         """Map any seen entity ID (including aliases) to the canonical ID."""
         return self._alias_to_canonical.get(entity_id, entity_id)
 
+    def assignments(self) -> dict[str, str]:
+        """Every name variant seen (``JCODE:name``) → its canonical ID.
+
+        Feed to ``app.eval.metrics.entity_resolution_quality`` with labelled
+        variants to measure merge precision/recall for a run.
+        """
+        return dict(self._name_to_canonical)
+
+    def stats(self) -> dict:
+        """Resolution counters for logging and the ``complete`` SSE event.
+
+        ``calls_saved`` counts name variants folded onto an existing node; each
+        would otherwise have been enqueued and expanded on its own.
+        """
+        return {
+            "canonical_entities": len(set(self._name_to_canonical.values())),
+            "name_variants": len(self._name_to_canonical),
+            "fuzzy_merges": len(self.merges),
+            "calls_saved": len(self.merges),
+            "fuzzy_threshold": self._index.threshold if self._index is not None else 0.0,
+            "merges": self.merges[:50],
+        }
+
 # region agent log
 _DEBUG_ENDPOINT = "http://127.0.0.1:7884/ingest/644327d9-ea5d-464a-b97e-a7bf1c844fd6"
 _DEBUG_SESSION = "cb8819"
@@ -147,6 +242,9 @@ def _debug_log(*, run_id: str, hypothesis_id: str, location: str, message: str,
         return
 # endregion
 
+# Top-level response arrays handed to on_element callbacks, in replay order
+_STREAMED_ARRAY_KEYS: tuple[str, ...] = ("sources", "programs", "administering_entities")
+
 # Confidence threshold below which items are flagged for human review
 L2_VERIFY_THRESHOLD = 0.6
 
@@ -256,7 +354,7 @@ class DiscoveryGraph:
         self.llm = llm
         self.db = db
         self.manifest_id = manifest_id
-        self._api_calls: int = 0
+        self.budget = CallBudget(settings.max_api_calls)
 
     async def run(
         self,
@@ -271,6 +369,8 @@ class DiscoveryGraph:
         seed_anchors: list[dict] | None = None,
         constitution_text: str = "",
         instruction_texts: list[str] | None = None,
+        prior: PriorKnowledge | None = None,
+        queue_policy: str | None = None,
     ) -> AsyncGenerator[dict, None]:
         """Execute V6 RLM BFS discovery, yielding SSE events.
 
@@ -280,6 +380,11 @@ class DiscoveryGraph:
                            Each text drives one full L1 sector pass; results are
                            merged before entering L2 BFS. Accepts a single item
                            for backward-compatible single-prompt runs.
+        prior: results of an earlier run or golden run (see prior_knowledge.py).
+               Seeds the registry and queue; L1 and any node expanded within
+               the TTL are replayed from it instead of calling the LLM.
+        queue_policy: L2 scheduling policy name (see queue_policies.py);
+                      defaults to settings.discovery_queue_policy.
         """
         _texts = [t.strip() for t in (instruction_texts or []) if t and t.strip()]
         if not _texts:
@@ -319,27 +424,39 @@ class DiscoveryGraph:
         queue_max_depth = min(k_depth - 1, settings.max_discovery_depth)
 
         # Initialize the discovery queue
-        queue = DiscoveryQueue(max_depth=queue_max_depth)
+        queue = DiscoveryQueue(
+            max_depth=queue_max_depth,
+            policy=get_policy(queue_policy or settings.discovery_queue_policy),
+        )
 
         # In-run entity ID registry — ensures consistent canonical IDs across all LLM calls
         registry = EntityRegistry()
+        if prior is not None:
+            # Prior canonical IDs win, so re-found entities keep their old IDs
+            registry.resolve_many(prior.entities)
 
         all_entities: list[dict] = []
         all_sources: list[dict] = []
         all_programs: list[dict] = []
         source_id_counter = 1
-        self._api_calls = 0
+        self.budget = CallBudget(max_api_calls)
+        run_started_at = datetime.now(UTC).isoformat()
+        reuse_l1 = prior is not None and prior.l1_is_fresh()
+        nodes_reused = 0
 
-        # ── L1: Serial Prompt Loop → Parallel Sector Discovery (seeds the queue) ─
+        # ── L1: Concurrent Prompt × Sector Discovery (seeds the queue) ─────
         l1_start_time = time.monotonic()
         log_stage("l1_sector_discovery", status="running", model=getattr(self.llm, "model", ""), manifest_id=self.manifest_id)
-        async for event in self._run_l1_prompts(
-            sectors=_sectors,
-            instruction_texts=_texts,
-            sector_concurrency=sector_concurrency,
-            max_entities_per_sector=max_entities_per_sector,
-            max_api_calls=max_api_calls,
-        ):
+        if reuse_l1:
+            l1_events = self._replay_l1(prior)
+        else:
+            l1_events = self._run_l1_prompts(
+                sectors=_sectors,
+                instruction_texts=_texts,
+                sector_concurrency=sector_concurrency,
+                max_entities_per_sector=max_entities_per_sector,
+            )
+        async for event in l1_events:
             if event.get("event") == "_l1_sector_result":
                 # Internal event — harvest entities, sources, and programs
                 data = event.get("data", {})
@@ -361,8 +478,7 @@ class DiscoveryGraph:
                     all_programs.append(prog)
 
                 # Seed the queue with discovered entities for L2+ expansion
-                for entity in sector_entities:
-                    entity = registry.rewrite(entity)
+                for entity in registry.rewrite_many(sector_entities):
                     entity_id = entity["id"]
                     queue.enqueue(
                         target_type="entity",
@@ -375,6 +491,20 @@ class DiscoveryGraph:
             else:
                 yield event
 
+        if prior is not None:
+            # Prior entities the L1 pass did not re-find still enter the BFS
+            for entity in registry.rewrite_many(prior.entities):
+                if queue.enqueue(
+                    target_type="entity",
+                    target_id=entity["id"],
+                    priority=entity.get("priority", 10),
+                    discovered_from=f"prior:{prior.origin}",
+                    depth=1,
+                    metadata=entity,
+                ):
+                    all_entities.append(entity)
+            all_programs.extend(dict(p) for p in prior.programs)
+
         # Persist L1 entities as RegulatoryBody records (dedup by canonical ID via registry)
         seen_entity_ids: set[str] = set()
         for entity in all_entities:
@@ -417,11 +547,21 @@ class DiscoveryGraph:
                     or float(src_data.get("confidence", 0.5) or 0.5) < 0.5
                 ),
                 classification_tags=src_data.get("classification_tags", []),
+                relationships={"discovered_at": src_data.get("discovered_at") or run_started_at},
                 citation=src_data.get("citation") or src_data.get("name"),
                 depth_hint=(src_data.get("depth_hint") or "").strip().lower() or None,
             ))
 
         manifest = await self.db.get(Manifest, self.manifest_id)
+        if isinstance(manifest.run_params, dict):
+            # Age of the L1 entity list, carried forward while it is being reused
+            manifest.run_params = {
+                **manifest.run_params,
+                "l1_discovered_at": (
+                    prior.l1_discovered_at.isoformat() if reuse_l1 else run_started_at
+                ),
+                "reused_from": prior.origin if prior is not None else None,
+            }
 
         await self.db.commit()
 
@@ -435,15 +575,15 @@ class DiscoveryGraph:
                           total_entities=len(all_entities),
                           total_sources=len(all_sources),
                           sector_count=len(_sectors),
-                          api_calls=self._api_calls,
-                          queue_stats=queue.stats())
+                          api_calls=self.budget.used,
+                          queue_stats=self._queue_stats(queue))
 
         # Write L1 boundary checkpoint so a resume can skip L1 entirely
         yield await self._write_checkpoint(
             queue=queue,
             checkpoint_type="l1_boundary",
             batch_n=0,
-            api_calls_used=self._api_calls,
+            api_calls_used=self.budget.used,
         )
 
         # Inject seed anchors that weren't already queued from L1.
@@ -455,6 +595,9 @@ class DiscoveryGraph:
             )
             if not anchor_id:
                 continue
+            if anchor.get("name"):
+                # Fold anchors onto an L1 entity with a variant spelling of the same name
+                anchor_id = registry.resolve({**anchor, "id": anchor_id})
             queue.enqueue(
                 target_type="entity",
                 target_id=anchor_id,
@@ -472,7 +615,8 @@ class DiscoveryGraph:
 
         logger.info(
             "[graph v6] L1 done — k_depth=%d queue_empty=%s queue_size=%d entities=%d api_calls=%d queue_stats=%s",
-            k_depth, queue.is_empty(), queue.size(), len(all_entities), self._api_calls, queue.stats(),
+            k_depth, queue.is_empty(), queue.size(), len(all_entities), self.budget.used,
+            queue.stats(),
         )
 
         if k_depth < 2 or queue.is_empty():
@@ -517,8 +661,12 @@ class DiscoveryGraph:
                               manifest_id=self.manifest_id,
                               total_entities=len(all_entities),
                               total_programs=len(deduped),
-                              api_calls=self._api_calls,
-                              queue_stats=queue.stats(),
+                              api_calls=self.budget.used,
+                              queue_stats=self._queue_stats(queue),
+                              entity_resolution=registry.stats(),
+                              reuse=None if prior is None else {
+                                  **prior.summary(), "l1_reused": reuse_l1,
+                              },
                               coverage_summary=coverage_summary)
             return
 
@@ -529,16 +677,133 @@ class DiscoveryGraph:
         entity_total = queue.size()
         l2_seen_source_ids: set[str] = set()
 
-        while not queue.is_empty():
-            # Pace outgoing LLM calls to stay within Gemini RPM quota
-            if settings.l2_sleep_between_calls > 0:
-                await asyncio.sleep(settings.l2_sleep_between_calls)
+        def _accept_l2_source(src: dict, item, node: dict) -> bool:
+            """Persist one expansion source; enqueue it when its depth_hint allows.
+
+            Returns True if the source was enqueued as a child node.
+            """
+            nonlocal source_id_counter
+            node_id = item.target_id
+            node_type = item.target_type
+            # Prefix source ID with node_id to prevent PK collisions when
+            # multiple nodes return sources with the same LLM-generated ID.
+            src.setdefault("id", f"src-{source_id_counter:03d}")
+            source_id_counter += 1
+            raw_sid = src["id"]
+            sid = f"{node_id}__{raw_sid}"
+            src["id"] = sid
+            if sid in l2_seen_source_ids:
+                logger.debug("[graph v6] L2 skipping duplicate source %s", sid)
+                return False
+            l2_seen_source_ids.add(sid)
+            all_sources.append(src)
+            self.db.add(Source(
+                id=src["id"],
+                manifest_id=self.manifest_id,
+                name=src.get("name", "Unknown Source"),
+                regulatory_body_id=registry.resolve_id(src.get("regulatory_body", "")),
+                type=_safe_enum(SourceType, src.get("type")),
+                format=_safe_enum(SourceFormat, src.get("format")),
+                authority=_safe_enum(AuthorityLevel, src.get("authority")),
+                jurisdiction=_safe_enum(Jurisdiction, src.get("jurisdiction")),
+                url=src.get("url", ""),
+                access_method=_safe_enum(AccessMethod, src.get("access_method")),
+                confidence=float(src.get("confidence", 0.5) or 0.5),
+                needs_human_review=bool(
+                    src.get("needs_human_review", False)
+                    or float(src.get("confidence", 0.5) or 0.5) < 0.5
+                ),
+                classification_tags=src.get("classification_tags", []),
+                relationships={"discovered_at": src.get("discovered_at") or run_started_at},
+                citation=src.get("citation") or src.get("name"),
+                depth_hint=(src.get("depth_hint") or "").strip().lower() or None,
+            ))
+
+            # ALGO-012: Enqueue source nodes for deeper BFS traversal based on depth_hint.
+            # depth_hint returned by the LLM classifies each source's depth level.
+            # 'title' and 'chapter' nodes become queue items for further expansion.
+            # 'section' nodes are queued only if we have depth remaining.
+            # 'leaf' nodes are persisted only — no further expansion.
+            depth_hint = (src.get("depth_hint") or "").strip().lower()
+            child_node_type = {
+                "title": "source_title",
+                "chapter": "source_chapter",
+                "section": "source_section",
+            }.get(depth_hint)
+
+            if not child_node_type or item.depth + 1 > queue.max_depth:
+                return False
+            # Build a metadata dict for the source node so the next
+            # expansion call has name, url, citation, jurisdiction context
+            src_meta = {
+                "id": sid,
+                "name": src.get("name", ""),
+                "url": src.get("url", ""),
+                "citation": src.get("citation") or src.get("name", ""),
+                "type": src.get("type", ""),
+                "jurisdiction_code": (
+                    src.get("jurisdiction_code") or node.get("jurisdiction_code", "")
+                ),
+                "citation_format_hint": (
+                    src.get("citation_format_hint") or node.get("citation_format_hint", "")
+                ),
+                "regulatory_body": src.get("regulatory_body", node_id),
+                "sector_key": node.get("sector_key", ""),
+                "depth_hint": depth_hint,
+            }
+            return queue.enqueue(
+                target_type=child_node_type,
+                target_id=sid,
+                priority=item.priority + 1,
+                discovered_from=f"{node_type}:{node_id}",
+                depth=item.depth + 1,
+                metadata=src_meta,
+            )
 
+        def _accept_l2_program(prog: dict, item) -> None:
+            """Collect one expansion program with provenance."""
+            prog.setdefault("provenance_links", {})
+            prog["provenance_links"]["discovery_level"] = f"L{item.depth + 1}"
+            prog["provenance_links"]["discovered_from"] = item.discovered_from
+            all_programs.append(prog)
+
+        def _accept_sub_entity(sub_entity: dict, item, node: dict) -> bool:
+            """Enqueue and persist one sub-entity (RLM recursion). Returns True if enqueued."""
+            sub_entity = registry.rewrite(sub_entity)
+            sub_id = sub_entity["id"]
+            sub_entity.setdefault("sector_key", node.get("sector_key", ""))
+            added = queue.enqueue(
+                target_type="entity",
+                target_id=sub_id,
+                priority=sub_entity.get("priority", item.priority + 1),
+                discovered_from=f"entity:{item.target_id}",
+                depth=item.depth + 1,
+                metadata=sub_entity,
+            )
+            if added:
+                all_entities.append(sub_entity)
+                # Persist sub-entity
+                self.db.add(RegulatoryBody(
+                    id=sub_id,
+                    manifest_id=self.manifest_id,
+                    name=sub_entity.get("name", "Unknown Entity"),
+                    jurisdiction=_safe_enum(Jurisdiction, sub_entity.get("jurisdiction")),
+                    jurisdiction_code=sub_entity.get("jurisdiction_code") or None,
+                    authority_type=_safe_enum(
+                        AuthorityType,
+                        sub_entity.get("authority_type") or sub_entity.get("entity_type"),
+                    ),
+                    url=sub_entity.get("url", ""),
+                    governs=sub_entity.get("governs", []),
+                ))
+            return added
+
+        while not queue.is_empty():
             # Safety cap: stop if we've hit the API call limit
-            if self._api_calls >= max_api_calls:
+            if self.budget.exhausted:
                 logger.warning(
                     "[graph v6] API call limit reached (%d/%d) — stopping queue expansion",
-                    self._api_calls, max_api_calls,
+                    self.budget.used, self.budget.limit,
                 )
                 break
 
@@ -551,6 +816,17 @@ class DiscoveryGraph:
             node_id = item.target_id
             node_name = node.get("name", node_id)
             node_type = item.target_type  # "entity" | "source_title" | "source_chapter" | "source_section"
+            reused = prior is not None and prior.node_is_fresh(node_id)
+            if not reused and not self.budget.try_reserve("l2"):
+                logger.warning(
+                    "[graph v6] API call limit reached (%d/%d) — stopping queue expansion",
+                    self.budget.used, self.budget.limit,
+                )
+                break
+
+            # Pace outgoing LLM calls to stay within Gemini RPM quota
+            if not reused and settings.l2_sleep_between_calls > 0:
+                await asyncio.sleep(settings.l2_sleep_between_calls)
 
             yield self._event("entity_expansion_start",
                               entity_id=node_id,
@@ -564,126 +840,38 @@ class DiscoveryGraph:
                               jurisdiction_code=node.get("jurisdiction_code", ""),
                               )
 
-            try:
-                result = await asyncio.wait_for(
-                    self._expand_node(node=node, node_type=node_type, depth=item.depth),
-                    timeout=180.0,
-                )
-                self._api_calls += 1
-
-                programs = result.get("programs", [])
-                sources = result.get("sources", [])
-                sub_entities = result.get("administering_entities", [])
+            # Each element is persisted/enqueued the moment it is parsed — while
+            # the response is still streaming when discovery_stream_json is on.
+            found: Counter[str] = Counter()
+
+            def _on_element(key: str, element, item=item, node=node, found=found) -> None:
+                if not isinstance(element, dict):
+                    return
+                if key == "sources":
+                    found["sources"] += 1
+                    if _accept_l2_source(element, item, node):
+                        found["children"] += 1
+                elif key == "programs":
+                    found["programs"] += 1
+                    _accept_l2_program(element, item)
+                elif key == "administering_entities":
+                    if _accept_sub_entity(element, item, node):
+                        found["children"] += 1
 
-                # Persist sources from this expansion.
-                # Prefix source ID with node_id to prevent PK collisions when
-                # multiple nodes return sources with the same LLM-generated ID.
-                enqueued_source_children = 0
-                for src in sources:
-                    src.setdefault("id", f"src-{source_id_counter:03d}")
-                    source_id_counter += 1
-                    raw_sid = src["id"]
-                    sid = f"{node_id}__{raw_sid}"
-                    src["id"] = sid
-                    if sid in l2_seen_source_ids:
-                        logger.debug("[graph v6] L2 skipping duplicate source %s", sid)
-                        continue
-                    l2_seen_source_ids.add(sid)
-                    all_sources.append(src)
-                    self.db.add(Source(
-                        id=src["id"],
-                        manifest_id=self.manifest_id,
-                        name=src.get("name", "Unknown Source"),
-                        regulatory_body_id=registry.resolve_id(src.get("regulatory_body", "")),
-                        type=_safe_enum(SourceType, src.get("type")),
-                        format=_safe_enum(SourceFormat, src.get("format")),
-                        authority=_safe_enum(AuthorityLevel, src.get("authority")),
-                        jurisdiction=_safe_enum(Jurisdiction, src.get("jurisdiction")),
-                        url=src.get("url", ""),
-                        access_method=_safe_enum(AccessMethod, src.get("access_method")),
-                        confidence=float(src.get("confidence", 0.5) or 0.5),
-                        needs_human_review=bool(
-                            src.get("needs_human_review", False)
-                            or float(src.get("confidence", 0.5) or 0.5) < 0.5
+            try:
+                if reused:
+                    # Expanded within the TTL by a prior run — replay its children
+                    for child in prior.children_of(node_id):
+                        _on_element("sources", child)
+                    nodes_reused += 1
+                else:
+                    await asyncio.wait_for(
+                        self._expand_node(
+                            node=node, node_type=node_type, depth=item.depth,
+                            on_element=_on_element,
                         ),
-                        classification_tags=src.get("classification_tags", []),
-                        citation=src.get("citation") or src.get("name"),
-                        depth_hint=(src.get("depth_hint") or "").strip().lower() or None,
-                    ))
-
-                    # ALGO-012: Enqueue source nodes for deeper BFS traversal based on depth_hint.
-                    # depth_hint returned by the LLM classifies each source's depth level.
-                    # 'title' and 'chapter' nodes become queue items for further expansion.
-                    # 'section' nodes are queued only if we have depth remaining.
-                    # 'leaf' nodes are persisted only — no further expansion.
-                    depth_hint = (src.get("depth_hint") or "").strip().lower()
-                    child_node_type = {
-                        "title": "source_title",
-                        "chapter": "source_chapter",
-                        "section": "source_section",
-                    }.get(depth_hint)
-
-                    if child_node_type and item.depth + 1 <= queue.max_depth:
-                        # Build a metadata dict for the source node so the next
-                        # expansion call has name, url, citation, jurisdiction context
-                        src_meta = {
-                            "id": sid,
-                            "name": src.get("name", ""),
-                            "url": src.get("url", ""),
-                            "citation": src.get("citation") or src.get("name", ""),
-                            "type": src.get("type", ""),
-                            "jurisdiction_code": src.get("jurisdiction_code") or node.get("jurisdiction_code", ""),
-                            "citation_format_hint": src.get("citation_format_hint") or node.get("citation_format_hint", ""),
-                            "regulatory_body": src.get("regulatory_body", node_id),
-                            "sector_key": node.get("sector_key", ""),
-                            "depth_hint": depth_hint,
-                        }
-                        added_src = queue.enqueue(
-                            target_type=child_node_type,
-                            target_id=sid,
-                            priority=item.priority + 1,
-                            discovered_from=f"{node_type}:{node_id}",
-                            depth=item.depth + 1,
-                            metadata=src_meta,
-                        )
-                        if added_src:
-                            enqueued_source_children += 1
-
-                # Collect programs with provenance
-                for prog in programs:
-                    prog.setdefault("provenance_links", {})
-                    prog["provenance_links"]["discovery_level"] = f"L{item.depth + 1}"
-                    prog["provenance_links"]["discovered_from"] = item.discovered_from
-                    all_programs.append(prog)
-
-                # Enqueue sub-entities for deeper expansion (RLM recursion)
-                enqueued_children = enqueued_source_children
-                for sub_entity in sub_entities:
-                    sub_entity = registry.rewrite(sub_entity)
-                    sub_id = sub_entity["id"]
-                    sub_entity.setdefault("sector_key", node.get("sector_key", ""))
-                    added = queue.enqueue(
-                        target_type="entity",
-                        target_id=sub_id,
-                        priority=sub_entity.get("priority", item.priority + 1),
-                        discovered_from=f"entity:{node_id}",
-                        depth=item.depth + 1,
-                        metadata=sub_entity,
+                        timeout=180.0,
                     )
-                    if added:
-                        enqueued_children += 1
-                        all_entities.append(sub_entity)
-                        # Persist sub-entity
-                        self.db.add(RegulatoryBody(
-                            id=sub_id,
-                            manifest_id=self.manifest_id,
-                            name=sub_entity.get("name", "Unknown Entity"),
-                            jurisdiction=_safe_enum(Jurisdiction, sub_entity.get("jurisdiction")),
-                            jurisdiction_code=sub_entity.get("jurisdiction_code") or None,
-                            authority_type=_safe_enum(AuthorityType, sub_entity.get("authority_type") or sub_entity.get("entity_type")),
-                            url=sub_entity.get("url", ""),
-                            governs=sub_entity.get("governs", []),
-                        ))
 
                 # Update total for SSE progress reporting
                 entity_total = entity_n + queue.size()
@@ -695,11 +883,19 @@ class DiscoveryGraph:
                                   entity_total=entity_total,
                                   depth=item.depth,
                                   node_type=node_type,
-                                  programs_found=len(programs),
-                                  sources_found=len(sources),
-                                  children_enqueued=enqueued_children,
+                                  programs_found=found["programs"],
+                                  sources_found=found["sources"],
+                                  children_enqueued=found["children"],
                                   queue_pending=queue.size(),
-                                  api_calls=self._api_calls)
+                                  reused=reused,
+                                  api_calls=self.budget.used)
+                queue.record(
+                    item,
+                    sources=found["sources"],
+                    new_sources=found["children"],
+                    programs=found["programs"],
+                    api_calls=0 if reused else 1,
+                )
 
                 # Heartbeat every 30s during long expansion phases
                 elapsed = time.monotonic() - l2_start_time
@@ -719,12 +915,12 @@ class DiscoveryGraph:
                         queue=queue,
                         checkpoint_type="l2_batch",
                         batch_n=batch_n,
-                        api_calls_used=self._api_calls,
+                        api_calls_used=self.budget.used,
                     )
 
             except Exception as exc:
                 await self.db.rollback()
-                self._api_calls += 1
+                queue.record(item, api_calls=0 if reused else 1)
                 logger.warning("[graph v6] node expansion failed for '%s' (type=%s): %s",
                                node_name, node_type, exc)
                 yield self._event("entity_expansion_complete",
@@ -736,7 +932,7 @@ class DiscoveryGraph:
                                   status="failed",
                                   error=str(exc),
                                   programs_found=0,
-                                  api_calls=self._api_calls)
+                                  api_calls=self.budget.used)
 
         # Dedup programs
         deduped = self._dedupe_programs(all_programs)
@@ -806,15 +1002,29 @@ class DiscoveryGraph:
             sources=len(all_sources), programs=len(deduped),
             manifest_id=self.manifest_id,
         )
+        curve = queue.yield_curve()
+        if curve:
+            logger.info(
+                "[graph v6] queue policy=%s yield: %d sources (%d new), %d programs over %d calls",
+                queue.policy.name, curve[-1]["sources"], curve[-1]["new_sources"],
+                curve[-1]["programs"], curve[-1]["api_calls"],
+            )
         yield self._event("complete",
                           manifest_id=self.manifest_id,
                           total_entities=len(all_entities),
                           total_sources=len(all_sources),
                           total_programs=len(deduped),
-                          api_calls=self._api_calls,
+                          api_calls=self.budget.used,
                           coverage_score=assessment.completeness_score,
                           coverage_summary=coverage_summary,
-                          queue_stats=queue.stats(),
+                          queue_stats=self._queue_stats(queue),
+                          entity_resolution=registry.stats(),
+                          reuse=None if prior is None else {
+                              **prior.summary(),
+                              "l1_reused": reuse_l1,
+                              "nodes_reused": nodes_reused,
+                              "nodes_expanded": entity_n - nodes_reused,
+                          },
                           seed_recovery_count=total_seed_recovery,
                           seed_recovery_rate=seed_recovery_rate,
                           seed_match_rate_by_topic={
@@ -851,7 +1061,7 @@ class DiscoveryGraph:
         all_programs: list[dict] = []
         source_id_counter = 1
         l2_seen_source_ids: set[str] = set()
-        self._api_calls = 0
+        self.budget = CallBudget(max_api_calls)
 
         yield self._event("resume_start",
                           manifest_id=self.manifest_id,
@@ -872,15 +1082,16 @@ class DiscoveryGraph:
             if settings.l2_sleep_between_calls > 0:
                 await asyncio.sleep(settings.l2_sleep_between_calls)
 
-            if self._api_calls >= max_api_calls:
+            if not self.budget.try_reserve("l2_resume"):
                 logger.warning(
                     "[graph v6 resume] API call limit reached (%d/%d) — stopping",
-                    self._api_calls, max_api_calls,
+                    self.budget.used, self.budget.limit,
                 )
                 break
 
             item = queue.pop()
             if item is None:
+                self.budget.release("l2_resume")
                 break
 
             entity_n += 1
@@ -905,7 +1116,6 @@ class DiscoveryGraph:
                     self._expand_node(node=node, node_type=node_type, depth=item.depth),
                     timeout=180.0,
                 )
-                self._api_calls += 1
 
                 programs = result.get("programs", [])
                 sources = result.get("sources", [])
@@ -976,7 +1186,13 @@ class DiscoveryGraph:
                                   sources_found=len(sources),
                                   children_enqueued=enqueued_children,
                                   queue_pending=queue.size(),
-                                  api_calls=self._api_calls)
+                                  api_calls=self.budget.used)
+                queue.record(
+                    item,
+                    sources=len(sources),
+                    new_sources=enqueued_children,
+                    programs=len(programs),
+                )
 
                 elapsed = time.monotonic() - l2_start_time
                 if elapsed > 30 and entity_n % 3 == 0:
@@ -994,12 +1210,12 @@ class DiscoveryGraph:
                         queue=queue,
                         checkpoint_type="l2_batch",
                         batch_n=batch_n,
-                        api_calls_used=self._api_calls,
+                        api_calls_used=self.budget.used,
                     )
 
             except Exception as exc:
                 await self.db.rollback()
-                self._api_calls += 1
+                queue.record(item)
                 logger.warning("[graph v6 resume] node expansion failed for '%s': %s", node_name, exc)
                 yield self._event("entity_expansion_complete",
                                   entity_id=node_id,
@@ -1010,7 +1226,7 @@ class DiscoveryGraph:
                                   status="failed",
                                   error=str(exc),
                                   programs_found=0,
-                                  api_calls=self._api_calls)
+                                  api_calls=self.budget.used)
 
         # Dedup and persist new programs discovered during resume
         deduped = self._dedupe_programs(all_programs)
@@ -1065,11 +1281,23 @@ class DiscoveryGraph:
         yield self._event("complete",
                           manifest_id=self.manifest_id,
                           total_programs=len(deduped),
-                          api_calls=self._api_calls,
-                          queue_stats=queue.stats(),
+                          api_calls=self.budget.used,
+                          queue_stats=self._queue_stats(queue),
                           resumed=True)
 
-    # ── L1: Serial Prompt Loop ────────────────────────────────────────────
+    # ── L1: Concurrent Prompt × Sector Calls ──────────────────────────────
+
+    async def _replay_l1(self, prior: PriorKnowledge) -> AsyncGenerator[dict, None]:
+        """Stand in for ``_run_l1_prompts`` with a prior run's L1 results."""
+        logger.info("[graph v6] L1 reused from %s — skipping sector calls", prior.origin)
+        yield self._event("l1_reused", **prior.summary())
+        yield {"event": "_l1_sector_result", "data": {
+            "sector_key": "prior",
+            "administering_entities": [dict(e) for e in prior.entities],
+            # Only L1 sources; expansion sources are replayed per node in L2
+            "sources": [dict(s) for s in prior.sources if "__" not in s["id"]],
+            "programs": [],
+        }}
 
     async def _run_l1_prompts(
         self,
@@ -1077,157 +1305,175 @@ class DiscoveryGraph:
         instruction_texts: list[str],
         sector_concurrency: int = 3,
         max_entities_per_sector: int = 200,
-        max_api_calls: int = 200,
     ) -> AsyncGenerator[dict, None]:
-        """Loop over instruction_texts serially, running a full sector pass per prompt.
-
-        Yields all SSE events from each pass. The caller's seen_entity_ids / seen_source_ids
-        sets (in run()) handle dedup across passes — no extra logic needed here.
+        """Run every (prompt, sector) L1 call concurrently, yielding SSE events.
+
+        All prompts share one pool of ``sector_concurrency`` slots, and each call
+        reserves from ``self.budget`` when it gets a slot; calls the budget can
+        no longer cover are skipped. Progress events stream as calls finish,
+        but ``_l1_sector_result`` events are released in (prompt, sector) order
+        so entity registration — and with it canonical IDs — does not depend on
+        which call returned first. The caller's seen_entity_ids / seen_source_ids
+        sets (in run()) handle dedup across passes.
         """
         total_prompts = len(instruction_texts)
-        for idx, instruction_text in enumerate(instruction_texts):
-            prompt_n = idx + 1
-            yield self._event(
-                "prompt_start",
-                prompt_n=prompt_n,
-                prompt_total=total_prompts,
-            )
-            logger.info(
-                "[graph v6] L1 prompt %d/%d starting",
-                prompt_n, total_prompts,
-            )
-            async for event in self._run_l1_sectors(
-                sectors=sectors,
-                instruction_text=instruction_text,
-                sector_concurrency=sector_concurrency,
-                max_entities_per_sector=max_entities_per_sector,
-                max_api_calls=max_api_calls,
-            ):
-                yield event
-            yield self._event(
-                "prompt_complete",
-                prompt_n=prompt_n,
-                prompt_total=total_prompts,
-            )
-            logger.info(
-                "[graph v6] L1 prompt %d/%d complete",
-                prompt_n, total_prompts,
-            )
-
-    # ── L1: Parallel Sector Calls ─────────────────────────────────────────
-
-    async def _run_l1_sectors(
-        self,
-        sectors: list[dict],
-        instruction_text: str,
-        sector_concurrency: int = 3,
-        max_entities_per_sector: int = 200,
-        max_api_calls: int = 200,
-    ) -> AsyncGenerator[dict, None]:
-        """Run all sector calls, yielding SSE events and internal result events."""
         total = len(sectors)
+        jobs = [(p, s) for p in range(total_prompts) for s in range(total)]
+        # (job index, event); a None event marks the job as finished
+        events: asyncio.Queue[tuple[int, dict | None]] = asyncio.Queue()
+        slots = asyncio.Semaphore(max(sector_concurrency, 1))
+        budget_warned = False
+
+        async def _run_job(idx: int, prompt_idx: int, sector_idx: int) -> None:
+            nonlocal budget_warned
+            sector = sectors[sector_idx]
+            try:
+                async with slots:
+                    if not self.budget.try_reserve("l1"):
+                        if not budget_warned:
+                            budget_warned = True
+                            logger.warning(
+                                "[graph v6] API call limit reached (%d/%d)"
+                                " — skipping remaining sectors",
+                                self.budget.used, self.budget.limit,
+                            )
+                        return
+                    await events.put((idx, self._event(
+                        "sector_start",
+                        sector_key=sector["key"],
+                        sector_label=sector["label"],
+                        sector_n=sector.get("priority", sector_idx + 1),
+                        sector_total=total,
+                        prompt_n=prompt_idx + 1,
+                    )))
+                    try:
+                        result: dict | Exception = await self._discover_sector(
+                            sector=sector,
+                            instruction_text=instruction_texts[prompt_idx],
+                            sector_n=sector.get("priority", sector_idx + 1),
+                            sector_total=total,
+                        )
+                    except Exception as exc:
+                        result = exc
+                for event in self._l1_sector_events(sector, result, max_entities_per_sector):
+                    await events.put((idx, event))
+            finally:
+                await events.put((idx, None))
+
+        for prompt_idx in range(total_prompts):
+            yield self._event("prompt_start", prompt_n=prompt_idx + 1, prompt_total=total_prompts)
+        logger.info("[graph v6] L1 starting — prompts=%d sectors=%d concurrency=%d",
+                    total_prompts, total, sector_concurrency)
+
+        tasks = [asyncio.create_task(_run_job(idx, p, s)) for idx, (p, s) in enumerate(jobs)]
+        held: dict[int, dict | None] = {}
+        prompt_pending = [total] * total_prompts
+        next_release = 0
+        finished = 0
+        try:
+            while finished < len(jobs):
+                idx, event = await events.get()
+                if event is not None and event["event"] != "_l1_sector_result":
+                    yield event
+                    continue
+                if event is not None:
+                    held[idx] = event
+                    continue
+                finished += 1
+                held.setdefault(idx, None)
+                while next_release in held:
+                    result_event = held.pop(next_release)
+                    if result_event is not None:
+                        yield result_event
+                    prompt_idx = next_release // total
+                    prompt_pending[prompt_idx] -= 1
+                    if prompt_pending[prompt_idx] == 0:
+                        yield self._event("prompt_complete",
+                                          prompt_n=prompt_idx + 1,
+                                          prompt_total=total_prompts)
+                        logger.info("[graph v6] L1 prompt %d/%d complete",
+                                    prompt_idx + 1, total_prompts)
+                    next_release += 1
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    # ── L1: Sector Call Results ───────────────────────────────────────────
+
+    def _l1_sector_events(
+        self,
+        sector: dict,
+        result: dict | Exception,
+        max_entities_per_sector: int,
+    ) -> list[dict]:
+        """SSE and internal result events for one finished sector call."""
+        if isinstance(result, Exception):
+            # region agent log
+            _debug_log(
+                run_id="v6",
+                hypothesis_id="H1",
+                location="graph_discovery.py:_l1_sector_events",
+                message="sector_task_exception",
+                data={
+                    "sector_key": sector.get("key", ""),
+                    "sector_label": sector.get("label", ""),
+                    "exc_type": type(result).__name__,
+                    "exc_message": str(result),
+                },
+            )
+            # endregion
+            error_desc = str(result) or f"{type(result).__name__} (no message)"
+            logger.warning("[graph v6] sector '%s' failed: %s", sector["key"], error_desc)
+            return [
+                self._event("sector_complete",
+                            sector_key=sector["key"],
+                            sector_label=sector["label"],
+                            status="failed",
+                            error=error_desc,
+                            entities_found=0),
+                # Empty result so the aggregation loop still works
+                {"event": "_l1_sector_result", "data": {
+                    "sector_key": sector["key"],
+                    "administering_entities": [],
+                    "sources": [],
+                }},
+            ]
 
-        # Run in batches of sector_concurrency to respect API rate limits
-        for batch_start in range(0, total, sector_concurrency):
-            # Safety cap check before launching batch
-            if self._api_calls >= max_api_calls:
-                logger.warning(
-                    "[graph v6] API call limit reached (%d/%d) — skipping remaining sectors",
-                    self._api_calls, max_api_calls,
-                )
-                break
+        entities = result.get("administering_entities", [])
+        sources = result.get("sources", [])
 
-            batch = sectors[batch_start:batch_start + sector_concurrency]
-
-            # Yield sector_start events before launching batch
-            for sector in batch:
-                yield self._event("sector_start",
-                                  sector_key=sector["key"],
-                                  sector_label=sector["label"],
-                                  sector_n=sector.get("priority", batch_start + 1),
-                                  sector_total=total)
-
-            # Run batch in parallel
-            tasks = [
-                self._discover_sector(
-                    sector=sector,
-                    instruction_text=instruction_text,
-                    sector_n=sector.get("priority", idx + 1),
-                    sector_total=total,
-                )
-                for idx, sector in enumerate(batch)
-            ]
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-            self._api_calls += len(batch)
-
-            for sector, result in zip(batch, results):
-                if isinstance(result, Exception):
-                    # region agent log
-                    _debug_log(
-                        run_id="v6",
-                        hypothesis_id="H1",
-                        location="graph_discovery.py:_run_l1_sectors",
-                        message="sector_task_exception",
-                        data={
-                            "sector_key": sector.get("key", ""),
-                            "sector_label": sector.get("label", ""),
-                            "exc_type": type(result).__name__,
-                            "exc_message": str(result),
-                        },
-                    )
-                    # endregion
-                    error_desc = str(result) or f"{type(result).__name__} (no message)"
-                    logger.warning("[graph v6] sector '%s' failed: %s", sector["key"], error_desc)
-                    yield self._event("sector_complete",
-                                      sector_key=sector["key"],
-                                      sector_label=sector["label"],
-                                      status="failed",
-                                      error=error_desc,
-                                      entities_found=0)
-                    # Yield empty result so aggregation loop still works
-                    yield {"event": "_l1_sector_result", "data": {
-                        "sector_key": sector["key"],
-                        "administering_entities": [],
-                        "sources": [],
-                    }}
-                else:
-                    entities = result.get("administering_entities", [])
-                    sources = result.get("sources", [])
-
-                    # Enforce per-sector entity cap
-                    if len(entities) > max_entities_per_sector:
-                        logger.warning(
-                            "[graph v6] sector '%s' returned %d entities, capping at %d",
-                            sector["key"], len(entities), max_entities_per_sector,
-                        )
-                        entities = entities[:max_entities_per_sector]
-                    elif len(entities) > int(max_entities_per_sector * 0.8):
-                        logger.warning(
-                            "[graph v6] sector '%s' returned %d entities — near cap (%d); "
-                            "results may be truncated if LLM returns more in future runs",
-                            sector["key"], len(entities), max_entities_per_sector,
-                        )
+        # Enforce per-sector entity cap
+        if len(entities) > max_entities_per_sector:
+            logger.warning(
+                "[graph v6] sector '%s' returned %d entities, capping at %d",
+                sector["key"], len(entities), max_entities_per_sector,
+            )
+            entities = entities[:max_entities_per_sector]
+        elif len(entities) > int(max_entities_per_sector * 0.8):
+            logger.warning(
+                "[graph v6] sector '%s' returned %d entities — near cap (%d); "
+                "results may be truncated if LLM returns more in future runs",
+                sector["key"], len(entities), max_entities_per_sector,
+            )
 
-                    logger.info(
-                        "[graph v6] sector '%s' OK — entities=%d programs=%d sources=%d",
-                        sector["key"], len(entities), len(result.get("programs", [])), len(sources),
-                    )
-                    yield self._event("sector_complete",
-                                      sector_key=sector["key"],
-                                      sector_label=sector["label"],
-                                      status="complete",
-                                      entities_found=len(entities),
-                                      programs_found=len(result.get("programs", [])))
-                    yield {"event": "_l1_sector_result", "data": {
-                        "sector_key": sector["key"],
-                        "administering_entities": entities,
-                        "sources": sources,
-                        "programs": result.get("programs", []),
-                    }}
-
-            # Brief pause between batches to avoid rate limit spikes
-            if batch_start + sector_concurrency < total:
-                await asyncio.sleep(1.0)
+        logger.info(
+            "[graph v6] sector '%s' OK — entities=%d programs=%d sources=%d",
+            sector["key"], len(entities), len(result.get("programs", [])), len(sources),
+        )
+        return [
+            self._event("sector_complete",
+                        sector_key=sector["key"],
+                        sector_label=sector["label"],
+                        status="complete",
+                        entities_found=len(entities),
+                        programs_found=len(result.get("programs", []))),
+            {"event": "_l1_sector_result", "data": {
+                "sector_key": sector["key"],
+                "administering_entities": entities,
+                "sources": sources,
+                "programs": result.get("programs", []),
+            }},
+        ]
 
     async def _discover_sector(
         self,
@@ -1283,8 +1529,8 @@ class DiscoveryGraph:
         )
 
         try:
-            text = await asyncio.wait_for(
-                self.llm.complete([
+            text, result = await asyncio.wait_for(
+                self._call_json([
                     {"role": "system", "content": L0_ORCHESTRATOR_SYSTEM},
                     {"role": "user", "content": prompt},
                 ], max_tokens=32768, response_mime_type="application/json"),
@@ -1326,8 +1572,6 @@ class DiscoveryGraph:
             sector["key"], len(text), text[:500], text[-200:] if len(text) > 200 else "",
         )
 
-        result = _extract_json(text)
-
         # region agent log
         _debug_log(
             run_id="v6",
@@ -1372,6 +1616,7 @@ class DiscoveryGraph:
         node: dict,
         node_type: str = "entity",
         depth: int = 1,
+        on_element: Callable[[str, Any], None] | None = None,
     ) -> dict:
         """Run one node expansion call using a node-type-aware single-question prompt.
 
@@ -1386,7 +1631,26 @@ class DiscoveryGraph:
           "source_section" — section; ask for sub-sections (leaf level)
 
         Template is always authoritative — stored expansion_prompt from L1 is NOT used.
+
+        on_element(key, element) is called for every source, program and
+        sub-entity in the response; see ``_call_json`` for streaming behaviour.
         """
+        with span("discovery.expand_node", {
+            "discovery.node": node.get("id") or node.get("citation") or node.get("name"),
+            "discovery.node_type": node_type,
+            "discovery.depth": depth,
+            "raris.manifest_id": self.manifest_id,
+        }):
+            return await self._expand_node_call(node, node_type, depth, on_element)
+
+    async def _expand_node_call(
+        self,
+        node: dict,
+        node_type: str,
+        depth: int,
+        on_element: Callable[[str, Any], None] | None,
+    ) -> dict:
+        """Body of ``_expand_node``, run inside its tracing span."""
         # ALGO-014: For source nodes, query already-found children and inject
         # sibling context so the LLM fills gaps rather than repeating known entries.
         sibling_context = ""
@@ -1469,11 +1733,47 @@ class DiscoveryGraph:
             "[graph v6][expansion_prompt] node=%s node_type=%s depth=%d chars=%d prompt_preview=%r",
             node.get("id") or node.get("citation", "?"), node_type, depth, len(prompt), prompt[:200],
         )
-        text = await self.llm.complete([
+        _, result = await self._call_json([
             {"role": "system", "content": L0_ORCHESTRATOR_SYSTEM},
             {"role": "user", "content": prompt},
-        ], max_tokens=16384, response_mime_type="application/json")
-        return _extract_json(text)
+        ], on_element=on_element, max_tokens=16384, response_mime_type="application/json")
+        return result
+
+    # ── LLM call + JSON parse (complete or streamed) ──────────────────────
+
+    async def _call_json(
+        self,
+        messages: list[dict],
+        *,
+        on_element: Callable[[str, Any], None] | None = None,
+        **kwargs,
+    ) -> tuple[str, dict]:
+        """Run one discovery LLM call and parse its JSON object. Returns (text, result).
+
+        With ``settings.discovery_stream_json`` the response is consumed through
+        ``LLMProvider.stream`` and parsed incrementally, so ``on_element`` fires
+        for each top-level array element as soon as its closing brace arrives.
+        Otherwise the full response is awaited, parsed with ``_extract_json``,
+        and ``on_element`` is replayed over the parsed arrays afterwards.
+        """
+        if settings.discovery_stream_json:
+            parser = StreamingJSONParser()
+            async for chunk in self.llm.stream(messages, **kwargs):
+                for key, element in parser.feed(chunk):
+                    if on_element is not None:
+                        on_element(key, element)
+            text, result = parser.text, parser.finish()
+            if parser.elements_emitted:
+                return text, result
+        else:
+            text = await self.llm.complete(messages, **kwargs)
+            result = _extract_json(text)
+
+        if on_element is not None:
+            for key in _STREAMED_ARRAY_KEYS:
+                for element in result.get(key) or []:
+                    on_element(key, element)
+        return text, result
 
     # ── Utility: Coverage summary ─────────────────────────────────────────
 
@@ -1503,6 +1803,10 @@ class DiscoveryGraph:
             }
         return summary
 
+    def _queue_stats(self, queue: DiscoveryQueue) -> dict:
+        """Queue statistics plus call-budget burn-down for SSE ``queue_stats``."""
+        return {**queue.stats(), "budget": self.budget.stats()}
+
     # ── Utility: SSE event builder ────────────────────────────────────────
 
     @staticmethod
@@ -0,0 +1,278 @@
+"""Prior Knowledge — cross-run reuse for graph discovery.
+
+A discovery run for a domain that was already mapped can start from what an
+earlier run (or the domain's current golden run) found instead of
+rediscovering every federal and state entity from scratch:
+
+- ``EntityRegistry`` is seeded with prior entities, so canonical IDs are
+  stable across runs.
+- ``DiscoveryQueue`` is seeded with prior entities, so nodes the new L1 pass
+  misses are still visited.
+- A node whose prior expansion is younger than the TTL is *replayed* — its
+  prior child sources are persisted and enqueued without an LLM call. Only new
+  or stale nodes spend API calls.
+
+Freshness is tracked per node through ``Source.relationships["discovered_at"]``,
+which replays carry forward unchanged. A nightly run therefore re-expands
+only the nodes whose results have aged past the TTL.
+
+Usage:
+    prior = await load_prior_knowledge(db, domain="US Insurance", reuse_from="golden")
+    async for event in DiscoveryGraph(...).run(..., prior=prior):
+        ...
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.models.manifest import (
+    DomainCurrentGolden,
+    GoldenRun,
+    GoldenRunItem,
+    Manifest,
+    ManifestStatus,
+    Program,
+    RegulatoryBody,
+    Source,
+)
+
+logger = logging.getLogger(__name__)
+
+# reuse_from values with special meaning; anything else is a manifest ID
+REUSE_GOLDEN = "golden"
+REUSE_LATEST = "latest"
+
+_REUSABLE_STATUSES = (ManifestStatus.pending_review, ManifestStatus.approved, ManifestStatus.active)
+
+
+def _parse_ts(value: object) -> datetime | None:
+    if isinstance(value, datetime):
+        return value if value.tzinfo else value.replace(tzinfo=UTC)
+    if isinstance(value, str) and value:
+        try:
+            parsed = datetime.fromisoformat(value)
+        except ValueError:
+            return None
+        return parsed if parsed.tzinfo else parsed.replace(tzinfo=UTC)
+    return None
+
+
+@dataclass
+class PriorKnowledge:
+    """Entities, sources and programs from earlier runs, keyed for replay."""
+
+    origin: str  # "manifest:<id>" | "golden:<id>"
+    entities: list[dict]
+    sources: list[dict]  # LLM-output shape; "id" is the persisted (prefixed) ID
+    programs: list[dict]
+    l1_discovered_at: datetime
+    ttl_hours: int = field(default_factory=lambda: settings.discovery_reuse_ttl_hours)
+    now: datetime = field(default_factory=lambda: datetime.now(UTC))
+
+    def __post_init__(self) -> None:
+        self._children: dict[str, list[dict]] = {}
+        for src in self.sources:
+            parent, sep, raw_id = src["id"].rpartition("__")
+            if sep:
+                self._children.setdefault(parent, []).append({**src, "id": raw_id})
+
+    def _is_fresh(self, discovered_at: datetime | None) -> bool:
+        if discovered_at is None or self.ttl_hours <= 0:
+            return False
+        return self.now - discovered_at < timedelta(hours=self.ttl_hours)
+
+    def l1_is_fresh(self) -> bool:
+        """True when the prior L1 entity discovery can stand in for a new one."""
+        return bool(self.entities) and self._is_fresh(self.l1_discovered_at)
+
+    def node_is_fresh(self, node_id: str) -> bool:
+        """True when node_id was expanded within the TTL and can be replayed.
+
+        A node's age is that of its oldest child source; nodes whose prior
+        expansion produced no sources are treated as never expanded.
+        """
+        children = self._children.get(node_id)
+        if not children:
+            return False
+        stamps = [_parse_ts(c.get("discovered_at")) or self.l1_discovered_at for c in children]
+        return self._is_fresh(min(stamps))
+
+    def children_of(self, node_id: str) -> list[dict]:
+        """Prior direct child sources of node_id, with the un-prefixed raw ID."""
+        return [dict(c) for c in self._children.get(node_id, [])]
+
+    def summary(self) -> dict:
+        age_h = (self.now - self.l1_discovered_at).total_seconds() / 3600
+        return {
+            "origin": self.origin,
+            "entities": len(self.entities),
+            "sources": len(self.sources),
+            "programs": len(self.programs),
+            "expanded_nodes": len(self._children),
+            "l1_age_hours": round(age_h, 1),
+            "ttl_hours": self.ttl_hours,
+        }
+
+
+def _entity_dict(body: RegulatoryBody) -> dict:
+    return {
+        "id": body.id,
+        "name": body.name,
+        "jurisdiction": body.jurisdiction.value if body.jurisdiction else None,
+        "jurisdiction_code": body.jurisdiction_code,
+        "authority_type": body.authority_type.value if body.authority_type else None,
+        "url": body.url,
+        "governs": body.governs or [],
+    }
+
+
+def _source_dict(src: Source, fallback_ts: datetime) -> dict:
+    relationships = src.relationships or {}
+    return {
+        "id": src.id,
+        "name": src.name,
+        "regulatory_body": src.regulatory_body_id,
+        "type": src.type.value if src.type else None,
+        "format": src.format.value if src.format else None,
+        "authority": src.authority.value if src.authority else None,
+        "jurisdiction": src.jurisdiction.value if src.jurisdiction else None,
+        "url": src.url,
+        "access_method": src.access_method.value if src.access_method else None,
+        "confidence": src.confidence,
+        "needs_human_review": src.needs_human_review,
+        "classification_tags": src.classification_tags or [],
+        "citation": src.citation,
+        "depth_hint": src.depth_hint,
+        "discovered_at": relationships.get("discovered_at") or fallback_ts.isoformat(),
+    }
+
+
+def _program_dict(program: Program | GoldenRunItem, origin: str) -> dict:
+    return {
+        "name": program.name,
+        "administering_entity": program.administering_entity,
+        "geo_scope": program.geo_scope.value if program.geo_scope else None,
+        "jurisdiction": program.jurisdiction,
+        "benefits": program.benefits,
+        "eligibility": program.eligibility,
+        "status": program.status.value if program.status else None,
+        "evidence_snippet": program.evidence_snippet,
+        "source_urls": program.source_urls or [],
+        "provenance_links": {**(program.provenance_links or {}), "reused_from": origin},
+        "confidence": program.confidence,
+        "needs_human_review": program.needs_human_review,
+    }
+
+
+def _l1_discovered_at(manifest: Manifest) -> datetime:
+    run_params = manifest.run_params or {}
+    return (
+        _parse_ts(run_params.get("l1_discovered_at"))
+        or _parse_ts(manifest.created_at)
+        or datetime.now(UTC)
+    )
+
+
+async def _load_manifests_graph(
+    db: AsyncSession, manifests: list[Manifest]
+) -> tuple[list[dict], list[dict], datetime]:
+    """Union of entities and sources across manifests, newest manifest first."""
+    manifests = sorted(manifests, key=_l1_discovered_at, reverse=True)
+    ids = [m.id for m in manifests]
+    discovered = {m.id: _l1_discovered_at(m) for m in manifests}
+
+    bodies = (
+        await db.execute(select(RegulatoryBody).where(RegulatoryBody.manifest_id.in_(ids)))
+    ).scalars().all()
+    rows = (await db.execute(select(Source).where(Source.manifest_id.in_(ids)))).scalars().all()
+
+    rank = {mid: i for i, mid in enumerate(ids)}
+    entities: dict[str, dict] = {}
+    for body in sorted(bodies, key=lambda b: rank[b.manifest_id]):
+        entities.setdefault(body.id, _entity_dict(body))
+    sources: dict[str, dict] = {}
+    for src in sorted(rows, key=lambda s: rank[s.manifest_id]):
+        sources.setdefault(src.id, _source_dict(src, discovered[src.manifest_id]))
+
+    # L1 is only as fresh as the oldest manifest contributing entities
+    return list(entities.values()), list(sources.values()), min(discovered.values())
+
+
+async def load_prior_knowledge(
+    db: AsyncSession,
+    *,
+    domain: str,
+    reuse_from: str | None,
+    ttl_hours: int | None = None,
+    exclude_manifest_id: str | None = None,
+) -> PriorKnowledge | None:
+    """Load reusable discovery results for a domain.
+
+    reuse_from:
+        ``"golden"`` — the domain's current golden run (programs from its items,
+        entities/sources from its source manifests);
+        ``"latest"`` — the most recent reviewable manifest for the domain;
+        any other value — that manifest ID.
+
+    Returns None when nothing reusable exists.
+    """
+    if not reuse_from:
+        return None
+    ttl = settings.discovery_reuse_ttl_hours if ttl_hours is None else ttl_hours
+
+    if reuse_from == REUSE_GOLDEN:
+        pointer = await db.get(DomainCurrentGolden, domain)
+        golden = await db.get(GoldenRun, pointer.golden_run_id) if pointer else None
+        if golden is None:
+            logger.info("[prior] no current golden run for domain=%r", domain)
+            return None
+        origin = f"golden:{golden.id}"
+        manifests = (
+            await db.execute(select(Manifest).where(Manifest.id.in_(golden.source_run_ids or [])))
+        ).scalars().all()
+        items = (
+            await db.execute(select(GoldenRunItem).where(GoldenRunItem.golden_run_id == golden.id))
+        ).scalars().all()
+        programs = [_program_dict(item, origin) for item in items]
+    else:
+        if reuse_from == REUSE_LATEST:
+            stmt = (
+                select(Manifest)
+                .where(Manifest.domain == domain, Manifest.status.in_(_REUSABLE_STATUSES))
+                .order_by(Manifest.created_at.desc())
+                .limit(2)
+            )
+            candidates = (await db.execute(stmt)).scalars().all()
+            manifests = [m for m in candidates if m.id != exclude_manifest_id][:1]
+        else:
+            manifest = await db.get(Manifest, reuse_from)
+            manifests = [manifest] if manifest else []
+        if not manifests:
+            logger.info("[prior] nothing to reuse for domain=%r reuse_from=%r", domain, reuse_from)
+            return None
+        origin = f"manifest:{manifests[0].id}"
+        rows = (
+            await db.execute(select(Program).where(Program.manifest_id == manifests[0].id))
+        ).scalars().all()
+        programs = [_program_dict(p, origin) for p in rows]
+
+    if not manifests:
+        return None
+    entities, sources, l1_at = await _load_manifests_graph(db, list(manifests))
+    prior = PriorKnowledge(
+        origin=origin,
+        entities=entities,
+        sources=sources,
+        programs=programs,
+        l1_discovered_at=l1_at,
+        ttl_hours=ttl,
+    )
+    logger.info("[prior] loaded %s", prior.summary())
+    return prior
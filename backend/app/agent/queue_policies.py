@@ -0,0 +1,198 @@
+"""Queue scheduling policies — pluggable pop order for ``DiscoveryQueue``.
+
+A policy turns a ``QueueItem`` into a sort key (lowest pops first) and learns
+from the outcome of each expansion. Under a ``max_api_calls`` cap the order
+decides which nodes get a call at all, so the policies differ in what they
+spend the budget on:
+
+- ``priority``       (priority, depth) — the original BFS order.
+- ``depth_first``    deepest node first; drills citation trees to the leaves.
+- ``value_per_call`` highest observed yield (sources + programs per API call)
+                     for the item's node type.
+- ``best_first``     highest expected *new* sources, estimated from the
+                     expansions of the item's siblings.
+- ``fair_share``     round-robin across L1 sectors (lanes) by calls spent.
+
+Learned estimates are smoothed toward a prior so a handful of early
+expansions cannot starve a node type.
+
+Usage:
+    queue = DiscoveryQueue(max_depth=3, policy=get_policy("value_per_call"))
+    item = queue.pop()
+    ...  # expand
+    queue.record(item, sources=4, new_sources=2, programs=1)
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from app.agent.discovery_queue import QueueItem
+
+# Smoothing for learned estimates: an unseen bucket behaves as if it had
+# _PRIOR_WEIGHT observations of _PRIOR_YIELD.
+_PRIOR_YIELD = 2.0
+_PRIOR_WEIGHT = 2.0
+
+
+class _YieldStats:
+    """Running mean of a per-bucket yield, smoothed toward the prior."""
+
+    def __init__(self) -> None:
+        self._total: dict[str, float] = defaultdict(float)
+        self._count: dict[str, float] = defaultdict(float)
+
+    def add(self, bucket: str, value: float, weight: float = 1.0) -> None:
+        self._total[bucket] += value
+        self._count[bucket] += weight
+
+    def has(self, bucket: str) -> bool:
+        return self._count.get(bucket, 0.0) > 0
+
+    def mean(self, bucket: str) -> float:
+        return (self._total[bucket] + _PRIOR_YIELD * _PRIOR_WEIGHT) / (
+            self._count[bucket] + _PRIOR_WEIGHT
+        )
+
+    def to_dict(self) -> dict[str, float]:
+        return {b: round(self.mean(b), 3) for b in sorted(self._count)}
+
+
+class SchedulingPolicy:
+    """Default policy: (priority, depth, FIFO) — the original BFS order.
+
+    Subclasses override ``key`` and, when their keys depend on observed
+    yields, ``observe``. ``epoch`` must be bumped whenever existing keys may
+    have changed; the queue re-keys its heap lazily on the next pop.
+    """
+
+    name = "priority"
+
+    def __init__(self) -> None:
+        self.epoch = 0
+
+    def key(self, item: QueueItem) -> tuple:
+        return (item.priority, item.depth)
+
+    def observe(
+        self, item: QueueItem, *, sources: int, new_sources: int, programs: int, api_calls: int,
+    ) -> None:
+        """Learn from one expansion outcome. Static policies ignore it."""
+
+    def on_pop(self, item: QueueItem) -> None:
+        """Called when an item leaves the queue for expansion."""
+
+    def state(self) -> dict:
+        return {}
+
+
+class DepthFirstPolicy(SchedulingPolicy):
+    """Deepest node first, so each citation tree is finished before the next."""
+
+    name = "depth_first"
+
+    def key(self, item: QueueItem) -> tuple:
+        return (-item.depth, item.priority)
+
+
+class ValuePerCallPolicy(SchedulingPolicy):
+    """Highest estimated yield per API call for the item's node type first.
+
+    Yield is sources + programs found; failed calls count as zero-yield
+    calls, so node types that tend to time out sink.
+    """
+
+    name = "value_per_call"
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._yield = _YieldStats()
+
+    def key(self, item: QueueItem) -> tuple:
+        return (-self._yield.mean(item.target_type), item.priority, item.depth)
+
+    def observe(self, item, *, sources, new_sources, programs, api_calls) -> None:
+        if api_calls <= 0:
+            return
+        self._yield.add(item.target_type, sources + programs, weight=api_calls)
+        self.epoch += 1
+
+    def state(self) -> dict:
+        return {"value_per_call": self._yield.to_dict()}
+
+
+class BestFirstPolicy(SchedulingPolicy):
+    """Highest expected number of new (non-duplicate) sources first.
+
+    An item is estimated from its expanded siblings (same ``discovered_from``),
+    falling back to its node type, then to the prior.
+    """
+
+    name = "best_first"
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._by_parent = _YieldStats()
+        self._by_type = _YieldStats()
+
+    def expected_new_sources(self, item: QueueItem) -> float:
+        if self._by_parent.has(item.discovered_from):
+            return self._by_parent.mean(item.discovered_from)
+        return self._by_type.mean(item.target_type)
+
+    def key(self, item: QueueItem) -> tuple:
+        return (-self.expected_new_sources(item), item.priority, item.depth)
+
+    def observe(self, item, *, sources, new_sources, programs, api_calls) -> None:
+        self._by_parent.add(item.discovered_from, new_sources)
+        self._by_type.add(item.target_type, new_sources)
+        self.epoch += 1
+
+    def state(self) -> dict:
+        return {"expected_new_sources_by_type": self._by_type.to_dict()}
+
+
+class FairSharePolicy(SchedulingPolicy):
+    """Serve the lane (L1 sector) that has received the fewest calls so far.
+
+    Within a lane, items keep the (priority, depth) order. Lanes that run dry
+    simply stop competing.
+    """
+
+    name = "fair_share"
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._served: dict[str, int] = defaultdict(int)
+
+    def key(self, item: QueueItem) -> tuple:
+        return (self._served[item.lane], item.priority, item.depth)
+
+    def on_pop(self, item: QueueItem) -> None:
+        self._served[item.lane] += 1
+        self.epoch += 1
+
+    def state(self) -> dict:
+        return {"served_by_lane": dict(sorted(self._served.items()))}
+
+
+_policies: dict[str, type[SchedulingPolicy]] = {
+    SchedulingPolicy.name: SchedulingPolicy,
+    DepthFirstPolicy.name: DepthFirstPolicy,
+    ValuePerCallPolicy.name: ValuePerCallPolicy,
+    BestFirstPolicy.name: BestFirstPolicy,
+    FairSharePolicy.name: FairSharePolicy,
+}
+
+
+def get_policy(name: str | None = None) -> SchedulingPolicy:
+    """Instantiate a scheduling policy by name (default: ``priority``)."""
+    policy_name = (name or SchedulingPolicy.name).strip().lower()
+    if policy_name not in _policies:
+        raise ValueError(
+            f"Unknown queue policy: {policy_name}. "
+            f"Available: {', '.join(_policies.keys())}"
+        )
+    return _policies[policy_name]()
@@ -0,0 +1,189 @@
+"""Incremental JSON parser for streamed discovery responses.
+
+Discovery calls return one JSON object whose interesting content lives in a
+handful of top-level arrays (``administering_entities``, ``sources``,
+``programs``). ``StreamingJSONParser`` consumes the response chunk by chunk and
+reports each array element the moment its closing bracket arrives, so callers
+can enqueue and persist results while the LLM is still generating.
+
+Usage:
+    parser = StreamingJSONParser()
+    async for chunk in llm.stream(messages):
+        for key, element in parser.feed(chunk):
+            ...  # e.g. key == "sources", element == {...}
+    result = parser.finish()  # full dict, same shape as _extract_json()
+
+Text before the first ``{`` (markdown fences, preambles) is skipped. If the
+stream is truncated, elements completed so far are kept — the same recovery
+``_extract_json`` performs on a truncated response, without re-scanning.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from typing import Any
+
+from app.agent.discovery import _extract_json
+
+logger = logging.getLogger(__name__)
+
+
+class StreamingJSONParser:
+    """Single-pass, chunk-fed parser for a root JSON object.
+
+    Top-level arrays are emitted element by element from ``feed()``; all other
+    top-level values are parsed once complete and returned from ``finish()``.
+    Each character of the response is scanned exactly once.
+    """
+
+    def __init__(self) -> None:
+        self._buf: str = ""
+        self._pos: int = 0
+        self._started: bool = False
+        self._done: bool = False
+        self._in_string: bool = False
+        self._escape: bool = False
+        # Open containers below the root object: "{" or "["
+        self._stack: list[str] = []
+
+        # Root-level parse state
+        self._key: str | None = None
+        self._key_start: int | None = None
+        self._expect_key: bool = True
+        self._value_start: int | None = None
+        # Array-element parse state (only for arrays directly under the root)
+        self._element_start: int | None = None
+
+        self._result: dict[str, Any] = {}
+        self.elements_emitted: int = 0
+
+    def feed(self, chunk: str) -> list[tuple[str, Any]]:
+        """Consume a chunk and return the (key, element) pairs it completed."""
+        if self._done or not chunk:
+            return []
+        self._buf += chunk
+        completed: list[tuple[str, Any]] = []
+        buf = self._buf
+
+        for i in range(self._pos, len(buf)):
+            ch = buf[i]
+            if not self._started:
+                if ch == "{":
+                    self._started = True
+                continue
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == "\\":
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+                    if self._key_start is not None:
+                        self._key = buf[self._key_start:i]
+                        self._key_start = None
+                continue
+
+            depth = len(self._stack)
+            if ch == '"':
+                self._in_string = True
+                if depth == 0 and self._expect_key:
+                    self._key_start = i + 1
+                    self._expect_key = False
+                elif depth == 0 and self._value_start is None:
+                    self._value_start = i
+                elif self._in_root_array() and self._element_start is None:
+                    self._element_start = i
+                continue
+
+            if ch in " \t\r\n":
+                continue
+
+            if depth == 0:
+                if ch == ":":
+                    self._value_start = None
+                elif ch == ",":
+                    self._close_root_value(i)
+                    self._expect_key = True
+                elif ch == "}":
+                    self._close_root_value(i)
+                    self._done = True
+                    break
+                elif ch in "{[":
+                    if ch == "[" and self._key is not None:
+                        self._result[self._key] = []
+                    else:
+                        self._value_start = i
+                    self._stack.append(ch)
+                elif self._value_start is None:
+                    self._value_start = i
+                continue
+
+            if self._in_root_array() and self._element_start is None and ch not in ",]":
+                self._element_start = i
+
+            if ch in "{[":
+                self._stack.append(ch)
+            elif ch in "}]":
+                self._stack.pop()
+                if not self._stack and ch == "]" and self._key in self._result:
+                    self._close_element(i, completed)
+            elif ch == "," and self._in_root_array():
+                self._close_element(i, completed)
+
+        self._pos = len(buf)
+        return completed
+
+    def finish(self) -> dict[str, Any]:
+        """Return the parsed object.
+
+        Falls back to ``_extract_json`` over the buffered text only when the
+        stream produced nothing usable (e.g. the response was not JSON).
+        """
+        if not self._result and self._buf.strip():
+            logger.debug(
+                "[stream_json] incremental parse empty — falling back to _extract_json (chars=%d)",
+                len(self._buf),
+            )
+            return _extract_json(self._buf)
+        return self._result
+
+    @property
+    def text(self) -> str:
+        """The raw response text received so far."""
+        return self._buf
+
+    # ── Internals ─────────────────────────────────────────────────────────
+
+    def _in_root_array(self) -> bool:
+        return len(self._stack) == 1 and self._stack[0] == "[" and self._key in self._result
+
+    def _close_element(self, end: int, completed: list[tuple[str, Any]]) -> None:
+        start = self._element_start
+        self._element_start = None
+        if start is None or self._key is None:
+            return
+        raw = self._buf[start:end].strip()
+        if not raw:
+            return
+        try:
+            element = json.loads(raw)
+        except json.JSONDecodeError:
+            logger.debug("[stream_json] skipping unparseable element under %r", self._key)
+            return
+        self._result[self._key].append(element)
+        self.elements_emitted += 1
+        completed.append((self._key, element))
+
+    def _close_root_value(self, end: int) -> None:
+        start = self._value_start
+        self._value_start = None
+        if start is None or self._key is None:
+            return
+        raw = self._buf[start:end].strip()
+        try:
+            self._result[self._key] = json.loads(raw)
+        except json.JSONDecodeError:
+            logger.debug("[stream_json] skipping unparseable value for %r", self._key)
+
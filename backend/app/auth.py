@@ -1,4 +1,9 @@
-"""API key authentication dependency."""
+"""API key authentication dependency.
+
+Validated keys are served from an in-process cache and ``last_used_at`` is
+written in batches (see app.auth_cache), so an authenticated request
+normally costs no database round trip.
+"""
 
 import hashlib
 import logging
@@ -7,9 +12,10 @@ from datetime import UTC, datetime
 
 from fastapi import Depends, HTTPException, Security
 from fastapi.security import APIKeyHeader
-from sqlalchemy import select, update
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.auth_cache import api_key_cache
 from app.config import settings
 from app.database import get_db
 from app.models.auth import ApiKey, ApiKeyScope
@@ -43,25 +49,27 @@ async def _get_api_key(
         raise HTTPException(status_code=401, detail="Missing API key")
 
     key_hash = hash_key(api_key)
-    result = await db.execute(
-        select(ApiKey).where(ApiKey.key_hash == key_hash, ApiKey.is_active.is_(True))
-    )
-    key_record = result.scalar_one_or_none()
+    key_record = await api_key_cache.get(key_hash)
+    if key_record is None:
+        result = await db.execute(
+            select(ApiKey).where(ApiKey.key_hash == key_hash, ApiKey.is_active.is_(True))
+        )
+        key_record = result.scalar_one_or_none()
 
-    if not key_record:
-        raise HTTPException(status_code=401, detail="Invalid API key")
+        if not key_record:
+            raise HTTPException(status_code=401, detail="Invalid API key")
+
+        # Detach so later commits in any session cannot expire the cached copy
+        db.expunge(key_record)
+        api_key_cache.put(key_hash, key_record)
 
     # Check expiration
     if key_record.expires_at and key_record.expires_at < datetime.now(UTC):
         raise HTTPException(status_code=401, detail="API key expired")
 
-    # Update last_used_at
-    await db.execute(
-        update(ApiKey).where(ApiKey.id == key_record.id).values(
-            last_used_at=datetime.now(UTC)
-        )
-    )
-    await db.commit()
+    # Record use; last_used_at is written in periodic batches
+    api_key_cache.touch(key_record.id)
+    await api_key_cache.flush_if_due(db)
 
     return key_record
 
@@ -0,0 +1,131 @@
+"""In-process cache of validated API keys, with batched last_used_at writes.
+
+A validated key is trusted for ``auth_cache_ttl_seconds`` without a database
+lookup. Revoking a key bumps a version counter in Redis; every process polls
+the counter at most every ``auth_revocation_check_seconds`` and drops its
+cache when it changes, so a revocation takes effect everywhere within that
+interval (within the TTL if Redis is unreachable). ``last_used_at`` is
+recorded in memory and written for all keys in one statement every
+``auth_last_used_flush_seconds``.
+
+Usage:
+    key = await api_key_cache.get(key_hash)   # cached ApiKey or None
+    api_key_cache.put(key_hash, key_record)
+    api_key_cache.touch(key_record.id)
+    await api_key_cache.flush_if_due(db)
+    await api_key_cache.invalidate()          # after revoking a key
+"""
+
+import logging
+import time
+from datetime import UTC, datetime
+
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.models.auth import ApiKey
+from app.rate_limit import redis_client
+
+logger = logging.getLogger(__name__)
+
+_VERSION_KEY = "auth:api_keys:version"
+_MAX_ENTRIES = 4096
+
+
+class ApiKeyCache:
+    """Validated keys by hash, plus pending last_used_at timestamps by key id."""
+
+    def __init__(self) -> None:
+        self._entries: dict[str, tuple[float, ApiKey]] = {}
+        self._version: int | None = None
+        self._checked_at = float("-inf")
+        self._last_used: dict[str, datetime] = {}
+        self._flushed_at = time.monotonic()
+
+    async def get(self, key_hash: str) -> ApiKey | None:
+        """The cached key for a hash, if it was validated within the TTL."""
+        if settings.auth_cache_ttl_seconds <= 0:
+            return None
+        await self._sync_version()
+        entry = self._entries.get(key_hash)
+        if entry is None:
+            return None
+        cached_at, key_record = entry
+        if time.monotonic() - cached_at > settings.auth_cache_ttl_seconds:
+            del self._entries[key_hash]
+            return None
+        return key_record
+
+    def put(self, key_hash: str, key_record: ApiKey) -> None:
+        if settings.auth_cache_ttl_seconds <= 0:
+            return
+        if len(self._entries) >= _MAX_ENTRIES:
+            self._entries.pop(next(iter(self._entries)))
+        self._entries[key_hash] = (time.monotonic(), key_record)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    async def invalidate(self) -> None:
+        """Drop cached keys here and signal other processes to drop theirs."""
+        self.clear()
+        try:
+            await redis_client().incr(_VERSION_KEY)
+        except Exception as exc:
+            logger.warning(
+                "Could not publish API key revocation (other processes expire it within %.0fs): %s",
+                settings.auth_cache_ttl_seconds, exc,
+            )
+
+    def touch(self, key_id: str) -> None:
+        """Record a use of the key; written on the next flush."""
+        self._last_used[key_id] = datetime.now(UTC)
+
+    async def flush_if_due(self, db: AsyncSession) -> None:
+        if time.monotonic() - self._flushed_at >= settings.auth_last_used_flush_seconds:
+            await self.flush(db)
+
+    async def flush(self, db: AsyncSession) -> None:
+        """Write pending last_used_at timestamps in one statement and commit.
+
+        A failed write is logged and its timestamps kept for the next flush,
+        so a database hiccup never fails the request that triggered it.
+        """
+        pending, self._last_used = self._last_used, {}
+        self._flushed_at = time.monotonic()
+        if not pending:
+            return
+        try:
+            await db.execute(update(ApiKey), [
+                {"id": key_id, "last_used_at": used_at} for key_id, used_at in pending.items()
+            ])
+            await db.commit()
+        except Exception as exc:
+            await db.rollback()
+            # Uses recorded since the swap are newer than the ones that failed
+            pending.update(self._last_used)
+            self._last_used = pending
+            logger.error("Could not write API key last_used_at (%d keys): %s", len(pending), exc)
+
+    async def _sync_version(self) -> None:
+        now = time.monotonic()
+        if now - self._checked_at < settings.auth_revocation_check_seconds:
+            return
+        self._checked_at = now
+        version = await _read_version()
+        if version != self._version:
+            self._entries.clear()
+            self._version = version
+
+
+async def _read_version() -> int | None:
+    """The revocation counter, or None when Redis is unreachable."""
+    try:
+        return int(await redis_client().get(_VERSION_KEY) or 0)
+    except Exception as exc:
+        logger.debug("API key revocation check failed: %s", exc)
+        return None
+
+
+api_key_cache = ApiKeyCache()
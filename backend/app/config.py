@@ -44,16 +44,47 @@ class Settings(BaseSettings):
     chunk_min_tokens: int = 500
     chunk_max_tokens: int = 1000
     chunk_overlap_tokens: int = 50
+    pdf_extract_workers: int = 1  # Processes extracting PDF pages in parallel (1 = in-thread)
+    xml_streaming_min_kb: int = 1024  # XML this large is extracted in one streaming iterparse pass
+    near_duplicate_threshold: float = 0.9  # Estimated Jaccard similarity that marks a duplicate
+    near_duplicate_shingle_words: int = 5
+    near_duplicate_permutations: int = 128  # MinHash signature length
+    near_duplicate_bands: int = 32  # LSH bands; permutations / bands rows per band
+
+    # Acquisition
+    acquisition_concurrency: int = 8  # Sources fetched in parallel across all hosts
+    acquisition_per_host_concurrency: int = 2  # Sources fetched in parallel from one host
+    acquisition_max_download_mb: int = 1024  # Abort larger streamed downloads (0 = no limit)
+    staging_compression: str = "none"  # New blobs: none | zstd (needs zstandard)
+
+    # Outbound HTTP (shared client pool)
+    http_max_connections: int = 50  # Pooled connections across all hosts
+    http_max_connections_per_host: int = 4  # In-flight requests to one host
+    http_keepalive_expiry: float = 30.0  # Seconds an idle connection is kept open
+    http_connect_timeout: float = 10.0  # Seconds to establish a connection
+    http_read_timeout: float = 60.0  # Default seconds per request (callers may override)
+    http2_enabled: bool = True  # Negotiate HTTP/2 when the h2 package is installed
+    http_dns_ttl_seconds: float = 300.0  # DNS cache lifetime (0 = no caching)
 
     # Rate limiting
     rate_limit_rpm: int = 60  # Requests per minute (0 = disabled)
+    rate_limit_local: bool = True  # Reject over-limit bursts in-process before asking Redis
 
     # Auth
     auth_enabled: bool = False  # Set True to require API keys
+    auth_cache_ttl_seconds: float = 30.0  # Validated keys skip the lookup this long (0 = no cache)
+    auth_revocation_check_seconds: float = 2.0  # How often to poll the revocation version in Redis
+    auth_last_used_flush_seconds: float = 60.0  # Batch last_used_at writes (0 = per request)
 
     # Scheduler
     scheduler_enabled: bool = False  # Set True to enable background jobs
     monitor_schedule_hour: int = 2  # Hour (UTC) for change monitor
+    # Sources probed in parallel by the change monitor (per host: http_max_connections_per_host)
+    monitor_concurrency: int = 16
+    monitor_shards: int = 16  # Host-based shards per monitor sweep
+    monitor_workers: int = 4  # In-process workers claiming shards during a sweep
+    monitor_batch_size: int = 50  # Sources checked between progress commits
+    monitor_shard_lease_seconds: int = 600  # Shards without a heartbeat this long are reclaimed
     snapshot_schedule_hour: int = 3  # Hour (UTC) for accuracy snapshot
 
     # Logging
@@ -64,11 +95,23 @@ class Settings(BaseSettings):
     max_discovery_depth: int = 3  # Maximum BFS depth (queue won't enqueue beyond this)
     max_entities_per_sector: int = 200  # Cap entities returned per sector call
     l2_sleep_between_calls: float = 0.4  # Seconds to sleep between L2 expand calls (Gemini Tier 1 = 150 RPM; set 0 for tests)
+    entity_fuzzy_threshold: float = 0.85  # Cosine similarity to merge entity names (0 = exact only)
+    # Stream discovery calls and parse JSON incrementally (enqueue/persist per element)
+    discovery_stream_json: bool = False
+    # L2 pop order: priority | depth_first | value_per_call | best_first | fair_share
+    discovery_queue_policy: str = "priority"
+    # Prior-run nodes younger than this are replayed instead of re-expanded (0 = always re-expand)
+    discovery_reuse_ttl_hours: int = 168
 
     # LLM call logging
     llm_logging: str = "ON"  # ON|OFF — master toggle for structured LLM call logs
     llm_log_prompts: str = "OFF"  # ON|OFF — whether to log full prompt content
 
+    # Tracing (needs the tracing extra)
+    tracing_exporter: str = "none"  # none | otlp | file
+    tracing_otlp_endpoint: str = "http://localhost:4318/v1/traces"  # OTLP/HTTP collector endpoint
+    tracing_file_path: str = "traces.jsonl"  # File exporter output, one JSON span per line
+
     def validate_on_startup(self) -> None:
         """Log warnings for missing or misconfigured settings."""
         provider_key_map = {
@@ -1,13 +1,16 @@
 """Evaluation metrics for RARIS pipeline phases.
 
-Phase 1: Manifest Accuracy (≥95%), Source Recall (≥90%)
+Phase 1: Manifest Accuracy (≥95%), Source Recall (≥90%),
+         Entity Resolution Precision (≥95%) / Recall (≥80%)
 Phase 2: Scrape Completion (≥90%)
 Phase 3: Ingestion Success (≥95%)
 Phase 4: Retrieval Precision@k (≥80%), NDCG@k
 """
 
 import math
+from collections import defaultdict
 from dataclasses import dataclass
+from itertools import combinations
 
 
 @dataclass
@@ -52,6 +55,51 @@ def source_recall(predicted_sources: list[dict], ground_truth: list[dict]) -> Me
     return MetricResult("Source Recall", recall, target, recall >= target)
 
 
+def _same_cluster_pairs(assignments: dict[str, str]) -> set[tuple[str, str]]:
+    clusters: dict[str, list[str]] = defaultdict(list)
+    for item, label in assignments.items():
+        clusters[label].append(item)
+    return {
+        tuple(sorted(pair))
+        for members in clusters.values()
+        for pair in combinations(members, 2)
+    }
+
+
+def entity_resolution_quality(
+    predicted: dict[str, str], ground_truth: dict[str, str]
+) -> tuple[MetricResult, MetricResult]:
+    """Phase 1: pairwise precision and recall of entity-name merging.
+
+    Args:
+        predicted: name variant → canonical ID assigned by the registry
+            (``EntityRegistry.assignments()``).
+        ground_truth: name variant → true entity ID, for the labelled variants.
+
+    Only variants present in both mappings are scored. Precision is the share
+    of predicted same-entity pairs that are truly the same entity (wrong merges
+    hide an entity from expansion); recall is the share of true pairs that
+    were merged (missed merges cost one duplicate expansion call each).
+    """
+    precision_target, recall_target = 0.95, 0.80
+    labelled = predicted.keys() & ground_truth.keys()
+    pred_pairs = _same_cluster_pairs({k: predicted[k] for k in labelled})
+    gt_pairs = _same_cluster_pairs({k: ground_truth[k] for k in labelled})
+
+    correct = len(pred_pairs & gt_pairs)
+    precision = correct / len(pred_pairs) if pred_pairs else 1.0
+    recall = correct / len(gt_pairs) if gt_pairs else 1.0
+    return (
+        MetricResult(
+            "Entity Resolution Precision", precision, precision_target,
+            precision >= precision_target,
+        ),
+        MetricResult(
+            "Entity Resolution Recall", recall, recall_target, recall >= recall_target,
+        ),
+    )
+
+
 def scrape_completion(completed: int, total: int) -> MetricResult:
     """Phase 2: fraction of sources successfully scraped."""
     target = 0.90
@@ -1,121 +1,518 @@
-"""Regulatory change monitor — detects content changes on indexed sources."""
+"""Regulatory change monitor — detects content changes on indexed sources.
 
+Each source is probed with a conditional GET carrying the ETag /
+Last-Modified saved from the previous sweep, so an unchanged source costs a
+304 and no body. Bodies that are downloaded are hashed as they stream in and
+compared with the last known raw-content hash: the monitor's own from the
+previous sweep, or the staged document's on the first sweep.
+
+A sweep is split into ``monitor_shards`` shards by source host, so one host's
+sources stay together and per-host politeness holds within a shard. Workers —
+coroutines in this process or separate processes sharing the database —
+claim shards one at a time and commit progress after every batch of
+``monitor_batch_size`` sources. A shard whose worker stops heartbeating for
+``monitor_shard_lease_seconds`` is reclaimed and resumed from its cursor, so
+an interrupted sweep continues where it stopped instead of starting over.
+Heartbeats continue while a batch is in flight, and a worker's writes only
+land while it still holds the shard.
+
+Within a batch, probes run concurrently (``monitor_concurrency``); the shared
+HTTP client caps in-flight requests per host.
+
+Usage:
+    summary = await run_change_monitor_workers()   # whole sweep, N workers
+    summary = await run_change_monitor(db)         # join the sweep as one worker
+"""
+
+import asyncio
 import hashlib
 import logging
-from datetime import UTC, datetime
+import uuid
+import zlib
+from collections.abc import Awaitable
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
 
 import httpx
-from sqlalchemy import select
+from sqlalchemy import and_, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models.feedback import ChangeEvent, CurationQueueItem, CurationQueuePriority
+from app.acquisition.scheduler import host_of
+from app.config import settings
+from app.database import async_session
+from app.http_client import get_http_client
+from app.models.acquisition import StagedDocument
+from app.models.feedback import (
+    ChangeEvent,
+    CurationQueueItem,
+    CurationQueuePriority,
+    MonitorShardStatus,
+    MonitorSweep,
+    MonitorSweepShard,
+    MonitorSweepStatus,
+    SourceFetchState,
+)
 from app.models.ingestion import InternalDocument
 from app.models.manifest import Source
 
 logger = logging.getLogger(__name__)
 
+_COUNTERS = ("sources_checked", "changes_detected", "not_modified", "bytes_downloaded", "errors")
+
+
+@dataclass
+class _Target:
+    """An indexed source to check, with the staged raw-content hash."""
+
+    source_id: str
+    manifest_id: str
+    name: str
+    url: str
+    staged_hash: str | None
+
+    @property
+    def key(self) -> tuple[str, str]:
+        return (self.manifest_id, self.source_id)
+
+
+@dataclass
+class _Probe:
+    """Network result for one source; carries no DB state."""
+
+    target: _Target
+    baseline_hash: str | None  # Raw-content hash to compare against
+    status: int | None = None
+    etag: str | None = None
+    last_modified: str | None = None
+    content_length: int | None = None
+    current_hash: str | None = None
+    bytes_read: int = 0
+    error: str | None = None
+
+    @property
+    def not_modified(self) -> bool:
+        return self.status == 304
+
+
+@dataclass
+class _Counts:
+    sources_checked: int = 0
+    changes_detected: int = 0
+    not_modified: int = 0
+    bytes_downloaded: int = 0
+    errors: int = 0
+    shards: list[int] = field(default_factory=list)
+
+    def add(self, other: "_Counts") -> None:
+        for name in _COUNTERS:
+            setattr(self, name, getattr(self, name) + getattr(other, name))
+
+
+def shard_of(url: str, shard_count: int) -> int:
+    """Stable shard for a source URL; every source of one host shares a shard."""
+    return zlib.crc32(host_of(url).encode("utf-8")) % max(shard_count, 1)
+
+
+# ── Sweeps ────────────────────────────────────────────────────────────────
+
+
+async def ensure_sweep(db: AsyncSession) -> MonitorSweep:
+    """Return the running sweep, starting a new one if none is in progress."""
+    result = await db.execute(
+        select(MonitorSweep)
+        .where(MonitorSweep.status == MonitorSweepStatus.running)
+        .order_by(MonitorSweep.started_at.desc())
+        .limit(1)
+    )
+    sweep = result.scalar_one_or_none()
+    if sweep is not None:
+        return sweep
+
+    shard_count = max(settings.monitor_shards, 1)
+    sweep = MonitorSweep(
+        id=f"sweep-{datetime.now(UTC).strftime('%Y%m%d%H%M%S%f')}",
+        status=MonitorSweepStatus.running,
+        shard_count=shard_count,
+        started_at=datetime.now(UTC),
+    )
+    db.add(sweep)
+    for shard in range(shard_count):
+        db.add(MonitorSweepShard(sweep_id=sweep.id, shard=shard, status=MonitorShardStatus.pending))
+    await db.commit()
+    logger.info("Monitor sweep %s started (%d shards)", sweep.id, shard_count)
+    return sweep
+
 
-async def run_change_monitor(db: AsyncSession) -> dict:
-    """Run a change monitoring sweep across all indexed sources.
+async def run_change_monitor(db: AsyncSession, *, worker_id: str | None = None) -> dict:
+    """Work on the current sweep until no shard is left to claim.
 
-    Checks HTTP headers and content hashes for changes.
-    Returns summary stats.
+    Starts a sweep if none is running. Several callers — each with its own
+    session — may run at once; they split the shards between them.
+    Returns this worker's counts plus the sweep's status.
     """
-    # Get all sources that have indexed documents
+    sweep = await ensure_sweep(db)
+    sweep_id = sweep.id
+    worker_id = worker_id or f"monitor-{uuid.uuid4().hex[:8]}"
+    targets = await _load_targets(db, sweep.shard_count)
+
+    states = await _load_states(db)
+
+    counts = _Counts()
+    while (shard := await _claim_shard(db, sweep_id, worker_id)) is not None:
+        shard_no = shard.shard
+        shard_counts, finished = await _run_shard(
+            db, shard, worker_id, targets.get(shard_no, []), states
+        )
+        counts.add(shard_counts)
+        if finished:
+            counts.shards.append(shard_no)
+        else:
+            # Lost the shard; the rollback expired the loaded fetch states
+            states = await _load_states(db)
+
+    sweep = await _finalize_sweep(db, sweep_id)
+    return {
+        "sweep_id": sweep.id,
+        "sweep_status": sweep.status,
+        "shards_processed": counts.shards,
+        **{name: getattr(counts, name) for name in _COUNTERS},
+        "duration_s": sweep.duration_s,
+        "sources_per_sec": sweep.sources_per_sec,
+    }
+
+
+async def run_change_monitor_workers(workers: int | None = None) -> dict:
+    """Run the current sweep with several in-process workers, each with its own session."""
+    workers = max(workers or settings.monitor_workers, 1)
+    async with async_session() as db:
+        sweep = await ensure_sweep(db)
+
+    async def work(index: int) -> dict:
+        async with async_session() as db:
+            return await run_change_monitor(db, worker_id=f"{sweep.id}-w{index}")
+
+    results = await asyncio.gather(*(work(i) for i in range(workers)))
+    async with async_session() as db:
+        sweep = await _finalize_sweep(db, sweep.id)
+    return {
+        "sweep_id": sweep.id,
+        "sweep_status": sweep.status,
+        "shards_processed": sorted(s for r in results for s in r["shards_processed"]),
+        **{name: sum(r[name] for r in results) for name in _COUNTERS},
+        "duration_s": sweep.duration_s,
+        "sources_per_sec": sweep.sources_per_sec,
+    }
+
+
+async def _load_targets(db: AsyncSession, shard_count: int) -> dict[int, list[_Target]]:
+    """Indexed sources grouped by shard, each shard in cursor order."""
     result = await db.execute(
-        select(Source, InternalDocument.content_hash)
+        select(Source.id, Source.manifest_id, Source.name, Source.url, StagedDocument.content_hash)
         .join(
             InternalDocument,
             (InternalDocument.source_id == Source.id)
             & (InternalDocument.manifest_id == Source.manifest_id),
         )
+        .outerjoin(StagedDocument, StagedDocument.id == InternalDocument.staged_document_id)
         .where(InternalDocument.content_hash != "")
     )
-    rows = result.all()
+    by_shard: dict[int, dict[tuple[str, str], _Target]] = {}
+    for source_id, manifest_id, name, url, staged_hash in result.all():
+        target = _Target(source_id, manifest_id, name, url, staged_hash)
+        # One entry per source even if it has several indexed documents
+        by_shard.setdefault(shard_of(url, shard_count), {}).setdefault(target.key, target)
+    return {
+        shard: sorted(targets.values(), key=lambda t: t.key)
+        for shard, targets in by_shard.items()
+    }
+
+
+async def _load_states(db: AsyncSession) -> dict[tuple[str, str], SourceFetchState]:
+    result = await db.execute(select(SourceFetchState))
+    return {(s.source_id, s.manifest_id): s for s in result.scalars().all()}
+
+
+async def _claim_shard(db: AsyncSession, sweep_id: str, worker_id: str) -> MonitorSweepShard | None:
+    """Atomically claim the next pending (or abandoned) shard of the sweep."""
+    now = datetime.now(UTC)
+    stale = now - timedelta(seconds=settings.monitor_shard_lease_seconds)
+    claimable = or_(
+        MonitorSweepShard.status == MonitorShardStatus.pending,
+        and_(
+            MonitorSweepShard.status == MonitorShardStatus.running,
+            or_(MonitorSweepShard.heartbeat_at.is_(None), MonitorSweepShard.heartbeat_at < stale),
+        ),
+    )
+    result = await db.execute(
+        select(MonitorSweepShard.shard)
+        .where(MonitorSweepShard.sweep_id == sweep_id, claimable)
+        .order_by(MonitorSweepShard.shard)
+    )
+    for shard_no in result.scalars().all():
+        claimed = await db.execute(
+            update(MonitorSweepShard)
+            .where(
+                MonitorSweepShard.sweep_id == sweep_id,
+                MonitorSweepShard.shard == shard_no,
+                claimable,
+            )
+            .values(status=MonitorShardStatus.running, worker_id=worker_id, heartbeat_at=now)
+            .execution_options(synchronize_session=False)
+        )
+        await db.commit()
+        if claimed.rowcount == 1:
+            return await db.get(MonitorSweepShard, (sweep_id, shard_no), populate_existing=True)
+    return None
+
+
+async def _run_shard(
+    db: AsyncSession,
+    shard: MonitorSweepShard,
+    worker_id: str,
+    targets: list[_Target],
+    states: dict[tuple[str, str], SourceFetchState],
+) -> tuple[_Counts, bool]:
+    """Check a shard's sources after its cursor, committing after each batch.
 
-    sources_checked = 0
-    changes_detected = 0
+    Every write is conditional on this worker still holding the shard. If
+    another worker reclaimed it, the batch is rolled back and the shard is
+    left to that worker; the second value returned is then False.
+    """
+    cursor = (
+        (shard.cursor_manifest_id, shard.cursor_source_id)
+        if shard.cursor_source_id is not None else None
+    )
+    remaining = [t for t in targets if cursor is None or t.key > cursor]
+    if cursor is not None:
+        logger.info(
+            "Monitor shard %s/%d resuming after %s (%d left)",
+            shard.sweep_id, shard.shard, cursor[1], len(remaining),
+        )
+    client = get_http_client()
+    semaphore = asyncio.Semaphore(max(settings.monitor_concurrency, 1))
 
-    async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
-        for source, prev_hash in rows:
-            sources_checked += 1
+    async def probe(target: _Target) -> _Probe:
+        async with semaphore:
+            state = states.get((target.source_id, target.manifest_id))
+            return await _probe_source(client, target, state)
+
+    counts = _Counts()
+    batch_size = max(settings.monitor_batch_size, 1)
+    for start in range(0, len(remaining), batch_size):
+        batch = remaining[start:start + batch_size]
+        probes = await _with_heartbeat(
+            db, shard, worker_id, asyncio.gather(*(probe(t) for t in batch))
+        )
+
+        batch_counts = _Counts(sources_checked=len(probes))
+        for p in probes:
+            batch_counts.bytes_downloaded += p.bytes_read
+            batch_counts.not_modified += p.not_modified
+            batch_counts.errors += p.error is not None
             try:
-                change = await _check_source(client, db, source, prev_hash)
-                if change:
-                    changes_detected += 1
+                if _apply_probe(db, p, states) is not None:
+                    batch_counts.changes_detected += 1
             except Exception:
                 logger.debug(
-                    "Monitor check failed for source %s", source.id, exc_info=True
+                    "Monitor check failed for source %s", p.target.source_id, exc_info=True
                 )
 
+        progress = {name: getattr(MonitorSweepShard, name) + getattr(batch_counts, name)
+                    for name in _COUNTERS}
+        cursor_manifest_id, cursor_source_id = batch[-1].key
+        if not await _renew_lease(
+            db, shard, worker_id, **progress, sources_total=len(targets),
+            cursor_manifest_id=cursor_manifest_id, cursor_source_id=cursor_source_id,
+        ):
+            logger.warning(
+                "Monitor shard %s/%d was reclaimed from %s; dropping its last batch",
+                shard.sweep_id, shard.shard, worker_id,
+            )
+            await db.rollback()
+            return counts, False
+        await db.commit()
+        counts.add(batch_counts)
+
+    finished = await _renew_lease(
+        db, shard, worker_id, sources_total=len(targets),
+        status=MonitorShardStatus.complete, completed_at=datetime.now(UTC),
+    )
     await db.commit()
-    return {
-        "sources_checked": sources_checked,
-        "changes_detected": changes_detected,
-    }
+    return counts, finished
+
+
+async def _renew_lease(
+    db: AsyncSession, shard: MonitorSweepShard, worker_id: str, **values
+) -> bool:
+    """Heartbeat the shard (and write ``values``) if ``worker_id`` still holds it."""
+    result = await db.execute(
+        update(MonitorSweepShard)
+        .where(
+            MonitorSweepShard.sweep_id == shard.sweep_id,
+            MonitorSweepShard.shard == shard.shard,
+            MonitorSweepShard.worker_id == worker_id,
+        )
+        .values(heartbeat_at=datetime.now(UTC), **values)
+        .execution_options(synchronize_session=False)
+    )
+    return result.rowcount == 1
+
+
+async def _with_heartbeat[T](
+    db: AsyncSession, shard: MonitorSweepShard, worker_id: str, work: Awaitable[T]
+) -> T:
+    """Await ``work``, renewing the shard's lease every third of the lease period.
+
+    The probes do not touch the session, so the heartbeats can use it.
+    """
+    task = asyncio.ensure_future(work)
+    interval = settings.monitor_shard_lease_seconds / 3
+    while not (await asyncio.wait({task}, timeout=interval))[0]:
+        await _renew_lease(db, shard, worker_id)
+        await db.commit()
+    return task.result()
+
+
+async def _finalize_sweep(db: AsyncSession, sweep_id: str) -> MonitorSweep:
+    """Roll shard totals into the sweep and close it once every shard is complete."""
+    sweep = await db.get(MonitorSweep, sweep_id, populate_existing=True)
+    if sweep.status == MonitorSweepStatus.complete:
+        return sweep
+
+    result = await db.execute(
+        select(MonitorSweepShard)
+        .where(MonitorSweepShard.sweep_id == sweep_id)
+        .execution_options(populate_existing=True)
+    )
+    shards = result.scalars().all()
+    if any(s.status != MonitorShardStatus.complete for s in shards):
+        return sweep
+
+    for name in _COUNTERS:
+        setattr(sweep, name, sum(getattr(s, name) for s in shards))
+    completed_at = datetime.now(UTC)
+    started_at = sweep.started_at
+    if started_at.tzinfo is None:
+        started_at = started_at.replace(tzinfo=UTC)
+    sweep.duration_s = round((completed_at - started_at).total_seconds(), 1)
+    sweep.sources_per_sec = (
+        round(sweep.sources_checked / sweep.duration_s, 2) if sweep.duration_s > 0 else 0.0
+    )
+    sweep.completed_at = completed_at
+    sweep.status = MonitorSweepStatus.complete
+    await db.commit()
+    logger.info(
+        "Monitor sweep %s complete: %d sources in %.1fs (%.2f/s), %d changes",
+        sweep.id, sweep.sources_checked, sweep.duration_s, sweep.sources_per_sec,
+        sweep.changes_detected,
+    )
+    return sweep
 
 
-async def _check_source(
+# ── Probing ───────────────────────────────────────────────────────────────
+
+
+async def _probe_source(
     client: httpx.AsyncClient,
+    target: _Target,
+    state: SourceFetchState | None,
+) -> _Probe:
+    """Conditionally GET a source, hashing the body only if it was sent."""
+    probe = _Probe(
+        target=target,
+        baseline_hash=(state.content_hash if state and state.content_hash else target.staged_hash),
+    )
+    headers = {}
+    if state and state.etag:
+        headers["If-None-Match"] = state.etag
+    if state and state.last_modified:
+        headers["If-Modified-Since"] = state.last_modified
+
+    try:
+        async with client.stream("GET", target.url, headers=headers, timeout=30.0) as response:
+            probe.status = response.status_code
+            probe.etag = response.headers.get("etag")
+            probe.last_modified = response.headers.get("last-modified")
+            length = response.headers.get("content-length")
+            probe.content_length = int(length) if length and length.isdigit() else None
+            if probe.not_modified or response.status_code >= 400:
+                return probe
+
+            digest = hashlib.sha256()
+            async for chunk in response.aiter_bytes():
+                probe.bytes_read += len(chunk)
+                digest.update(chunk)
+            probe.current_hash = f"sha256:{digest.hexdigest()}"
+    except Exception as exc:
+        # Not only httpx.HTTPError: a malformed stored URL raises InvalidURL,
+        # which must not abort the rest of the batch
+        logger.debug("Error checking source %s", target.source_id, exc_info=True)
+        probe.error = str(exc) or type(exc).__name__
+    return probe
+
+
+def _apply_probe(
     db: AsyncSession,
-    source: Source,
-    previous_hash: str,
+    probe: _Probe,
+    states: dict[tuple[str, str], SourceFetchState],
 ) -> ChangeEvent | None:
-    """Check a single source for changes via HTTP HEAD + content hash."""
-    try:
-        # First try HEAD for quick metadata check
-        head_resp = await client.head(source.url)
-        if head_resp.status_code >= 400:
-            return None
-
-        # Check Last-Modified and Content-Length headers
-        last_modified = head_resp.headers.get("last-modified")
-        content_length = head_resp.headers.get("content-length")
-
-        # If we can't determine from headers, do a full GET and hash
-        get_resp = await client.get(source.url)
-        if get_resp.status_code >= 400:
-            return None
-
-        current_hash = hashlib.sha256(get_resp.content).hexdigest()
-
-        if current_hash == previous_hash:
-            return None  # No change
-
-        # Change detected
-        event_id = f"chg-{datetime.now(UTC).strftime('%Y%m%d%H%M%S%f')}"
-        event = ChangeEvent(
-            id=event_id,
-            source_id=source.id,
-            manifest_id=source.manifest_id,
-            detection_method="hash_check",
-            change_type="content_update",
-            previous_hash=previous_hash,
-            current_hash=current_hash,
-            description=(
-                f"Content hash changed for {source.name}. "
-                f"Last-Modified: {last_modified or 'unknown'}, "
-                f"Content-Length: {content_length or 'unknown'}"
-            ),
-        )
-        db.add(event)
-
-        # Queue for re-curation
-        queue_id = f"rcq-chg-{datetime.now(UTC).strftime('%Y%m%d%H%M%S%f')}"
-        queue_item = CurationQueueItem(
-            id=queue_id,
-            source_id=source.id,
-            manifest_id=source.manifest_id,
-            priority=CurationQueuePriority.high,
-            reason=f"Content change detected: {event.description[:200]}",
-            trigger_type="change_detected",
-            change_event_id=event_id,
-        )
-        db.add(queue_item)
+    """Persist validators for a probe and record a change event if the content changed."""
+    target = probe.target
+    if probe.status is None:
+        return None
 
-        await db.flush()
-        return event
+    key = (target.source_id, target.manifest_id)
+    state = states.get(key)
+    if state is None:
+        state = SourceFetchState(source_id=target.source_id, manifest_id=target.manifest_id)
+        db.add(state)
+        states[key] = state
+    state.last_status = probe.status
+    state.checked_at = datetime.now(UTC)
 
-    except httpx.HTTPError:
-        logger.debug("HTTP error checking source %s", source.id)
+    if probe.not_modified or probe.status >= 400:
         return None
+
+    # Validators are replaced, not merged: a server that stops sending an
+    # ETag must not be asked about a stale one
+    state.etag = probe.etag
+    state.last_modified = probe.last_modified
+    state.content_length = probe.content_length
+    state.content_hash = probe.current_hash
+
+    previous_hash = probe.baseline_hash
+    if previous_hash is None or probe.current_hash == previous_hash:
+        return None  # No change (or nothing to compare with yet)
+
+    # Change detected
+    state.changed_at = state.checked_at
+    event_id = f"chg-{datetime.now(UTC).strftime('%Y%m%d%H%M%S%f')}-{uuid.uuid4().hex[:6]}"
+    event = ChangeEvent(
+        id=event_id,
+        source_id=target.source_id,
+        manifest_id=target.manifest_id,
+        detection_method="hash_check",
+        change_type="content_update",
+        previous_hash=previous_hash,
+        current_hash=probe.current_hash,
+        description=(
+            f"Content hash changed for {target.name}. "
+            f"Last-Modified: {probe.last_modified or 'unknown'}, "
+            f"Content-Length: {probe.content_length or 'unknown'}"
+        ),
+    )
+    db.add(event)
+
+    # Queue for re-curation
+    queue_id = f"rcq-chg-{datetime.now(UTC).strftime('%Y%m%d%H%M%S%f')}-{uuid.uuid4().hex[:6]}"
+    queue_item = CurationQueueItem(
+        id=queue_id,
+        source_id=target.source_id,
+        manifest_id=target.manifest_id,
+        priority=CurationQueuePriority.high,
+        reason=f"Content change detected: {event.description[:200]}",
+        trigger_type="change_detected",
+        change_event_id=event_id,
+    )
+    db.add(queue_item)
+    return event
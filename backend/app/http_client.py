@@ -0,0 +1,361 @@
+"""Shared HTTP client — one pooled httpx client for all outbound fetches.
+
+Scraping, direct downloads, API acquisition and the change monitor all talk to
+the same handful of government hosts. Sharing one app-lifetime client keeps
+connections alive between requests, reuses TLS sessions and multiplexes
+requests over HTTP/2 where the server supports it.
+
+On top of httpx's own connection pool this adds:
+
+- a per-host limit on in-flight requests (``http_max_connections_per_host``);
+- a DNS cache with a TTL (``http_dns_ttl_seconds``);
+- counters for requests and opened connections, reported by ``pool_stats()``.
+
+The client is bound to the event loop that created it; ``get_http_client()``
+builds a fresh one when called from a different loop (tests, CLI scripts).
+Each client is closed when its loop's leftover tasks are cancelled, as
+``asyncio.run()`` does before closing the loop, so replaced clients do not
+leak connections.
+
+Usage:
+    client = get_http_client()
+    response = await client.get(url, headers={"User-Agent": USER_AGENT})
+    pool_stats()  # {"requests": ..., "connections_opened": ..., "reuse_ratio": ...}
+    await close_http_client()  # on shutdown
+"""
+
+from __future__ import annotations
+
+import asyncio
+import ipaddress
+import logging
+import socket
+import time
+from collections import defaultdict
+from collections.abc import AsyncIterable, AsyncIterator, Callable, Iterable, Iterator
+from contextlib import contextmanager
+
+import httpcore
+import httpx
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+USER_AGENT = "RARIS/0.1 Regulatory Research Bot"
+MAX_REDIRECTS = 5
+
+
+def _h2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+class _CachingResolverBackend(httpcore.AsyncNetworkBackend):
+    """Network backend that caches DNS lookups and counts opened connections.
+
+    Connects to the resolved IP address; httpcore still passes the origin
+    hostname to ``start_tls`` so SNI and certificate checks are unaffected.
+    """
+
+    def __init__(self, inner: httpcore.AsyncNetworkBackend, ttl_seconds: float) -> None:
+        self._inner = inner
+        self._ttl = ttl_seconds
+        # host → (expires_at, addresses)
+        self._cache: dict[str, tuple[float, list[str]]] = {}
+        self.connections_opened = 0
+        self.dns_lookups = 0
+
+    async def _resolve(self, host: str, port: int) -> list[str]:
+        cached = self._cache.get(host)
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+        self.dns_lookups += 1
+        infos = await asyncio.get_running_loop().getaddrinfo(host, port, type=socket.SOCK_STREAM)
+        addresses = list(dict.fromkeys(info[4][0] for info in infos))
+        if self._ttl > 0:
+            self._cache[host] = (time.monotonic() + self._ttl, addresses)
+        return addresses
+
+    async def connect_tcp(
+        self,
+        host: str,
+        port: int,
+        timeout: float | None = None,
+        local_address: str | None = None,
+        socket_options: Iterable[httpcore.SOCKET_OPTION] | None = None,
+    ) -> httpcore.AsyncNetworkStream:
+        try:
+            ipaddress.ip_address(host)
+            addresses = [host]
+        except ValueError:
+            addresses = await self._resolve(host, port)
+
+        last_exc: Exception | None = None
+        for address in addresses:
+            try:
+                stream = await self._inner.connect_tcp(
+                    address, port, timeout=timeout,
+                    local_address=local_address, socket_options=socket_options,
+                )
+            except (httpcore.ConnectError, httpcore.ConnectTimeout) as exc:
+                last_exc = exc
+                continue
+            self.connections_opened += 1
+            return stream
+
+        # Every cached address failed — look the host up again next time
+        self._cache.pop(host, None)
+        raise last_exc or httpcore.ConnectError(f"No addresses for {host}")
+
+    async def connect_unix_socket(
+        self,
+        path: str,
+        timeout: float | None = None,
+        socket_options: Iterable[httpcore.SOCKET_OPTION] | None = None,
+    ) -> httpcore.AsyncNetworkStream:
+        return await self._inner.connect_unix_socket(
+            path, timeout=timeout, socket_options=socket_options
+        )
+
+    async def sleep(self, seconds: float) -> None:
+        await self._inner.sleep(seconds)
+
+    def cache_size(self) -> int:
+        now = time.monotonic()
+        return sum(1 for expires_at, _ in self._cache.values() if expires_at > now)
+
+
+# httpcore exceptions and the httpx exceptions callers catch; subclasses
+# come first in an exception's MRO, so the most specific match wins
+_EXCEPTION_MAP: dict[type[Exception], type[httpx.TransportError]] = {
+    httpcore.TimeoutException: httpx.TimeoutException,
+    httpcore.ConnectTimeout: httpx.ConnectTimeout,
+    httpcore.ReadTimeout: httpx.ReadTimeout,
+    httpcore.WriteTimeout: httpx.WriteTimeout,
+    httpcore.PoolTimeout: httpx.PoolTimeout,
+    httpcore.NetworkError: httpx.NetworkError,
+    httpcore.ConnectError: httpx.ConnectError,
+    httpcore.ReadError: httpx.ReadError,
+    httpcore.WriteError: httpx.WriteError,
+    httpcore.ProxyError: httpx.ProxyError,
+    httpcore.UnsupportedProtocol: httpx.UnsupportedProtocol,
+    httpcore.ProtocolError: httpx.ProtocolError,
+    httpcore.LocalProtocolError: httpx.LocalProtocolError,
+    httpcore.RemoteProtocolError: httpx.RemoteProtocolError,
+}
+
+
+@contextmanager
+def _mapped_exceptions() -> Iterator[None]:
+    try:
+        yield
+    except Exception as exc:
+        for cls in type(exc).__mro__:
+            if cls in _EXCEPTION_MAP:
+                raise _EXCEPTION_MAP[cls](str(exc)) from exc
+        raise
+
+
+class _PoolByteStream(httpx.AsyncByteStream):
+    """Response body read from an httpcore connection."""
+
+    def __init__(self, inner: AsyncIterable[bytes]) -> None:
+        self._inner = inner
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        with _mapped_exceptions():
+            async for chunk in self._inner:
+                yield chunk
+
+    async def aclose(self) -> None:
+        if hasattr(self._inner, "aclose"):
+            with _mapped_exceptions():
+                await self._inner.aclose()
+
+
+class _PoolTransport(httpx.AsyncBaseTransport):
+    """Sends requests through an httpcore pool built with our network backend."""
+
+    def __init__(self, pool: httpcore.AsyncConnectionPool) -> None:
+        self.pool = pool
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        core_request = httpcore.Request(
+            method=request.method,
+            url=httpcore.URL(
+                scheme=request.url.raw_scheme,
+                host=request.url.raw_host,
+                port=request.url.port,
+                target=request.url.raw_path,
+            ),
+            headers=request.headers.raw,
+            content=request.stream,
+            extensions=request.extensions,
+        )
+        with _mapped_exceptions():
+            response = await self.pool.handle_async_request(core_request)
+        return httpx.Response(
+            status_code=response.status,
+            headers=response.headers,
+            stream=_PoolByteStream(response.stream),
+            extensions=response.extensions,
+        )
+
+    async def aclose(self) -> None:
+        await self.pool.aclose()
+
+
+class _ReleasingStream(httpx.AsyncByteStream):
+    """Response body stream that frees the host slot when it is closed."""
+
+    def __init__(self, inner: httpx.AsyncByteStream, release: Callable[[], None]) -> None:
+        self._inner = inner
+        self._release: Callable[[], None] | None = release
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._inner:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._inner.aclose()
+        finally:
+            if self._release is not None:
+                self._release()
+                self._release = None
+
+
+class _HostLimitedTransport(httpx.AsyncBaseTransport):
+    """Caps in-flight requests per host; a slot is held until the body is closed."""
+
+    def __init__(self, inner: httpx.AsyncBaseTransport, per_host: int) -> None:
+        self._inner = inner
+        self._per_host = max(per_host, 1)
+        self._slots: dict[str, asyncio.Semaphore] = defaultdict(
+            lambda: asyncio.Semaphore(self._per_host)
+        )
+        self.requests = 0
+        self.waited = 0
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        slot = self._slots[request.url.host]
+        if slot.locked():
+            self.waited += 1
+        await slot.acquire()
+        self.requests += 1
+        try:
+            response = await self._inner.handle_async_request(request)
+        except BaseException:
+            slot.release()
+            raise
+        if isinstance(response.stream, httpx.ByteStream):
+            # Fully buffered body — no connection is held while it is read
+            slot.release()
+            return response
+        response.stream = _ReleasingStream(response.stream, slot.release)
+        return response
+
+    async def aclose(self) -> None:
+        await self._inner.aclose()
+
+
+_client: httpx.AsyncClient | None = None
+_client_loop: asyncio.AbstractEventLoop | None = None
+_transport: _HostLimitedTransport | None = None
+_backend: _CachingResolverBackend | None = None
+_pool: httpcore.AsyncConnectionPool | None = None
+_closer: asyncio.Task | None = None
+
+
+def _build_client(
+    inner: httpx.AsyncBaseTransport | None = None,
+) -> httpx.AsyncClient:
+    """Build the shared client; ``inner`` replaces the network transport in tests."""
+    global _transport, _backend, _pool
+
+    http2 = settings.http2_enabled and _h2_available()
+    if inner is None:
+        _backend = _CachingResolverBackend(httpcore.AnyIOBackend(), settings.http_dns_ttl_seconds)
+        _pool = httpcore.AsyncConnectionPool(
+            ssl_context=httpx.create_ssl_context(),
+            max_connections=settings.http_max_connections,
+            max_keepalive_connections=settings.http_max_connections,
+            keepalive_expiry=settings.http_keepalive_expiry,
+            http2=http2,
+            network_backend=_backend,
+        )
+        inner = _PoolTransport(_pool)
+    else:
+        _pool = None
+        _backend = None
+
+    _transport = _HostLimitedTransport(inner, settings.http_max_connections_per_host)
+    return httpx.AsyncClient(
+        transport=_transport,
+        timeout=httpx.Timeout(settings.http_read_timeout, connect=settings.http_connect_timeout),
+        follow_redirects=True,
+        max_redirects=MAX_REDIRECTS,
+    )
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the shared client for the running event loop, creating it if needed."""
+    global _client, _client_loop, _closer
+
+    loop = asyncio.get_running_loop()
+    if _client is None or _client.is_closed or _client_loop is not loop:
+        _client = _build_client()
+        _client_loop = loop
+        _closer = loop.create_task(_close_with_loop(_client))
+        logger.info(
+            "HTTP client pool created (http2=%s, max_connections=%d, per_host=%d)",
+            settings.http2_enabled and _h2_available(),
+            settings.http_max_connections,
+            settings.http_max_connections_per_host,
+        )
+    return _client
+
+
+async def _close_with_loop(client: httpx.AsyncClient) -> None:
+    """Wait until cancelled, then close ``client`` while its loop still runs."""
+    try:
+        await asyncio.Future()
+    finally:
+        await client.aclose()
+
+
+async def close_http_client() -> None:
+    """Close the shared client and its pooled connections."""
+    global _client, _client_loop, _closer
+
+    if _client is not None and not _client.is_closed:
+        await _client.aclose()
+    if _closer is not None and _closer.get_loop() is asyncio.get_running_loop():
+        _closer.cancel()
+    _client = None
+    _client_loop = None
+    _closer = None
+
+
+def pool_stats() -> dict:
+    """Connection pool metrics for the admin API."""
+    requests = _transport.requests if _transport else 0
+    opened = _backend.connections_opened if _backend else 0
+    connections = _pool.connections if _pool else []
+    idle = sum(1 for conn in connections if conn.is_idle())
+    return {
+        "active": _client is not None and not _client.is_closed,
+        "http2": settings.http2_enabled and _h2_available(),
+        "requests": requests,
+        "connections_opened": opened,
+        "connections_open": len(connections),
+        "connections_idle": idle,
+        "reuse_ratio": round(1 - opened / requests, 3) if requests else 0.0,
+        "per_host_waits": _transport.waited if _transport else 0,
+        "dns_lookups": _backend.dns_lookups if _backend else 0,
+        "dns_cache_size": _backend.cache_size() if _backend else 0,
+    }
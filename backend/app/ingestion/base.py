@@ -2,6 +2,7 @@
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
+from pathlib import Path
 
 
 @dataclass
@@ -33,6 +34,9 @@ class ExtractedDocument:
 
 
 class IngestionAdapter(ABC):
+    # True when ingest_file() reads from disk rather than loading the whole file
+    reads_files: bool = False
+
     @abstractmethod
     async def ingest(self, content: str | bytes, source_url: str = "") -> ExtractedDocument:
         """Transform raw content into an ExtractedDocument."""
@@ -42,3 +46,7 @@ class IngestionAdapter(ABC):
     def supports(self, content_type: str) -> bool:
         """Return True if this adapter handles the given content type."""
         ...
+
+    async def ingest_file(self, path: Path, source_url: str = "") -> ExtractedDocument:
+        """Transform a staged file on disk into an ExtractedDocument."""
+        return await self.ingest(path.read_bytes(), source_url=source_url)
@@ -0,0 +1,113 @@
+"""Bulk persistence for ingestion — a document's rows in a few statements.
+
+Sections, tables and chunks are written with executemany INSERT / UPDATE /
+DELETE statements (batched into multi-row statements by the driver) rather
+than one ORM object per row, so nothing passes through the session's unit
+of work and a document with thousands of sections costs a handful of round
+trips.
+
+Usage:
+    await insert_sections(db, doc_id, flat_sections)
+    await insert_tables(db, doc_id, extracted.tables)
+    await write_chunks(db, doc_id, delta, metadata=chunk_metadata(doc))
+"""
+
+from collections.abc import Iterator, Sequence
+
+from sqlalchemy import delete, insert, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.ingestion.base import ExtractedTable
+from app.ingestion.incremental import ChunkDelta, FlatSection
+from app.models.ingestion import Chunk, DocumentSection, DocumentTable
+
+# Ids per DELETE ... IN (...); keeps bind parameters well under driver limits
+_ID_BATCH = 5000
+
+
+async def insert_sections(db: AsyncSession, doc_id: str, sections: list[FlatSection]) -> None:
+    if not sections:
+        return
+    await db.execute(insert(DocumentSection), [
+        {
+            "id": flat.db_id,
+            "document_id": doc_id,
+            "parent_id": flat.parent_id,
+            "heading": flat.section.heading,
+            "level": flat.section.level,
+            "text": flat.section.text,
+            "position": flat.position,
+            "content_hash": flat.content_hash,
+        }
+        for flat in sections
+    ])
+
+
+async def insert_tables(db: AsyncSession, doc_id: str, tables: list[ExtractedTable]) -> None:
+    if not tables:
+        return
+    await db.execute(insert(DocumentTable), [
+        {
+            "id": f"{doc_id}-{tbl.id}",
+            "document_id": doc_id,
+            "section_id": tbl.section_id,
+            "caption": tbl.caption,
+            "headers": tbl.headers,
+            "rows": tbl.rows,
+        }
+        for tbl in tables
+    ])
+
+
+async def write_chunks(
+    db: AsyncSession, doc_id: str, delta: ChunkDelta, metadata: dict | None = None
+) -> None:
+    """Apply a chunk delta: delete removed, move kept, insert added chunks.
+
+    Embeddings set on the delta's chunks are written with them. ``metadata``,
+    when given, becomes every chunk's ``chunk_metadata`` in one statement.
+    """
+    for ids in _batches(delta.removed):
+        await db.execute(delete(Chunk).where(Chunk.id.in_(ids)))
+
+    moved = [c for c in delta.kept if c.embedding is None]
+    embedded = [c for c in delta.kept if c.embedding is not None]
+    if moved:
+        await db.execute(update(Chunk), [
+            {"id": c.id, "section_id": c.section_id, "position": c.position} for c in moved
+        ])
+    if embedded:
+        await db.execute(update(Chunk), [
+            {
+                "id": c.id,
+                "section_id": c.section_id,
+                "position": c.position,
+                "embedding": c.embedding,
+            }
+            for c in embedded
+        ])
+
+    if delta.added:
+        await db.execute(insert(Chunk), [
+            {
+                "id": c.id,
+                "document_id": doc_id,
+                "section_id": c.section_id,
+                "section_path": c.section_path,
+                "text": c.text,
+                "token_count": c.token_count,
+                "position": c.position,
+                "embedding": c.embedding,
+            }
+            for c in delta.added
+        ])
+
+    if metadata is not None:
+        await db.execute(
+            update(Chunk).where(Chunk.document_id == doc_id).values(chunk_metadata=metadata)
+        )
+
+
+def _batches(ids: Sequence[str]) -> Iterator[Sequence[str]]:
+    for start in range(0, len(ids), _ID_BATCH):
+        yield ids[start:start + _ID_BATCH]
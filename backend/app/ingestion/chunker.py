@@ -1,11 +1,13 @@
 """Semantic chunker — section-aware splitting with overlap and hierarchy preservation."""
 
+import time
 from dataclasses import dataclass
 
 import tiktoken
 
 from app.config import settings
 from app.ingestion.base import ExtractedSection
+from app.metrics import CHUNKER_SECONDS, CHUNKER_TOKENS
 
 _enc = tiktoken.get_encoding("cl100k_base")
 
@@ -31,6 +33,7 @@ def chunk_document(
     Each section is split independently. Chunks retain their section path
     for hierarchy preservation.
     """
+    started = time.perf_counter()
     min_tok = min_tokens or settings.chunk_min_tokens
     max_tok = max_tokens or settings.chunk_max_tokens
     overlap = overlap_tokens or settings.chunk_overlap_tokens
@@ -68,9 +71,43 @@ def chunk_document(
     # Merge tiny trailing chunks
     chunks = _merge_small_chunks(chunks, min_tok)
 
+    _record_throughput(chunks, started)
     return chunks
 
 
+def chunk_section(
+    section: ExtractedSection,
+    section_path: str,
+    min_tokens: int | None = None,
+    max_tokens: int | None = None,
+    overlap_tokens: int | None = None,
+) -> list[ChunkResult]:
+    """Chunk one section's own text (not its children), positions from 0.
+
+    Produces the same chunks ``chunk_document`` does for this section, so a
+    document can be re-chunked one changed section at a time.
+    """
+    if not section.text.strip():
+        return []
+    started = time.perf_counter()
+    chunks = _split_text(
+        section.text.strip(),
+        section.id,
+        section_path,
+        max_tokens or settings.chunk_max_tokens,
+        overlap_tokens or settings.chunk_overlap_tokens,
+        0,
+    )
+    chunks = _merge_small_chunks(chunks, min_tokens or settings.chunk_min_tokens)
+    _record_throughput(chunks, started)
+    return chunks
+
+
+def _record_throughput(chunks: list[ChunkResult], started: float) -> None:
+    CHUNKER_SECONDS.inc(time.perf_counter() - started)
+    CHUNKER_TOKENS.inc(sum(c.token_count for c in chunks))
+
+
 def _split_text(
     text: str,
     section_id: str,
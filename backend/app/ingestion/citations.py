@@ -0,0 +1,119 @@
+"""Citation scanner — regulatory cross-references and effective dates.
+
+References are found in one pass over the text: a literal-only regex locates
+the anchors every citation contains (CFR, U.S.C., Public Law, §, Section)
+and each hit is completed locally, instead of running one digit-led regex
+per citation form over the whole document. References are normalized to
+canonical citation keys:
+
+    12 C.F.R. Part 1026    → 12 CFR 1026
+    15 U.S.C. § 1601       → 15 U.S.C. 1601
+    P.L. 111-203           → Pub. L. 111-203
+    Section 1026.2         → § 1026.2
+
+Matches do not overlap, so the section sign inside "15 U.S.C. § 1601" is part
+of the U.S.C. citation rather than a separate reference. Dates are taken from
+the first DATE_WINDOW characters with one combined pattern. The scanner only
+needs text, so any adapter can run it on what it extracts.
+
+Usage:
+    scan = scan_citations(extracted.full_text)
+    scan.references      # canonical keys in order of first appearance
+    scan.effective_date  # "January 1, 2025" or None
+"""
+
+import re
+from dataclasses import dataclass, field
+
+# Dates are only looked for near the top, where effective dates appear
+DATE_WINDOW = 2000
+
+# Every reference contains one of these literals. Scanning for them is far
+# cheaper than trying a digit-led alternation at every position; each hit is
+# then parsed locally, looking back for the title number and forward for the
+# part, section or law number. No capture groups: they would disable the
+# regex engine's literal-prefix search, which is most of the speed.
+_ANCHOR = re.compile(r"CFR|C\.F\.R\.|U\.S\.C\.|Public\s+Law|P\.L\.|Pub\.\s*L\.|§|Section")
+_ANCHOR_KIND = {"C": "cfr", "U": "usc", "P": "public_law", "§": "section", "S": "section"}
+_TITLE_LOOKBACK = 24  # Characters searched before a CFR / U.S.C. anchor
+_TAILS = {
+    "cfr": re.compile(r"\s+(?:Part\s+)?(\d+(?:\.\d+)*)"),
+    "usc": re.compile(r"\s+§?\s*(\d+)"),
+    "public_law": re.compile(r"(?:\s+No\.)?\s+(\d+-\d+)"),
+    "section": re.compile(r"\s*(\d+(?:\.\d+)*)"),
+}
+
+_DATES = re.compile(
+    r"(?i:effective\s+(?:date\s*[:.]?\s*|as\s+of\s+)?)(?P<effective>\w+\s+\d{1,2},?\s+\d{4})"
+    r"|(?i:dated?|published|issued)[:\s]*(?P<dated>\w+\s+\d{1,2},?\s+\d{4})"
+    r"|(?P<slash_date>\d{1,2}/\d{1,2}/\d{4})"
+    r"|(?P<iso_date>\d{4}-\d{2}-\d{2})"
+)
+# Most specific first: an explicit "effective" date beats a publication date
+_DATE_PRIORITY = ("effective", "dated", "slash_date", "iso_date")
+
+
+@dataclass
+class CitationScan:
+    references: list[str] = field(default_factory=list)
+    dates: dict[str, str] = field(default_factory=dict)  # First date of each kind in the window
+
+    @property
+    def effective_date(self) -> str | None:
+        for kind in _DATE_PRIORITY:
+            if kind in self.dates:
+                return self.dates[kind]
+        return None
+
+
+def scan_citations(text: str) -> CitationScan:
+    """Canonical references from the whole text, dates from its first DATE_WINDOW characters."""
+    scan = CitationScan(references=list(dict.fromkeys(_iter_citations(text))))
+    for m in _DATES.finditer(text, 0, DATE_WINDOW):
+        scan.dates.setdefault(m.lastgroup, m[m.lastgroup].strip())
+    return scan
+
+
+def normalize_citation(citation: str) -> str:
+    """Canonical key for one citation string; anything else is returned stripped."""
+    citation = citation.strip()
+    keys = list(_iter_citations(citation))
+    return keys[0] if len(keys) == 1 else citation
+
+
+def _iter_citations(text: str):
+    """Yield a canonical key per reference, in order; matches never overlap."""
+    consumed = 0
+    for anchor in _ANCHOR.finditer(text):
+        if anchor.start() < consumed:
+            continue
+        kind = _ANCHOR_KIND[text[anchor.start()]]
+        title = ""
+        if kind in ("cfr", "usc"):
+            start = max(consumed, anchor.start() - _TITLE_LOOKBACK)
+            title = _title_before(text, start, anchor.start())
+            if not title:
+                continue
+        tail = _TAILS[kind].match(text, anchor.end())
+        if tail is None:
+            continue
+        consumed = tail.end()
+        number = tail[1]
+        if kind == "cfr":
+            yield f"{title} CFR {number}"
+        elif kind == "usc":
+            yield f"{title} U.S.C. {number}"
+        elif kind == "public_law":
+            yield f"Pub. L. {number}"
+        else:
+            yield f"§ {number}"
+
+
+def _title_before(text: str, start: int, end: int) -> str:
+    """The number ending just before whitespace at ``end`` ("12" in "12 CFR"), or ""."""
+    head = text[start:end]
+    spaced = head.rstrip()
+    if len(spaced) == len(head):
+        return ""
+    number = spaced.rstrip("0123456789")
+    return spaced[len(number):]
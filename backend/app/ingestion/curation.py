@@ -1,33 +1,23 @@
 """Curation pipeline — metadata extraction, relationship linking, dedup, quality gates."""
 
+import asyncio
 import hashlib
-import re
 from dataclasses import dataclass
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config import settings
 from app.ingestion.base import ExtractedDocument
+from app.ingestion.citations import normalize_citation, scan_citations
+from app.ingestion.near_duplicates import (
+    canonical_before,
+    find_near_duplicate,
+    minhash_signature,
+    store_fingerprint,
+)
 from app.models.ingestion import CurationStatus, InternalDocument
 
-# Date patterns common in regulatory documents
-_DATE_PATTERNS = [
-    re.compile(
-        r"effective\s+(?:date\s*[:.]?\s*|as of\s+)?(\w+\s+\d{1,2},?\s+\d{4})", re.IGNORECASE
-    ),
-    re.compile(r"(?:dated?|published|issued)[:\s]*(\w+\s+\d{1,2},?\s+\d{4})", re.IGNORECASE),
-    re.compile(r"(\d{1,2}/\d{1,2}/\d{4})"),
-    re.compile(r"(\d{4}-\d{2}-\d{2})"),
-]
-
-# Regulatory cross-reference patterns
-_XREF_PATTERNS = [
-    re.compile(r"(\d+)\s+(?:CFR|C\.F\.R\.)\s+(?:Part\s+)?(\d+(?:\.\d+)*)"),
-    re.compile(r"(?:§|Section)\s*(\d+(?:\.\d+)*)"),
-    re.compile(r"(?:Public Law|P\.L\.)\s+(\d+-\d+)"),
-    re.compile(r"(\d+)\s+U\.S\.C\.\s+§?\s*(\d+)"),
-]
-
 
 @dataclass
 class CurationResult:
@@ -39,6 +29,8 @@ class CurationResult:
     cross_references: list[str]
     content_hash: str
     is_duplicate: bool
+    duplicate_of: str | None = None
+    duplicate_similarity: float | None = None  # 1.0 for an exact match
 
 
 async def run_curation(
@@ -58,21 +50,32 @@ async def run_curation(
     """
     notes: list[str] = []
 
-    # Step 1: Metadata enrichment (from manifest + document text)
-    effective_date = _extract_effective_date(extracted.full_text)
+    # Steps 1-2: Effective date and cross-references, in one scan of the text
+    scan = scan_citations(extracted.full_text)
+    effective_date = scan.effective_date
     if effective_date:
         notes.append(f"Extracted effective date: {effective_date}")
 
-    # Step 2: Cross-reference detection
-    text_xrefs = _detect_cross_references(extracted.full_text)
-    manifest_xrefs = manifest_source.get("relationships", {}).get("cross_references", [])
-    all_xrefs = list(set(text_xrefs + manifest_xrefs + extracted.cross_references))
+    manifest_xrefs = [
+        normalize_citation(x)
+        for x in manifest_source.get("relationships", {}).get("cross_references", [])
+    ]
+    all_xrefs = list(dict.fromkeys(scan.references + manifest_xrefs + extracted.cross_references))
 
-    # Step 3: Content hash + dedup
+    # Step 3: Content hash + dedup, exact first, then near-duplicates by MinHash
     content_hash = hashlib.sha256(extracted.full_text.encode("utf-8")).hexdigest()
-    is_duplicate = await _check_duplicate(content_hash, doc.id, db)
-    if is_duplicate:
-        notes.append("DUPLICATE: Content hash matches an existing document")
+    duplicate_of = await _find_exact_duplicate(content_hash, doc.id, db)
+    similarity = 1.0 if duplicate_of else None
+    if duplicate_of:
+        notes.append(f"DUPLICATE: Content hash matches {duplicate_of}")
+    signature = await asyncio.to_thread(minhash_signature, extracted.full_text)
+    if duplicate_of is None and signature is not None and settings.near_duplicate_threshold > 0:
+        near = await find_near_duplicate(db, signature, doc.id)
+        if near:
+            duplicate_of, similarity = near.document_id, near.similarity
+            notes.append(f"NEAR-DUPLICATE: {near.similarity:.0%} similar to {near.document_id}")
+    await store_fingerprint(db, doc.id, signature)
+    is_duplicate = duplicate_of is not None
 
     # Step 4: Quality gates
     gates = _run_quality_gates(extracted, manifest_source, content_hash)
@@ -113,41 +116,22 @@ async def run_curation(
         cross_references=all_xrefs,
         content_hash=content_hash,
         is_duplicate=is_duplicate,
+        duplicate_of=duplicate_of,
+        duplicate_similarity=similarity,
     )
 
 
-def _extract_effective_date(text: str) -> str | None:
-    """Extract effective date from document text."""
-    # Search first 2000 chars (dates usually appear early)
-    search_text = text[:2000]
-    for pattern in _DATE_PATTERNS:
-        m = pattern.search(search_text)
-        if m:
-            return m.group(1).strip()
-    return None
-
-
-def _detect_cross_references(text: str) -> list[str]:
-    """Detect regulatory cross-references in text."""
-    refs: set[str] = set()
-    for pattern in _XREF_PATTERNS:
-        for m in pattern.finditer(text):
-            refs.add(m.group(0).strip())
-    return list(refs)
-
-
-async def _check_duplicate(
-    content_hash: str, exclude_doc_id: str, db: AsyncSession
-) -> bool:
-    """Check if content hash already exists in indexed documents."""
+async def _find_exact_duplicate(
+    content_hash: str, doc_id: str, db: AsyncSession
+) -> str | None:
+    """Id of the first earlier canonical document with the same content hash, if any."""
     result = await db.execute(
         select(InternalDocument.id).where(
             InternalDocument.content_hash == content_hash,
-            InternalDocument.id != exclude_doc_id,
-            InternalDocument.status != CurationStatus.rejected,
-        )
+            canonical_before(doc_id),
+        ).order_by(InternalDocument.created_at, InternalDocument.id).limit(1)
     )
-    return result.scalar_one_or_none() is not None
+    return result.scalar_one_or_none()
 
 
 def _run_quality_gates(
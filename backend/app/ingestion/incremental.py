@@ -0,0 +1,188 @@
+"""Incremental re-ingestion — rechunk and re-embed only the sections that changed.
+
+Every persisted section carries a content hash over its section path, level
+and own text. When a document is ingested again, each new section is matched
+against the stored sections by that hash:
+
+- a match keeps the old section's chunks — same IDs, same embeddings — and only
+  their position and section id are refreshed;
+- a section without a match is chunked afresh, and only those chunks need
+  embedding;
+- chunks of stored sections left unmatched are deleted.
+
+Chunk IDs are derived from the section hash (``chk-<doc>-<hash12>-<nn>``), so a
+section that is unchanged keeps its chunk IDs across re-ingestions and
+citations or feedback that refer to them stay valid. Because the section path
+is part of the hash, renaming a heading re-chunks the sections beneath it
+(their chunks carry the path).
+
+Usage:
+    flat = flatten_sections(extracted.sections, doc_id)
+    stored = await load_stored_chunks(db, doc_id)
+    delta = reconcile_chunks(doc_id, flat, stored_hashes, stored)
+    await index_document(doc, db, delta)  # or write_chunks(db, doc_id, delta)
+"""
+
+import hashlib
+from collections import defaultdict
+from dataclasses import dataclass, field
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.ingestion.base import ExtractedSection
+from app.ingestion.chunker import chunk_section
+from app.models.ingestion import Chunk
+
+
+@dataclass
+class FlatSection:
+    """A section in document order with its persisted id, path and hash."""
+
+    db_id: str
+    parent_id: str | None
+    position: int  # Index among its siblings
+    path: str
+    content_hash: str
+    section: ExtractedSection
+
+
+@dataclass
+class StoredChunk:
+    """A persisted chunk as reconciliation needs it — without its vector."""
+
+    id: str
+    section_id: str
+    position: int
+    text: str
+    embedded: bool
+    embedding: list[float] | None = None  # Set when (re-)embedded in this run
+
+
+@dataclass
+class ChunkDelta:
+    """Chunk changes for one document, written in bulk by ``write_chunks``."""
+
+    kept: list[StoredChunk] = field(default_factory=list)
+    added: list[Chunk] = field(default_factory=list)  # Transient; never added to the session
+    removed: list[str] = field(default_factory=list)  # Chunk ids
+    sections_changed: int = 0
+    sections_unchanged: int = 0
+
+    @property
+    def to_embed(self) -> list[Chunk | StoredChunk]:
+        """New chunks plus kept ones that were never embedded."""
+        return self.added + [c for c in self.kept if not c.embedded]
+
+
+def section_hash(path: str, level: int, text: str) -> str:
+    digest = hashlib.sha256(f"{level}\x00{path}\x00{text.strip()}".encode())
+    return f"sha256:{digest.hexdigest()}"
+
+
+def flatten_sections(sections: list[ExtractedSection], doc_id: str) -> list[FlatSection]:
+    """Walk the section tree in document order, building paths as the chunker does."""
+    flat: list[FlatSection] = []
+
+    def walk(items: list[ExtractedSection], path_parts: list[str], parent_id: str | None) -> None:
+        for i, section in enumerate(items):
+            parts = path_parts + [section.heading] if section.heading else path_parts
+            path = " > ".join(parts)
+            db_id = f"{doc_id}-{section.id}"
+            flat.append(FlatSection(
+                db_id=db_id,
+                parent_id=parent_id,
+                position=i,
+                path=path,
+                content_hash=section_hash(path, section.level, section.text),
+                section=section,
+            ))
+            walk(section.children, path_parts + [section.heading], db_id)
+
+    walk(sections, [], None)
+    return flat
+
+
+async def load_stored_chunks(db: AsyncSession, doc_id: str) -> list[StoredChunk]:
+    """A document's persisted chunks, without loading their embeddings."""
+    result = await db.execute(
+        select(Chunk.id, Chunk.section_id, Chunk.position, Chunk.text, Chunk.embedding.is_not(None))
+        .where(Chunk.document_id == doc_id)
+        .order_by(Chunk.position)
+    )
+    return [StoredChunk(*row) for row in result.all()]
+
+
+def reconcile_chunks(
+    doc_id: str,
+    sections: list[FlatSection],
+    stored_hashes: dict[str, str],
+    stored_chunks: list[StoredChunk],
+) -> ChunkDelta:
+    """Work out how a document's chunks change with its new sections.
+
+    Args:
+        sections: The new sections, from ``flatten_sections``.
+        stored_hashes: Previously persisted section db id → content hash.
+        stored_chunks: The document's existing chunks.
+
+    Kept chunks get their new position and section id; nothing is written
+    until the delta is passed to ``write_chunks``.
+    """
+    # Existing chunks grouped by the hash of the section they came from
+    by_hash: dict[str, list[list[StoredChunk]]] = defaultdict(list)
+    by_section: dict[str, list[StoredChunk]] = defaultdict(list)
+    for chunk in sorted(stored_chunks, key=lambda c: c.position):
+        by_section[f"{doc_id}-{chunk.section_id}"].append(chunk)
+    for section_db_id, chunks in by_section.items():
+        content_hash = stored_hashes.get(section_db_id)
+        if content_hash:
+            by_hash[content_hash].append(chunks)
+
+    delta = ChunkDelta()
+    taken = {c.id for c in stored_chunks}
+    position = 0
+    for flat in sections:
+        reusable = by_hash.get(flat.content_hash)
+        if reusable:
+            chunks = reusable.pop(0)
+            for chunk in chunks:
+                chunk.section_id = flat.section.id
+                chunk.position = position
+                position += 1
+            delta.kept.extend(chunks)
+            delta.sections_unchanged += 1
+            continue
+
+        results = chunk_section(flat.section, flat.path)
+        if results:
+            delta.sections_changed += 1
+        for n, result in enumerate(results):
+            chunk = Chunk(
+                id=_chunk_id(doc_id, flat.content_hash, n, taken),
+                document_id=doc_id,
+                section_id=result.section_id,
+                section_path=result.section_path,
+                text=result.text,
+                token_count=result.token_count,
+                position=position,
+            )
+            position += 1
+            delta.added.append(chunk)
+
+    kept_ids = {c.id for c in delta.kept}
+    delta.removed = [c.id for c in stored_chunks if c.id not in kept_ids]
+    return delta
+
+
+def _chunk_id(doc_id: str, content_hash: str, n: int, taken: set[str]) -> str:
+    """Stable chunk id for the n-th chunk of a section, unique within the document."""
+    base = f"chk-{doc_id}-{content_hash.split(':', 1)[-1][:12]}"
+    chunk_id = f"{base}-{n:02d}"
+    dup = 1
+    while chunk_id in taken:
+        # Identical sections repeated in one document
+        chunk_id = f"{base}-{n:02d}-{dup}"
+        dup += 1
+    taken.add(chunk_id)
+    return chunk_id
@@ -1,12 +1,16 @@
 """Indexer — generates embeddings and writes to pgvector + tsvector hybrid index."""
 
 import logging
+import time
 
 from openai import AsyncOpenAI
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import settings
+from app.ingestion.bulk import write_chunks
+from app.ingestion.incremental import ChunkDelta
+from app.metrics import EMBEDDING_BATCH_SECONDS, EMBEDDING_BATCH_SIZE
 from app.models.ingestion import CurationStatus, InternalDocument
 
 logger = logging.getLogger(__name__)
@@ -14,50 +18,57 @@ logger = logging.getLogger(__name__)
 _BATCH_SIZE = 64  # OpenAI embedding batch limit
 
 
-async def index_document(doc: InternalDocument, db: AsyncSession) -> int:
-    """Generate embeddings for all chunks of a document and update the index.
+async def index_document(doc: InternalDocument, db: AsyncSession, delta: ChunkDelta) -> int:
+    """Embed a document's chunk changes and write them to the hybrid index.
+
+    New chunks and kept ones never embedded are embedded first, so new
+    chunks are inserted with their vectors; the delta is then written in
+    bulk with the document's metadata on every chunk, and the lexical index
+    is filled in one statement for the chunks that lack it.
 
     Returns the number of chunks indexed.
     """
-    chunks = doc.chunks
-    if not chunks:
+    if not delta.kept and not delta.added:
+        await write_chunks(db, doc.id, delta)
         return 0
+    to_index = delta.to_embed
 
     # Generate embeddings in batches
-    texts = [c.text for c in chunks]
-    embeddings = await _generate_embeddings(texts)
-
-    for chunk, embedding in zip(chunks, embeddings):
+    embeddings = await _generate_embeddings([c.text for c in to_index])
+    for chunk, embedding in zip(to_index, embeddings):
         chunk.embedding = embedding
-        # Denormalize document metadata into chunk for filtered retrieval
-        chunk.chunk_metadata = {
-            "jurisdiction": doc.jurisdiction,
-            "regulatory_body": doc.regulatory_body,
-            "authority_level": doc.authority_level,
-            "document_type": doc.document_type,
-            "classification_tags": doc.classification_tags or [],
-            "document_id": doc.id,
-            "manifest_id": doc.manifest_id,
-            "source_id": doc.source_id,
-        }
 
-    await db.flush()
+    await write_chunks(db, doc.id, delta, metadata=chunk_metadata(doc))
 
     # Update tsvector for lexical search
-    for chunk in chunks:
+    if to_index:
         await db.execute(
             text(
-                "UPDATE chunks SET search_vector = to_tsvector('english', :text) "
-                "WHERE id = :chunk_id"
+                "UPDATE chunks SET search_vector = to_tsvector('english', text) "
+                "WHERE document_id = :document_id AND search_vector IS NULL"
             ),
-            {"text": chunk.text, "chunk_id": chunk.id},
+            {"document_id": doc.id},
         )
 
     # Mark document as indexed
     doc.status = CurationStatus.indexed
 
     await db.flush()
-    return len(chunks)
+    return len(to_index)
+
+
+def chunk_metadata(doc: InternalDocument) -> dict:
+    """Document metadata denormalized into each chunk for filtered retrieval."""
+    return {
+        "jurisdiction": doc.jurisdiction,
+        "regulatory_body": doc.regulatory_body,
+        "authority_level": doc.authority_level,
+        "document_type": doc.document_type,
+        "classification_tags": doc.classification_tags or [],
+        "document_id": doc.id,
+        "manifest_id": doc.manifest_id,
+        "source_id": doc.source_id,
+    }
 
 
 async def _generate_embeddings(texts: list[str]) -> list[list[float]]:
@@ -73,6 +84,8 @@ async def _generate_embeddings(texts: list[str]) -> list[list[float]]:
         # Truncate texts that are too long (8191 token limit for embedding models)
         batch = [t[:30000] for t in batch]
 
+        EMBEDDING_BATCH_SIZE.observe(len(batch))
+        started = time.perf_counter()
         try:
             response = await client.embeddings.create(
                 model=settings.embedding_model,
@@ -81,7 +94,9 @@ async def _generate_embeddings(texts: list[str]) -> list[list[float]]:
             )
             for item in response.data:
                 all_embeddings.append(item.embedding)
+            EMBEDDING_BATCH_SECONDS.observe(time.perf_counter() - started, outcome="ok")
         except Exception:
+            EMBEDDING_BATCH_SECONDS.observe(time.perf_counter() - started, outcome="error")
             logger.exception("Embedding generation failed for batch %d", i)
             # Fill with None-equivalent (zeros) so we don't lose chunks
             for _ in batch:
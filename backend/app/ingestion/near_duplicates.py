@@ -0,0 +1,173 @@
+"""Near-duplicate detection — MinHash signatures with LSH banding.
+
+Regulators republish the same rule with a different header, footer or date,
+which an exact content hash cannot see. Each document's text is reduced to
+a set of word shingles and summarised by a MinHash signature, whose share of
+equal positions estimates the Jaccard similarity of two shingle sets.
+
+The signature is cut into bands and each band hashed to a bucket key. Two
+documents share at least one bucket with high probability when they are
+similar, so candidates come from one indexed lookup on the bucket keys rather
+than a scan of every document; candidates are then confirmed against the
+threshold using their stored signatures.
+
+Usage:
+    signature = minhash_signature(extracted.full_text)
+    match = await find_near_duplicate(db, signature, doc.id)
+    await store_fingerprint(db, doc.id, signature)
+"""
+
+import hashlib
+import re
+from dataclasses import dataclass
+
+import numpy as np
+from sqlalchemy import ColumnElement, and_, delete, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.models.ingestion import (
+    CurationStatus,
+    DocumentFingerprint,
+    DocumentLshBand,
+    InternalDocument,
+)
+
+_WORD_RE = re.compile(r"\w+")
+_SHINGLE_BASE = np.uint64(1_000_003)
+_BLOCK = 8192  # Shingles hashed per block, bounding memory at num_perm × _BLOCK
+
+# Multiply-shift hash family: h(x) = (a·x + b) mod 2^64 >> 32, a odd.
+# Fixed seed so signatures stay comparable across processes and releases.
+_rng = np.random.default_rng(0x5EED)
+_A = _rng.integers(1, 2**63, size=1024, dtype=np.uint64) | np.uint64(1)
+_B = _rng.integers(0, 2**63, size=1024, dtype=np.uint64)
+
+
+def _digest(data: bytes) -> bytes:
+    return hashlib.blake2b(data, digest_size=8).digest()
+
+
+@dataclass
+class NearDuplicate:
+    document_id: str
+    similarity: float
+
+
+def shingle_hashes(text: str, size: int | None = None) -> np.ndarray:
+    """64-bit hashes of the distinct word ``size``-grams of lower-cased text."""
+    size = size or settings.near_duplicate_shingle_words
+    words = _WORD_RE.findall(text.lower())
+    if not words:
+        return np.empty(0, dtype=np.uint64)
+    vocab: dict[str, int] = {}
+    ids = np.fromiter(
+        (vocab.setdefault(w, len(vocab)) for w in words), dtype=np.int64, count=len(words)
+    )
+    word_hash = np.fromiter(
+        (int.from_bytes(_digest(w.encode()), "little") for w in vocab),
+        dtype=np.uint64,
+        count=len(vocab),
+    )[ids]
+    if len(word_hash) < size:
+        size = len(word_hash)
+    # Polynomial rolling combination; uint64 arithmetic wraps, which is intended
+    count = len(word_hash) - size + 1
+    hashes = np.zeros(count, dtype=np.uint64)
+    with np.errstate(over="ignore"):
+        for j in range(size):
+            hashes = hashes * _SHINGLE_BASE + word_hash[j:j + count]
+    return np.unique(hashes)
+
+
+def minhash_signature(text: str, num_perm: int | None = None) -> np.ndarray | None:
+    """MinHash signature (uint32 per permutation), or None for text without words."""
+    num_perm = num_perm or settings.near_duplicate_permutations
+    if num_perm > len(_A):
+        raise ValueError(f"Unsupported permutation count: {num_perm}. Maximum: {len(_A)}")
+    shingles = shingle_hashes(text)
+    if not len(shingles):
+        return None
+    a = _A[:num_perm, None]
+    b = _B[:num_perm, None]
+    signature = np.full(num_perm, np.iinfo(np.uint32).max, dtype=np.uint64)
+    with np.errstate(over="ignore"):
+        for start in range(0, len(shingles), _BLOCK):
+            block = shingles[None, start:start + _BLOCK]
+            values = (a * block + b) >> np.uint64(32)
+            np.minimum(signature, values.min(axis=1), out=signature)
+    return signature.astype(np.uint32)
+
+
+def estimate_similarity(a: np.ndarray, b: np.ndarray) -> float:
+    """Estimated Jaccard similarity of the shingle sets behind two signatures."""
+    if len(a) != len(b):
+        return 0.0
+    return float(np.count_nonzero(a == b)) / len(a)
+
+
+def band_keys(signature: np.ndarray, bands: int | None = None) -> list[str]:
+    """One bucket key per band: ``<band>:<hash of the band's rows>``."""
+    bands = bands or settings.near_duplicate_bands
+    rows = len(signature) // bands
+    return [
+        f"{i}:{_digest(signature[i * rows:(i + 1) * rows].tobytes()).hex()}"
+        for i in range(bands)
+    ]
+
+
+def canonical_before(doc_id: str) -> ColumnElement[bool]:
+    """Documents ``doc_id`` may be marked a duplicate of.
+
+    Only canonical ones (not rejected, not duplicates themselves) created
+    before it, ties broken by id, so re-curating an original never points
+    it at its own later copy.
+    """
+    created_at = (
+        select(InternalDocument.created_at).where(InternalDocument.id == doc_id).scalar_subquery()
+    )
+    return and_(
+        InternalDocument.status != CurationStatus.rejected,
+        InternalDocument.duplicate_of.is_(None),
+        or_(
+            InternalDocument.created_at < created_at,
+            and_(InternalDocument.created_at == created_at, InternalDocument.id < doc_id),
+        ),
+    )
+
+
+async def find_near_duplicate(
+    db: AsyncSession,
+    signature: np.ndarray,
+    doc_id: str,
+    threshold: float | None = None,
+) -> NearDuplicate | None:
+    """The most similar earlier canonical document at or above ``threshold``, if any."""
+    threshold = settings.near_duplicate_threshold if threshold is None else threshold
+    result = await db.execute(
+        select(DocumentFingerprint.document_id, DocumentFingerprint.signature)
+        .where(
+            DocumentFingerprint.document_id.in_(
+                select(DocumentLshBand.document_id)
+                .where(DocumentLshBand.band_key.in_(band_keys(signature)))
+            ),
+        )
+        .join(InternalDocument, InternalDocument.id == DocumentFingerprint.document_id)
+        .where(canonical_before(doc_id))
+    )
+    best: NearDuplicate | None = None
+    for doc_id, stored in result.all():
+        similarity = estimate_similarity(signature, np.frombuffer(stored, dtype=np.uint32))
+        if similarity >= threshold and (best is None or similarity > best.similarity):
+            best = NearDuplicate(document_id=doc_id, similarity=round(similarity, 4))
+    return best
+
+
+async def store_fingerprint(db: AsyncSession, doc_id: str, signature: np.ndarray | None) -> None:
+    """Replace a document's signature and bucket keys; the caller flushes."""
+    await db.execute(delete(DocumentLshBand).where(DocumentLshBand.document_id == doc_id))
+    await db.execute(delete(DocumentFingerprint).where(DocumentFingerprint.document_id == doc_id))
+    if signature is None:
+        return
+    db.add(DocumentFingerprint(document_id=doc_id, signature=signature.astype(np.uint32).tobytes()))
+    db.add_all(DocumentLshBand(band_key=key, document_id=doc_id) for key in band_keys(signature))
@@ -5,12 +5,18 @@ import pathlib
 from collections.abc import AsyncIterator
 from datetime import UTC, datetime
 
-from sqlalchemy import select
+from sqlalchemy import Row, delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.ingestion.base import ExtractedSection
-from app.ingestion.chunker import chunk_document
+from app.acquisition.staging import get_blob_store, read_staged_content, staged_file
+from app.ingestion.bulk import insert_sections, insert_tables, write_chunks
 from app.ingestion.curation import run_curation
+from app.ingestion.incremental import (
+    ChunkDelta,
+    flatten_sections,
+    load_stored_chunks,
+    reconcile_chunks,
+)
 from app.ingestion.indexer import index_document
 from app.ingestion.registry import get_adapter
 from app.models.acquisition import (
@@ -18,10 +24,10 @@ from app.models.acquisition import (
     StagedDocument,
 )
 from app.models.ingestion import (
-    Chunk,
     CurationStatus,
     DocumentSection,
     DocumentTable,
+    IngestionCheckpoint,
     IngestionRun,
     IngestionRunStatus,
     InternalDocument,
@@ -32,7 +38,13 @@ logger = logging.getLogger(__name__)
 
 
 class IngestionOrchestrator:
-    """Processes an acquisition run's staged documents through ingestion."""
+    """Processes an acquisition run's staged documents through ingestion.
+
+    Each document is committed on its own together with a checkpoint row, so
+    a run that stops part-way keeps its finished documents. Running the same
+    ingestion run again resumes it: sources with a completed checkpoint are
+    skipped and failed ones are retried.
+    """
 
     def __init__(self, db: AsyncSession, ingestion_run_id: str):
         self.db = db
@@ -49,166 +61,71 @@ class IngestionOrchestrator:
             yield {"event": "error", "data": "Ingestion run not found"}
             return
 
-        run.status = IngestionRunStatus.running
-        await self.db.flush()
-
-        # Load staged documents from the acquisition run
+        # Load staged documents from the acquisition run as plain rows, which
+        # survive the rollback of a failed document
         acq_result = await self.db.execute(
-            select(AcquisitionSource)
+            select(
+                AcquisitionSource.source_id,
+                AcquisitionSource.name,
+                AcquisitionSource.url,
+                AcquisitionSource.staged_document_id,
+            )
             .where(AcquisitionSource.acquisition_id == run.acquisition_id)
             .where(AcquisitionSource.staged_document_id.isnot(None))
         )
-        acq_sources = acq_result.scalars().all()
+        acq_sources = acq_result.all()
+        completed = await _completed_sources(self.db, self.run_id)
 
         total = len(acq_sources)
+        processed = sum(1 for acq_src in acq_sources if acq_src.source_id in completed)
+        failed = 0
+        run.status = IngestionRunStatus.running
         run.total_documents = total
-        await self.db.flush()
+        run.processed = processed
+        run.failed = failed
+        run.completed_at = None
+        await self.db.commit()
 
         yield {
             "event": "started",
-            "data": {"run_id": self.run_id, "total_documents": total},
+            "data": {"run_id": self.run_id, "total_documents": total, "skipped": processed},
         }
 
-        processed = 0
-        failed = 0
-
         for acq_src in acq_sources:
-            try:
-                yield {
-                    "event": "document_start",
-                    "data": {
-                        "source_id": acq_src.source_id,
-                        "name": acq_src.name,
-                    },
-                }
-
-                doc_id = f"doc-{run.manifest_id}-{acq_src.source_id}"
+            if acq_src.source_id in completed:
+                continue
+            doc_id = f"doc-{run.manifest_id}-{acq_src.source_id}"
+            yield {
+                "event": "document_start",
+                "data": {
+                    "source_id": acq_src.source_id,
+                    "name": acq_src.name,
+                },
+            }
 
-                # Load staged document
-                stg_result = await self.db.execute(
-                    select(StagedDocument).where(
-                        StagedDocument.id == acq_src.staged_document_id
-                    )
-                )
-                staged = stg_result.scalar_one_or_none()
-                if not staged:
-                    raise ValueError(f"Staged document {acq_src.staged_document_id} not found")
-
-                # Load manifest source for metadata
-                src_result = await self.db.execute(
-                    select(Source).where(
-                        Source.id == acq_src.source_id,
-                        Source.manifest_id == run.manifest_id,
-                    )
-                )
-                manifest_source = src_result.scalar_one_or_none()
-                source_meta = _source_to_dict(manifest_source) if manifest_source else {}
-
-                # Read raw content from staging
-                content = _read_staged_content(staged.raw_content_path)
-
-                # Select and run adapter
-                source_format = source_meta.get("format", "")
-                adapter = get_adapter(staged.content_type, source_format)
-                extracted = await adapter.ingest(content, source_url=acq_src.url)
-
-                # Create InternalDocument record
-                doc = InternalDocument(
-                    id=doc_id,
-                    ingestion_run_id=self.run_id,
-                    manifest_id=run.manifest_id,
-                    source_id=acq_src.source_id,
-                    staged_document_id=staged.id,
-                    title=extracted.title,
-                    full_text=extracted.full_text,
-                    jurisdiction=source_meta.get("jurisdiction", ""),
-                    regulatory_body=source_meta.get("regulatory_body", ""),
-                    authority_level=source_meta.get("authority", "informational"),
-                    document_type=source_meta.get("type", "guidance"),
-                    classification_tags=source_meta.get("classification_tags", []),
-                    status=CurationStatus.raw,
+            try:
+                doc, delta, reingest, indexed_count = await self._ingest_source(
+                    run, acq_src, doc_id
                 )
-                self.db.add(doc)
-                await self.db.flush()
-
-                # Persist sections
-                _persist_sections(self.db, doc_id, extracted.sections)
-
-                # Persist tables
-                for tbl in extracted.tables:
-                    self.db.add(DocumentTable(
-                        id=f"{doc_id}-{tbl.id}",
-                        document_id=doc_id,
-                        section_id=tbl.section_id,
-                        caption=tbl.caption,
-                        headers=tbl.headers,
-                        rows=tbl.rows,
-                    ))
-
-                await self.db.flush()
-
-                # Run curation pipeline
-                curation = await run_curation(doc, extracted, source_meta, self.db)
-                doc.status = curation.status
-                doc.quality_score = curation.quality_score
-                doc.quality_gates = curation.quality_gates
-                doc.curation_notes = curation.curation_notes
-                doc.effective_date = curation.effective_date
-                doc.cross_references = curation.cross_references
-                doc.content_hash = curation.content_hash
-                doc.curated_at = datetime.now(UTC)
-                await self.db.flush()
-
-                # Chunk if approved or validated
-                if doc.status in (CurationStatus.approved, CurationStatus.validated):
-                    chunks = chunk_document(extracted.sections, doc_id)
-                    for c in chunks:
-                        self.db.add(Chunk(
-                            id=f"chk-{doc_id}-{c.position:04d}",
-                            document_id=doc_id,
-                            section_id=c.section_id,
-                            section_path=c.section_path,
-                            text=c.text,
-                            token_count=c.token_count,
-                            position=c.position,
-                        ))
-                    await self.db.flush()
-
-                    # Index if approved
-                    if doc.status == CurationStatus.approved:
-                        # Reload doc with chunks
-                        await self.db.refresh(doc, attribute_names=["chunks"])
-                        indexed_count = await index_document(doc, self.db)
-                        yield {
-                            "event": "document_indexed",
-                            "data": {
-                                "source_id": acq_src.source_id,
-                                "chunks_indexed": indexed_count,
-                            },
-                        }
-
                 processed += 1
                 run.processed = processed
-                await self.db.flush()
-
-                yield {
-                    "event": "document_complete",
-                    "data": {
-                        "source_id": acq_src.source_id,
-                        "name": acq_src.name,
-                        "status": doc.status,
-                        "quality_score": doc.quality_score,
-                        "processed": processed,
-                        "failed": failed,
-                        "total": total,
-                    },
-                }
-
+                await self.db.merge(IngestionCheckpoint(
+                    ingestion_run_id=self.run_id, source_id=acq_src.source_id,
+                    document_id=doc_id, status=IngestionRunStatus.complete, error=None,
+                ))
+                await self.db.commit()
             except Exception as exc:
                 logger.exception("Failed to ingest source %s", acq_src.source_id)
+                # Drop the document's partial writes; earlier documents are committed
+                await self.db.rollback()
+                await self.db.refresh(run)
                 failed += 1
                 run.failed = failed
-                await self.db.flush()
+                await self.db.merge(IngestionCheckpoint(
+                    ingestion_run_id=self.run_id, source_id=acq_src.source_id,
+                    document_id=doc_id, status=IngestionRunStatus.failed, error=str(exc),
+                ))
+                await self.db.commit()
 
                 yield {
                     "event": "document_failed",
@@ -221,6 +138,31 @@ class IngestionOrchestrator:
                         "total": total,
                     },
                 }
+                continue
+
+            if indexed_count is not None:
+                yield {
+                    "event": "document_indexed",
+                    "data": {
+                        "source_id": acq_src.source_id,
+                        "chunks_indexed": indexed_count,
+                        "chunks_reused": len(delta.kept),
+                    },
+                }
+            yield {
+                "event": "document_complete",
+                "data": {
+                    "source_id": acq_src.source_id,
+                    "name": acq_src.name,
+                    "status": doc.status,
+                    "quality_score": doc.quality_score,
+                    "reingested": reingest,
+                    "sections_changed": delta.sections_changed,
+                    "processed": processed,
+                    "failed": failed,
+                    "total": total,
+                },
+            }
 
         # Finalize run
         run.status = IngestionRunStatus.complete
@@ -237,6 +179,110 @@ class IngestionOrchestrator:
             },
         }
 
+    async def _ingest_source(
+        self, run: IngestionRun, acq_src: Row, doc_id: str
+    ) -> tuple[InternalDocument, ChunkDelta, bool, int | None]:
+        """Extract, curate, chunk and index one source; nothing is committed.
+
+        Returns the document, its chunk delta, whether it was ingested before
+        and the number of chunks embedded (None when it was not indexed).
+        """
+        # Load staged document
+        stg_result = await self.db.execute(
+            select(StagedDocument).where(
+                StagedDocument.id == acq_src.staged_document_id
+            )
+        )
+        staged = stg_result.scalar_one_or_none()
+        if not staged:
+            raise ValueError(f"Staged document {acq_src.staged_document_id} not found")
+
+        # Load manifest source for metadata
+        src_result = await self.db.execute(
+            select(Source).where(
+                Source.id == acq_src.source_id,
+                Source.manifest_id == run.manifest_id,
+            )
+        )
+        manifest_source = src_result.scalar_one_or_none()
+        source_meta = _source_to_dict(manifest_source) if manifest_source else {}
+
+        # Select and run adapter; PDF and XML adapters read the blob
+        # from disk instead of having it loaded into memory
+        source_format = source_meta.get("format", "")
+        adapter = get_adapter(staged.content_type, source_format)
+        if adapter.reads_files and get_blob_store().exists(staged.content_hash):
+            with staged_file(staged.content_hash) as path:
+                extracted = await adapter.ingest_file(path, source_url=acq_src.url)
+        else:
+            content = _read_staged_content(staged)
+            extracted = await adapter.ingest(content, source_url=acq_src.url)
+
+        # Create the InternalDocument record, or update it in place
+        # when the source was ingested before (or by an interrupted attempt)
+        doc = await self.db.get(InternalDocument, doc_id)
+        reingest = doc is not None
+        if doc is None:
+            doc = InternalDocument(
+                id=doc_id, manifest_id=run.manifest_id, source_id=acq_src.source_id
+            )
+            self.db.add(doc)
+        doc.ingestion_run_id = self.run_id
+        doc.staged_document_id = staged.id
+        doc.title = extracted.title
+        doc.full_text = extracted.full_text
+        doc.jurisdiction = source_meta.get("jurisdiction", "")
+        doc.regulatory_body = source_meta.get("regulatory_body", "")
+        doc.authority_level = source_meta.get("authority", "informational")
+        doc.document_type = source_meta.get("type", "guidance")
+        doc.classification_tags = source_meta.get("classification_tags", [])
+        doc.status = CurationStatus.raw
+        await self.db.flush()
+
+        # Replace sections and tables; remember the old section hashes
+        stored_hashes = await _clear_document_rows(self.db, doc_id) if reingest else {}
+        sections = flatten_sections(extracted.sections, doc_id)
+        await insert_sections(self.db, doc_id, sections)
+        await insert_tables(self.db, doc_id, extracted.tables)
+
+        # Run curation pipeline
+        curation = await run_curation(doc, extracted, source_meta, self.db)
+        doc.status = curation.status
+        doc.quality_score = curation.quality_score
+        doc.quality_gates = curation.quality_gates
+        doc.curation_notes = curation.curation_notes
+        doc.effective_date = curation.effective_date
+        doc.cross_references = curation.cross_references
+        doc.content_hash = curation.content_hash
+        doc.duplicate_of = curation.duplicate_of
+        doc.duplicate_similarity = curation.duplicate_similarity
+        doc.curated_at = datetime.now(UTC)
+        await self.db.flush()
+
+        # Chunk if approved or validated, reusing the chunks of
+        # sections that have not changed since the last ingestion
+        stored_chunks = await load_stored_chunks(self.db, doc_id) if reingest else []
+        if doc.status in (CurationStatus.approved, CurationStatus.validated):
+            delta = reconcile_chunks(doc_id, sections, stored_hashes, stored_chunks)
+        else:
+            delta = ChunkDelta(removed=[c.id for c in stored_chunks])
+
+        # Index if approved; otherwise just persist the chunk changes
+        indexed_count = None
+        if doc.status == CurationStatus.approved:
+            indexed_count = await index_document(doc, self.db, delta)
+        else:
+            await write_chunks(self.db, doc_id, delta)
+
+        if reingest:
+            logger.info(
+                "Re-ingested %s: %d sections changed, %d unchanged; "
+                "%d chunks reused, %d added, %d removed",
+                doc_id, delta.sections_changed, delta.sections_unchanged,
+                len(delta.kept), len(delta.added), len(delta.removed),
+            )
+        return doc, delta, reingest, indexed_count
+
 
 def _source_to_dict(source: Source) -> dict:
     """Convert a manifest Source ORM object to a dict for the curation pipeline."""
@@ -252,11 +298,23 @@ def _source_to_dict(source: Source) -> dict:
     }
 
 
-def _read_staged_content(path: str) -> str | bytes:
-    """Read content from the staging directory."""
-    p = pathlib.Path(path)
-    if not p.exists():
-        raise FileNotFoundError(f"Staged content not found: {path}")
+def _read_staged_content(staged: StagedDocument) -> str | bytes:
+    """Read a staged document's content from the blob store.
+
+    Documents staged before the blob store existed are read from their
+    ``content.<ext>`` file in the staging directory.
+    """
+    if get_blob_store().exists(staged.content_hash):
+        content = read_staged_content(staged.content_hash)
+        if staged.content_type == "application/pdf":
+            return content
+        return content.decode("utf-8", errors="replace")
+
+    p = pathlib.Path(staged.raw_content_path)
+    if p.is_dir():
+        p = next(p.glob("content.*"), p)
+    if not p.is_file():
+        raise FileNotFoundError(f"Staged content not found: {staged.raw_content_path}")
 
     suffix = p.suffix.lower()
     if suffix in (".pdf",):
@@ -264,20 +322,24 @@ def _read_staged_content(path: str) -> str | bytes:
     return p.read_text(encoding="utf-8", errors="replace")
 
 
-def _persist_sections(
-    db: AsyncSession, doc_id: str, sections: list[ExtractedSection], parent_id: str | None = None
-) -> None:
-    """Recursively persist sections to the database."""
-    for i, section in enumerate(sections):
-        section_db_id = f"{doc_id}-{section.id}"
-        db.add(DocumentSection(
-            id=section_db_id,
-            document_id=doc_id,
-            parent_id=parent_id,
-            heading=section.heading,
-            level=section.level,
-            text=section.text,
-            position=i,
-        ))
-        if section.children:
-            _persist_sections(db, doc_id, section.children, parent_id=section_db_id)
+async def _clear_document_rows(db: AsyncSession, doc_id: str) -> dict[str, str]:
+    """Delete a document's sections and tables; return the old section hashes."""
+    result = await db.execute(
+        select(DocumentSection.id, DocumentSection.content_hash)
+        .where(DocumentSection.document_id == doc_id)
+    )
+    stored_hashes = {section_id: content_hash for section_id, content_hash in result.all()}
+    await db.execute(delete(DocumentSection).where(DocumentSection.document_id == doc_id))
+    await db.execute(delete(DocumentTable).where(DocumentTable.document_id == doc_id))
+    return stored_hashes
+
+
+async def _completed_sources(db: AsyncSession, run_id: str) -> set[str]:
+    """Source ids the run has already ingested successfully."""
+    result = await db.execute(
+        select(IngestionCheckpoint.source_id).where(
+            IngestionCheckpoint.ingestion_run_id == run_id,
+            IngestionCheckpoint.status == IngestionRunStatus.complete,
+        )
+    )
+    return set(result.scalars().all())
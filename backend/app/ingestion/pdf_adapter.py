@@ -1,10 +1,19 @@
 """PDF ingestion adapter — extracts structure from PDF documents."""
 
+import asyncio
 import re
-from io import BytesIO
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from io import BytesIO, StringIO
+from pathlib import Path
+from typing import BinaryIO
 
 import pdfplumber
+from pdfplumber.page import Page
 
+from app.config import settings
 from app.ingestion.base import (
     ExtractedDocument,
     ExtractedSection,
@@ -22,51 +31,132 @@ _HEADING_PATTERN = re.compile(
     re.MULTILINE,
 )
 
+_PAGES_PER_TASK = 16  # Pages per process-pool task in parallel extraction
+
 
 class PdfAdapter(IngestionAdapter):
+    reads_files = True
+
     def supports(self, content_type: str) -> bool:
         return "pdf" in content_type.lower()
 
     async def ingest(self, content: str | bytes, source_url: str = "") -> ExtractedDocument:
         if isinstance(content, str):
             content = content.encode("utf-8")
+        return await asyncio.to_thread(_extract_document, iter_pages(BytesIO(content)))
+
+    async def ingest_file(
+        self, path: str | Path, source_url: str = "", workers: int | None = None
+    ) -> ExtractedDocument:
+        """Extract a PDF on disk page by page, without loading the file into memory.
+
+        Args:
+            workers: Extract pages in this many processes (default ``pdf_extract_workers``).
+        """
+        workers = workers or settings.pdf_extract_workers
+        return await asyncio.to_thread(_extract_document, iter_pages(path, workers=workers))
+
+
+@dataclass
+class PdfPage:
+    number: int  # 1-based
+    text: str
+    tables: list[list[list[str]]]  # Raw rows of each table with a header row
+
+
+def iter_pages(source: str | Path | BinaryIO, workers: int = 1) -> Iterator[PdfPage]:
+    """Yield pages in order; each page's parsed layout is released once it is read.
 
-        pdf = pdfplumber.open(BytesIO(content))
-        pages_text: list[str] = []
-        tables: list[ExtractedTable] = []
-        tbl_seq = 0
+    With ``workers`` > 1 and a file path, pages are extracted in a process pool
+    in runs of ``_PAGES_PER_TASK``; at most two runs per worker are in flight,
+    so memory stays bounded however long the document is.
+    """
+    if workers > 1 and isinstance(source, (str, Path)):
+        yield from _iter_pages_parallel(str(source), workers)
+        return
 
+    with pdfplumber.open(source) as pdf:
         for page in pdf.pages:
-            # Extract text
-            text = page.extract_text() or ""
-            pages_text.append(text)
-
-            # Extract tables
-            for tbl_data in page.extract_tables() or []:
-                if not tbl_data or len(tbl_data) < 2:
-                    continue
-                headers = [str(c or "") for c in tbl_data[0]]
-                rows = [[str(c or "") for c in row] for row in tbl_data[1:]]
+            yield _read_page(page)
+            page.close()
+
+
+def iter_sections(pages: Iterable[PdfPage]) -> Iterator[ExtractedSection]:
+    """Yield sections as soon as the next heading closes them."""
+    builder = _SectionBuilder()
+    for i, page in enumerate(pages):
+        if i:
+            yield from builder.feed("")  # Page break, as in the joined full text
+        for line in page.text.split("\n"):
+            yield from builder.feed(line)
+    yield from builder.finish()
+
+
+def _extract_document(pages: Iterable[PdfPage]) -> ExtractedDocument:
+    """Build an ExtractedDocument in one pass over the pages."""
+    full_text = StringIO()
+    tables: list[ExtractedTable] = []
+    title_lines: list[str] = []
+
+    def consume() -> Iterator[PdfPage]:
+        for i, page in enumerate(pages):
+            if i:
+                full_text.write("\n\n")
+            else:
+                title_lines.append(_extract_title([page.text]))
+            full_text.write(page.text)
+            for tbl_data in page.tables:
                 tables.append(ExtractedTable(
-                    id=f"tbl-{tbl_seq:03d}",
+                    id=f"tbl-{len(tables):03d}",
                     caption=None,
-                    headers=headers,
-                    rows=rows,
+                    headers=tbl_data[0],
+                    rows=tbl_data[1:],
                 ))
-                tbl_seq += 1
+            yield page
 
-        pdf.close()
+    sections = list(iter_sections(consume()))
+    return ExtractedDocument(
+        title=title_lines[0] if title_lines else "",
+        sections=sections,
+        full_text=full_text.getvalue(),
+        tables=tables,
+    )
 
-        full_text = "\n\n".join(pages_text)
-        title = _extract_title(pages_text)
-        sections = _build_sections_from_text(full_text)
 
-        return ExtractedDocument(
-            title=title,
-            sections=sections,
-            full_text=full_text,
-            tables=tables,
-        )
+def _read_page(page: Page) -> PdfPage:
+    tables = []
+    for tbl_data in page.extract_tables() or []:
+        if not tbl_data or len(tbl_data) < 2:
+            continue
+        tables.append([[str(c or "") for c in row] for row in tbl_data])
+    return PdfPage(number=page.page_number, text=page.extract_text() or "", tables=tables)
+
+
+def _extract_range(path: str, first: int, last: int) -> list[PdfPage]:
+    """Worker task: extract pages ``first``..``last`` (1-based, inclusive)."""
+    with pdfplumber.open(path, pages=list(range(first, last + 1))) as pdf:
+        result = []
+        for page in pdf.pages:
+            result.append(_read_page(page))
+            page.close()
+        return result
+
+
+def _iter_pages_parallel(path: str, workers: int) -> Iterator[PdfPage]:
+    with pdfplumber.open(path) as pdf:
+        page_count = len(pdf.pages)
+    ranges = [
+        (first, min(first + _PAGES_PER_TASK - 1, page_count))
+        for first in range(1, page_count + 1, _PAGES_PER_TASK)
+    ]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending: deque = deque()
+        for first, last in ranges:
+            pending.append(pool.submit(_extract_range, path, first, last))
+            if len(pending) >= workers * 2:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
 
 
 def _extract_title(pages: list[str]) -> str:
@@ -83,56 +173,67 @@ def _extract_title(pages: list[str]) -> str:
 
 def _build_sections_from_text(text: str) -> list[ExtractedSection]:
     """Build sections from plain text using heading heuristics."""
-    lines = text.split("\n")
-    sections: list[ExtractedSection] = []
-    current_text: list[str] = []
-    seq = 0
+    builder = _SectionBuilder()
+    sections = [s for line in text.split("\n") for s in builder.feed(line)]
+    return sections + list(builder.finish())
+
+
+class _SectionBuilder:
+    """Line-at-a-time section splitter; a section is emitted once it is complete."""
+
+    def __init__(self) -> None:
+        self._open: ExtractedSection | None = None
+        self._text: list[str] = []
+        self._seq = 0
 
-    for line in lines:
+    def _next_id(self) -> str:
+        section_id = f"sec-{self._seq:03d}"
+        self._seq += 1
+        return section_id
+
+    def feed(self, line: str) -> Iterator[ExtractedSection]:
         stripped = line.strip()
         if not stripped:
-            current_text.append("")
-            continue
+            self._text.append("")
+            return
+        if not _is_heading(stripped):
+            self._text.append(stripped)
+            return
 
-        if _is_heading(stripped):
-            # Flush accumulated text
-            if current_text and sections:
-                sections[-1].text += "\n" + "\n".join(current_text)
-                current_text = []
-            elif current_text:
-                sections.append(ExtractedSection(
-                    id=f"sec-{seq:03d}",
-                    heading="(Preamble)",
-                    level=0,
-                    text="\n".join(current_text),
-                ))
-                seq += 1
-                current_text = []
-
-            level = _estimate_level(stripped)
-            sections.append(ExtractedSection(
-                id=f"sec-{seq:03d}",
-                heading=stripped[:200],
-                level=level,
-                text="",
-            ))
-            seq += 1
-        else:
-            current_text.append(stripped)
-
-    # Flush remaining
-    if current_text:
-        if sections:
-            sections[-1].text += "\n" + "\n".join(current_text)
-        else:
-            sections.append(ExtractedSection(
-                id=f"sec-{seq:03d}",
-                heading="(Document)",
+        # Flush accumulated text into the open section (or a preamble)
+        if self._open is not None:
+            if self._text:
+                self._open.text += "\n" + "\n".join(self._text)
+            yield self._open
+        elif self._text:
+            yield ExtractedSection(
+                id=self._next_id(),
+                heading="(Preamble)",
                 level=0,
-                text="\n".join(current_text),
-            ))
+                text="\n".join(self._text),
+            )
+        self._text = []
+        self._open = ExtractedSection(
+            id=self._next_id(),
+            heading=stripped[:200],
+            level=_estimate_level(stripped),
+            text="",
+        )
 
-    return sections
+    def finish(self) -> Iterator[ExtractedSection]:
+        if self._open is not None:
+            if self._text:
+                self._open.text += "\n" + "\n".join(self._text)
+            yield self._open
+        elif self._text:
+            yield ExtractedSection(
+                id=self._next_id(),
+                heading="(Document)",
+                level=0,
+                text="\n".join(self._text),
+            )
+        self._open = None
+        self._text = []
 
 
 def _is_heading(line: str) -> bool:
@@ -1,7 +1,22 @@
-"""Legal XML ingestion adapter — USLM, Akoma Ntoso, generic XML."""
+"""Legal XML ingestion adapter — USLM, Akoma Ntoso, generic XML.
+
+Documents of ``xml_streaming_min_kb`` or more are extracted in a single
+``iterparse`` pass that builds sections, tables, text and references as
+elements close and clears each element once it has been read, so memory
+follows the extracted text rather than the size of the parsed tree. Smaller
+documents are parsed into a tree and walked; both paths produce the same
+ExtractedDocument.
+"""
+
+import asyncio
+from dataclasses import dataclass, field
+from io import BytesIO
+from pathlib import Path
+from typing import BinaryIO
 
 from lxml import etree
 
+from app.config import settings
 from app.ingestion.base import (
     ExtractedDocument,
     ExtractedSection,
@@ -17,6 +32,8 @@ _AKN_NS = {"akn": "http://docs.oasis-open.org/legaldocml/ns/akn/3.0"}
 
 
 class XmlAdapter(IngestionAdapter):
+    reads_files = True
+
     def supports(self, content_type: str) -> bool:
         ct = content_type.lower()
         return "xml" in ct
@@ -25,14 +42,23 @@ class XmlAdapter(IngestionAdapter):
         if isinstance(content, str):
             content = content.encode("utf-8")
 
-        root = etree.fromstring(content)
-        ns = _detect_schema(root)
+        if len(content) >= settings.xml_streaming_min_kb * 1024:
+            return await asyncio.to_thread(_stream_parse, BytesIO(content))
+        return _parse_tree(etree.fromstring(content))
+
+    async def ingest_file(self, path: Path, source_url: str = "") -> ExtractedDocument:
+        if path.stat().st_size >= settings.xml_streaming_min_kb * 1024:
+            return await asyncio.to_thread(_stream_parse, path)
+        return _parse_tree(etree.parse(str(path)).getroot())
 
-        if ns == "uslm":
-            return _parse_uslm(root)
-        if ns == "akn":
-            return _parse_akn(root)
-        return _parse_generic_xml(root)
+
+def _parse_tree(root: etree._Element) -> ExtractedDocument:
+    ns = _detect_schema(root)
+    if ns == "uslm":
+        return _parse_uslm(root)
+    if ns == "akn":
+        return _parse_akn(root)
+    return _parse_generic_xml(root)
 
 
 def _detect_schema(root: etree._Element) -> str:
@@ -238,3 +264,277 @@ def _get_direct_text(el: etree._Element) -> str:
         if child.tail:
             parts.append(child.tail.strip())
     return "\n".join(p for p in parts if p)
+
+
+# ── Single-pass streaming extraction ──────────────────────────────────────
+#
+# Mirrors the tree walk above element by element. Each element's text is
+# assembled when it closes, from its own text, its children's texts (already
+# assembled) and their tails; the element is then cleared. Section numbering
+# follows the recursive walk: a section takes a number on entry, its
+# descendants are numbered, then it takes the current number on exit.
+
+_USLM_STRUCT = frozenset(
+    ("section", "title", "subtitle", "chapter", "subchapter", "part", "subpart")
+)
+_USLM_CONTENT = frozenset(("content", "paragraph", "subsection"))
+_AKN_STRUCT = frozenset(("section", "article", "chapter", "part", "title", "division"))
+# Children left out of a section's direct text (see _get_direct_text)
+_NESTED_STRUCT = frozenset(("section", "chapter", "part", "title", "article", "division"))
+_ROW_TAGS = frozenset(("tr", "row"))
+_XLINK_HREF = "{http://www.w3.org/1999/xlink}href"
+
+
+@dataclass(slots=True)
+class _Closed:
+    """What a parent needs to know about a child element after it is cleared."""
+
+    name: str
+    all_text: str
+    has_children: bool
+
+
+@dataclass(slots=True)
+class _Table:
+    index: int  # Position among all tables in document order
+    rows: list[list[str] | None] = field(default_factory=list)  # Slots filled as rows close
+
+
+@dataclass(slots=True)
+class _Open:
+    name: str
+    closed: list[_Closed] = field(default_factory=list)
+    sections: list[ExtractedSection] | None = None  # Set when children may be sections
+    tree: str = ""  # Which section tree ``sections`` belongs to
+    child_level: int = 1
+    role: str = ""  # "section" | "content" | ""
+    first_of_name: bool = False  # First descendant of the root with this local name
+    first_of_plain_tag: bool = False  # ... and with this un-namespaced tag
+    table: _Table | None = None
+    row_slots: list[tuple[_Table, int]] = field(default_factory=list)
+
+
+class _StreamExtractor:
+    def __init__(self) -> None:
+        self.stack: list[_Open] = []
+        self.schema = "generic"
+        self.seq: dict[str, int] = {}
+        self.roots: dict[str, list[ExtractedSection]] = {}
+        self.open_tables: list[_Table] = []
+        self.tables: list[tuple[_Table, list[str]]] = []
+        self.table_count = 0
+        self.refs: set[str] = set()
+        self.full_text = ""
+        self.struct: frozenset[str] = frozenset()
+        # First descendant of the root per local name (and per un-namespaced
+        # tag, for generic titles), as the tree walk's find() would return:
+        # (text, has_children, all_text), or None while still open
+        self.first: dict[str, tuple[str | None, bool, str] | None] = {}
+        self.first_plain: dict[str, tuple[str | None, bool, str] | None] = {}
+
+    # ── Events ────────────────────────────────────────────────────────────
+
+    def start(self, el: etree._Element) -> None:
+        name = etree.QName(el.tag).localname
+        node = _Open(name=name)
+
+        if not self.stack:
+            self.schema = _detect_schema(el)
+            self.struct = _USLM_STRUCT if self.schema == "uslm" else _AKN_STRUCT
+            if self.schema in ("uslm", "akn"):
+                node.sections, node.tree = [], "root"
+                self.roots["root"] = node.sections
+                self.seq["root"] = 0
+        else:
+            if name not in self.first:
+                self.first[name] = None
+                node.first_of_name = True
+            if "}" not in el.tag and name not in self.first_plain:
+                self.first_plain[name] = None
+                node.first_of_plain_tag = True
+            parent = self.stack[-1]
+            if parent.sections is not None and name in self.struct:
+                node.role = "section"
+                node.sections, node.tree = [], parent.tree
+                node.child_level = parent.child_level + 1
+                self.seq[node.tree] += 1
+            elif parent.sections is not None and self.schema == "uslm" and name in _USLM_CONTENT:
+                node.role = "content"
+            if self.schema == "akn" and name == "body" and node.first_of_name:
+                node.sections, node.tree = [], "body"
+                self.roots["body"] = node.sections
+                self.seq["body"] = 0
+
+        if name == "table":
+            node.table = _Table(index=self.table_count)
+            self.table_count += 1
+            self.open_tables.append(node.table)
+        elif name in _ROW_TAGS:
+            for table in self.open_tables:
+                node.row_slots.append((table, len(table.rows)))
+                table.rows.append(None)
+        if name in ("ref", "a"):
+            href = el.get("href") or el.get(_XLINK_HREF) or ""
+            if href.startswith(("http://", "https://")):
+                self.refs.add(href)
+
+        self.stack.append(node)
+
+    def end(self, el: etree._Element) -> None:
+        node = self.stack.pop()
+        parent = self.stack[-1] if self.stack else None
+
+        # Text of the subtree, and the direct text used for section bodies
+        all_parts = [el.text or ""]
+        direct = [el.text.strip()] if el.text else []
+        closed = iter(node.closed)
+        for child in el:
+            if isinstance(child.tag, str):
+                info = next(closed)
+                all_parts.append(info.all_text)
+                if info.name not in _NESTED_STRUCT:
+                    direct.append(info.all_text.strip())
+            if child.tail:
+                all_parts.append(child.tail)
+                direct.append(child.tail.strip())
+        all_text = "".join(all_parts)
+
+        if node.first_of_name:
+            self.first[node.name] = (el.text, len(el) > 0, all_text)
+        if node.first_of_plain_tag:
+            self.first_plain[node.name] = (el.text, len(el) > 0, all_text)
+
+        if node.role == "section":
+            level = parent.child_level
+            if self.schema == "uslm":
+                heading = _closed_text(_heading_of(node.closed)).strip()
+                heading = heading or f"({node.name})"
+            else:
+                heading_info = _heading_of(node.closed)
+                heading = f"({node.name})"
+                if heading_info is not None:
+                    heading = heading_info.all_text.strip()
+            parent.sections.append(ExtractedSection(
+                id=f"sec-{self.seq[node.tree]:03d}",
+                heading=heading,
+                level=level,
+                text="\n".join(p for p in direct if p),
+                children=node.sections,
+            ))
+            self.seq[node.tree] += 1
+        elif node.role == "content":
+            text = all_text.strip()
+            if text:
+                if parent.sections:
+                    parent.sections[-1].text += "\n" + text
+                else:
+                    parent.sections.append(ExtractedSection(
+                        id=f"sec-{self.seq[parent.tree]:03d}",
+                        heading=f"({node.name})",
+                        level=parent.child_level,
+                        text=text,
+                    ))
+                    self.seq[parent.tree] += 1
+
+        if node.row_slots:
+            cells = [c.all_text.strip() for c in node.closed]
+            for table, slot in node.row_slots:
+                table.rows[slot] = cells
+        if node.table is not None:
+            self.open_tables.pop()
+            self.tables.append((node.table, [r for r in node.table.rows if r]))
+
+        if parent is None:
+            self.full_text = all_text
+        else:
+            parent.closed.append(_Closed(node.name, all_text, len(el) > 0))
+        # Keep the tail: the parent reads it when it closes
+        el.clear(keep_tail=True)
+
+    # ── Result ────────────────────────────────────────────────────────────
+
+    def _first_text(self, name: str, plain: bool = False) -> tuple[bool, str | None, bool, str]:
+        info = (self.first_plain if plain else self.first).get(name)
+        if info is None:
+            return False, None, False, ""
+        return (True, *info)
+
+    def result(self) -> ExtractedDocument:
+        tables = [
+            ExtractedTable(
+                id=f"tbl-{table.index:03d}", caption=None, headers=rows[0], rows=rows[1:]
+            )
+            for table, rows in sorted(self.tables, key=lambda t: t[0].index)
+            if len(rows) > 1
+        ]
+
+        if self.schema == "uslm":
+            found, text, has_children, _ = self._first_text("title")
+            if not (found and has_children):
+                found, text, _, _ = self._first_text("heading")
+            title = text.strip() if found and text else ""
+            return ExtractedDocument(
+                title=title,
+                sections=self.roots["root"],
+                full_text=self.full_text,
+                tables=tables,
+                cross_references=list(self.refs),
+            )
+
+        if self.schema == "akn":
+            found, _, _, doc_title = self._first_text("docTitle")
+            body_found, _, body_has_children, _ = self._first_text("body")
+            use_body = body_found and body_has_children
+            sections = self.roots["body"] if use_body else self.roots["root"]
+            return ExtractedDocument(
+                title=doc_title.strip() if found else "",
+                sections=sections,
+                full_text=self.full_text,
+                tables=tables,
+                cross_references=list(self.refs),
+            )
+
+        title = ""
+        for tag_name in ("title", "name", "heading"):
+            found, text, _, _ = self._first_text(tag_name, plain=True)
+            if not found:
+                found, text, _, _ = self._first_text(tag_name)
+            if found and text:
+                title = text.strip()
+                break
+        return ExtractedDocument(
+            title=title,
+            sections=[ExtractedSection(
+                id="sec-000",
+                heading=title or "(Document)",
+                level=1,
+                text=self.full_text,
+            )],
+            full_text=self.full_text,
+            tables=tables,
+        )
+
+
+def _heading_of(children: list[_Closed]) -> _Closed | None:
+    """``find("{*}heading") or find("{*}num")`` — a heading without child elements is falsy."""
+    heading = next((c for c in children if c.name == "heading"), None)
+    if heading is not None and heading.has_children:
+        return heading
+    return next((c for c in children if c.name == "num"), None)
+
+
+def _closed_text(info: _Closed | None) -> str:
+    return info.all_text if info is not None else ""
+
+
+def _stream_parse(source: str | Path | BinaryIO) -> ExtractedDocument:
+    """Extract a document in one streaming pass over the XML."""
+    extractor = _StreamExtractor()
+    if isinstance(source, Path):
+        source = str(source)
+    for event, el in etree.iterparse(source, events=("start", "end")):
+        if event == "start":
+            extractor.start(el)
+        else:
+            extractor.end(el)
+    return extractor.result()
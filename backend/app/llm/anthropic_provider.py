@@ -149,6 +149,9 @@ class AnthropicProvider(LLMProvider):
                         )
 
         text = "\n".join(text_parts)
+        usage = getattr(response, "usage", None)
+        if usage is not None:
+            record.set_usage(usage.input_tokens, usage.output_tokens)
         record.finish(response_chars=len(text))
         log_llm_call_success(record)
         return text, citations
@@ -6,6 +6,8 @@ Emits structured log lines for every LLM call with Track A fields:
 Also provides [STAGE] and [HEARTBEAT] stdout formatters per log-file-rule.mdc §9-10.
 
 Controlled by settings.llm_logging (ON|OFF) and settings.llm_log_prompts (ON|OFF).
+Call latency and prompt/response sizes feed the /metrics registry regardless,
+and each call is a tracing span carrying the record's fields.
 """
 
 from __future__ import annotations
@@ -17,6 +19,8 @@ from dataclasses import dataclass, field
 from typing import Any
 
 from app.config import settings
+from app.metrics import LLM_CALL_SECONDS, LLM_CHARS, LLM_TOKENS
+from app.tracing import mark_error, start_span
 
 logger = logging.getLogger("app.llm.calls")
 
@@ -58,6 +62,8 @@ class LLMCallRecord:
     manifest_id: str = ""
     prompt_chars: int = 0
     response_chars: int = 0
+    prompt_tokens: int | None = None  # Set only where the provider reports usage
+    completion_tokens: int | None = None
     duration_ms: float = 0.0
     error_code: int | None = None
     error_message: str = ""
@@ -65,6 +71,7 @@ class LLMCallRecord:
     fallback_model: str | None = None
     metadata: dict[str, Any] = field(default_factory=dict)
     _start_time: float = field(default=0.0, repr=False)
+    _span: Any = field(default=None, repr=False)
 
     def start(self) -> None:
         self._start_time = time.monotonic()
@@ -73,6 +80,10 @@ class LLMCallRecord:
         self.duration_ms = round((time.monotonic() - self._start_time) * 1000, 1)
         self.response_chars = response_chars
 
+    def set_usage(self, prompt_tokens: int | None, completion_tokens: int | None) -> None:
+        self.prompt_tokens = prompt_tokens
+        self.completion_tokens = completion_tokens
+
 
 def _is_enabled() -> bool:
     return settings.llm_logging.upper() == "ON"
@@ -84,9 +95,17 @@ def _should_log_prompts() -> bool:
 
 def log_llm_call_start(record: LLMCallRecord) -> None:
     """Log the start of an LLM call."""
+    record.start()
+    record._span = start_span(f"llm.{record.method}", {
+        "llm.provider": record.provider,
+        "llm.model": record.model,
+        "llm.stage": record.stage or None,
+        "raris.run_id": record.run_id or None,
+        "raris.manifest_id": record.manifest_id or None,
+        "llm.prompt_chars": record.prompt_chars,
+    })
     if not _is_enabled():
         return
-    record.start()
     logger.info(
         "[llm-call] START provider=%s model=%s method=%s stage=%s "
         "run_id=%s manifest_id=%s prompt_chars=%d",
@@ -102,6 +121,7 @@ def log_llm_call_start(record: LLMCallRecord) -> None:
 
 def log_llm_call_success(record: LLMCallRecord) -> None:
     """Log successful completion of an LLM call."""
+    _observe(record, "ok")
     if not _is_enabled():
         return
     logger.info(
@@ -120,6 +140,7 @@ def log_llm_call_success(record: LLMCallRecord) -> None:
 
 def log_llm_call_error(record: LLMCallRecord) -> None:
     """Log a failed LLM call."""
+    _observe(record, "error")
     if not _is_enabled():
         return
     logger.error(
@@ -140,6 +161,39 @@ def log_llm_call_error(record: LLMCallRecord) -> None:
     )
 
 
+def _observe(record: LLMCallRecord, outcome: str) -> None:
+    """Record the finished call in the metrics registry and end its span."""
+    labels = {"provider": record.provider, "stage": record.stage or "unknown"}
+    LLM_CALL_SECONDS.observe(record.duration_ms / 1000, outcome=outcome, **labels)
+    LLM_CHARS.inc(record.prompt_chars, direction="prompt", **labels)
+    LLM_CHARS.inc(record.response_chars, direction="response", **labels)
+    # Providers leave counts unset (None) when they do not report usage
+    if isinstance(record.prompt_tokens, int):
+        LLM_TOKENS.inc(record.prompt_tokens, direction="prompt", **labels)
+    if isinstance(record.completion_tokens, int):
+        LLM_TOKENS.inc(record.completion_tokens, direction="completion", **labels)
+
+    if record._span is None:
+        return
+    record._span.set_attributes({
+        "llm.response_chars": record.response_chars,
+        "llm.duration_ms": record.duration_ms,
+        "llm.retry_attempt": record.retry_attempt,
+    })
+    if isinstance(record.prompt_tokens, int):
+        record._span.set_attribute("llm.prompt_tokens", record.prompt_tokens)
+    if isinstance(record.completion_tokens, int):
+        record._span.set_attribute("llm.completion_tokens", record.completion_tokens)
+    if record.fallback_model:
+        record._span.set_attribute("llm.fallback_model", record.fallback_model)
+    if outcome == "error":
+        if record.error_code is not None:
+            record._span.set_attribute("llm.error_code", record.error_code)
+        mark_error(record._span, record.error_message)
+    record._span.end()
+    record._span = None
+
+
 def log_stage(
     stage_name: str,
     *,
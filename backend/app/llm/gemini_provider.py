@@ -283,6 +283,9 @@ class GeminiProvider(LLMProvider):
                                 title=getattr(web, "title", "") or "",
                             )
                         )
+        usage = getattr(response, "usage_metadata", None)
+        if usage is not None:
+            record.set_usage(usage.prompt_token_count, usage.candidates_token_count)
         record.finish(response_chars=len(text))
         log_llm_call_success(record)
         return text, citations
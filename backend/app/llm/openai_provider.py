@@ -62,6 +62,8 @@ class OpenAIProvider(LLMProvider):
         try:
             response = await self.client.responses.create(**params)
             text = response.output_text or ""
+            if response.usage is not None:
+                record.set_usage(response.usage.input_tokens, response.usage.output_tokens)
             record.finish(response_chars=len(text))
             log_llm_call_success(record)
             return text
@@ -147,6 +149,8 @@ class OpenAIProvider(LLMProvider):
                             )
 
         text = response.output_text or ""
+        if response.usage is not None:
+            record.set_usage(response.usage.input_tokens, response.usage.output_tokens)
         record.finish(response_chars=len(text))
         log_llm_call_success(record)
         return text, citations
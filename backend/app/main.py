@@ -5,10 +5,13 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from sqlalchemy import text
 
+from app.auth_cache import api_key_cache
 from app.config import settings
-from app.database import Base, engine
+from app.database import Base, async_session, engine
 from app.errors import register_error_handlers
+from app.http_client import close_http_client
 from app.middleware import RequestLoggingMiddleware
+from app.rate_limit import close_rate_limiter
 from app.routers import (
     acquisitions,
     admin,
@@ -21,6 +24,7 @@ from app.routers import (
     verticals,
 )
 from app.scheduler import configure_scheduler, scheduler
+from app.tracing import configure_tracing, shutdown_tracing
 
 # Configure logging
 logging.basicConfig(
@@ -34,6 +38,7 @@ logger = logging.getLogger(__name__)
 async def lifespan(app: FastAPI):
     # Validate config
     settings.validate_on_startup()
+    configure_tracing()
 
     # Create pgvector extension and tables on startup
     async with engine.begin() as conn:
@@ -51,6 +56,11 @@ async def lifespan(app: FastAPI):
     # Shutdown
     if scheduler.running:
         scheduler.shutdown(wait=False)
+    async with async_session() as db:
+        await api_key_cache.flush(db)
+    await close_http_client()
+    await close_rate_limiter()
+    shutdown_tracing()
     await engine.dispose()
 
 
@@ -0,0 +1,308 @@
+"""In-process metrics registry, exposed at /metrics in Prometheus text format.
+
+Counters, gauges and histograms with labels, kept in memory per process and
+rendered on scrape. Gauges that describe live state (queue depths, the DB
+pool) are read from callbacks at scrape time rather than updated on every
+change. No client library is needed; the exposition format is plain text.
+
+Usage:
+    SEARCH_LEG_SECONDS.observe(0.042, leg="dense")
+    with LLM_CALL_SECONDS.time(provider="gemini", stage="l2_expand", outcome="ok"):
+        ...
+    ACQUISITION_BYTES.inc(result["byte_size"], method="download")
+    register_sse_queues("ingestion", _event_queues)
+    render()  # text for GET /metrics
+"""
+
+import bisect
+import math
+import threading
+import time
+import weakref
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+_LLM_BUCKETS = (0.5, 1.0, 2.5, 5.0, 10.0, 20.0, 40.0, 60.0, 120.0, 300.0)
+_SIZE_BUCKETS = (1, 8, 16, 32, 64, 128, 256, 512, 1024, 2048)
+
+
+class _Metric(ABC):
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self._lock = threading.Lock()
+
+    def _key(self, labels: dict[str, str]) -> tuple[str, ...]:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(
+                f"Unknown labels for {self.name}: {sorted(labels)}. "
+                f"Available: {list(self.labelnames)}"
+            )
+        return tuple(str(labels[n]) for n in self.labelnames)
+
+    def _header(self) -> list[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+
+    @abstractmethod
+    def samples(self) -> list[str]:
+        """The metric's sample lines, without the HELP and TYPE header."""
+        ...
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: str) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def samples(self) -> list[str]:
+        with self._lock:
+            items = list(self._values.items())
+        return [f"{self.name}{_labels(self.labelnames, key)} {_num(v)}" for key, v in items]
+
+
+class Gauge(_Metric):
+    """A gauge set directly, or read from ``callback`` at scrape time.
+
+    A callback returns ``{label values tuple: value}`` (``{(): value}`` when
+    the gauge has no labels).
+    """
+
+    kind = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        callback: Callable[[], dict[tuple[str, ...], float]] | None = None,
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[tuple[str, ...], float] = {}
+        self._callback = callback
+
+    def set(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def samples(self) -> list[str]:
+        if self._callback is not None:
+            items = list(self._callback().items())
+        else:
+            with self._lock:
+                items = list(self._values.items())
+        return [f"{self.name}{_labels(self.labelnames, key)} {_num(v)}" for key, v in items]
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = _LATENCY_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # Per label set: [count per bucket (non-cumulative) + overflow, sum]
+        self._series: dict[tuple[str, ...], tuple[list[int], list[float]]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = ([0] * (len(self.buckets) + 1), [0.0])
+            series[0][index] += 1
+            series[1][0] += value
+
+    @contextmanager
+    def time(self, **labels: str) -> Iterator[None]:
+        """Observe the duration of the block in seconds, also when it raises."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    def count(self, **labels: str) -> int:
+        series = self._series.get(self._key(labels))
+        return sum(series[0]) if series else 0
+
+    def samples(self) -> list[str]:
+        with self._lock:
+            items = [(key, list(counts), total[0]) for key, (counts, total) in self._series.items()]
+        lines = []
+        for key, counts, total in items:
+            cumulative = 0
+            for bound, n in zip((*self.buckets, math.inf), counts, strict=True):
+                cumulative += n
+                le = "+Inf" if bound == math.inf else _num(bound)
+                bucket_labels = _labels((*self.labelnames, "le"), (*key, le))
+                lines.append(f"{self.name}_bucket{bucket_labels} {cumulative}")
+            lines.append(f"{self.name}_sum{_labels(self.labelnames, key)} {_num(total)}")
+            lines.append(f"{self.name}_count{_labels(self.labelnames, key)} {cumulative}")
+        return lines
+
+
+_registry: dict[str, _Metric] = {}
+
+
+def _register[M: _Metric](metric: M) -> M:
+    if metric.name in _registry:
+        raise ValueError(f"Metric already registered: {metric.name}")
+    _registry[metric.name] = metric
+    return metric
+
+
+def render() -> str:
+    """All registered metrics in Prometheus text exposition format."""
+    lines: list[str] = []
+    for metric in _registry.values():
+        lines.extend(metric._header())
+        lines.extend(metric.samples())
+    return "\n".join(lines) + "\n"
+
+
+def _labels(names: tuple[str, ...], values: tuple[str, ...]) -> str:
+    if not names:
+        return ""
+    pairs = (f'{n}="{_escape(v)}"' for n, v in zip(names, values, strict=True))
+    return "{" + ",".join(pairs) + "}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _num(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+
+# ── Live-state sources read at scrape time ──────────────────────────────────
+
+_discovery_queues: "weakref.WeakSet" = weakref.WeakSet()
+_sse_queues: dict[str, dict] = {}
+
+
+def track_discovery_queue(queue) -> None:
+    """Include a DiscoveryQueue in the depth gauge while it is alive."""
+    _discovery_queues.add(queue)
+
+
+def register_sse_queues(stream: str, queues: dict) -> None:
+    """Report a router's per-run SSE event queues under ``stream``."""
+    _sse_queues[stream] = queues
+
+
+def _discovery_depth() -> dict[tuple[str, ...], float]:
+    queues = list(_discovery_queues)
+    return {("active",): len(queues), ("pending",): sum(q.size() for q in queues)}
+
+
+def _sse_depth() -> dict[tuple[str, ...], float]:
+    values: dict[tuple[str, ...], float] = {}
+    for stream, queues in _sse_queues.items():
+        live = list(queues.values())
+        values[(stream, "streams")] = len(live)
+        values[(stream, "pending_events")] = sum(q.qsize() for q in live)
+    return values
+
+
+def _db_pool() -> dict[tuple[str, ...], float]:
+    from app.database import engine
+
+    pool = engine.sync_engine.pool
+    values: dict[tuple[str, ...], float] = {}
+    readers = (("size", "size"), ("checked_out", "checkedout"), ("overflow", "overflow"))
+    for state, reader in readers:
+        method = getattr(pool, reader, None)
+        if callable(method):
+            values[(state,)] = method()
+    return values
+
+
+# ── Metrics ─────────────────────────────────────────────────────────────────
+
+HTTP_REQUESTS = _register(Counter(
+    "raris_http_requests_total", "HTTP requests by route template and status.",
+    ("method", "route", "status"),
+))
+HTTP_REQUEST_SECONDS = _register(Histogram(
+    "raris_http_request_duration_seconds", "HTTP request latency, including streamed bodies.",
+    ("method", "route"),
+))
+SEARCH_LEG_SECONDS = _register(Histogram(
+    "raris_search_leg_duration_seconds",
+    "Hybrid search latency per leg (embed, dense, sparse, fuse).",
+    ("leg",),
+))
+LLM_CALL_SECONDS = _register(Histogram(
+    "raris_llm_call_duration_seconds", "LLM call latency per provider and pipeline stage.",
+    ("provider", "stage", "outcome"), buckets=_LLM_BUCKETS,
+))
+LLM_TOKENS = _register(Counter(
+    "raris_llm_tokens_total", "LLM tokens reported by the provider, per direction.",
+    ("provider", "stage", "direction"),
+))
+LLM_CHARS = _register(Counter(
+    "raris_llm_chars_total", "LLM prompt and response characters, per direction.",
+    ("provider", "stage", "direction"),
+))
+EMBEDDING_BATCH_SECONDS = _register(Histogram(
+    "raris_embedding_batch_duration_seconds", "Embedding API latency per batch.",
+    ("outcome",),
+))
+EMBEDDING_BATCH_SIZE = _register(Histogram(
+    "raris_embedding_batch_size", "Texts per embedding batch.", buckets=_SIZE_BUCKETS,
+))
+CHUNKER_TOKENS = _register(Counter(
+    "raris_chunker_tokens_total", "Tokens emitted by the chunker.",
+))
+CHUNKER_SECONDS = _register(Counter(
+    "raris_chunker_seconds_total", "Time spent chunking; tokens / seconds is chunker throughput.",
+))
+ACQUISITION_BYTES = _register(Counter(
+    "raris_acquisition_bytes_total", "Bytes staged by acquisition, per access method.",
+    ("method",),
+))
+ACQUISITION_SECONDS = _register(Counter(
+    "raris_acquisition_seconds_total",
+    "Time spent fetching sources; bytes / seconds is throughput.",
+    ("method",),
+))
+DISCOVERY_QUEUE = _register(Gauge(
+    "raris_discovery_queue", "Live discovery queues and their pending items.",
+    ("state",), callback=_discovery_depth,
+))
+SSE_QUEUES = _register(Gauge(
+    "raris_sse_queues", "Open SSE event queues and events waiting in them, per stream.",
+    ("stream", "state"), callback=_sse_depth,
+))
+DB_POOL = _register(Gauge(
+    "raris_db_pool_connections",
+    "Database connection pool size, checked-out and overflow connections.",
+    ("state",), callback=_db_pool,
+))
@@ -1,47 +1,69 @@
-"""Request logging middleware with correlation IDs, timing, and rate limiting."""
+"""Request logging middleware with correlation IDs, timing, and rate limiting.
+
+A pure ASGI middleware: it wraps ``send`` to add headers to the response
+start message rather than running the endpoint in a separate task and
+re-streaming its body as ``BaseHTTPMiddleware`` does, so streaming responses
+(SSE) pass through untouched and each request costs one extra function call.
+Each request runs in a tracing span tagged with its correlation ID. The
+request is logged, recorded and its span ended when the last body chunk is
+sent, so background tasks run after the response do not count toward it.
+"""
 
 import logging
 import time
 import uuid
 
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
-from starlette.requests import Request
-from starlette.responses import JSONResponse, Response
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.config import settings
+from app.metrics import HTTP_REQUEST_SECONDS, HTTP_REQUESTS
+from app.tracing import correlation, mark_error, span
 
 logger = logging.getLogger("raris.access")
 
 # Paths exempt from rate limiting
-_EXEMPT_PATHS = {"/health", "/health/ready", "/docs", "/openapi.json", "/redoc"}
+_EXEMPT_PATHS = {"/health", "/health/ready", "/metrics", "/docs", "/openapi.json", "/redoc"}
 
 
-class RequestLoggingMiddleware(BaseHTTPMiddleware):
+class RequestLoggingMiddleware:
     """Adds correlation ID, logs request timing, rate limiting, and sets response headers."""
 
-    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
-        correlation_id = request.headers.get("X-Correlation-ID", str(uuid.uuid4()))
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        correlation_id = headers.get("X-Correlation-ID", str(uuid.uuid4()))
         start = time.monotonic()
+        method = scope["method"]
+        path = scope["path"]
 
         # Store correlation ID in request state
-        request.state.correlation_id = correlation_id
+        scope.setdefault("state", {})["correlation_id"] = correlation_id
 
         # Rate limiting (skip health checks and docs)
         rate_result = None
-        if settings.rate_limit_rpm > 0 and request.url.path not in _EXEMPT_PATHS:
+        if settings.rate_limit_rpm > 0 and path not in _EXEMPT_PATHS:
             from app.rate_limit import check_rate_limit
 
             # Use API key prefix if present, otherwise client IP
-            api_key = request.headers.get("X-API-Key", "")
+            api_key = headers.get("X-API-Key", "")
             if api_key:
                 identifier = api_key[:12]
             else:
-                identifier = request.client.host if request.client else "unknown"
+                client = scope.get("client")
+                identifier = client[0] if client else "unknown"
 
             rate_result = await check_rate_limit(identifier)
 
             if not rate_result.allowed:
-                return JSONResponse(
+                response = JSONResponse(
                     status_code=429,
                     content={"detail": "Rate limit exceeded"},
                     headers={
@@ -51,39 +73,76 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
                         "Retry-After": str(int(rate_result.retry_after) + 1),
                     },
                 )
-
-        try:
-            response = await call_next(request)
-        except Exception:
-            duration_ms = (time.monotonic() - start) * 1000
-            logger.error(
-                "%s %s 500 %.1fms [%s]",
-                request.method,
-                request.url.path,
-                duration_ms,
-                correlation_id,
+                await response(scope, receive, send)
+                _record(method, "unmatched", 429, time.monotonic() - start)
+                return
+
+        status_code = 500
+        finished = False
+
+        def finish(level: int = logging.INFO) -> None:
+            # Runs once the last body chunk is sent (streams finish at their
+            # end), before any background tasks the response then runs
+            nonlocal finished
+            if finished:
+                return
+            finished = True
+            seconds = time.monotonic() - start
+            route = _route_path(scope)
+            _record(method, route, status_code, seconds)
+            request_span.update_name(f"{method} {route}")
+            request_span.set_attributes(
+                {"http.route": route, "http.response.status_code": status_code}
+            )
+            request_span.end()
+            logger.log(
+                level, "%s %s %d %.1fms [%s]",
+                method, path, status_code, seconds * 1000, correlation_id,
             )
-            raise
-
-        duration_ms = (time.monotonic() - start) * 1000
-
-        # Set response headers
-        response.headers["X-Correlation-ID"] = correlation_id
-        response.headers["X-Response-Time-Ms"] = f"{duration_ms:.1f}"
-
-        # Rate limit headers
-        if rate_result:
-            response.headers["X-RateLimit-Limit"] = str(rate_result.limit)
-            response.headers["X-RateLimit-Remaining"] = str(rate_result.remaining)
-
-        # Log the request
-        logger.info(
-            "%s %s %d %.1fms [%s]",
-            request.method,
-            request.url.path,
-            response.status_code,
-            duration_ms,
-            correlation_id,
-        )
-
-        return response
+
+        async def send_with_headers(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                duration_ms = (time.monotonic() - start) * 1000
+
+                # Set response headers
+                response_headers = MutableHeaders(scope=message)
+                response_headers["X-Correlation-ID"] = correlation_id
+                response_headers["X-Response-Time-Ms"] = f"{duration_ms:.1f}"
+
+                # Rate limit headers
+                if rate_result:
+                    response_headers["X-RateLimit-Limit"] = str(rate_result.limit)
+                    response_headers["X-RateLimit-Remaining"] = str(rate_result.remaining)
+            await send(message)
+            if message["type"] == "http.response.body" and not message.get("more_body", False):
+                finish()
+
+        request_attributes = {"http.request.method": method, "url.path": path}
+        with (
+            correlation(correlation_id),
+            span(method, request_attributes, end_on_exit=False) as request_span,
+        ):
+            try:
+                await self.app(scope, receive, send_with_headers)
+            except Exception as exc:
+                if not finished:
+                    status_code = 500
+                    request_span.record_exception(exc)
+                    mark_error(request_span, type(exc).__name__)
+                    finish(logging.ERROR)
+                raise
+            finally:
+                # A client that disconnects mid-stream never gets the last chunk
+                finish()
+
+
+def _route_path(scope: Scope) -> str:
+    """The matched route template (``/api/manifests/{manifest_id}``), so labels stay bounded."""
+    return getattr(scope.get("route"), "path", "unmatched")
+
+
+def _record(method: str, route: str, status_code: int, seconds: float) -> None:
+    HTTP_REQUESTS.inc(method=method, route=route, status=str(status_code))
+    HTTP_REQUEST_SECONDS.observe(seconds, method=method, route=route)
@@ -4,12 +4,17 @@ from app.models.feedback import (
     AccuracySnapshot,
     ChangeEvent,
     CurationQueueItem,
+    FeedbackRollup,
+    MonitorSweep,
+    MonitorSweepShard,
     ResponseFeedback,
+    SourceFetchState,
 )
 from app.models.ingestion import (
     Chunk,
     DocumentSection,
     DocumentTable,
+    IngestionCheckpoint,
     IngestionRun,
     InternalDocument,
 )
@@ -20,9 +25,11 @@ from app.models.vertical import Vertical
 __all__ = [
     "Manifest", "Source", "RegulatoryBody", "CoverageAssessment", "KnownGap",
     "AcquisitionRun", "AcquisitionSource", "StagedDocument",
-    "IngestionRun", "InternalDocument", "DocumentSection", "DocumentTable", "Chunk",
+    "IngestionRun", "IngestionCheckpoint", "InternalDocument",
+    "DocumentSection", "DocumentTable", "Chunk",
     "QueryRecord", "AnalysisRecord",
     "Vertical",
-    "ResponseFeedback", "CurationQueueItem", "ChangeEvent", "AccuracySnapshot",
+    "ResponseFeedback", "FeedbackRollup", "CurationQueueItem", "ChangeEvent", "AccuracySnapshot",
+    "SourceFetchState", "MonitorSweep", "MonitorSweepShard",
     "ApiKey",
 ]
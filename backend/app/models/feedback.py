@@ -3,7 +3,7 @@
 import enum
 from datetime import datetime
 
-from sqlalchemy import DateTime, Float, Integer, String, Text, func
+from sqlalchemy import BigInteger, DateTime, Float, Integer, String, Text, func
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -52,6 +52,21 @@ class ResponseFeedback(Base):
     )
 
 
+class FeedbackRollup(Base):
+    """Running feedback count per (type, status).
+
+    Kept current as feedback is created and resolved, so the accuracy
+    dashboard reads at most one row per combination instead of scanning
+    response_feedback. The accuracy snapshot job recounts it.
+    """
+
+    __tablename__ = "feedback_rollups"
+
+    feedback_type: Mapped[FeedbackType] = mapped_column(String(20), primary_key=True)
+    status: Mapped[FeedbackStatus] = mapped_column(String(20), primary_key=True)
+    count: Mapped[int] = mapped_column(Integer, default=0)
+
+
 class CurationQueuePriority(enum.StrEnum):
     critical = "critical"
     high = "high"
@@ -118,6 +133,92 @@ class ChangeEvent(Base):
     )
 
 
+class SourceFetchState(Base):
+    """Validators and body hash from the change monitor's last fetch of a source."""
+
+    __tablename__ = "source_fetch_state"
+
+    source_id: Mapped[str] = mapped_column(String(255), primary_key=True)
+    manifest_id: Mapped[str] = mapped_column(String(255), primary_key=True)
+    etag: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    last_modified: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    content_length: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    content_hash: Mapped[str | None] = mapped_column(String(80), nullable=True)
+    # sha256:<hex> of the raw body, same format as StagedDocument.content_hash
+    last_status: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    checked_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    changed_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+
+
+class MonitorSweepStatus(enum.StrEnum):
+    running = "running"
+    complete = "complete"
+
+
+class MonitorShardStatus(enum.StrEnum):
+    pending = "pending"
+    running = "running"
+    complete = "complete"
+
+
+class MonitorSweep(Base):
+    """One change-monitor pass over all indexed sources, split into shards."""
+
+    __tablename__ = "monitor_sweeps"
+
+    id: Mapped[str] = mapped_column(String(100), primary_key=True)
+    status: Mapped[MonitorSweepStatus] = mapped_column(
+        String(20), default=MonitorSweepStatus.running, index=True
+    )
+    shard_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    # Totals, filled in when the last shard completes
+    sources_checked: Mapped[int] = mapped_column(Integer, default=0)
+    changes_detected: Mapped[int] = mapped_column(Integer, default=0)
+    not_modified: Mapped[int] = mapped_column(Integer, default=0)
+    bytes_downloaded: Mapped[int] = mapped_column(BigInteger, default=0)
+    errors: Mapped[int] = mapped_column(Integer, default=0)
+    duration_s: Mapped[float] = mapped_column(Float, default=0.0)
+    sources_per_sec: Mapped[float] = mapped_column(Float, default=0.0)
+
+    started_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
+    completed_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+
+
+class MonitorSweepShard(Base):
+    """Per-shard progress of a sweep; the cursor is the last source processed."""
+
+    __tablename__ = "monitor_sweep_shards"
+
+    sweep_id: Mapped[str] = mapped_column(String(100), primary_key=True)
+    shard: Mapped[int] = mapped_column(Integer, primary_key=True)
+    status: Mapped[MonitorShardStatus] = mapped_column(
+        String(20), default=MonitorShardStatus.pending
+    )
+    worker_id: Mapped[str | None] = mapped_column(String(100), nullable=True)
+    cursor_manifest_id: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    cursor_source_id: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    sources_total: Mapped[int] = mapped_column(Integer, default=0)
+    sources_checked: Mapped[int] = mapped_column(Integer, default=0)
+    changes_detected: Mapped[int] = mapped_column(Integer, default=0)
+    not_modified: Mapped[int] = mapped_column(Integer, default=0)
+    bytes_downloaded: Mapped[int] = mapped_column(BigInteger, default=0)
+    errors: Mapped[int] = mapped_column(Integer, default=0)
+    heartbeat_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    completed_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+
+
 class AccuracySnapshot(Base):
     __tablename__ = "accuracy_snapshots"
 
@@ -2,7 +2,7 @@ import enum
 from datetime import datetime
 
 from pgvector.sqlalchemy import Vector
-from sqlalchemy import DateTime, Float, ForeignKey, Integer, String, Text, func
+from sqlalchemy import DateTime, Float, ForeignKey, Integer, LargeBinary, String, Text, func
 from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -50,6 +50,22 @@ class IngestionRun(Base):
     )
 
 
+class IngestionCheckpoint(Base):
+    """Outcome of one source in an ingestion run; completed sources are skipped on resume."""
+
+    __tablename__ = "ingestion_checkpoints"
+
+    ingestion_run_id: Mapped[str] = mapped_column(ForeignKey("ingestion_runs.id"), primary_key=True)
+    source_id: Mapped[str] = mapped_column(String(100), primary_key=True)
+    document_id: Mapped[str] = mapped_column(String(150), nullable=False)
+    # complete | failed
+    status: Mapped[IngestionRunStatus] = mapped_column(String(20), nullable=False)
+    error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
+
+
 class InternalDocument(Base):
     __tablename__ = "internal_documents"
 
@@ -86,6 +102,9 @@ class InternalDocument(Base):
         DateTime(timezone=True), nullable=True
     )
     content_hash: Mapped[str] = mapped_column(String(80), default="")
+    # Earlier document this one duplicates (exactly or near), and how closely
+    duplicate_of: Mapped[str | None] = mapped_column(String(150), nullable=True, index=True)
+    duplicate_similarity: Mapped[float | None] = mapped_column(Float, nullable=True)
 
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now()
@@ -104,6 +123,27 @@ class InternalDocument(Base):
     )
 
 
+class DocumentFingerprint(Base):
+    """MinHash signature of a document's shingles, for near-duplicate checks."""
+
+    __tablename__ = "document_fingerprints"
+
+    document_id: Mapped[str] = mapped_column(String(150), primary_key=True)
+    signature: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)  # uint32 per permutation
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
+
+
+class DocumentLshBand(Base):
+    """LSH bucket of one signature band; documents sharing a key are candidates."""
+
+    __tablename__ = "document_lsh_bands"
+
+    band_key: Mapped[str] = mapped_column(String(24), primary_key=True)  # "<band>:<hash>"
+    document_id: Mapped[str] = mapped_column(String(150), primary_key=True, index=True)
+
+
 class DocumentSection(Base):
     __tablename__ = "document_sections"
 
@@ -114,6 +154,8 @@ class DocumentSection(Base):
     level: Mapped[int] = mapped_column(Integer, default=1)
     text: Mapped[str] = mapped_column(Text, default="")
     position: Mapped[int] = mapped_column(Integer, default=0)
+    # sha256 of the section's path and own text; unchanged sections keep their chunks
+    content_hash: Mapped[str] = mapped_column(String(80), default="")
 
     document: Mapped["InternalDocument"] = relationship(back_populates="sections")
 
@@ -1,7 +1,32 @@
-"""Redis-based sliding window rate limiter."""
-
+"""Redis GCRA rate limiter with an in-process pre-limiter.
+
+Each identifier (API key prefix or client IP) is limited to ``rate_limit_rpm``
+requests per minute, with bursts up to the same number, by the generic cell
+rate algorithm (GCRA). Its whole state is one Redis key holding the
+theoretical arrival time (TAT), read and advanced atomically by a Lua script
+in one round trip on a pooled client, so Redis memory per client is constant.
+
+With ``rate_limit_local`` each process first runs the same algorithm over its
+own requests, seeded with the TAT Redis last returned. A process sees only
+part of a client's traffic, so its local TAT never runs ahead of the shared
+one: a local rejection is always one Redis would make, and a client that
+keeps hammering after being limited is turned away without a Redis call.
+
+If Redis is unavailable the request is allowed (fail-open), subject to the
+local tier.
+
+Usage:
+    result = await check_rate_limit(identifier)
+    limiter_stats()             # {"checks": ..., "p99_ms": ..., ...}
+    redis_client()              # the shared pooled client, for other modules
+    await close_rate_limiter()  # on shutdown
+"""
+
+import asyncio
 import logging
+import math
 import time
+from collections import deque
 
 import redis.asyncio as aioredis
 
@@ -9,6 +34,27 @@ from app.config import settings
 
 logger = logging.getLogger(__name__)
 
+_WINDOW_MS = 60_000.0
+_MAX_LOCAL_ENTRIES = 10_000
+_LATENCY_SAMPLES = 4096
+
+# KEYS[1] = limiter key; ARGV = emission interval (ms), burst tolerance (ms).
+# Returns {allowed, TAT - now in ms}; the offset is a string to keep fractions.
+_GCRA_LUA = """
+local t = redis.call('TIME')
+local now = t[1] * 1000 + t[2] / 1000
+local interval = tonumber(ARGV[1])
+local tolerance = tonumber(ARGV[2])
+local tat = tonumber(redis.call('GET', KEYS[1])) or now
+if tat < now then tat = now end
+local new_tat = tat + interval
+if new_tat - now > tolerance then
+  return {0, tostring(tat - now)}
+end
+redis.call('SET', KEYS[1], tostring(new_tat), 'PX', math.ceil(new_tat - now))
+return {1, tostring(new_tat - now)}
+"""
+
 
 class RateLimitResult:
     """Result of a rate limit check."""
@@ -22,60 +68,133 @@ class RateLimitResult:
         self.retry_after = retry_after
 
 
-async def check_rate_limit(identifier: str) -> RateLimitResult:
-    """Check rate limit for an identifier (API key prefix or IP).
+class _LocalLimiter:
+    """GCRA over this process's requests; TATs are kept as monotonic ms."""
+
+    def __init__(self) -> None:
+        self._tats: dict[str, float] = {}
+
+    def check(self, identifier: str, interval: float, tolerance: float) -> tuple[bool, float]:
+        """Admit or reject one request; returns (allowed, TAT - now in ms)."""
+        now = time.monotonic() * 1000
+        tat = max(self._tats.get(identifier, now), now)
+        new_tat = tat + interval
+        if new_tat - now > tolerance:
+            return False, tat - now
+        self._store(identifier, new_tat, now)
+        return True, new_tat - now
+
+    def sync(self, identifier: str, offset: float) -> None:
+        """Adopt the shared TAT Redis returned (as an offset from now)."""
+        now = time.monotonic() * 1000
+        self._store(identifier, now + offset, now)
+
+    def _store(self, identifier: str, tat: float, now: float) -> None:
+        if identifier not in self._tats and len(self._tats) >= _MAX_LOCAL_ENTRIES:
+            # Drop clients whose bucket has fully refilled; they are at the default
+            self._tats = {k: v for k, v in self._tats.items() if v > now}
+            if len(self._tats) >= _MAX_LOCAL_ENTRIES:
+                self._tats.pop(next(iter(self._tats)))
+        self._tats[identifier] = tat
 
-    Uses a Redis sorted set sliding window:
-    - Members are timestamps of requests
-    - Score is the timestamp value
-    - Window is 60 seconds
-    """
+
+_local = _LocalLimiter()
+_client: aioredis.Redis | None = None
+_client_loop: asyncio.AbstractEventLoop | None = None
+_script = None
+_latencies: deque[float] = deque(maxlen=_LATENCY_SAMPLES)
+_counts = {"checks": 0, "rejected": 0, "local_rejections": 0, "redis_calls": 0, "redis_errors": 0}
+
+
+async def check_rate_limit(identifier: str) -> RateLimitResult:
+    """Check rate limit for an identifier (API key prefix or IP)."""
     limit = settings.rate_limit_rpm
     if limit <= 0:
         return RateLimitResult(allowed=True, limit=0, remaining=0)
 
-    window = 60.0  # seconds
-    now = time.time()
-    window_start = now - window
-    key = f"ratelimit:{identifier}"
-
+    started = time.perf_counter()
+    interval = _WINDOW_MS / limit
+    tolerance = interval * limit
+    _counts["checks"] += 1
     try:
-        r = aioredis.from_url(settings.redis_url)
+        if settings.rate_limit_local:
+            allowed, offset = _local.check(identifier, interval, tolerance)
+            if not allowed:
+                _counts["local_rejections"] += 1
+                _counts["rejected"] += 1
+                return _result(False, offset, interval, tolerance, limit)
+
         try:
-            pipe = r.pipeline()
-            # Remove expired entries
-            pipe.zremrangebyscore(key, 0, window_start)
-            # Count current entries
-            pipe.zcard(key)
-            # Add current request
-            pipe.zadd(key, {str(now): now})
-            # Set expiry on key
-            pipe.expire(key, int(window) + 1)
-            results = await pipe.execute()
-
-            current_count = results[1]  # zcard result
-
-            if current_count >= limit:
-                # Over limit — remove the entry we just added
-                await r.zrem(key, str(now))
-                # Find oldest entry to calculate retry_after
-                oldest = await r.zrange(key, 0, 0, withscores=True)
-                retry_after = 0.0
-                if oldest:
-                    retry_after = oldest[0][1] + window - now
-                    retry_after = max(0.0, retry_after)
-                return RateLimitResult(
-                    allowed=False,
-                    limit=limit,
-                    remaining=0,
-                    retry_after=retry_after,
-                )
-
-            remaining = max(0, limit - current_count - 1)
-            return RateLimitResult(allowed=True, limit=limit, remaining=remaining)
-        finally:
-            await r.aclose()
-    except Exception as exc:
-        # If Redis is unavailable, allow the request (fail-open)
-        logger.warning("Rate limiter Redis error (fail-open): %s", exc)
-        return RateLimitResult(allowed=True, limit=limit, remaining=limit)
+            _counts["redis_calls"] += 1
+            allowed, offset = await _check_redis(f"ratelimit:{identifier}", interval, tolerance)
+        except Exception as exc:
+            # If Redis is unavailable, allow the request (fail-open)
+            _counts["redis_errors"] += 1
+            logger.warning("Rate limiter Redis error (fail-open): %s", exc)
+            return RateLimitResult(allowed=True, limit=limit, remaining=limit)
+
+        if settings.rate_limit_local:
+            _local.sync(identifier, offset)
+        if not allowed:
+            _counts["rejected"] += 1
+        return _result(allowed, offset, interval, tolerance, limit)
+    finally:
+        _latencies.append((time.perf_counter() - started) * 1000)
+
+
+def redis_client() -> aioredis.Redis:
+    """The pooled Redis client for the running event loop, created on first use."""
+    global _client, _client_loop, _script
+
+    loop = asyncio.get_running_loop()
+    if _client is None or _client_loop is not loop:
+        _client = aioredis.from_url(settings.redis_url)
+        _client_loop = loop
+        _script = _client.register_script(_GCRA_LUA)
+    return _client
+
+
+async def _check_redis(key: str, interval: float, tolerance: float) -> tuple[bool, float]:
+    """Run the GCRA script; returns (allowed, TAT - now in ms)."""
+    redis_client()
+    allowed, offset = await _script(keys=[key], args=[interval, tolerance])
+    return bool(allowed), float(offset)
+
+
+def _result(
+    allowed: bool, offset: float, interval: float, tolerance: float, limit: int
+) -> RateLimitResult:
+    if allowed:
+        remaining = max(0, math.floor((tolerance - offset) / interval))
+        return RateLimitResult(allowed=True, limit=limit, remaining=remaining)
+    retry_after = max(0.0, (offset + interval - tolerance) / 1000)
+    return RateLimitResult(allowed=False, limit=limit, remaining=0, retry_after=retry_after)
+
+
+async def close_rate_limiter() -> None:
+    """Close the pooled Redis client."""
+    global _client, _client_loop, _script
+
+    if _client is not None:
+        await _client.aclose()
+    _client = None
+    _client_loop = None
+    _script = None
+
+
+def limiter_stats() -> dict:
+    """Limiter counters and check latency percentiles for the admin API."""
+    samples = sorted(_latencies)
+
+    def percentile(p: float) -> float:
+        if not samples:
+            return 0.0
+        return round(samples[min(len(samples) - 1, math.ceil(p * len(samples)) - 1)], 3)
+
+    return {
+        **_counts,
+        "local_enabled": settings.rate_limit_local,
+        "p50_ms": percentile(0.50),
+        "p99_ms": percentile(0.99),
+        "samples": len(samples),
+    }
@@ -10,6 +10,7 @@ from app.llm.registry import get_provider
 from app.retrieval.citations import CitationChain, build_citations_for_results
 from app.retrieval.reranker import rerank
 from app.retrieval.search import SearchFilters, SearchResult, hybrid_search
+from app.tracing import span
 
 logger = logging.getLogger(__name__)
 
@@ -107,34 +108,26 @@ class RetrievalAgent:
         depth = max(1, min(4, depth))
         config = DEPTH_CONFIG[depth]
 
-        # Step 1: Plan sub-queries
-        sub_queries = await self._plan_queries(query_text, depth)
+        with span("retrieval.query", {"retrieval.depth": depth, "retrieval.query_id": query_id}):
+            # Step 1: Plan sub-queries
+            sub_queries = await self._plan_queries(query_text, depth)
 
-        # Step 2: Retrieve for each sub-query
-        all_results: list[SearchResult] = []
-        for sq in sub_queries:
-            results = await hybrid_search(self.db, sq, filters)
-            all_results.extend(results)
-
-        # Deduplicate by chunk_id
-        seen: set[str] = set()
-        unique_results: list[SearchResult] = []
-        for r in all_results:
-            if r.chunk_id not in seen:
-                seen.add(r.chunk_id)
-                unique_results.append(r)
-
-        # Step 3: Re-rank
-        top_k = min(config["token_budget"] // 100, 20)
-        reranked = await rerank(query_text, unique_results, top_k=top_k)
+            # Step 2: Retrieve for each sub-query, deduplicated by chunk_id
+            unique_results = await self._retrieve(sub_queries, filters)
 
-        # Step 4: Build citation chains
-        citations = await build_citations_for_results(self.db, reranked)
+            # Step 3: Re-rank
+            top_k = min(config["token_budget"] // 100, 20)
+            reranked = await self._rerank(query_text, unique_results, top_k)
 
-        # Step 5: Synthesize response
-        response_text = await self._synthesize(
-            query_text, depth, config, reranked, citations
-        )
+            # Step 4: Build citation chains
+            with span("retrieval.citations"):
+                citations = await build_citations_for_results(self.db, reranked)
+
+            # Step 5: Synthesize response
+            with span("retrieval.synthesize"):
+                response_text = await self._synthesize(
+                    query_text, depth, config, reranked, citations
+                )
 
         return AgentResponse(
             query_id=query_id,
@@ -159,7 +152,7 @@ class RetrievalAgent:
 
         yield {"event": "status", "data": {"step": "planning", "query": query_text}}
 
-        # Plan
+        # Plan (spans here never stay open across a yield)
         sub_queries = await self._plan_queries(query_text, depth)
         yield {
             "event": "status",
@@ -167,17 +160,7 @@ class RetrievalAgent:
         }
 
         # Retrieve
-        all_results: list[SearchResult] = []
-        for sq in sub_queries:
-            results = await hybrid_search(self.db, sq, filters)
-            all_results.extend(results)
-
-        seen: set[str] = set()
-        unique_results: list[SearchResult] = []
-        for r in all_results:
-            if r.chunk_id not in seen:
-                seen.add(r.chunk_id)
-                unique_results.append(r)
+        unique_results = await self._retrieve(sub_queries, filters)
 
         yield {
             "event": "status",
@@ -189,10 +172,11 @@ class RetrievalAgent:
 
         # Re-rank
         top_k = min(config["token_budget"] // 100, 20)
-        reranked = await rerank(query_text, unique_results, top_k=top_k)
+        reranked = await self._rerank(query_text, unique_results, top_k)
 
         # Build citations
-        citations = await build_citations_for_results(self.db, reranked)
+        with span("retrieval.citations"):
+            citations = await build_citations_for_results(self.db, reranked)
 
         yield {
             "event": "status",
@@ -240,6 +224,32 @@ class RetrievalAgent:
             },
         }
 
+    async def _retrieve(
+        self, sub_queries: list[str], filters: SearchFilters | None
+    ) -> list[SearchResult]:
+        """Search each sub-query and merge the results, deduplicated by chunk_id."""
+        with span("retrieval.retrieve", {"retrieval.sub_queries": len(sub_queries)}) as s:
+            all_results: list[SearchResult] = []
+            for sq in sub_queries:
+                results = await hybrid_search(self.db, sq, filters)
+                all_results.extend(results)
+
+            seen: set[str] = set()
+            unique_results: list[SearchResult] = []
+            for r in all_results:
+                if r.chunk_id not in seen:
+                    seen.add(r.chunk_id)
+                    unique_results.append(r)
+            s.set_attribute("retrieval.chunks", len(unique_results))
+        return unique_results
+
+    async def _rerank(
+        self, query: str, results: list[SearchResult], top_k: int
+    ) -> list[SearchResult]:
+        attributes = {"retrieval.candidates": len(results), "retrieval.top_k": top_k}
+        with span("retrieval.rerank", attributes):
+            return await rerank(query, results, top_k=top_k)
+
     async def _plan_queries(self, query: str, depth: int) -> list[str]:
         """Decompose complex queries into sub-queries for depth >= 3."""
         if depth < 3:
@@ -249,9 +259,10 @@ class RetrievalAgent:
             import json
 
             prompt = _PLANNER_PROMPT.format(query=query)
-            response = await self.llm.complete(
-                [{"role": "user", "content": prompt}]
-            )
+            with span("retrieval.plan", {"retrieval.depth": depth}):
+                response = await self.llm.complete(
+                    [{"role": "user", "content": prompt}]
+                )
             cleaned = response.strip()
             if cleaned.startswith("```"):
                 cleaned = cleaned.split("\n", 1)[-1].rsplit("```", 1)[0]
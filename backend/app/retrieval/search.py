@@ -8,6 +8,8 @@ from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import settings
+from app.metrics import SEARCH_LEG_SECONDS
+from app.tracing import span
 
 logger = logging.getLogger(__name__)
 
@@ -50,7 +52,19 @@ async def hybrid_search(
         mode: "hybrid" | "semantic" | "lexical"
     """
     k = top_k or settings.search_top_k
+    with span("search.hybrid", {"search.mode": mode, "search.top_k": k}) as search_span:
+        results = await _hybrid_search(db, query, filters, k, mode)
+        search_span.set_attribute("search.results", len(results))
+    return results
+
 
+async def _hybrid_search(
+    db: AsyncSession,
+    query: str,
+    filters: SearchFilters | None,
+    k: int,
+    mode: str,
+) -> list[SearchResult]:
     dense_results: list[SearchResult] = []
     sparse_results: list[SearchResult] = []
 
@@ -66,7 +80,8 @@ async def hybrid_search(
         return sparse_results[:k]
 
     # Reciprocal Rank Fusion
-    fused = _rrf_merge(dense_results, sparse_results, k=settings.rrf_k)
+    with SEARCH_LEG_SECONDS.time(leg="fuse"), span("search.fuse"):
+        fused = _rrf_merge(dense_results, sparse_results, k=settings.rrf_k)
     return fused[:k]
 
 
@@ -95,8 +110,9 @@ async def _dense_search(
         LIMIT :limit
     """)
 
-    result = await db.execute(sql, params)
-    rows = result.all()
+    with SEARCH_LEG_SECONDS.time(leg="dense"), span("search.dense"):
+        result = await db.execute(sql, params)
+        rows = result.all()
 
     return [
         SearchResult(
@@ -134,8 +150,9 @@ async def _sparse_search(
         LIMIT :limit
     """)
 
-    result = await db.execute(sql, params)
-    rows = result.all()
+    with SEARCH_LEG_SECONDS.time(leg="sparse"), span("search.sparse"):
+        result = await db.execute(sql, params)
+        rows = result.all()
 
     return [
         SearchResult(
@@ -238,11 +255,12 @@ async def _embed_query(query: str) -> list[float] | None:
 
     try:
         client = AsyncOpenAI(api_key=settings.openai_api_key)
-        response = await client.embeddings.create(
-            model=settings.embedding_model,
-            input=query,
-            dimensions=settings.embedding_dimensions,
-        )
+        with SEARCH_LEG_SECONDS.time(leg="embed"), span("search.embed"):
+            response = await client.embeddings.create(
+                model=settings.embedding_model,
+                input=query,
+                dimensions=settings.embedding_dimensions,
+            )
         embedding = response.data[0].embedding
         await set_cached_embedding(query, embedding)
         return embedding
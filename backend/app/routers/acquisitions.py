@@ -8,6 +8,7 @@ from sse_starlette.sse import EventSourceResponse
 
 from app.acquisition.orchestrator import AcquisitionOrchestrator
 from app.database import async_session, get_db
+from app.metrics import register_sse_queues
 from app.schemas.acquisition import (
     AcquisitionListResponse,
     AcquisitionRunDetail,
@@ -24,6 +25,7 @@ router = APIRouter(prefix="/api/acquisitions", tags=["acquisitions"])
 
 # In-memory SSE event queues per acquisition run
 _event_queues: dict[str, asyncio.Queue] = {}
+register_sse_queues("acquisition", _event_queues)
 
 
 @router.post("", status_code=202, response_model=StartAcquisitionResponse)
@@ -1,4 +1,4 @@
-"""Admin endpoints — API key management, system info, scheduler control."""
+"""Admin endpoints — API key management, system info, scheduler control, HTTP pool."""
 
 import logging
 from datetime import UTC, datetime, timedelta
@@ -8,6 +8,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.auth import generate_api_key, hash_key, require_admin
+from app.auth_cache import api_key_cache
 from app.config import settings
 from app.database import get_db
 from app.models.auth import ApiKey, ApiKeyScope
@@ -98,6 +99,7 @@ async def revoke_api_key(
 
     key_record.is_active = False
     await db.commit()
+    await api_key_cache.invalidate()
 
     return RevokeApiKeyResponse(id=key_id, name=key_record.name, revoked=True)
 
@@ -139,6 +141,22 @@ async def scheduler_status(_admin: None = Depends(require_admin)):
     }
 
 
+@router.get("/api/admin/http-pool")
+async def http_pool_status(_admin: None = Depends(require_admin)):
+    """Shared outbound HTTP client pool metrics."""
+    from app.http_client import pool_stats
+
+    return pool_stats()
+
+
+@router.get("/api/admin/rate-limit")
+async def rate_limit_status(_admin: None = Depends(require_admin)):
+    """Rate limiter counters and check latency (p50/p99)."""
+    from app.rate_limit import limiter_stats
+
+    return limiter_stats()
+
+
 def _mask_url(url: str) -> str:
     """Mask password in database/redis URL."""
     if "@" in url and "://" in url:
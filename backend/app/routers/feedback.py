@@ -6,8 +6,8 @@ from datetime import UTC, datetime
 from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import async_session, get_db
-from app.feedback.monitor import run_change_monitor
+from app.database import get_db
+from app.feedback.monitor import run_change_monitor_workers
 from app.feedback.tracer import trace_and_act
 from app.schemas.feedback import (
     AccuracyDashboardData,
@@ -168,12 +168,17 @@ async def accuracy_dashboard(db: AsyncSession = Depends(get_db)):
 
 async def _bg_monitor():
     try:
-        async with async_session() as db:
-            result = await run_change_monitor(db)
-            logger.info(
-                "Monitor run complete: %d checked, %d changes",
-                result["sources_checked"],
-                result["changes_detected"],
-            )
+        result = await run_change_monitor_workers()
+        logger.info(
+            "Monitor run complete (%s, %s): %d checked, %d changes, %d not modified, "
+            "%d bytes downloaded, %.2f sources/s",
+            result["sweep_id"],
+            result["sweep_status"],
+            result["sources_checked"],
+            result["changes_detected"],
+            result["not_modified"],
+            result["bytes_downloaded"],
+            result["sources_per_sec"],
+        )
     except Exception:
         logger.exception("Background monitor run failed")
@@ -2,11 +2,12 @@
 
 import logging
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Response
 from sqlalchemy import text
 
 from app.config import settings
 from app.database import async_session
+from app.metrics import CONTENT_TYPE, render
 
 logger = logging.getLogger(__name__)
 router = APIRouter(tags=["health"])
@@ -18,6 +19,12 @@ async def health_check():
     return {"status": "ok", "service": "raris-backend"}
 
 
+@router.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Prometheus scrape endpoint for this process's metrics."""
+    return Response(render(), media_type=CONTENT_TYPE)
+
+
 @router.get("/health/ready")
 async def readiness_check():
     """Readiness probe — checks DB and Redis connectivity."""
@@ -12,9 +12,12 @@ from sse_starlette.sse import EventSourceResponse
 from app.database import async_session, get_db
 from app.ingestion.indexer import get_index_stats
 from app.ingestion.orchestrator import IngestionOrchestrator
+from app.metrics import register_sse_queues
+from app.models.ingestion import IngestionRun, IngestionRunStatus
 from app.schemas.ingestion import (
     DocumentDetail,
     DocumentSummary,
+    DuplicateCluster,
     IndexStats,
     IngestionRunDetail,
     StartIngestionRequest,
@@ -27,6 +30,7 @@ router = APIRouter(tags=["ingestion"])
 
 # In-memory SSE event queues per ingestion run
 _event_queues: dict[str, asyncio.Queue] = {}
+register_sse_queues("ingestion", _event_queues)
 
 
 # --- Ingestion Run endpoints ---
@@ -74,11 +78,53 @@ async def _run_ingestion(ingestion_id: str):
                 "event": "error",
                 "data": {"message": "Ingestion run failed. Check server logs."},
             })
+        # Committed documents are kept; the run can be resumed from them
+        async with async_session() as db:
+            run = await db.get(IngestionRun, ingestion_id)
+            if run:
+                run.status = IngestionRunStatus.failed
+                await db.commit()
     finally:
         if queue:
             await queue.put(None)
 
 
+@router.post(
+    "/api/ingestion/{ingestion_id}/resume", status_code=202, response_model=StartIngestionResponse
+)
+async def resume_ingestion(
+    ingestion_id: str,
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_db),
+):
+    """Resume an interrupted or partly failed ingestion run.
+
+    Sources the run already ingested are skipped; failed and unprocessed
+    sources are ingested. Progress streams from the same ``stream_url``.
+    """
+    run = await db.get(IngestionRun, ingestion_id)
+    if not run:
+        raise HTTPException(status_code=404, detail="Ingestion run not found")
+    if run.status == IngestionRunStatus.running and ingestion_id in _event_queues:
+        raise HTTPException(status_code=409, detail="This ingestion run is already active.")
+    if run.status == IngestionRunStatus.complete and not run.failed:
+        raise HTTPException(
+            status_code=409, detail="Ingestion run completed with no failed documents."
+        )
+
+    _event_queues[run.id] = asyncio.Queue()
+    background_tasks.add_task(_run_ingestion, run.id)
+
+    return StartIngestionResponse(
+        ingestion_id=run.id,
+        acquisition_id=run.acquisition_id,
+        manifest_id=run.manifest_id,
+        status="running",
+        total_documents=run.total_documents,
+        stream_url=f"/api/ingestion/{run.id}/stream",
+    )
+
+
 @router.get("/api/ingestion/{ingestion_id}/stream")
 async def stream_ingestion_progress(ingestion_id: str):
     queue = _event_queues.get(ingestion_id)
@@ -122,6 +168,13 @@ async def list_ingestion_documents(
 # --- Document endpoints ---
 
 
+@router.get("/api/documents/duplicates", response_model=list[DuplicateCluster])
+async def list_duplicate_clusters(
+    manifest_id: str | None = None, db: AsyncSession = Depends(get_db)
+):
+    return await ingestion_service.list_duplicate_clusters(db, manifest_id)
+
+
 @router.get("/api/documents/{doc_id}", response_model=DocumentDetail)
 async def get_document(
     doc_id: str, db: AsyncSession = Depends(get_db)
@@ -19,6 +19,7 @@ from sse_starlette.sse import EventSourceResponse
 from app.config import settings
 from app.database import async_session, get_db
 from app.llm.registry import get_provider, resolve_provider_name
+from app.metrics import register_sse_queues
 from app.models.manifest import LogicalRunStatus, Manifest, ManifestStatus
 from app.schemas.manifest import (
     GenerateManifestRequest,
@@ -55,6 +56,7 @@ ALLOWED_SECTOR_EXTENSIONS = {".json"}
 
 # In-memory store for SSE event queues per manifest
 _event_queues: dict[str, asyncio.Queue] = {}
+register_sse_queues("discovery", _event_queues)
 
 
 async def _reconcile_orphaned_generating_manifests(
@@ -112,6 +114,8 @@ async def generate_manifest(
             "llm_model": payload.llm_model,
             "k_depth": payload.k_depth,
             "geo_scope": payload.geo_scope,
+            "reuse_from": payload.reuse_from,
+            "reuse_ttl_hours": payload.reuse_ttl_hours,
         },
     )
     db.add(manifest)
@@ -137,6 +141,8 @@ async def generate_manifest(
         payload.seed_metrics,
         payload.constitution_text,
         payload.instruction_texts,
+        reuse_from=payload.reuse_from,
+        reuse_ttl_hours=payload.reuse_ttl_hours,
     )
 
     return GenerateManifestResponse(
@@ -192,6 +198,8 @@ class _GeneratePayload:
         seed_metrics: dict,
         constitution_text: str = "",
         instruction_texts: list[str] | None = None,
+        reuse_from: str | None = None,
+        reuse_ttl_hours: int | None = None,
     ) -> None:
         self.manifest_name = manifest_name
         self.llm_provider = llm_provider
@@ -205,6 +213,8 @@ class _GeneratePayload:
         self.seed_metrics = seed_metrics
         self.constitution_text = constitution_text
         self.instruction_texts: list[str] = instruction_texts or []
+        self.reuse_from = reuse_from
+        self.reuse_ttl_hours = reuse_ttl_hours
 
 
 def _raise_missing_domain_validation() -> None:
@@ -523,6 +533,8 @@ async def _parse_generate_request(request: Request) -> _GeneratePayload:
             seed_programs=[],
             seed_metrics={},
             instruction_texts=[parsed.instruction_text or ""],
+            reuse_from=parsed.reuse_from,
+            reuse_ttl_hours=parsed.reuse_ttl_hours,
         )
 
     if "multipart/form-data" in content_type or "application/x-www-form-urlencoded" in content_type:
@@ -561,6 +573,8 @@ async def _parse_generate_request(request: Request) -> _GeneratePayload:
             "k_depth": k_depth,
             "geo_scope": str(form.get("geo_scope", "state")).strip() or "state",
             "target_segments": target_segments,
+            "reuse_from": str(form.get("reuse_from", "")).strip() or None,
+            "reuse_ttl_hours": str(form.get("reuse_ttl_hours", "")).strip() or None,
         }
         try:
             parsed = GenerateManifestRequest.model_validate(form_payload)
@@ -628,6 +642,8 @@ async def _parse_generate_request(request: Request) -> _GeneratePayload:
             },
             constitution_text=constitution_text,
             instruction_texts=instruction_texts,
+            reuse_from=parsed.reuse_from,
+            reuse_ttl_hours=parsed.reuse_ttl_hours,
         )
 
     raise HTTPException(status_code=415, detail="Unsupported content type")
@@ -647,15 +663,25 @@ async def _run_agent(
     seed_metrics: dict | None = None,
     constitution_text: str = "",
     instruction_texts: list[str] | None = None,
+    reuse_from: str | None = None,
+    reuse_ttl_hours: int | None = None,
 ):
     """Run the V5 BFS discovery engine in background and push events to the queue."""
     queue = _event_queues.get(manifest_id)
     try:
         from app.agent.graph_discovery import DiscoveryGraph
+        from app.agent.prior_knowledge import load_prior_knowledge
 
         provider = get_provider(llm_provider, model=llm_model)
         seed_index = _index_seeds_by_type(seed_programs or [])
         async with async_session() as db:
+            prior = await load_prior_knowledge(
+                db,
+                domain=manifest_name,
+                reuse_from=reuse_from,
+                ttl_hours=reuse_ttl_hours,
+                exclude_manifest_id=manifest_id,
+            )
             agent = DiscoveryGraph(llm=provider, db=db, manifest_id=manifest_id)
             async for event in agent.run(
                 manifest_name,
@@ -667,6 +693,7 @@ async def _run_agent(
                 seed_anchors=seed_anchors or [],
                 constitution_text=constitution_text,
                 instruction_texts=instruction_texts or [],
+                prior=prior,
             ):
                 if queue:
                     await queue.put(event)
@@ -102,8 +102,24 @@ class AccuracyTrendPoint(BaseModel):
     resolution_rate: float
 
 
+class MonitorSweepSummary(BaseModel):
+    id: str
+    status: str
+    started_at: str
+    completed_at: str | None = None
+    shard_count: int
+    shards_complete: int
+    sources_checked: int
+    changes_detected: int
+    not_modified: int
+    bytes_downloaded: int
+    duration_s: float
+    sources_per_sec: float
+
+
 class AccuracyDashboardData(BaseModel):
     current: AccuracyMetrics
     trends: list[AccuracyTrendPoint]
     by_feedback_type: dict[str, int]
     by_vertical: dict[str, float]
+    monitor: MonitorSweepSummary | None = None
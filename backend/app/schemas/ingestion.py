@@ -74,6 +74,21 @@ class DocumentDetail(BaseModel):
     chunk_count: int
     created_at: datetime
     curated_at: datetime | None = None
+    duplicate_of: str | None = None
+    duplicate_similarity: float | None = None
+
+
+class DuplicateMember(BaseModel):
+    document_id: str
+    source_id: str
+    title: str
+    status: str
+    similarity: float | None = None  # To the document it was matched against
+
+
+class DuplicateCluster(BaseModel):
+    canonical: DuplicateMember
+    duplicates: list[DuplicateMember]
 
 
 class SectionSummary(BaseModel):
@@ -14,6 +14,8 @@ class GenerateManifestRequest(BaseModel):
     k_depth: int = Field(default=2, ge=1, le=4)
     geo_scope: Literal["national", "state", "municipal"] = "state"
     target_segments: list[str] = []
+    reuse_from: str | None = None  # "golden" | "latest" | manifest ID
+    reuse_ttl_hours: int | None = Field(default=None, ge=0)
 
 
 class GenerateManifestResponse(BaseModel):
@@ -1,9 +1,13 @@
 """Feedback service — CRUD for feedback, curation queue, changes, accuracy metrics."""
 
 import logging
+from dataclasses import dataclass
 from datetime import UTC, datetime
 
 from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.feedback import (
@@ -11,8 +15,13 @@ from app.models.feedback import (
     ChangeEvent,
     CurationQueueItem,
     CurationQueueStatus,
+    FeedbackRollup,
     FeedbackStatus,
     FeedbackType,
+    MonitorShardStatus,
+    MonitorSweep,
+    MonitorSweepShard,
+    MonitorSweepStatus,
     ResponseFeedback,
 )
 from app.models.manifest import Source
@@ -24,6 +33,7 @@ from app.schemas.feedback import (
     ChangeEventSchema,
     CurationQueueItemSchema,
     FeedbackDetail,
+    MonitorSweepSummary,
 )
 
 logger = logging.getLogger(__name__)
@@ -52,6 +62,7 @@ async def create_feedback(
     )
     db.add(fb)
     await db.flush()
+    await _bump_rollup(db, fb.feedback_type, fb.status, 1)
     return fb
 
 
@@ -95,7 +106,11 @@ async def resolve_feedback(
     if not fb:
         return None
 
+    previous = fb.status
     fb.status = FeedbackStatus(status)
+    if fb.status != previous:
+        await _bump_rollup(db, fb.feedback_type, previous, -1)
+        await _bump_rollup(db, fb.feedback_type, fb.status, 1)
     fb.resolution = resolution
     fb.resolved_at = datetime.now(UTC)
     await db.commit()
@@ -121,6 +136,89 @@ def _fb_to_detail(fb: ResponseFeedback) -> FeedbackDetail:
     )
 
 
+# --- Feedback Rollups ---
+
+
+@dataclass
+class _FeedbackTotals:
+    type_counts: dict[str, int]
+    total: int
+    accuracy_score: float  # correct / (correct + inaccurate), 1.0 without either
+    resolution_rate: float  # (resolved + dismissed) / total, 1.0 without feedback
+
+    @classmethod
+    def from_counts(cls, counts: dict[tuple[str, str], int]) -> "_FeedbackTotals":
+        """Totals from feedback counts keyed by (feedback_type, status)."""
+        type_counts = {ftype.value: 0 for ftype in FeedbackType}
+        closed = 0
+        for (ftype, status), count in counts.items():
+            if ftype not in type_counts:
+                continue
+            type_counts[ftype] += count
+            if status in (FeedbackStatus.resolved, FeedbackStatus.dismissed):
+                closed += count
+
+        total = sum(type_counts.values())
+        correct, inaccurate = type_counts["correct"], type_counts["inaccurate"]
+        return cls(
+            type_counts=type_counts,
+            total=total,
+            accuracy_score=correct / (correct + inaccurate) if correct + inaccurate else 1.0,
+            resolution_rate=closed / total if total else 1.0,
+        )
+
+
+async def _bump_rollup(db: AsyncSession, feedback_type: str, status: str, delta: int) -> None:
+    """Add ``delta`` to one rollup counter in the caller's transaction.
+
+    A single upsert, so concurrent first feedbacks of a kind cannot both
+    insert the row. Counters never go below zero, even for feedback the
+    rollups never counted; ``rebuild_feedback_rollups`` recounts exactly.
+    """
+    if db.get_bind().dialect.name == "sqlite":
+        insert, greatest = sqlite_insert, func.max
+    else:
+        insert, greatest = pg_insert, func.greatest
+    await db.execute(
+        insert(FeedbackRollup)
+        .values(feedback_type=feedback_type, status=status, count=max(delta, 0))
+        .on_conflict_do_update(
+            index_elements=[FeedbackRollup.feedback_type, FeedbackRollup.status],
+            set_={"count": greatest(FeedbackRollup.count + delta, 0)},
+        )
+    )
+
+
+async def rebuild_feedback_rollups(db: AsyncSession) -> dict[tuple[str, str], int]:
+    """Recount feedback per (type, status) in one GROUP BY pass and rewrite the rollups.
+
+    The rollup rows are locked first, so feedback created or resolved
+    meanwhile is applied on top of the recount rather than lost. Returns the
+    counts; the caller commits.
+    """
+    rollups = {
+        (r.feedback_type, r.status): r
+        for r in (
+            await db.execute(
+                select(FeedbackRollup).with_for_update().execution_options(populate_existing=True)
+            )
+        ).scalars()
+    }
+    grouped = await db.execute(
+        select(ResponseFeedback.feedback_type, ResponseFeedback.status, func.count())
+        .group_by(ResponseFeedback.feedback_type, ResponseFeedback.status)
+    )
+    counts = {(ftype, status): n for ftype, status, n in grouped.all()}
+
+    for key, rollup in rollups.items():
+        rollup.count = counts.get(key, 0)
+    for (ftype, status), n in counts.items():
+        if (ftype, status) not in rollups:
+            db.add(FeedbackRollup(feedback_type=ftype, status=status, count=n))
+    await db.flush()
+    return counts
+
+
 # --- Curation Queue ---
 
 
@@ -244,73 +342,46 @@ async def get_change(db: AsyncSession, event_id: str) -> ChangeEventSchema | Non
 
 
 async def get_accuracy_dashboard(db: AsyncSession) -> AccuracyDashboardData:
-    """Compute accuracy metrics from feedback, sources, and queue state."""
-    # Feedback counts by type
-    type_counts: dict[str, int] = {}
-    for ftype in FeedbackType:
-        count = (
-            await db.execute(
-                select(func.count()).select_from(ResponseFeedback).where(
-                    ResponseFeedback.feedback_type == ftype
-                )
-            )
-        ).scalar() or 0
-        type_counts[ftype.value] = count
-
-    total = sum(type_counts.values())
-    correct = type_counts.get("correct", 0)
-    inaccurate = type_counts.get("inaccurate", 0)
-    outdated = type_counts.get("outdated", 0)
-    incomplete = type_counts.get("incomplete", 0)
-    irrelevant = type_counts.get("irrelevant", 0)
-
-    # Accuracy score: correct / (correct + inaccurate) if any exist
-    accuracy_denominator = correct + inaccurate
-    accuracy_score = correct / accuracy_denominator if accuracy_denominator > 0 else 1.0
-
-    # Resolution rate
-    resolved = (
-        await db.execute(
-            select(func.count()).select_from(ResponseFeedback).where(
-                ResponseFeedback.status.in_(["resolved", "dismissed"])
-            )
-        )
-    ).scalar() or 0
-    resolution_rate = resolved / total if total > 0 else 1.0
-
-    # Average source confidence
-    avg_conf = (
-        await db.execute(select(func.avg(Source.confidence)))
-    ).scalar() or 0.0
-
-    # Pending queue items
-    pending_queue = (
-        await db.execute(
+    """Accuracy metrics from the feedback rollups, sources, and queue state.
+
+    Rollups are rebuilt on the first read after they were found empty, as
+    in a database created by ``create_all`` rather than the migrations.
+    """
+    counts = await _rollup_counts(db)
+    if not counts:
+        try:
+            counts = await rebuild_feedback_rollups(db)
+            await db.commit()
+        except IntegrityError:
+            # Another request rebuilt them first
+            await db.rollback()
+            counts = await _rollup_counts(db)
+    feedback = _FeedbackTotals.from_counts(counts)
+
+    # Source confidence, pending queue items and unresolved changes in one round trip
+    avg_conf, pending_queue, unresolved_changes = (
+        await db.execute(select(
+            select(func.avg(Source.confidence)).scalar_subquery(),
             select(func.count()).select_from(CurationQueueItem).where(
                 CurationQueueItem.status == CurationQueueStatus.pending
-            )
-        )
-    ).scalar() or 0
-
-    # Unresolved changes
-    unresolved_changes = (
-        await db.execute(
+            ).scalar_subquery(),
             select(func.count()).select_from(ChangeEvent).where(
                 ChangeEvent.status.in_(["detected", "processing"])
-            )
-        )
-    ).scalar() or 0
+            ).scalar_subquery(),
+        ))
+    ).one()
+    type_counts = feedback.type_counts
 
     current = AccuracyMetrics(
-        total_feedback=total,
-        correct_count=correct,
-        inaccurate_count=inaccurate,
-        outdated_count=outdated,
-        incomplete_count=incomplete,
-        irrelevant_count=irrelevant,
-        accuracy_score=round(accuracy_score, 3),
-        resolution_rate=round(resolution_rate, 3),
-        avg_source_confidence=round(float(avg_conf), 3),
+        total_feedback=feedback.total,
+        correct_count=type_counts["correct"],
+        inaccurate_count=type_counts["inaccurate"],
+        outdated_count=type_counts["outdated"],
+        incomplete_count=type_counts["incomplete"],
+        irrelevant_count=type_counts["irrelevant"],
+        accuracy_score=round(feedback.accuracy_score, 3),
+        resolution_rate=round(feedback.resolution_rate, 3),
+        avg_source_confidence=round(float(avg_conf or 0.0), 3),
         stale_sources=0,
         pending_queue_items=pending_queue,
         unresolved_changes=unresolved_changes,
@@ -346,4 +417,79 @@ async def get_accuracy_dashboard(db: AsyncSession) -> AccuracyDashboardData:
         trends=trends,
         by_feedback_type=type_counts,
         by_vertical=by_vertical,
+        monitor=await _latest_monitor_sweep(db),
+    )
+
+
+async def _rollup_counts(db: AsyncSession) -> dict[tuple[str, str], int]:
+    rows = await db.execute(
+        select(FeedbackRollup.feedback_type, FeedbackRollup.status, FeedbackRollup.count)
+    )
+    return {(t, s): n for t, s, n in rows.all()}
+
+
+async def take_accuracy_snapshot(db: AsyncSession) -> AccuracySnapshot:
+    """Recount the feedback rollups and record an accuracy snapshot for trends."""
+    feedback = _FeedbackTotals.from_counts(await rebuild_feedback_rollups(db))
+    avg_conf = (await db.execute(select(func.avg(Source.confidence)))).scalar() or 0.0
+
+    snapshot = AccuracySnapshot(
+        snapshot_date=datetime.now(UTC),
+        total_feedback=feedback.total,
+        correct_count=feedback.type_counts["correct"],
+        inaccurate_count=feedback.type_counts["inaccurate"],
+        outdated_count=feedback.type_counts["outdated"],
+        incomplete_count=feedback.type_counts["incomplete"],
+        irrelevant_count=feedback.type_counts["irrelevant"],
+        accuracy_score=round(feedback.accuracy_score, 3),
+        resolution_rate=round(feedback.resolution_rate, 3),
+        avg_confidence=round(float(avg_conf), 3),
+    )
+    db.add(snapshot)
+    await db.commit()
+    return snapshot
+
+
+async def _latest_monitor_sweep(db: AsyncSession) -> MonitorSweepSummary | None:
+    """Most recent change-monitor sweep; a running sweep reports progress so far."""
+    sweep = (
+        await db.execute(
+            select(MonitorSweep).order_by(MonitorSweep.started_at.desc()).limit(1)
+        )
+    ).scalar_one_or_none()
+    if sweep is None:
+        return None
+
+    shards = (
+        await db.execute(select(MonitorSweepShard).where(MonitorSweepShard.sweep_id == sweep.id))
+    ).scalars().all()
+    started_at = sweep.started_at
+    if started_at.tzinfo is None:
+        started_at = started_at.replace(tzinfo=UTC)
+
+    if sweep.status == MonitorSweepStatus.complete:
+        checked, changes = sweep.sources_checked, sweep.changes_detected
+        not_modified, downloaded = sweep.not_modified, sweep.bytes_downloaded
+        duration_s, rate = sweep.duration_s, sweep.sources_per_sec
+    else:
+        checked = sum(s.sources_checked for s in shards)
+        changes = sum(s.changes_detected for s in shards)
+        not_modified = sum(s.not_modified for s in shards)
+        downloaded = sum(s.bytes_downloaded for s in shards)
+        duration_s = round((datetime.now(UTC) - started_at).total_seconds(), 1)
+        rate = round(checked / duration_s, 2) if duration_s > 0 else 0.0
+
+    return MonitorSweepSummary(
+        id=sweep.id,
+        status=sweep.status,
+        started_at=started_at.isoformat(),
+        completed_at=sweep.completed_at.isoformat() if sweep.completed_at else None,
+        shard_count=sweep.shard_count,
+        shards_complete=sum(1 for s in shards if s.status == MonitorShardStatus.complete),
+        sources_checked=checked,
+        changes_detected=changes,
+        not_modified=not_modified,
+        bytes_downloaded=downloaded,
+        duration_s=duration_s,
+        sources_per_sec=rate,
     )
@@ -17,6 +17,8 @@ from app.models.ingestion import (
 from app.schemas.ingestion import (
     DocumentDetail,
     DocumentSummary,
+    DuplicateCluster,
+    DuplicateMember,
     IngestionRunDetail,
     IngestionRunSummary,
 )
@@ -169,9 +171,59 @@ async def get_document(
         chunk_count=len(doc.chunks),
         created_at=doc.created_at,
         curated_at=doc.curated_at,
+        duplicate_of=doc.duplicate_of,
+        duplicate_similarity=doc.duplicate_similarity,
     )
 
 
+async def list_duplicate_clusters(
+    db: AsyncSession, manifest_id: str | None = None
+) -> list[DuplicateCluster]:
+    """Group duplicate documents under the earliest document they chain back to."""
+    query = select(InternalDocument).where(InternalDocument.duplicate_of.is_not(None))
+    if manifest_id:
+        query = query.where(InternalDocument.manifest_id == manifest_id)
+    duplicates = (await db.execute(query)).scalars().all()
+    if not duplicates:
+        return []
+
+    parent = {d.id: d.duplicate_of for d in duplicates}
+    docs = {d.id: d for d in duplicates}
+    missing = set(parent.values()) - docs.keys()
+    if missing:
+        result = await db.execute(select(InternalDocument).where(InternalDocument.id.in_(missing)))
+        docs.update({d.id: d for d in result.scalars().all()})
+
+    def root(doc_id: str) -> str:
+        seen = {doc_id}
+        while parent.get(doc_id) in docs and parent[doc_id] not in seen:
+            doc_id = parent[doc_id]
+            seen.add(doc_id)
+        return doc_id
+
+    def member(d: InternalDocument) -> DuplicateMember:
+        return DuplicateMember(
+            document_id=d.id,
+            source_id=d.source_id,
+            title=d.title,
+            status=d.status,
+            similarity=d.duplicate_similarity,
+        )
+
+    clusters: dict[str, list[InternalDocument]] = {}
+    for d in duplicates:
+        canonical = root(d.id)
+        if canonical != d.id:
+            clusters.setdefault(canonical, []).append(d)
+    return [
+        DuplicateCluster(
+            canonical=member(docs[canonical]),
+            duplicates=[member(d) for d in sorted(members, key=lambda d: d.id)],
+        )
+        for canonical, members in sorted(clusters.items(), key=lambda c: -len(c[1]))
+    ]
+
+
 async def approve_document(db: AsyncSession, doc_id: str) -> InternalDocument | None:
     """Approve a document for indexing."""
     result = await db.execute(
@@ -0,0 +1,200 @@
+"""OpenTelemetry tracing for requests, retrieval, search, LLM calls and discovery.
+
+Spans are created through the OpenTelemetry API and nest through the async
+context, so a query's planning, embedding, dense and sparse SQL, rerank,
+citations and synthesis appear under its request span. Every span carries
+the request's correlation ID as ``raris.correlation_id``, so the trace behind
+a slow response is found from its ``X-Correlation-ID`` header.
+
+Export is chosen by ``settings.tracing_exporter`` at startup:
+  none  — spans are not recorded (the default)
+  otlp  — batched OTLP/HTTP export to ``settings.tracing_otlp_endpoint``,
+          e.g. a local OpenTelemetry Collector or Jaeger
+  file  — one JSON object per finished span appended to
+          ``settings.tracing_file_path``
+
+Tracing needs the optional ``tracing`` extra (opentelemetry-api and -sdk,
+plus opentelemetry-exporter-otlp-proto-http for otlp). Without it a warning
+is logged and spans are no-ops.
+
+Usage:
+    configure_tracing()  # on startup
+    with correlation(correlation_id), span("GET /api/query"):
+        ...
+    with span("retrieval.rerank", {"retrieval.candidates": len(results)}) as s:
+        ...
+        s.set_attribute("retrieval.kept", len(reranked))
+    shutdown_tracing()  # on shutdown, flushes pending spans
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+EXPORTERS = ("none", "otlp", "file")
+_SERVICE_NAME = "raris-backend"
+
+try:
+    from opentelemetry import trace as _otel_trace
+except ImportError:
+    _otel_trace = None
+
+_correlation_id: ContextVar[str] = ContextVar("correlation_id", default="")
+_tracer: Any = None
+_provider: Any = None
+
+
+class _NoopSpan:
+    """Stands in for a span while tracing is off."""
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def set_attributes(self, attributes: dict[str, Any]) -> None:
+        pass
+
+    def update_name(self, name: str) -> None:
+        pass
+
+    def record_exception(self, exception: BaseException) -> None:
+        pass
+
+    def set_status(self, status: Any, description: str | None = None) -> None:
+        pass
+
+    def end(self) -> None:
+        pass
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+@contextmanager
+def correlation(correlation_id: str) -> Iterator[None]:
+    """Tag spans started within the block (and tasks it spawns) with a correlation ID."""
+    token = _correlation_id.set(correlation_id)
+    try:
+        yield
+    finally:
+        _correlation_id.reset(token)
+
+
+def _attributes(attributes: dict[str, Any] | None) -> dict[str, Any]:
+    merged = {k: v for k, v in (attributes or {}).items() if v is not None}
+    correlation_id = _correlation_id.get()
+    if correlation_id:
+        merged["raris.correlation_id"] = correlation_id
+    return merged
+
+
+@contextmanager
+def span(
+    name: str, attributes: dict[str, Any] | None = None, *, end_on_exit: bool = True
+) -> Iterator[Any]:
+    """Run the block in a child span of the current one.
+
+    An exception leaving the block is recorded on the span and marks it as
+    an error. With ``end_on_exit=False`` the caller ends the span itself,
+    possibly before the block exits, and records its own errors. Do not
+    hold a ``span`` open across a ``yield`` in an async generator; its
+    consumer may close it from another context.
+    """
+    if _tracer is None:
+        yield _NOOP_SPAN
+        return
+    with _tracer.start_as_current_span(
+        name,
+        attributes=_attributes(attributes),
+        end_on_exit=end_on_exit,
+        record_exception=end_on_exit,
+        set_status_on_exception=end_on_exit,
+    ) as current:
+        yield current
+
+
+def start_span(name: str, attributes: dict[str, Any] | None = None) -> Any:
+    """Start a child span of the current one without making it current.
+
+    For work whose start and end are in different callbacks (LLM call
+    logging, streamed responses); the caller must ``end()`` it.
+    """
+    if _tracer is None:
+        return _NOOP_SPAN
+    return _tracer.start_span(name, attributes=_attributes(attributes))
+
+
+def mark_error(current: Any, message: str) -> None:
+    """Set error status on a span started with ``start_span``."""
+    if _otel_trace is not None and current is not _NOOP_SPAN:
+        current.set_status(_otel_trace.Status(_otel_trace.StatusCode.ERROR, message))
+
+
+def configure_tracing(exporter: str | None = None) -> bool:
+    """Set up span export; returns True if spans are now recorded."""
+    global _tracer, _provider
+
+    exporter = exporter or settings.tracing_exporter
+    if exporter not in EXPORTERS:
+        raise ValueError(f"Unknown tracing exporter: {exporter}. Available: {', '.join(EXPORTERS)}")
+    shutdown_tracing()
+    if exporter == "none":
+        return False
+
+    try:
+        from opentelemetry.sdk.resources import Resource
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import BatchSpanProcessor
+    except ImportError:
+        logger.warning("opentelemetry-sdk is not installed; tracing is disabled")
+        return False
+
+    if exporter == "otlp":
+        try:
+            from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+        except ImportError:
+            logger.warning(
+                "opentelemetry-exporter-otlp-proto-http is not installed; tracing is disabled"
+            )
+            return False
+        span_exporter = OTLPSpanExporter(endpoint=settings.tracing_otlp_endpoint)
+    else:
+        span_exporter = _json_lines_exporter(settings.tracing_file_path)
+
+    _provider = TracerProvider(resource=Resource.create({"service.name": _SERVICE_NAME}))
+    _provider.add_span_processor(BatchSpanProcessor(span_exporter))
+    _tracer = _provider.get_tracer("raris")
+    logger.info("Tracing enabled (exporter=%s)", exporter)
+    return True
+
+
+def shutdown_tracing() -> None:
+    """Flush pending spans and stop recording."""
+    global _tracer, _provider
+
+    if _provider is not None:
+        _provider.shutdown()
+    _tracer = None
+    _provider = None
+
+
+def _json_lines_exporter(path: str):
+    from opentelemetry.sdk.trace.export import SpanExporter, SpanExportResult
+
+    class JsonLinesSpanExporter(SpanExporter):
+        """Appends each finished span to ``path`` as one line of JSON."""
+
+        def export(self, spans) -> SpanExportResult:
+            with open(path, "a", encoding="utf-8") as f:
+                for finished in spans:
+                    f.write(finished.to_json(indent=None) + "\n")
+            return SpanExportResult.SUCCESS
+
+    return JsonLinesSpanExporter()
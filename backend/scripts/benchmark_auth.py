@@ -0,0 +1,93 @@
+"""
+benchmark_auth.py
+
+Per-request overhead of API key authentication, calling the auth dependency
+the way FastAPI does (one session per request), comparing:
+
+  uncached  — auth_cache_ttl_seconds=0 and auth_last_used_flush_seconds=0:
+              a key lookup plus a last_used_at UPDATE and commit per request
+  cached    — the defaults: validated keys served from the in-process cache,
+              last_used_at written in batches
+
+Runs against --database-url (default: a temporary SQLite file).
+
+Usage:
+  docker compose exec backend uv run python scripts/benchmark_auth.py \
+      [--requests 2000] [--database-url postgresql+asyncpg://...]
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+# Adjust path so app imports work when run from /app inside the container
+sys.path.insert(0, "/app")
+
+from app import auth  # noqa: E402
+from app.auth_cache import ApiKeyCache  # noqa: E402
+from app.config import settings  # noqa: E402
+from app.models.auth import ApiKey, ApiKeyScope  # noqa: E402
+
+
+async def run(database_url: str, requests: int) -> None:
+    engine = create_async_engine(database_url)
+    async with engine.begin() as conn:
+        await conn.run_sync(ApiKey.__table__.create, checkfirst=True)
+    session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    raw_key, prefix = auth.generate_api_key()
+    async with session() as db:
+        db.add(ApiKey(
+            id=f"bench-{prefix}", name="bench", key_hash=auth.hash_key(raw_key),
+            key_prefix=prefix, scope=ApiKeyScope.read,
+        ))
+        await db.commit()
+
+    settings.auth_enabled = True
+    defaults = (settings.auth_cache_ttl_seconds, settings.auth_last_used_flush_seconds)
+    print(f"Database: {engine.dialect.name}; {requests} authenticated requests per mode")
+    print(f"{'mode':<10}{'mean µs':>10}{'p95 µs':>10}")
+    for mode, ttl, flush in (("uncached", 0.0, 0.0), ("cached", *defaults)):
+        settings.auth_cache_ttl_seconds = ttl
+        settings.auth_last_used_flush_seconds = flush
+        auth.api_key_cache = ApiKeyCache()
+        timings = []
+        for _ in range(requests):
+            started = time.perf_counter()
+            async with session() as db:
+                await auth._get_api_key(raw_key, db)
+            timings.append((time.perf_counter() - started) * 1e6)
+        p95 = statistics.quantiles(timings, n=20)[-1]
+        print(f"{mode:<10}{statistics.fmean(timings):>10.0f}{p95:>10.0f}")
+
+    async with session() as db:
+        await db.delete(await db.get(ApiKey, f"bench-{prefix}"))
+        await db.commit()
+    await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        "--requests", type=int, default=2000, help="Authenticated requests per mode"
+    )
+    parser.add_argument(
+        "--database-url", help="Async SQLAlchemy URL (default: temporary SQLite file)"
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        url = args.database_url or f"sqlite+aiosqlite:///{Path(tmp) / 'bench.db'}"
+        asyncio.run(run(url, args.requests))
+
+
+if __name__ == "__main__":
+    main()
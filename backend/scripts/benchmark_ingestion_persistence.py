@@ -0,0 +1,193 @@
+"""
+benchmark_ingestion_persistence.py
+
+Documents per minute for the persistence step of ingestion — writing a
+document's sections, tables and indexed chunks — comparing:
+
+  orm   — one ORM object per row through the session's unit of work, chunks
+          reloaded and updated per row, one lexical-index UPDATE per chunk
+          (the path ingestion used before bulk persistence)
+  bulk  — app.ingestion.bulk: executemany INSERT/UPDATE, one metadata and one
+          lexical-index statement per document
+
+Extraction, curation and embedding are left out; chunks get fixed vectors.
+Runs against --database-url (default: a temporary SQLite file). On
+PostgreSQL the lexical index uses to_tsvector as in production.
+
+Usage:
+  docker compose exec backend uv run python scripts/benchmark_ingestion_persistence.py \
+      [--docs 20] [--sections 1000] [--database-url postgresql+asyncpg://...]
+"""
+
+import argparse
+import asyncio
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from sqlalchemy import delete, text
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.ext.compiler import compiles
+
+# Adjust path so app imports work when run from /app inside the container
+sys.path.insert(0, "/app")
+
+from app.config import settings  # noqa: E402
+from app.database import Base  # noqa: E402
+from app.ingestion.base import ExtractedSection, ExtractedTable  # noqa: E402
+from app.ingestion.bulk import insert_sections, insert_tables, write_chunks  # noqa: E402
+from app.ingestion.incremental import flatten_sections, reconcile_chunks  # noqa: E402
+from app.ingestion.indexer import chunk_metadata  # noqa: E402
+from app.models.ingestion import (  # noqa: E402
+    Chunk,
+    DocumentSection,
+    DocumentTable,
+    IngestionRun,
+    InternalDocument,
+)
+
+
+# PostgreSQL-only column types render as TEXT on the SQLite fallback
+@compiles(JSONB, "sqlite")
+@compiles(TSVECTOR, "sqlite")
+def _compile_text_sqlite(type_, compiler, **kw):
+    return "TEXT"
+
+
+def synthetic_sections(count: int) -> list[ExtractedSection]:
+    """Parts of ten sections each, every section a short paragraph."""
+    parts = []
+    for p in range(max(count // 10, 1)):
+        children = [
+            ExtractedSection(
+                id=f"sec-{p:03d}-{s:02d}", heading=f"§ {p + 1}.{s}", level=2,
+                text=f"({s}) A covered institution shall retain records of each transaction under "
+                f"part {p + 1} for not less than {s + 2} years and produce them on request.",
+            )
+            for s in range(9)
+        ]
+        parts.append(ExtractedSection(
+            id=f"sec-{p:03d}", heading=f"PART {p + 1}", level=1, text="Scope and purpose.",
+            children=children,
+        ))
+    return parts
+
+
+def _tables(count: int) -> list[ExtractedTable]:
+    return [
+        ExtractedTable(
+            id=f"tbl-{i:03d}", caption=None, headers=["Tier", "Ratio"], rows=[["CET1", "4.5%"]]
+        )
+        for i in range(count)
+    ]
+
+
+def _lexical_sql(dialect: str, where: str) -> str:
+    vector = "to_tsvector('english', text)" if dialect == "postgresql" else "text"
+    return f"UPDATE chunks SET search_vector = {vector} WHERE {where}"
+
+
+async def persist_orm(db: AsyncSession, doc: InternalDocument, sections, tables) -> None:
+    flat = flatten_sections(sections, doc.id)
+    for f in flat:
+        db.add(DocumentSection(
+            id=f.db_id, document_id=doc.id, parent_id=f.parent_id, heading=f.section.heading,
+            level=f.section.level, text=f.section.text, position=f.position,
+            content_hash=f.content_hash,
+        ))
+    for tbl in tables:
+        db.add(DocumentTable(
+            id=f"{doc.id}-{tbl.id}", document_id=doc.id, section_id=tbl.section_id,
+            caption=tbl.caption, headers=tbl.headers, rows=tbl.rows,
+        ))
+    await db.flush()
+    for chunk in reconcile_chunks(doc.id, flat, {}, []).added:
+        db.add(chunk)
+    await db.flush()
+    await db.refresh(doc, attribute_names=["chunks"])
+    for chunk in doc.chunks:
+        chunk.embedding = [0.0] * settings.embedding_dimensions
+        chunk.chunk_metadata = chunk_metadata(doc)
+    await db.flush()
+    sql = text(_lexical_sql(db.bind.dialect.name, "id = :chunk_id"))
+    for chunk in doc.chunks:
+        await db.execute(sql, {"chunk_id": chunk.id})
+    await db.flush()
+
+
+async def persist_bulk(db: AsyncSession, doc: InternalDocument, sections, tables) -> None:
+    flat = flatten_sections(sections, doc.id)
+    await insert_sections(db, doc.id, flat)
+    await insert_tables(db, doc.id, tables)
+    delta = reconcile_chunks(doc.id, flat, {}, [])
+    for chunk in delta.to_embed:
+        chunk.embedding = [0.0] * settings.embedding_dimensions
+    await write_chunks(db, doc.id, delta, metadata=chunk_metadata(doc))
+    await db.execute(
+        text(_lexical_sql(
+            db.bind.dialect.name, "document_id = :document_id AND search_vector IS NULL"
+        )),
+        {"document_id": doc.id},
+    )
+
+
+async def run(database_url: str, docs: int, section_count: int) -> None:
+    engine = create_async_engine(database_url)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    sections = synthetic_sections(section_count)
+    tables = _tables(max(section_count // 100, 1))
+    rows = len(flatten_sections(sections, "d")) + len(tables)
+
+    print(f"Database: {engine.dialect.name}; {docs} documents × {rows} section/table rows + chunks")
+    print(f"{'mode':<8}{'seconds':>9}{'docs/min':>10}")
+    for mode, persist in (("orm", persist_orm), ("bulk", persist_bulk)):
+        run_id = f"bench-{mode}"
+        async with session() as db:
+            db.add(IngestionRun(id=run_id, acquisition_id="bench", manifest_id="bench"))
+            await db.commit()
+        started = time.perf_counter()
+        for n in range(docs):
+            async with session() as db:
+                doc = InternalDocument(
+                    id=f"{run_id}-{n}", ingestion_run_id=run_id, manifest_id="bench",
+                    source_id=f"s-{n}", staged_document_id=f"stg-{n}", jurisdiction="federal",
+                )
+                db.add(doc)
+                await db.flush()
+                await persist(db, doc, sections, tables)
+                await db.commit()
+        elapsed = time.perf_counter() - started
+        print(f"{mode:<8}{elapsed:>9.2f}{docs / elapsed * 60:>10.1f}")
+
+        async with session() as db:
+            prefix = f"{run_id}-%"
+            for model in (Chunk, DocumentSection, DocumentTable):
+                await db.execute(delete(model).where(model.document_id.like(prefix)))
+            await db.execute(delete(InternalDocument).where(InternalDocument.id.like(prefix)))
+            await db.execute(delete(IngestionRun).where(IngestionRun.id == run_id))
+            await db.commit()
+    await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--docs", type=int, default=20, help="Documents persisted per mode")
+    parser.add_argument("--sections", type=int, default=1000, help="Sections per document")
+    parser.add_argument(
+        "--database-url", help="Async SQLAlchemy URL (default: temporary SQLite file)"
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        url = args.database_url or f"sqlite+aiosqlite:///{Path(tmp) / 'bench.db'}"
+        asyncio.run(run(url, args.docs, args.sections))
+
+
+if __name__ == "__main__":
+    main()
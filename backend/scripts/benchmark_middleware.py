@@ -0,0 +1,117 @@
+"""
+benchmark_middleware.py
+
+Request middleware overhead, comparing the pure ASGI RequestLoggingMiddleware
+with the BaseHTTPMiddleware version it replaced (kept below as the baseline):
+
+  /health  — requests per second for a small JSON response
+  /stream  — time to stream an SSE response of --events events
+
+Both run in-process through httpx's ASGI transport with rate limiting off,
+so the numbers are middleware and framework cost only.
+
+Usage:
+  docker compose exec backend uv run python scripts/benchmark_middleware.py \
+      [--requests 5000] [--events 10000]
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+import time
+import uuid
+
+import httpx
+from fastapi import FastAPI
+from sse_starlette.sse import EventSourceResponse
+from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
+from starlette.requests import Request
+from starlette.responses import Response
+
+# Adjust path so app imports work when run from /app inside the container
+sys.path.insert(0, "/app")
+
+from app.config import settings  # noqa: E402
+from app.middleware import RequestLoggingMiddleware  # noqa: E402
+
+logger = logging.getLogger("raris.access")
+
+
+class LegacyRequestLoggingMiddleware(BaseHTTPMiddleware):
+    """The previous implementation, minus rate limiting (disabled here anyway)."""
+
+    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
+        correlation_id = request.headers.get("X-Correlation-ID", str(uuid.uuid4()))
+        start = time.monotonic()
+        request.state.correlation_id = correlation_id
+        response = await call_next(request)
+        duration_ms = (time.monotonic() - start) * 1000
+        response.headers["X-Correlation-ID"] = correlation_id
+        response.headers["X-Response-Time-Ms"] = f"{duration_ms:.1f}"
+        logger.info(
+            "%s %s %d %.1fms [%s]",
+            request.method, request.url.path, response.status_code, duration_ms, correlation_id,
+        )
+        return response
+
+
+def build_app(middleware: type, events: int) -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(middleware)
+
+    @app.get("/health")
+    async def health():
+        return {"status": "ok"}
+
+    @app.get("/stream")
+    async def stream():
+        async def generate():
+            for i in range(events):
+                yield {"event": "progress", "data": str(i)}
+
+        return EventSourceResponse(generate())
+
+    return app
+
+
+async def run(requests: int, events: int) -> None:
+    settings.rate_limit_rpm = 0
+    logging.getLogger("raris.access").setLevel(logging.WARNING)
+
+    print(f"{'middleware':<12}{'/health req/s':>15}{'/stream s':>11}{'events':>8}")
+    modes = (("base_http", LegacyRequestLoggingMiddleware), ("pure_asgi", RequestLoggingMiddleware))
+    for name, middleware in modes:
+        app = build_app(middleware, events)
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            for _ in range(50):
+                await client.get("/health")
+
+            started = time.perf_counter()
+            for _ in range(requests):
+                await client.get("/health")
+            rps = requests / (time.perf_counter() - started)
+
+            started = time.perf_counter()
+            resp = await client.get("/stream")
+            stream_seconds = time.perf_counter() - started
+            received = resp.text.count("event: progress")
+
+        print(f"{name:<12}{rps:>15.0f}{stream_seconds:>11.2f}{received:>8}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        "--requests", type=int, default=5000, help="Requests to /health per middleware"
+    )
+    parser.add_argument("--events", type=int, default=10_000, help="Events in the SSE stream")
+    args = parser.parse_args()
+    asyncio.run(run(args.requests, args.events))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+"""
+benchmark_pdf_extraction.py
+
+Page throughput and peak RSS of the PDF adapter's extraction modes:
+
+  bytes    — PdfAdapter.ingest() on the whole file read into memory
+  file     — PdfAdapter.ingest_file() streaming pages from disk
+  parallel — ingest_file() with --workers extraction processes
+  chunks   — pages → sections → chunker as a pure stream (nothing retained, 1 process)
+
+Each mode runs in a fresh subprocess so peak RSS is measured in isolation.
+Without --pdf a synthetic text PDF of --pages pages is generated.
+
+Usage:
+  docker compose exec backend uv run python scripts/benchmark_pdf_extraction.py \
+      [--pdf handbook.pdf | --pages 2000] [--workers 4] [--modes bytes,file,parallel,chunks]
+"""
+
+import argparse
+import asyncio
+import json
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Adjust path so app imports work when run from /app inside the container
+sys.path.insert(0, "/app")
+
+MODES = ("bytes", "file", "parallel", "chunks")
+
+
+def synthetic_pdf(page_count: int, lines_per_page: int = 45) -> bytes:
+    """A minimal uncompressed text PDF that reads like a regulatory handbook."""
+
+    def escape(text: str) -> str:
+        return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+    objects = [
+        "<< /Type /Catalog /Pages 2 0 R >>",
+        "",
+        "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    kids = []
+    for p in range(page_count):
+        lines = [f"PART {p // 10 + 1} SUBJECT {p // 10 + 1}"] if p % 10 == 0 else []
+        if p % 2 == 0:
+            lines.append(f"§ {p // 10 + 1}.{p % 10} Requirements")
+        lines += [
+            f"({i}) An institution shall maintain records under paragraph ({i}) of this "
+            f"section for page {p + 1}, as provided in 12 CFR 1026.{i}."
+            for i in range(lines_per_page - len(lines))
+        ]
+        shown = " ".join(f"({escape(t)}) Tj T*" for t in lines)
+        stream = f"BT /F1 9 Tf 11 TL 40 780 Td {shown} ET"
+        objects.append(f"<< /Length {len(stream)} >>\nstream\n{stream}\nendstream")
+        objects.append(
+            "<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            f"/Resources << /Font << /F1 3 0 R >> >> /Contents {len(objects)} 0 R >>"
+        )
+        kids.append(f"{len(objects)} 0 R")
+    objects[1] = f"<< /Type /Pages /Kids [{' '.join(kids)}] /Count {len(kids)} >>"
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for i, obj in enumerate(objects, 1):
+        offsets.append(len(out))
+        out += f"{i} 0 obj\n{obj}\nendobj\n".encode("latin-1")
+    xref = len(out)
+    out += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    out += "".join(f"{offset:010d} 00000 n \n" for offset in offsets).encode()
+    out += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\n".encode()
+    out += f"startxref\n{xref}\n%%EOF\n".encode()
+    return bytes(out)
+
+
+def _run_mode(mode: str, pdf: Path, workers: int) -> dict:
+    """Body of a child process: extract once and report counts."""
+    from app.ingestion.chunker import chunk_section
+    from app.ingestion.pdf_adapter import PdfAdapter, iter_pages, iter_sections
+
+    adapter = PdfAdapter()
+    started = time.perf_counter()
+    if mode == "bytes":
+        doc = asyncio.run(adapter.ingest(pdf.read_bytes()))
+        pages, sections = doc.full_text.count("\n\n") + 1, len(doc.sections)
+    elif mode in ("file", "parallel"):
+        doc = asyncio.run(adapter.ingest_file(pdf, workers=workers if mode == "parallel" else 1))
+        pages, sections = doc.full_text.count("\n\n") + 1, len(doc.sections)
+    else:
+        pages = sections = chunks = 0
+
+        def counted():
+            nonlocal pages
+            for page in iter_pages(pdf):
+                pages += 1
+                yield page
+
+        for section in iter_sections(counted()):
+            sections += 1
+            chunks += len(chunk_section(section, section.heading))
+    elapsed = time.perf_counter() - started
+    return {
+        "mode": mode,
+        "pages": pages,
+        "sections": sections,
+        "seconds": round(elapsed, 2),
+        "pages_per_sec": round(pages / elapsed, 1) if elapsed else 0.0,
+        # ru_maxrss is KiB on Linux; for workers it is the largest single worker
+        "peak_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+        "worker_rss_mb": round(resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / 1024, 1),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--pdf", type=Path, help="PDF to extract (default: generate one)")
+    parser.add_argument("--pages", type=int, default=2000, help="Pages in the generated PDF")
+    parser.add_argument("--workers", type=int, default=4, help="Processes for parallel modes")
+    parser.add_argument("--modes", default=",".join(MODES))
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(_run_mode(args.child, args.pdf, args.workers)))
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        pdf = args.pdf
+        if pdf is None:
+            pdf = Path(tmp) / "synthetic.pdf"
+            pdf.write_bytes(synthetic_pdf(args.pages))
+        print(f"PDF: {pdf} ({pdf.stat().st_size / 1e6:.1f} MB)")
+        print(
+            f"{'mode':<10}{'pages':>7}{'sections':>10}{'seconds':>9}{'pages/s':>9}"
+            f"{'peak RSS MB':>13}{'worker RSS MB':>15}"
+        )
+        for mode in args.modes.split(","):
+            if mode not in MODES:
+                raise SystemExit(f"Unknown mode: {mode}. Available: {', '.join(MODES)}")
+            out = subprocess.run(
+                [
+                    sys.executable, __file__, "--child", mode,
+                    "--pdf", str(pdf), "--workers", str(args.workers),
+                ],
+                check=True, capture_output=True, text=True,
+            ).stdout
+            r = json.loads(out.strip().splitlines()[-1])
+            print(
+                f"{r['mode']:<10}{r['pages']:>7}{r['sections']:>10}{r['seconds']:>9}"
+                f"{r['pages_per_sec']:>9}{r['peak_rss_mb']:>13}{r['worker_rss_mb']:>15}"
+            )
+
+
+if __name__ == "__main__":
+    main()
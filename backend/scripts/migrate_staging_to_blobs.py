@@ -0,0 +1,108 @@
+"""
+migrate_staging_to_blobs.py
+
+One-off migration of staging trees written before the blob store existed.
+
+Steps:
+  1. Move every legacy staging/<manifest>/<source>/content.<ext> into the
+     content-addressed blob store (staging/.blobs) and reference it.
+  2. Reference the blob from duplicate sources that only carry provenance.yaml.
+  3. Remove the legacy content files (unless --keep-legacy).
+
+Staging writes go through the blob store already; re-running is harmless.
+
+Usage:
+  docker compose exec backend uv run python scripts/migrate_staging_to_blobs.py \
+      [--staging-root staging] [--keep-legacy] [--dry-run]
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+import yaml
+
+# Adjust path so app imports work when run from /app inside the container
+sys.path.insert(0, "/app")
+
+from app.acquisition.blob_store import BlobStore
+from app.config import settings
+
+
+def _provenance_files(root: Path):
+    for prov_file in sorted(root.glob("*/*/provenance.yaml")):
+        if prov_file.parts[len(root.parts)].startswith("."):
+            continue
+        try:
+            prov = yaml.safe_load(prov_file.read_text()) or {}
+        except Exception:
+            print(f"  skip (unreadable): {prov_file}")
+            continue
+        if prov.get("content_hash"):
+            yield prov_file.parent, prov["content_hash"]
+
+
+def run(root: Path, keep_legacy: bool, dry_run: bool) -> None:
+    store = BlobStore(root / ".blobs", compression=settings.staging_compression)
+    before = sum(f.stat().st_size for f in root.glob("*/*/content.*"))
+
+    # 1. Import legacy content files
+    imported = 0
+    for source_dir, content_hash in _provenance_files(root):
+        legacy = next(source_dir.glob("content.*"), None)
+        if legacy is None:
+            continue
+        if not dry_run:
+            put = store.put_bytes(legacy.read_bytes())
+            if put.content_hash != content_hash:
+                print(
+                    f"  WARNING: {legacy} hashes to {put.content_hash}, "
+                    f"provenance says {content_hash}"
+                )
+                content_hash = put.content_hash
+            store.add_ref(content_hash, source_dir.parent.name, source_dir.name)
+            if not keep_legacy:
+                legacy.unlink()
+        imported += 1
+
+    # 2. Reference blobs from duplicates
+    referenced = 0
+    missing = 0
+    for source_dir, content_hash in _provenance_files(root):
+        if store.exists(content_hash):
+            if not dry_run:
+                store.add_ref(content_hash, source_dir.parent.name, source_dir.name)
+            referenced += 1
+        elif not dry_run:
+            missing += 1
+            print(f"  no content anywhere for {source_dir} ({content_hash})")
+
+    stats = store.stats()
+    print("\nMigration summary:")
+    print(f"  legacy files imported : {imported}")
+    print(f"  sources referenced    : {referenced}")
+    print(f"  sources without blob  : {missing}")
+    print(f"  legacy bytes          : {before}")
+    print(f"  blobs / stored bytes  : {stats['blobs']} / {stats['stored_bytes']}")
+    if dry_run:
+        print("\n[DRY-RUN] Nothing written. Re-run without --dry-run to apply.")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Move legacy staging content into the blob store.")
+    parser.add_argument("--staging-root", default="staging", help="Staging directory to migrate")
+    parser.add_argument(
+        "--keep-legacy", action="store_true", help="Leave content.<ext> files in place"
+    )
+    parser.add_argument("--dry-run", action="store_true", help="Report without writing")
+    args = parser.parse_args()
+
+    root = Path(args.staging_root)
+    if not root.exists():
+        print(f"ERROR: staging root '{root}' does not exist.")
+        sys.exit(1)
+    run(root, args.keep_legacy, args.dry_run)
+
+
+if __name__ == "__main__":
+    main()
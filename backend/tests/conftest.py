@@ -1,6 +1,7 @@
 """Test fixtures — in-memory SQLite database for API integration tests."""
 
 import uuid
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from httpx import ASGITransport, AsyncClient
@@ -69,3 +70,21 @@ async def client():
         headers={"X-API-Key": f"test-{uuid.uuid4().hex}"},
     ) as ac:
         yield ac
+
+
+@pytest.fixture
+def mock_db():
+    """Create a mock async database session."""
+    db = AsyncMock()
+    db.add = MagicMock()
+    db.flush = AsyncMock()
+    db.commit = AsyncMock()
+
+    mock_manifest = MagicMock()
+    mock_manifest.jurisdiction_hierarchy = None
+    mock_manifest.coverage_summary = None
+    mock_manifest.status = None
+    mock_manifest.completeness_score = None
+    db.get = AsyncMock(return_value=mock_manifest)
+
+    return db
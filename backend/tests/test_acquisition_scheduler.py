@@ -0,0 +1,241 @@
+"""Tests for the concurrent acquisition scheduler and orchestrator."""
+
+import asyncio
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.acquisition import orchestrator as orchestrator_module
+from app.acquisition.orchestrator import AcquisitionOrchestrator
+from app.acquisition.scheduler import (
+    FAILURE,
+    RETRY,
+    START,
+    SUCCESS,
+    AcquisitionJob,
+    AcquisitionScheduler,
+)
+from app.models.acquisition import (
+    AcquisitionRun,
+    AcquisitionSource,
+    AcquisitionStatus,
+    SourceAcqStatus,
+    StagedDocument,
+)
+from tests.conftest import TestSession
+
+
+async def _collect(scheduler: AcquisitionScheduler, jobs) -> list:
+    return [o async for o in scheduler.run(jobs)]
+
+
+class TestAcquisitionScheduler:
+    @pytest.mark.asyncio
+    async def test_global_concurrency_limit(self):
+        async def fetch(job):
+            await asyncio.sleep(0.05)
+            return job.key
+
+        scheduler = AcquisitionScheduler(fetch, max_concurrency=3, politeness_ms=0)
+        jobs = [AcquisitionJob(key=f"s{i}", url=f"https://host{i}.gov/doc") for i in range(6)]
+        start = time.monotonic()
+        outcomes = await _collect(scheduler, jobs)
+
+        succeeded = sorted(o.result for o in outcomes if o.kind == SUCCESS)
+        assert succeeded == [f"s{i}" for i in range(6)]
+        assert scheduler.peak_in_flight == 3
+        assert time.monotonic() - start < 0.25  # two waves, not six serial fetches
+
+    @pytest.mark.asyncio
+    async def test_per_host_limit_lets_other_hosts_proceed(self):
+        in_flight: dict[str, int] = {}
+        peak: dict[str, int] = {}
+
+        async def fetch(job):
+            in_flight[job.host] = in_flight.get(job.host, 0) + 1
+            peak[job.host] = max(peak.get(job.host, 0), in_flight[job.host])
+            await asyncio.sleep(0.02)
+            in_flight[job.host] -= 1
+
+        scheduler = AcquisitionScheduler(
+            fetch, max_concurrency=4, per_host_concurrency=1, politeness_ms=0,
+        )
+        jobs = [AcquisitionJob(key=f"a{i}", url=f"https://busy.gov/{i}") for i in range(4)]
+        jobs.append(AcquisitionJob(key="b", url="https://quiet.gov/doc"))
+        outcomes = await _collect(scheduler, jobs)
+
+        assert peak["busy.gov"] == 1
+        successes = [o.job.key for o in outcomes if o.kind == SUCCESS]
+        # The other host is not stuck behind the busy host's chain
+        assert successes.index("b") < 2
+
+    @pytest.mark.asyncio
+    async def test_politeness_spaces_starts_per_host(self):
+        starts: list[float] = []
+
+        async def fetch(job):
+            starts.append(time.monotonic())
+
+        scheduler = AcquisitionScheduler(
+            fetch, max_concurrency=3, per_host_concurrency=3, politeness_ms=50,
+        )
+        jobs = [AcquisitionJob(key=str(i), url=f"https://a.gov/{i}") for i in range(3)]
+        await _collect(scheduler, jobs)
+
+        gaps = [b - a for a, b in zip(starts, starts[1:])]
+        assert all(gap >= 0.045 for gap in gaps)
+
+    @pytest.mark.asyncio
+    async def test_retry_is_requeued_without_blocking_worker(self):
+        attempts: dict[str, int] = {}
+
+        async def fetch(job):
+            attempts[job.key] = attempts.get(job.key, 0) + 1
+            if job.key == "flaky" and attempts[job.key] == 1:
+                raise RuntimeError("503")
+            return "ok"
+
+        scheduler = AcquisitionScheduler(
+            fetch, max_concurrency=1, politeness_ms=0, backoff_base=0.1,
+        )
+        jobs = [
+            AcquisitionJob(key="flaky", url="https://a.gov/1"),
+            AcquisitionJob(key="steady", url="https://b.gov/1"),
+        ]
+        outcomes = await _collect(scheduler, jobs)
+
+        assert [(o.kind, o.job.key) for o in outcomes] == [
+            (START, "flaky"), (RETRY, "flaky"),
+            (START, "steady"), (SUCCESS, "steady"),
+            (START, "flaky"), (SUCCESS, "flaky"),
+        ]
+        assert outcomes[1].retry_in_s == pytest.approx(0.1)
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_retries(self):
+        async def fetch(job):
+            raise RuntimeError("404")
+
+        scheduler = AcquisitionScheduler(fetch, politeness_ms=0, max_retries=2, backoff_base=0.01)
+        outcomes = await _collect(scheduler, [AcquisitionJob(key="x", url="https://a.gov/x")])
+
+        assert [o.kind for o in outcomes] == [START, RETRY, START, FAILURE]
+        assert outcomes[-1].error == "404"
+
+
+def _source(source_id: str, url: str, method: str = "download") -> SimpleNamespace:
+    return SimpleNamespace(
+        source_id=source_id, name=source_id, url=url, access_method=method,
+        manifest_id="m-1", status=SourceAcqStatus.pending, retry_count=0,
+        error_message=None, staged_document_id=None, duration_ms=None, last_attempt_at=None,
+    )
+
+
+class TestConcurrentOrchestrator:
+    @pytest.mark.asyncio
+    async def test_events_preserved_with_concurrent_fetches(self, monkeypatch):
+        sources = [
+            _source("s1", "https://a.gov/1"),
+            _source("s2", "https://b.gov/2"),
+            _source("s3", "https://c.gov/3", method="manual"),
+        ]
+        db = AsyncMock()
+        db.add = MagicMock()
+        db.get = AsyncMock(return_value=MagicMock())
+        result = MagicMock()
+        result.scalars.return_value.all.return_value = sources
+        db.execute = AsyncMock(return_value=result)
+
+        async def fake_download(manifest_id, source_id, url, **kwargs):
+            await asyncio.sleep(0.01)
+            return {"content_hash": f"sha256:{source_id}", "raw_content_path": f"/tmp/{source_id}",
+                    "byte_size": 42, "duration_ms": 10}
+
+        monkeypatch.setattr(orchestrator_module, "download_source", fake_download)
+        orchestrator = AcquisitionOrchestrator(db=db, acquisition_id="acq-1", rate_limit_ms=0)
+        events = [e async for e in orchestrator.run()]
+
+        kinds = [e["event"] for e in events]
+        assert kinds.count("source_start") == 2
+        assert kinds.count("source_complete") == 2
+        assert kinds.count("progress") == 2
+        assert events[-1]["event"] == "complete"
+        assert events[-1]["data"]["completed"] == 2
+        assert events[-1]["data"]["scheduler"]["peak_in_flight"] == 2
+        assert sources[2].status == SourceAcqStatus.skipped
+        assert all(s.status == SourceAcqStatus.complete for s in sources[:2])
+        assert events[-2]["data"]["pending"] == 0
+
+    @pytest.mark.asyncio
+    async def test_pending_excludes_unsupported_sources(self, monkeypatch):
+        sources = [
+            _source("s1", "https://a.gov/1"),
+            _source("s2", "https://b.gov/2"),
+            _source("s3", "ftp://c.gov/3", method="ftp"),
+        ]
+        db = AsyncMock()
+        db.add = MagicMock()
+        db.get = AsyncMock(return_value=MagicMock())
+        result = MagicMock()
+        result.scalars.return_value.all.return_value = sources
+        db.execute = AsyncMock(return_value=result)
+
+        async def fake_download(manifest_id, source_id, url, **kwargs):
+            if source_id == "s2":
+                await asyncio.sleep(0.01)
+            return {"content_hash": f"sha256:{source_id}", "raw_content_path": f"/tmp/{source_id}",
+                    "byte_size": 42, "duration_ms": 10}
+
+        monkeypatch.setattr(orchestrator_module, "download_source", fake_download)
+        orchestrator = AcquisitionOrchestrator(db=db, acquisition_id="acq-1", rate_limit_ms=0)
+        events = [e async for e in orchestrator.run()]
+
+        progress = [e["data"] for e in events if e["event"] == "progress"]
+        assert [(p["completed"], p["failed"], p["pending"]) for p in progress] == [
+            (1, 1, 1), (2, 1, 0),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_staging_error_fails_only_that_source(self, monkeypatch):
+        async with TestSession() as db:
+            db.add(AcquisitionRun(id="acq-1", manifest_id="m-1", total_sources=3))
+            for source_id in ("s1", "s2", "s3"):
+                db.add(AcquisitionSource(
+                    acquisition_id="acq-1", source_id=source_id, manifest_id="m-1",
+                    name=source_id, regulatory_body="rb", url=f"https://{source_id}.gov/",
+                    access_method="download",
+                ))
+            # Left behind by an earlier run: staging s1 collides on its primary key
+            db.add(StagedDocument(
+                id="stg-s1", manifest_id="m-1", source_id="s1", acquisition_method="download",
+                content_hash="sha256:old", content_type="text/html", raw_content_path="",
+            ))
+            await db.commit()
+
+        async def fake_download(manifest_id, source_id, url, **kwargs):
+            if source_id == "s3":
+                return {"content_hash": "sha256:s3"}  # no raw_content_path or byte_size
+            await asyncio.sleep(0.01)
+            return {"content_hash": f"sha256:{source_id}", "raw_content_path": f"/tmp/{source_id}",
+                    "byte_size": 42, "duration_ms": 10}
+
+        monkeypatch.setattr(orchestrator_module, "download_source", fake_download)
+        async with TestSession() as db:
+            orchestrator = AcquisitionOrchestrator(db=db, acquisition_id="acq-1", rate_limit_ms=0)
+            events = [e async for e in orchestrator.run()]
+
+        failed = {e["data"]["source_id"]: e["data"]["error"]
+                  for e in events if e["event"] == "source_failed"}
+        assert set(failed) == {"s1", "s3"}
+        assert failed["s1"].startswith("Staging failed: IntegrityError")
+        assert events[-1]["data"]["completed"] == 1
+        async with TestSession() as db:
+            assert (await db.get(AcquisitionRun, "acq-1")).status == AcquisitionStatus.complete
+            statuses = {s.source_id: s.status for s in await orchestrator._load_sources()}
+        assert statuses == {
+            "s1": SourceAcqStatus.failed,
+            "s2": SourceAcqStatus.complete,
+            "s3": SourceAcqStatus.failed,
+        }
@@ -1,5 +1,6 @@
 """Tests for API key auth, admin endpoints, middleware, scheduler, and health checks."""
 
+import asyncio
 import hashlib
 
 import pytest
@@ -180,6 +181,15 @@ async def test_scheduler_status(client):
     assert isinstance(data["jobs"], list)
 
 
+@pytest.mark.asyncio
+async def test_http_pool_status(client):
+    resp = await client.get("/api/admin/http-pool")
+    assert resp.status_code == 200
+    data = resp.json()
+    assert "connections_open" in data
+    assert "reuse_ratio" in data
+
+
 @pytest.mark.asyncio
 async def test_create_api_key(client):
     resp = await client.post(
@@ -276,6 +286,101 @@ async def test_response_time_header(client):
     assert time_ms >= 0
 
 
+async def _call_asgi(app, path: str = "/") -> list[dict]:
+    """Drive an ASGI app directly and collect the messages it sends."""
+    sent = []
+    requested = asyncio.Event()
+
+    async def receive():
+        # The request body once, then block like a client that stays connected
+        if requested.is_set():
+            await asyncio.Event().wait()
+        requested.set()
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {
+        "type": "http", "method": "GET", "path": path, "headers": [], "query_string": b"",
+        "client": ("127.0.0.1", 5000), "server": ("test", 80), "scheme": "http",
+        "root_path": "", "http_version": "1.1",
+    }
+    await app(scope, receive, send)
+    return sent
+
+
+@pytest.mark.asyncio
+async def test_streaming_body_passes_through_unbuffered():
+    from starlette.requests import Request
+    from starlette.responses import StreamingResponse
+
+    from app.middleware import RequestLoggingMiddleware
+
+    seen_ids = []
+
+    async def app(scope, receive, send):
+        seen_ids.append(Request(scope).state.correlation_id)
+
+        async def events():
+            for i in range(3):
+                yield f"data: {i}\n\n"
+
+        await StreamingResponse(events(), media_type="text/event-stream")(scope, receive, send)
+
+    sent = await _call_asgi(RequestLoggingMiddleware(app), "/health")
+
+    start = dict(sent[0]["headers"])
+    assert start[b"x-correlation-id"].decode() == seen_ids[0]
+    assert b"x-response-time-ms" in start
+    bodies = [m["body"] for m in sent[1:] if m["body"]]
+    assert bodies == [b"data: 0\n\n", b"data: 1\n\n", b"data: 2\n\n"]
+
+
+@pytest.mark.asyncio
+async def test_request_is_logged_before_background_tasks_run(caplog):
+    from starlette.background import BackgroundTask
+    from starlette.responses import PlainTextResponse
+
+    from app.middleware import RequestLoggingMiddleware
+
+    logged_before_task = []
+
+    async def slow_task():
+        logged_before_task.append(any(r.name == "raris.access" for r in caplog.records))
+        await asyncio.sleep(0.3)
+
+    async def app(scope, receive, send):
+        response = PlainTextResponse("ok", background=BackgroundTask(slow_task))
+        await response(scope, receive, send)
+
+    with caplog.at_level("INFO", logger="raris.access"):
+        await _call_asgi(RequestLoggingMiddleware(app), "/health")
+
+    assert logged_before_task == [True]
+    (record,) = [r for r in caplog.records if r.name == "raris.access"]
+    assert float(record.getMessage().split()[3].removesuffix("ms")) < 300
+
+
+@pytest.mark.asyncio
+async def test_rate_limited_request_gets_429_without_reaching_app(monkeypatch):
+    from app import rate_limit
+    from app.middleware import RequestLoggingMiddleware
+    from app.rate_limit import RateLimitResult
+
+    async def _deny(identifier):
+        return RateLimitResult(allowed=False, limit=60, remaining=0, retry_after=2.5)
+
+    async def app(scope, receive, send):
+        raise AssertionError("app should not be called")
+
+    monkeypatch.setattr(rate_limit, "check_rate_limit", _deny)
+    sent = await _call_asgi(RequestLoggingMiddleware(app), "/api/manifests")
+
+    assert sent[0]["status"] == 429
+    assert dict(sent[0]["headers"])[b"retry-after"] == b"3"
+
+
 # --- URL Masking ---
 
 
@@ -0,0 +1,148 @@
+"""Tests for the API key cache: cached validation, revocation and batched last_used_at."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy import event, select
+
+from app import auth, auth_cache, rate_limit
+from app.auth import generate_api_key, hash_key
+from app.config import settings
+from app.models.auth import ApiKey, ApiKeyScope
+from app.routers import admin
+from tests.conftest import TestSession, test_engine
+
+
+@pytest.fixture
+async def admin_key(monkeypatch):
+    """Auth enabled with a fresh cache; returns a raw admin key."""
+    monkeypatch.setattr(settings, "auth_enabled", True)
+    monkeypatch.setattr(settings, "auth_revocation_check_seconds", 0.0)
+    monkeypatch.setattr(settings, "auth_last_used_flush_seconds", 3600.0)
+    version = {"value": 0}
+
+    async def _read_version():
+        return version["value"]
+
+    cache = auth_cache.ApiKeyCache()
+    monkeypatch.setattr(auth_cache, "_read_version", _read_version)
+    monkeypatch.setattr(auth, "api_key_cache", cache)
+    monkeypatch.setattr(admin, "api_key_cache", cache)
+
+    raw_key, prefix = generate_api_key()
+    async with TestSession() as db:
+        db.add(ApiKey(
+            id="key-admin", name="Admin", key_hash=hash_key(raw_key),
+            key_prefix=prefix, scope=ApiKeyScope.admin,
+        ))
+        await db.commit()
+    return {"key": raw_key, "cache": cache, "version": version}
+
+
+@pytest.fixture
+def key_lookups():
+    """Count SELECTs against api_keys on the test engine."""
+    statements = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT") and "FROM api_keys" in statement:
+            statements.append(statement)
+
+    event.listen(test_engine.sync_engine, "before_cursor_execute", _record)
+    yield statements
+    event.remove(test_engine.sync_engine, "before_cursor_execute", _record)
+
+
+async def _last_used():
+    async with TestSession() as db:
+        return (await db.execute(select(ApiKey.last_used_at))).scalar_one()
+
+
+class TestCachedValidation:
+    @pytest.mark.asyncio
+    async def test_repeat_requests_skip_the_lookup(self, client, admin_key, key_lookups):
+        headers = {"X-API-Key": admin_key["key"]}
+        for _ in range(3):
+            assert (await client.get("/api/admin/info", headers=headers)).status_code == 200
+        assert len(key_lookups) == 1
+
+    @pytest.mark.asyncio
+    async def test_unknown_key_is_rejected_every_time(self, client, admin_key, key_lookups):
+        for _ in range(2):
+            resp = await client.get("/api/admin/info", headers={"X-API-Key": "raris_wrong"})
+            assert resp.status_code == 401
+        assert len(key_lookups) == 2
+
+    @pytest.mark.asyncio
+    async def test_zero_ttl_disables_the_cache(self, client, admin_key, key_lookups, monkeypatch):
+        monkeypatch.setattr(settings, "auth_cache_ttl_seconds", 0.0)
+        for _ in range(2):
+            await client.get("/api/admin/info", headers={"X-API-Key": admin_key["key"]})
+        assert len(key_lookups) == 2
+
+
+class TestRevocation:
+    @pytest.mark.asyncio
+    async def test_revoked_key_is_rejected_immediately(self, client, admin_key):
+        headers = {"X-API-Key": admin_key["key"]}
+        resp = await client.delete("/api/admin/keys/key-admin", headers=headers)
+        assert resp.status_code == 200
+        assert (await client.get("/api/admin/info", headers=headers)).status_code == 401
+
+    @pytest.mark.asyncio
+    async def test_revocation_in_another_process_drops_the_cache(self, client, admin_key):
+        headers = {"X-API-Key": admin_key["key"]}
+        assert (await client.get("/api/admin/info", headers=headers)).status_code == 200
+        async with TestSession() as db:
+            (await db.get(ApiKey, "key-admin")).is_active = False
+            await db.commit()
+        # Still served from cache until the revocation version changes
+        assert (await client.get("/api/admin/info", headers=headers)).status_code == 200
+
+        admin_key["version"]["value"] += 1
+        assert (await client.get("/api/admin/info", headers=headers)).status_code == 401
+
+    @pytest.mark.asyncio
+    async def test_version_checks_share_the_pooled_client(self, monkeypatch):
+        redis = MagicMock(get=AsyncMock(return_value=b"3"), incr=AsyncMock())
+        from_url = MagicMock(return_value=redis)
+        monkeypatch.setattr(rate_limit.aioredis, "from_url", from_url)
+        monkeypatch.setattr(rate_limit, "_client", None)
+
+        assert await auth_cache._read_version() == 3
+        assert await auth_cache._read_version() == 3
+        await auth_cache.ApiKeyCache().invalidate()
+
+        from_url.assert_called_once()
+        redis.incr.assert_awaited_once_with(auth_cache._VERSION_KEY)
+        redis.aclose.assert_not_called()
+
+
+class TestLastUsed:
+    @pytest.mark.asyncio
+    async def test_last_used_is_written_on_flush(self, client, admin_key):
+        await client.get("/api/admin/info", headers={"X-API-Key": admin_key["key"]})
+        assert await _last_used() is None
+
+        async with TestSession() as db:
+            await admin_key["cache"].flush(db)
+        assert await _last_used() is not None
+
+    @pytest.mark.asyncio
+    async def test_due_flush_happens_during_a_request(self, client, admin_key, monkeypatch):
+        monkeypatch.setattr(settings, "auth_last_used_flush_seconds", 0.0)
+        await client.get("/api/admin/info", headers={"X-API-Key": admin_key["key"]})
+        assert await _last_used() is not None
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_keeps_timestamps_for_the_next_one(self, admin_key, monkeypatch):
+        cache = admin_key["cache"]
+        cache.touch("key-admin")
+        async with TestSession() as db:
+            monkeypatch.setattr(db, "execute", AsyncMock(side_effect=RuntimeError("db down")))
+            await cache.flush(db)
+        assert await _last_used() is None
+
+        async with TestSession() as db:
+            await cache.flush(db)
+        assert await _last_used() is not None
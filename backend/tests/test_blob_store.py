@@ -0,0 +1,100 @@
+"""Tests for the content-addressed staging blob store."""
+
+import pytest
+
+from app.acquisition import staging
+from app.acquisition.blob_store import BlobStore
+from app.config import settings
+from app.ingestion.orchestrator import _read_staged_content
+from app.models.acquisition import StagedDocument
+
+
+@pytest.fixture
+def staging_root(tmp_path, monkeypatch):
+    monkeypatch.setattr(staging, "STAGING_ROOT", tmp_path)
+    return tmp_path
+
+
+class TestBlobStore:
+    def test_blobs_are_sharded_by_hash(self, tmp_path):
+        store = BlobStore(tmp_path)
+        put = store.put_bytes(b"Title 12 CFR")
+        hex_digest = put.content_hash.split(":")[1]
+
+        assert put.created
+        shard = tmp_path / "objects" / hex_digest[:2] / hex_digest[2:4]
+        assert store.path(put.content_hash) == shard / hex_digest
+        assert not store.put_bytes(b"Title 12 CFR").created
+
+    def test_last_reference_deletes_blob(self, tmp_path):
+        store = BlobStore(tmp_path)
+        put = store.put_bytes(b"statute")
+        store.add_ref(put.content_hash, "m-1", "s-1")
+        store.add_ref(put.content_hash, "m-1", "s-1")  # idempotent
+        store.add_ref(put.content_hash, "m-2", "s-7")
+        assert store.refcount(put.content_hash) == 2
+
+        assert store.remove_ref(put.content_hash, "m-1", "s-1") == 1
+        assert store.exists(put.content_hash)
+        assert store.remove_ref(put.content_hash, "m-2", "s-7") == 0
+        assert not store.exists(put.content_hash)
+
+    @pytest.mark.asyncio
+    async def test_zstd_round_trip(self, tmp_path):
+        pytest.importorskip("zstandard")
+        store = BlobStore(tmp_path, compression="zstd")
+        body = b"<section>Reserved.</section>" * 2000
+
+        async def chunks():
+            for i in range(0, len(body), 4096):
+                yield body[i:i + 4096]
+
+        put = await store.put_stream(chunks())
+        assert store.path(put.content_hash).suffix == ".zst"
+        assert put.stored_bytes < put.byte_size // 10
+        assert store.read_bytes(put.content_hash) == body
+        # Uncompressed stores still read compressed blobs
+        assert BlobStore(tmp_path).read_bytes(put.content_hash) == body
+
+    def test_unknown_compression_raises(self, tmp_path):
+        with pytest.raises(ValueError, match="Unknown blob compression"):
+            BlobStore(tmp_path, compression="lz4")
+
+
+class TestStagingThroughBlobs:
+    def test_restaging_new_content_moves_reference(self, staging_root):
+        old = staging.stage_document("m-1", "s-1", b"v1", "text/plain", {})
+        new = staging.stage_document("m-1", "s-1", b"v2", "text/plain", {})
+
+        store = staging.get_blob_store()
+        assert not store.exists(old["content_hash"])
+        assert store.refs(new["content_hash"]) == [("m-1", "s-1")]
+
+    def test_restaging_same_content_is_duplicate_and_keeps_blob(self, staging_root):
+        first = staging.stage_document("m-1", "s-1", b"same", "text/plain", {})
+        again = staging.stage_document("m-1", "s-1", b"same", "text/plain", {})
+
+        assert again["is_duplicate"]
+        assert staging.get_blob_store().refcount(first["content_hash"]) == 1
+
+    def test_ingestion_reads_duplicates_through_store(self, staging_root):
+        staging.stage_document("m-1", "s-1", b"%PDF-1.7", "application/pdf", {})
+        dup = staging.stage_document("m-2", "s-9", b"%PDF-1.7", "application/pdf", {})
+        staged = StagedDocument(
+            id="stg-1", manifest_id="m-2", source_id="s-9", acquisition_method="download",
+            content_hash=dup["content_hash"], content_type="application/pdf",
+            raw_content_path=dup["raw_content_path"],
+        )
+        assert _read_staged_content(staged) == b"%PDF-1.7"
+
+    def test_ingestion_falls_back_to_legacy_content_file(self, staging_root, monkeypatch):
+        monkeypatch.setattr(settings, "staging_compression", "none")
+        legacy = staging_root / "m-0" / "s-0"
+        legacy.mkdir(parents=True)
+        (legacy / "content.html").write_text("<p>legacy</p>")
+        staged = StagedDocument(
+            id="stg-0", manifest_id="m-0", source_id="s-0", acquisition_method="scrape",
+            content_hash="sha256:" + "0" * 64, content_type="text/html",
+            raw_content_path=str(legacy),
+        )
+        assert _read_staged_content(staged) == "<p>legacy</p>"
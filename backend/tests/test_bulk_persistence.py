@@ -0,0 +1,115 @@
+"""Tests for bulk persistence of sections, tables and chunks."""
+
+import pytest
+from sqlalchemy import select
+
+from app.config import settings
+from app.ingestion.base import ExtractedSection, ExtractedTable
+from app.ingestion.bulk import insert_sections, insert_tables, write_chunks
+from app.ingestion.incremental import flatten_sections, load_stored_chunks, reconcile_chunks
+from app.models.ingestion import Chunk, DocumentSection, DocumentTable, InternalDocument
+from tests.conftest import TestSession
+
+# Unit vectors sized to the chunks.embedding column
+_X = [1.0] + [0.0] * (settings.embedding_dimensions - 1)
+_Y = [0.0, 1.0] + [0.0] * (settings.embedding_dimensions - 2)
+
+
+def _sections(capital: str = "six percent") -> list[ExtractedSection]:
+    return [
+        ExtractedSection(
+            id="s0", heading="Part 1", level=1, text="General rules apply to banks.", children=[
+                ExtractedSection(id="s1", heading="A", level=2, text=f"Hold capital of {capital}."),
+            ],
+        ),
+        ExtractedSection(id="s2", heading="Part 2", level=1, text="Lending limits apply."),
+    ]
+
+
+async def _rows(model, order_by):
+    async with TestSession() as db:
+        return (await db.execute(select(model).order_by(order_by))).scalars().all()
+
+
+@pytest.fixture
+async def doc():
+    async with TestSession() as db:
+        db.add(InternalDocument(
+            id="doc-1", ingestion_run_id="ing-1", manifest_id="m-1",
+            source_id="s-1", staged_document_id="stg-1",
+        ))
+        await db.commit()
+    return "doc-1"
+
+
+class TestBulkInsert:
+    @pytest.mark.asyncio
+    async def test_sections_and_tables_round_trip(self, doc):
+        flat = flatten_sections(_sections(), doc)
+        async with TestSession() as db:
+            await insert_sections(db, doc, flat)
+            await insert_tables(db, doc, [
+                ExtractedTable(id="tbl-000", caption="Limits", headers=["a"], rows=[["1"]]),
+            ])
+            await insert_sections(db, doc, [])
+            await db.commit()
+
+        sections = await _rows(DocumentSection, DocumentSection.id)
+        assert [(s.id, s.parent_id, s.position) for s in sections] == [
+            ("doc-1-s0", None, 0), ("doc-1-s1", "doc-1-s0", 0), ("doc-1-s2", None, 1),
+        ]
+        by_id = sorted(flat, key=lambda f: f.db_id)
+        assert [s.content_hash for s in sections] == [f.content_hash for f in by_id]
+        [table] = await _rows(DocumentTable, DocumentTable.id)
+        assert (table.id, table.rows) == ("doc-1-tbl-000", [["1"]])
+
+
+class TestWriteChunks:
+    @pytest.mark.asyncio
+    async def test_delta_is_applied_with_embeddings_and_metadata(self, doc):
+        first = reconcile_chunks(doc, flatten_sections(_sections(), doc), {}, [])
+        for chunk in first.added:
+            chunk.embedding = _X
+        async with TestSession() as db:
+            await write_chunks(db, doc, first, metadata={"jurisdiction": "federal"})
+            await db.commit()
+
+        before = await _rows(Chunk, Chunk.position)
+        assert len(before) == 3
+        assert all(c.chunk_metadata == {"jurisdiction": "federal"} for c in before)
+        assert all(list(c.embedding) == _X for c in before)
+
+        # Change one section: its chunk is replaced, the others keep id and vector
+        flat = flatten_sections(_sections("eight percent"), doc)
+        hashes = {f.db_id: f.content_hash for f in flatten_sections(_sections(), doc)}
+        async with TestSession() as db:
+            stored = await load_stored_chunks(db, doc)
+            assert all(s.embedded for s in stored)
+            second = reconcile_chunks(doc, flat, hashes, stored)
+            await write_chunks(db, doc, second)
+            await db.commit()
+
+        after = await _rows(Chunk, Chunk.position)
+        assert len(second.removed) == len(second.added) == 1
+        before_ids = {b.id for b in before}
+        assert [c.id for c in after if c.id in before_ids] == [c.id for c in second.kept]
+        assert "eight percent" in next(c.text for c in after if c.id == second.added[0].id)
+        assert next(c for c in after if c.id == second.added[0].id).embedding is None
+
+    @pytest.mark.asyncio
+    async def test_kept_chunks_embedded_late_get_their_vectors(self, doc):
+        flat = flatten_sections(_sections(), doc)
+        async with TestSession() as db:
+            await write_chunks(db, doc, reconcile_chunks(doc, flat, {}, []))
+            await db.commit()
+
+        hashes = {f.db_id: f.content_hash for f in flat}
+        async with TestSession() as db:
+            delta = reconcile_chunks(doc, flat, hashes, await load_stored_chunks(db, doc))
+            assert len(delta.to_embed) == 3 and not delta.added
+            for chunk in delta.to_embed:
+                chunk.embedding = _Y
+            await write_chunks(db, doc, delta)
+            await db.commit()
+
+        assert all(list(c.embedding) == _Y for c in await _rows(Chunk, Chunk.position))
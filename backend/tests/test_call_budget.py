@@ -0,0 +1,119 @@
+"""Tests for the shared call budget and concurrent multi-prompt L1."""
+
+import asyncio
+import json
+
+import pytest
+
+from app.agent.call_budget import CallBudget
+from app.agent.graph_discovery import DiscoveryGraph
+from app.config import settings
+from app.llm.base import LLMProvider
+from app.models.manifest import RegulatoryBody
+
+
+class TestCallBudget:
+    def test_reservations_are_all_or_nothing(self):
+        budget = CallBudget(limit=3)
+        assert budget.try_reserve("l1", 2)
+        assert not budget.try_reserve("l2", 2)
+        assert budget.try_reserve("l2")
+        assert budget.exhausted
+        assert budget.stats()["by_phase"] == {"l1": 2, "l2": 1}
+        assert budget.stats()["denied"] == 2
+
+    def test_release_returns_unused_calls(self):
+        budget = CallBudget(limit=2)
+        budget.try_reserve("l2")
+        budget.release("l2")
+        assert budget.remaining == 2
+        # Cannot release more than the phase reserved
+        budget.release("l2", 5)
+        assert budget.used == 0
+
+    def test_burn_down_is_downsampled(self):
+        budget = CallBudget(limit=100)
+        for _ in range(80):
+            budget.try_reserve("l2")
+        burn_down = budget.stats()["burn_down"]
+        assert len(burn_down) <= 26
+        assert burn_down[-1]["used"] == 80
+        assert burn_down[-1]["remaining"] == 20
+
+
+class _SlowFirstSectorLLM(LLMProvider):
+    """The first sector of each prompt answers last; tracks peak concurrency."""
+
+    def __init__(self):
+        self.calls = 0
+        self.in_flight = 0
+        self.peak = 0
+
+    async def complete(self, messages, **kwargs):
+        self.calls += 1
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        prompt = messages[-1]["content"]
+        label = "Alpha" if "Alpha" in prompt else "Beta"
+        await asyncio.sleep(0.05 if label == "Alpha" else 0)
+        self.in_flight -= 1
+        return json.dumps({
+            "administering_entities": [{"id": f"{label.lower()}-body", "name": f"{label} Body"}],
+            "sources": [],
+            "programs": [],
+        })
+
+    async def stream(self, messages, **kwargs):
+        yield await self.complete(messages, **kwargs)
+
+
+_SECTORS = [
+    {"key": "alpha", "label": "Alpha", "priority": 1},
+    {"key": "beta", "label": "Beta", "priority": 2},
+]
+
+
+class TestConcurrentL1:
+    @pytest.mark.asyncio
+    async def test_prompts_share_concurrency_and_release_results_in_order(self, mock_db):
+        llm = _SlowFirstSectorLLM()
+        graph = DiscoveryGraph(llm=llm, db=mock_db, manifest_id="budget-001")
+
+        events = [
+            e async for e in graph.run(
+                "Budget", k_depth=1, sectors=_SECTORS, sector_concurrency=4,
+                instruction_texts=["PROMPT ONE", "PROMPT TWO"],
+            )
+        ]
+
+        assert llm.calls == 4
+        # Both prompts ran at once rather than one after the other
+        assert llm.peak == 4
+        completes = [e["data"]["sector_key"] for e in events if e["event"] == "sector_complete"]
+        assert completes[:2] == ["beta", "beta"]
+        # ...but results are harvested in (prompt, sector) order
+        added = [o for c in mock_db.add.call_args_list for o in c.args]
+        bodies = [o.id for o in added if isinstance(o, RegulatoryBody)]
+        assert bodies == ["alpha-body", "beta-body"]
+        names = [e["event"] for e in events if e["event"].startswith("prompt_")]
+        assert names == ["prompt_start", "prompt_start", "prompt_complete", "prompt_complete"]
+
+    @pytest.mark.asyncio
+    async def test_l1_never_overshoots_budget(self, monkeypatch, mock_db):
+        monkeypatch.setattr(settings, "max_api_calls", 3)
+        llm = _SlowFirstSectorLLM()
+        graph = DiscoveryGraph(llm=llm, db=mock_db, manifest_id="budget-002")
+
+        events = [
+            e async for e in graph.run(
+                "Budget", k_depth=1, sectors=_SECTORS, sector_concurrency=4,
+                instruction_texts=["PROMPT ONE", "PROMPT TWO"],
+            )
+        ]
+
+        assert llm.calls == 3
+        budget = events[-1]["data"]["queue_stats"]["budget"]
+        assert budget["used"] == 3
+        assert budget["remaining"] == 0
+        assert budget["by_phase"] == {"l1": 3}
+        assert len([e for e in events if e["event"] == "prompt_complete"]) == 2
@@ -0,0 +1,351 @@
+"""Tests for the change monitor: conditional GETs, sharded sweeps and resume."""
+
+import asyncio
+import hashlib
+from datetime import UTC, datetime, timedelta
+
+import httpx
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.database import Base
+from app.feedback import monitor
+from app.models.acquisition import StagedDocument
+from app.models.feedback import (
+    ChangeEvent,
+    MonitorShardStatus,
+    MonitorSweep,
+    MonitorSweepShard,
+    MonitorSweepStatus,
+    SourceFetchState,
+)
+from app.models.ingestion import InternalDocument
+from app.models.manifest import Source
+from app.services.feedback_service import get_accuracy_dashboard
+from tests.conftest import TestSession
+
+
+def _sha(body: bytes) -> str:
+    return f"sha256:{hashlib.sha256(body).hexdigest()}"
+
+
+async def _seed(*sources: tuple[str, str, bytes | None], states=(), session=TestSession) -> None:
+    """Indexed sources as (source_id, url, staged body)."""
+    async with session() as db:
+        for source_id, url, staged in sources:
+            db.add(Source(
+                id=source_id, manifest_id="m-1", name=source_id, regulatory_body_id="rb",
+                type="regulation", format="html", authority="binding",
+                jurisdiction="federal", url=url, access_method="scrape",
+            ))
+            db.add(StagedDocument(
+                id=f"stg-{source_id}", manifest_id="m-1", source_id=source_id,
+                acquisition_method="scrape", content_hash=_sha(staged) if staged else "",
+                content_type="text/html", raw_content_path="",
+            ))
+            db.add(InternalDocument(
+                id=f"doc-{source_id}", ingestion_run_id="ing-1", manifest_id="m-1",
+                source_id=source_id, staged_document_id=f"stg-{source_id}",
+                content_hash="sha256:text",
+            ))
+        for state in states:
+            db.add(state)
+        await db.commit()
+
+
+def _use_transport(monkeypatch, handler):
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(monitor, "get_http_client", lambda: client)
+
+
+async def _run(**kwargs) -> dict:
+    async with TestSession() as db:
+        return await monitor.run_change_monitor(db, **kwargs)
+
+
+async def _all(model, session=TestSession):
+    async with session() as db:
+        return (await db.execute(select(model))).scalars().all()
+
+
+@pytest.fixture(autouse=True)
+def _small_sweeps(monkeypatch):
+    monkeypatch.setattr(monitor.settings, "monitor_shards", 4)
+    monkeypatch.setattr(monitor.settings, "monitor_batch_size", 2)
+    monkeypatch.setattr(monitor, "async_session", TestSession)
+
+
+@pytest.fixture
+async def file_session(monkeypatch, tmp_path):
+    """Sessions on a file database: concurrent workers need real separate
+    connections, which the shared in-memory test database does not give them."""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'monitor.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    monkeypatch.setattr(monitor, "async_session", session)
+    yield session
+    await engine.dispose()
+
+
+class TestConditionalGet:
+    @pytest.mark.asyncio
+    async def test_sends_validators_and_short_circuits_on_304(self, monkeypatch):
+        seen = {}
+
+        def handler(request):
+            seen.update(request.headers)
+            return httpx.Response(304)
+
+        _use_transport(monkeypatch, handler)
+        await _seed(("s-1", "https://www.ecfr.gov/t12", b"v1"), states=[SourceFetchState(
+            source_id="s-1", manifest_id="m-1", etag='"v1"',
+            last_modified="Tue, 01 Oct 2026 00:00:00 GMT", content_hash=_sha(b"v1"),
+        )])
+
+        summary = await _run()
+
+        assert seen["if-none-match"] == '"v1"'
+        assert seen["if-modified-since"] == "Tue, 01 Oct 2026 00:00:00 GMT"
+        assert summary["not_modified"] == 1
+        assert summary["bytes_downloaded"] == 0
+        assert summary["changes_detected"] == 0
+        [state] = await _all(SourceFetchState)
+        assert state.last_status == 304
+        assert state.etag == '"v1"'
+
+    @pytest.mark.asyncio
+    async def test_first_sweep_compares_against_staged_raw_hash(self, monkeypatch):
+        bodies = {"/same": b"unchanged", "/new": b"amended text"}
+
+        def handler(request):
+            return httpx.Response(200, headers={"etag": '"e"'}, content=bodies[request.url.path])
+
+        _use_transport(monkeypatch, handler)
+        await _seed(
+            ("same", "https://a.gov/same", b"unchanged"),
+            ("new", "https://a.gov/new", b"original text"),
+        )
+
+        summary = await _run()
+
+        assert summary["sources_checked"] == 2
+        assert summary["changes_detected"] == 1
+        events = await _all(ChangeEvent)
+        assert [e.source_id for e in events] == ["new"]
+        assert events[0].current_hash == _sha(b"amended text")
+        states = {s.source_id: s for s in await _all(SourceFetchState)}
+        assert states["same"].etag == '"e"'
+        assert states["same"].content_hash == _sha(b"unchanged")
+
+    @pytest.mark.asyncio
+    async def test_errors_are_counted_not_raised(self, monkeypatch):
+        def handler(request):
+            if request.url.host == "down.gov":
+                raise httpx.ConnectError("refused")
+            return httpx.Response(404)
+
+        _use_transport(monkeypatch, handler)
+        await _seed(("a", "https://down.gov/a", None), ("b", "https://gone.gov/b", None))
+
+        summary = await _run()
+
+        assert summary["errors"] == 1
+        assert summary["changes_detected"] == 0
+        assert [s.last_status for s in await _all(SourceFetchState)] == [404]
+
+    @pytest.mark.asyncio
+    async def test_malformed_url_is_an_error_not_a_crash(self, monkeypatch):
+        _use_transport(monkeypatch, lambda request: httpx.Response(200, content=b"ok"))
+        monkeypatch.setattr(monitor.settings, "monitor_shards", 1)
+        await _seed(
+            ("bad", "http://x\x00y/", None),
+            ("nbsp", "https://exa\xa0mple.com/a", None),
+            ("good", "https://ok.gov/a", None),
+        )
+
+        summary = await _run()
+
+        assert summary["errors"] == 2
+        assert summary["sources_checked"] == 3
+        assert [s.source_id for s in await _all(SourceFetchState)] == ["good"]
+        assert [s.status for s in await _all(MonitorSweep)] == [MonitorSweepStatus.complete]
+
+    @pytest.mark.asyncio
+    async def test_sources_are_probed_concurrently(self, monkeypatch):
+        in_flight = 0
+        peak = 0
+
+        async def handler(request):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.02)
+            in_flight -= 1
+            return httpx.Response(304)
+
+        _use_transport(monkeypatch, handler)
+        monkeypatch.setattr(monitor.settings, "monitor_concurrency", 3)
+        monkeypatch.setattr(monitor.settings, "monitor_batch_size", 6)
+        await _seed(*[(f"s{i}", f"https://h.gov/{i}", None) for i in range(6)])
+
+        await _run()
+        assert peak == 3
+
+
+class TestShardedSweeps:
+    def test_sources_of_one_host_share_a_shard(self):
+        shard = monitor.shard_of("https://a.gov/x", 16)
+        assert shard == monitor.shard_of("https://a.gov/y?z=1", 16)
+        assert monitor.shard_of("https://a.gov/x", 1) == 0
+
+    @pytest.mark.asyncio
+    async def test_workers_split_shards_and_finalize_sweep(self, monkeypatch, file_session):
+        session = file_session
+        _use_transport(monkeypatch, lambda request: httpx.Response(304))
+        sources = [(f"s{i}", f"https://host{i}.gov/doc", None) for i in range(10)]
+        await _seed(*sources, session=session)
+
+        summary = await monitor.run_change_monitor_workers(workers=3)
+
+        assert summary["sweep_status"] == MonitorSweepStatus.complete
+        assert summary["sources_checked"] == 10
+        assert summary["shards_processed"] == [0, 1, 2, 3]
+        [sweep] = await _all(MonitorSweep, session)
+        assert sweep.status == MonitorSweepStatus.complete
+        assert sweep.sources_checked == 10
+        assert sweep.not_modified == 10
+        assert sweep.completed_at is not None
+        assert sweep.duration_s >= 0
+        shards = await _all(MonitorSweepShard, session)
+        assert all(s.status == MonitorShardStatus.complete for s in shards)
+        assert sum(s.sources_total for s in shards) == 10
+
+    @pytest.mark.asyncio
+    async def test_next_run_starts_a_new_sweep(self, monkeypatch):
+        _use_transport(monkeypatch, lambda request: httpx.Response(304))
+        await _seed(("s-1", "https://a.gov/x", None))
+
+        first = await _run()
+        second = await _run()
+
+        assert first["sweep_id"] != second["sweep_id"]
+        assert second["sources_checked"] == 1
+
+    @pytest.mark.asyncio
+    async def test_abandoned_shard_resumes_from_cursor(self, monkeypatch):
+        monkeypatch.setattr(monitor.settings, "monitor_shards", 1)
+        requested = []
+
+        def handler(request):
+            requested.append(request.url.path)
+            return httpx.Response(304)
+
+        _use_transport(monkeypatch, handler)
+        await _seed(*[(f"s{i}", f"https://a.gov/{i}", None) for i in range(5)])
+
+        # A worker checked s0 and s1, then died holding the lease
+        async with TestSession() as db:
+            sweep = await monitor.ensure_sweep(db)
+            shard = await db.get(MonitorSweepShard, (sweep.id, 0))
+            shard.status = MonitorShardStatus.running
+            shard.worker_id = "dead"
+            shard.cursor_manifest_id, shard.cursor_source_id = "m-1", "s1"
+            shard.sources_checked = shard.not_modified = 2
+            shard.heartbeat_at = datetime.now(UTC) - timedelta(hours=1)
+            await db.commit()
+
+        summary = await _run()
+
+        assert sorted(requested) == ["/2", "/3", "/4"]
+        assert summary["sources_checked"] == 3
+        assert summary["sweep_status"] == MonitorSweepStatus.complete
+        [sweep] = await _all(MonitorSweep)
+        assert sweep.sources_checked == 5
+
+    @pytest.mark.asyncio
+    async def test_reclaimed_shard_is_not_written_by_its_old_worker(
+        self, monkeypatch, file_session
+    ):
+        monkeypatch.setattr(monitor.settings, "monitor_shards", 1)
+
+        async def handler(request):
+            if request.url.path == "/2":
+                # Another worker takes the shard over while this batch runs
+                async with file_session() as db:
+                    [shard] = (await db.execute(select(MonitorSweepShard))).scalars().all()
+                    shard.worker_id = "thief"
+                    await db.commit()
+            return httpx.Response(304)
+
+        _use_transport(monkeypatch, handler)
+        await _seed(*[(f"s{i}", f"https://a.gov/{i}", None) for i in range(4)],
+                    session=file_session)
+
+        async with file_session() as db:
+            summary = await monitor.run_change_monitor(db, worker_id="slow")
+
+        assert summary["shards_processed"] == []
+        assert summary["sources_checked"] == 2
+        [shard] = await _all(MonitorSweepShard, file_session)
+        assert shard.worker_id == "thief"
+        assert shard.status == MonitorShardStatus.running
+        assert shard.sources_checked == 2
+        assert shard.cursor_source_id == "s1"
+
+    @pytest.mark.asyncio
+    async def test_long_batch_keeps_renewing_its_lease(self, monkeypatch, file_session):
+        monkeypatch.setattr(monitor.settings, "monitor_shards", 1)
+        monkeypatch.setattr(monitor.settings, "monitor_shard_lease_seconds", 0.06)
+        claimed_at = datetime.now(UTC)
+        heartbeats = []
+
+        async def handler(request):
+            await asyncio.sleep(0.15)
+            async with file_session() as db:
+                [shard] = (await db.execute(select(MonitorSweepShard))).scalars().all()
+                heartbeats.append(shard.heartbeat_at.replace(tzinfo=UTC))
+            return httpx.Response(304)
+
+        _use_transport(monkeypatch, handler)
+        await _seed(("s0", "https://a.gov/0", None), session=file_session)
+
+        async with file_session() as db:
+            summary = await monitor.run_change_monitor(db, worker_id="w")
+
+        assert summary["shards_processed"] == [0]
+        # Renewed mid-request, well after the claim
+        assert heartbeats[0] - claimed_at >= timedelta(seconds=0.1)
+
+    @pytest.mark.asyncio
+    async def test_live_lease_is_not_stolen(self, monkeypatch):
+        monkeypatch.setattr(monitor.settings, "monitor_shards", 1)
+        _use_transport(monkeypatch, lambda request: httpx.Response(304))
+        await _seed(("s-1", "https://a.gov/x", None))
+
+        async with TestSession() as db:
+            sweep = await monitor.ensure_sweep(db)
+            shard = await db.get(MonitorSweepShard, (sweep.id, 0))
+            shard.status = MonitorShardStatus.running
+            shard.heartbeat_at = datetime.now(UTC)
+            await db.commit()
+
+        summary = await _run()
+
+        assert summary["shards_processed"] == []
+        assert summary["sweep_status"] == MonitorSweepStatus.running
+
+    @pytest.mark.asyncio
+    async def test_dashboard_reports_latest_sweep(self, monkeypatch):
+        _use_transport(monkeypatch, lambda request: httpx.Response(304))
+        await _seed(("s-1", "https://a.gov/x", None), ("s-2", "https://b.gov/y", None))
+        await _run()
+
+        async with TestSession() as db:
+            dashboard = await get_accuracy_dashboard(db)
+
+        assert dashboard.monitor is not None
+        assert dashboard.monitor.status == MonitorSweepStatus.complete
+        assert dashboard.monitor.sources_checked == 2
+        assert dashboard.monitor.shards_complete == dashboard.monitor.shard_count == 4
@@ -0,0 +1,60 @@
+"""Tests for the single-pass citation scanner."""
+
+import pytest
+
+from app.ingestion.citations import DATE_WINDOW, normalize_citation, scan_citations
+
+
+class TestReferences:
+    @pytest.mark.parametrize(
+        ("text", "key"),
+        [
+            ("12 CFR 1026.37", "12 CFR 1026.37"),
+            ("12 C.F.R. Part 1026", "12 CFR 1026"),
+            ("15 U.S.C. § 1601", "15 U.S.C. 1601"),
+            ("15 U.S.C. 1601", "15 U.S.C. 1601"),
+            ("Public Law 111-203", "Pub. L. 111-203"),
+            ("P.L. 111-203", "Pub. L. 111-203"),
+            ("Pub. L. No. 111-203", "Pub. L. 111-203"),
+            ("Section 1026.2", "§ 1026.2"),
+            ("§1026.2(a)(1)", "§ 1026.2"),
+        ],
+    )
+    def test_citations_are_normalized(self, text, key):
+        assert scan_citations(f"See {text} for details.").references == [key]
+        assert normalize_citation(text) == key
+
+    def test_references_are_unique_and_in_order(self):
+        text = "Under 12 C.F.R. 1026 and § 1026.2, and again under 12 CFR 1026, see P.L. 111-203."
+        assert scan_citations(text).references == ["12 CFR 1026", "§ 1026.2", "Pub. L. 111-203"]
+
+    def test_section_sign_inside_usc_citation_is_not_a_separate_reference(self):
+        scan = scan_citations("Pursuant to 15 U.S.C. § 1601 et seq.")
+        assert scan.references == ["15 U.S.C. 1601"]
+
+    def test_anchors_without_numbers_are_ignored(self):
+        scan = scan_citations("The CFR and the U.S.C. are codes; see this Section.")
+        assert scan.references == []
+
+    def test_title_spanning_a_line_break(self):
+        assert scan_citations("title\n12\nCFR 208").references == ["12 CFR 208"]
+
+    def test_unrecognized_text_is_returned_stripped(self):
+        assert normalize_citation("  src-002 ") == "src-002"
+
+
+class TestDates:
+    def test_effective_date_beats_earlier_publication_date(self):
+        scan = scan_citations("Published March 3, 2024. This rule is effective July 1, 2024.")
+        assert scan.effective_date == "July 1, 2024"
+        assert scan.dates["dated"] == "March 3, 2024"
+
+    def test_falls_back_through_date_forms(self):
+        assert scan_citations("Amended 06/30/2023 and 2023-07-01.").effective_date == "06/30/2023"
+        assert scan_citations("Amended 2023-07-01.").effective_date == "2023-07-01"
+
+    def test_dates_past_the_window_are_ignored(self):
+        text = "x" * DATE_WINDOW + " effective January 1, 2025 under 12 CFR 1026"
+        scan = scan_citations(text)
+        assert scan.effective_date is None
+        assert scan.references == ["12 CFR 1026"]
@@ -1,11 +1,12 @@
 """Tests for curation pipeline — quality gates and metadata extraction."""
 
+import pytest
+
 from app.ingestion.base import ExtractedDocument, ExtractedSection
-from app.ingestion.curation import (
-    _detect_cross_references,
-    _extract_effective_date,
-    _run_quality_gates,
-)
+from app.ingestion.citations import scan_citations
+from app.ingestion.curation import _run_quality_gates, run_curation
+from app.models.ingestion import InternalDocument
+from tests.conftest import TestSession
 
 
 def _make_extracted(text: str = "A" * 200, title: str = "Test", sections: int = 1):
@@ -19,38 +20,54 @@ def _make_extracted(text: str = "A" * 200, title: str = "Test", sections: int =
 class TestEffectiveDateExtraction:
     def test_extracts_effective_date(self):
         text = "This regulation is effective January 1, 2025 and applies to all lenders."
-        date = _extract_effective_date(text)
+        date = scan_citations(text).effective_date
         assert date is not None
         assert "2025" in date
 
     def test_extracts_iso_date(self):
         text = "Published on 2024-06-15 in the Federal Register."
-        date = _extract_effective_date(text)
+        date = scan_citations(text).effective_date
         assert date == "2024-06-15"
 
     def test_no_date_returns_none(self):
         text = "This is a general regulatory overview."
-        date = _extract_effective_date(text)
+        date = scan_citations(text).effective_date
         assert date is None
 
 
 class TestCrossReferenceDetection:
     def test_detects_cfr_references(self):
         text = "See 12 CFR 1026.37 for disclosure requirements."
-        refs = _detect_cross_references(text)
+        refs = scan_citations(text).references
         assert len(refs) > 0
         assert any("CFR" in r for r in refs)
 
     def test_detects_section_symbols(self):
         text = "As defined in § 1026.2(a)(1)."
-        refs = _detect_cross_references(text)
+        refs = scan_citations(text).references
         assert len(refs) > 0
 
     def test_detects_usc_references(self):
         text = "Pursuant to 15 U.S.C. § 1601."
-        refs = _detect_cross_references(text)
+        refs = scan_citations(text).references
         assert len(refs) > 0
 
+    @pytest.mark.asyncio
+    async def test_manifest_references_merge_with_scanned_ones(self):
+        text = "See 12 CFR 1026.37 for disclosure requirements. " + "A" * 200
+        relationships = {"cross_references": ["12 C.F.R. 1026.37", "Regulation Z"]}
+        async with TestSession() as db:
+            doc = InternalDocument(
+                id="doc-1", ingestion_run_id="ing-1", manifest_id="m-1",
+                source_id="doc-1", staged_document_id="stg-doc-1", full_text=text,
+            )
+            db.add(doc)
+            await db.flush()
+            result = await run_curation(
+                doc, _make_extracted(text=text), {"relationships": relationships}, db
+            )
+        assert result.cross_references == ["12 CFR 1026.37", "Regulation Z"]
+
 
 class TestQualityGates:
     def test_all_gates_pass(self):
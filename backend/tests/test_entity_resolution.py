@@ -0,0 +1,88 @@
+"""Tests for fuzzy entity resolution in EntityRegistry."""
+
+from app.agent.entity_resolution import EntityResolutionIndex, normalize_entity_name
+from app.agent.graph_discovery import EntityRegistry
+
+_CALHFA = [
+    {"id": "calhfa", "name": "California Housing Finance Agency", "jurisdiction_code": "CA"},
+    {"id": "ca-hfa", "name": "CA Housing Finance Agency", "jurisdiction_code": "CA"},
+]
+
+
+class TestNormalizeEntityName:
+    def test_abbreviations_and_state_codes_expand(self):
+        assert normalize_entity_name("NJ Dept. of Banking & Insurance") == (
+            "new jersey department banking insurance"
+        )
+        assert normalize_entity_name("New Jersey Department of Banking and Insurance") == (
+            "new jersey department banking insurance"
+        )
+
+    def test_lowercase_words_are_not_state_codes(self):
+        assert normalize_entity_name("Office in Oregon") == "office oregon"
+
+    def test_parenthetical_acronym_dropped(self):
+        assert normalize_entity_name("Department of Labor (DOL)") == "department labor"
+
+
+class TestEntityResolutionIndex:
+    def test_query_is_blocked_by_jurisdiction(self):
+        index = EntityResolutionIndex(threshold=0.85)
+        vecs = index.vectorize(["Department of Insurance", "Department of Insurance"])
+        index.add(vecs[0], "CA", "ca-doi")
+        best, scores = index.query(vecs[1:], ["TX"])
+        assert best[0] == -1
+
+    def test_index_grows_past_initial_capacity(self):
+        index = EntityResolutionIndex(initial_capacity=2)
+        names = [f"Agency Number {i}" for i in range(5)]
+        vecs = index.vectorize(names)
+        for i, vec in enumerate(vecs):
+            index.add(vec, "XX", f"agency-{i}")
+        best, scores = index.query(vecs[3:4], ["XX"])
+        assert index.label(int(best[0])) == "agency-3"
+        assert scores[0] > 0.99
+
+
+class TestEntityRegistryFuzzy:
+    def test_variant_spelling_resolves_to_first_id(self):
+        registry = EntityRegistry(fuzzy_threshold=0.85)
+        first = registry.resolve({
+            "id": "nj-dobi", "name": "NJ Dept. of Banking & Insurance", "jurisdiction_code": "NJ",
+        })
+        second = registry.resolve({
+            "id": "new-jersey-department-of-banking",
+            "name": "New Jersey Department of Banking and Insurance",
+            "jurisdiction_code": "NJ",
+        })
+        assert first == second == "nj-dobi"
+        assert registry.resolve_id("new-jersey-department-of-banking") == "nj-dobi"
+        stats = registry.stats()
+        assert stats["fuzzy_merges"] == 1
+        assert stats["calls_saved"] == 1
+        assert stats["canonical_entities"] == 1
+
+    def test_distinct_entities_stay_separate(self):
+        registry = EntityRegistry(fuzzy_threshold=0.85)
+        ids = registry.resolve_many([
+            {
+                "id": "nj-banking", "name": "New Jersey Department of Banking",
+                "jurisdiction_code": "NJ",
+            },
+            {
+                "id": "nj-ins", "name": "New Jersey Department of Insurance",
+                "jurisdiction_code": "NJ",
+            },
+        ])
+        assert ids == ["nj-banking", "nj-ins"]
+
+    def test_batch_merges_variants_within_the_same_response(self):
+        registry = EntityRegistry(fuzzy_threshold=0.85)
+        rewritten = registry.rewrite_many(_CALHFA)
+        assert [e["id"] for e in rewritten] == ["calhfa", "calhfa"]
+
+    def test_zero_threshold_keeps_exact_matching(self):
+        registry = EntityRegistry(fuzzy_threshold=0)
+        ids = registry.resolve_many(_CALHFA)
+        assert ids == ["calhfa", "ca-hfa"]
+        assert registry.stats()["fuzzy_merges"] == 0
@@ -1,4 +1,9 @@
-from app.eval.metrics import manifest_accuracy, scrape_completion, source_recall
+from app.eval.metrics import (
+    entity_resolution_quality,
+    manifest_accuracy,
+    scrape_completion,
+    source_recall,
+)
 
 
 def test_manifest_accuracy_perfect():
@@ -51,3 +56,24 @@ def test_scrape_completion():
 
     result = scrape_completion(50, 100)
     assert result.passed is False
+
+
+def test_entity_resolution_quality_pairwise():
+    predicted = {
+        "NJ:nj dobi": "nj-dobi",
+        "NJ:new jersey dobi": "nj-dobi",
+        "NJ:nj banking": "nj-dobi",  # wrong merge
+        "NJ:njhmfa": "njhmfa",
+        "NJ:nj housing agency": "nj-housing",  # missed merge
+    }
+    gt = {
+        "NJ:nj dobi": "dobi",
+        "NJ:new jersey dobi": "dobi",
+        "NJ:nj banking": "banking",
+        "NJ:njhmfa": "hmfa",
+        "NJ:nj housing agency": "hmfa",
+    }
+    precision, recall = entity_resolution_quality(predicted, gt)
+    assert round(precision.value, 3) == 0.333
+    assert recall.value == 0.5
+    assert precision.passed is False
@@ -0,0 +1,175 @@
+"""Tests for feedback rollups, the accuracy dashboard and the snapshot job."""
+
+import pytest
+from sqlalchemy import event, select
+
+from app.models.feedback import AccuracySnapshot, FeedbackRollup, ResponseFeedback
+from app.services import feedback_service
+from tests.conftest import TestSession, test_engine
+
+
+async def _submit(db, n: int, feedback_type: str) -> list[str]:
+    ids = []
+    for i in range(n):
+        fb = await feedback_service.create_feedback(
+            db, f"fb-{feedback_type}-{i}", "q-1", feedback_type, None, "", "tester",
+        )
+        ids.append(fb.id)
+    await db.commit()
+    return ids
+
+
+async def _rollups(db) -> dict[tuple[str, str], int]:
+    rows = await db.execute(
+        select(FeedbackRollup.feedback_type, FeedbackRollup.status, FeedbackRollup.count)
+    )
+    return {(t, s): n for t, s, n in rows.all() if n}
+
+
+@pytest.mark.asyncio
+async def test_rollups_track_create_and_resolve():
+    async with TestSession() as db:
+        correct = await _submit(db, 3, "correct")
+        inaccurate = await _submit(db, 1, "inaccurate")
+        await feedback_service.resolve_feedback(db, inaccurate[0], "fixed")
+        await feedback_service.resolve_feedback(db, correct[0], "ok", status="dismissed")
+
+        assert await _rollups(db) == {
+            ("correct", "pending"): 2,
+            ("correct", "dismissed"): 1,
+            ("inaccurate", "resolved"): 1,
+        }
+        dashboard = await feedback_service.get_accuracy_dashboard(db)
+
+    current = dashboard.current
+    assert current.total_feedback == 4
+    assert current.correct_count == 3
+    assert current.inaccurate_count == 1
+    assert current.accuracy_score == 0.75
+    assert current.resolution_rate == 0.5
+    assert dashboard.by_feedback_type["outdated"] == 0
+
+
+@pytest.mark.asyncio
+async def test_dashboard_query_count_is_independent_of_feedback_volume():
+    async def dashboard_statements() -> list[str]:
+        statements: list[str] = []
+
+        def record(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(test_engine.sync_engine, "before_cursor_execute", record)
+        try:
+            async with TestSession() as db:
+                await feedback_service.get_accuracy_dashboard(db)
+        finally:
+            event.remove(test_engine.sync_engine, "before_cursor_execute", record)
+        return statements
+
+    async with TestSession() as db:
+        await _submit(db, 2, "correct")
+    few = await dashboard_statements()
+
+    async with TestSession() as db:
+        await _submit(db, 50, "outdated")
+    many = await dashboard_statements()
+
+    assert len(few) == len(many)
+    assert not any("response_feedback" in s for s in many)
+
+
+@pytest.mark.asyncio
+async def test_rollup_bump_is_one_upsert():
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    async with TestSession() as db:
+        event.listen(test_engine.sync_engine, "before_cursor_execute", record)
+        try:
+            await feedback_service._bump_rollup(db, "correct", "pending", 1)
+            await feedback_service._bump_rollup(db, "correct", "pending", 1)
+        finally:
+            event.remove(test_engine.sync_engine, "before_cursor_execute", record)
+        await db.commit()
+        assert await _rollups(db) == {("correct", "pending"): 2}
+
+    assert len(statements) == 2
+    assert all("ON CONFLICT" in s for s in statements)
+
+
+@pytest.mark.asyncio
+async def test_resolving_without_backfilled_rollups_never_goes_negative():
+    async with TestSession() as db:
+        db.add(ResponseFeedback(id="fb-old", query_id="q-1", feedback_type="inaccurate"))
+        await db.commit()
+
+        await feedback_service.resolve_feedback(db, "fb-old", "fixed")
+        counts = (await db.execute(select(FeedbackRollup.count))).scalars().all()
+        assert await _rollups(db) == {("inaccurate", "resolved"): 1}
+
+    assert min(counts) == 0
+
+
+@pytest.mark.asyncio
+async def test_uncounted_feedback_keeps_the_dashboard_consistent():
+    async with TestSession() as db:
+        await _submit(db, 1, "correct")
+        for i in range(2):
+            db.add(ResponseFeedback(id=f"fb-old-{i}", query_id="q-1", feedback_type="inaccurate"))
+        await db.commit()
+
+        for i in range(2):
+            await feedback_service.resolve_feedback(db, f"fb-old-{i}", "fixed")
+        counts = (await db.execute(select(FeedbackRollup.count))).scalars().all()
+        dashboard = await feedback_service.get_accuracy_dashboard(db)
+
+    assert min(counts) == 0
+    assert dashboard.current.total_feedback == 3
+    assert dashboard.current.resolution_rate == round(2 / 3, 3)
+
+
+@pytest.mark.asyncio
+async def test_dashboard_rebuilds_empty_rollups():
+    async with TestSession() as db:
+        db.add(ResponseFeedback(id="fb-1", query_id="q-1", feedback_type="correct"))
+        db.add(ResponseFeedback(id="fb-2", query_id="q-2", feedback_type="outdated"))
+        await db.commit()
+
+        dashboard = await feedback_service.get_accuracy_dashboard(db)
+
+    assert dashboard.current.total_feedback == 2
+    assert dashboard.by_feedback_type["outdated"] == 1
+    async with TestSession() as db:
+        assert await _rollups(db) == {("correct", "pending"): 1, ("outdated", "pending"): 1}
+
+
+@pytest.mark.asyncio
+async def test_snapshot_recounts_rollups():
+    async with TestSession() as db:
+        await _submit(db, 2, "correct")
+        # Rows written around the service leave the rollups behind
+        db.add(ResponseFeedback(id="fb-direct", query_id="q-2", feedback_type="inaccurate"))
+        db.add(FeedbackRollup(feedback_type="irrelevant", status="pending", count=5))
+        await db.commit()
+
+        snapshot = await feedback_service.take_accuracy_snapshot(db)
+        assert await _rollups(db) == {("correct", "pending"): 2, ("inaccurate", "pending"): 1}
+
+    assert snapshot.total_feedback == 3
+    assert snapshot.inaccurate_count == 1
+    assert snapshot.irrelevant_count == 0
+    assert snapshot.accuracy_score == round(2 / 3, 3)
+    async with TestSession() as db:
+        assert (await db.execute(select(AccuracySnapshot))).scalars().one().total_feedback == 3
+
+
+@pytest.mark.asyncio
+async def test_submit_endpoint_updates_dashboard(client):
+    resp = await client.post("/api/feedback", json={"query_id": "q-1", "feedback_type": "correct"})
+    assert resp.status_code == 201
+
+    dashboard = (await client.get("/api/accuracy/dashboard")).json()
+    assert dashboard["current"]["total_feedback"] == 1
+    assert dashboard["by_feedback_type"]["correct"] == 1
@@ -2,7 +2,6 @@
 
 import json
 import pytest
-from unittest.mock import AsyncMock, MagicMock
 
 from app.agent.graph_discovery import DiscoveryGraph, _SEED_TO_ENTITY_TYPE
 from app.llm.base import Citation, LLMProvider
@@ -104,24 +103,6 @@ class MockLLM(LLMProvider):
         return text, citations
 
 
-@pytest.fixture
-def mock_db():
-    """Create a mock async database session."""
-    db = AsyncMock()
-    db.add = MagicMock()
-    db.flush = AsyncMock()
-    db.commit = AsyncMock()
-
-    mock_manifest = MagicMock()
-    mock_manifest.jurisdiction_hierarchy = None
-    mock_manifest.coverage_summary = None
-    mock_manifest.status = None
-    mock_manifest.completeness_score = None
-    db.get = AsyncMock(return_value=mock_manifest)
-
-    return db
-
-
 # ---------------------------------------------------------------------------
 # Tests: Instantiation
 # ---------------------------------------------------------------------------
@@ -471,7 +452,7 @@ class TestSeedToEntityMapping:
 # ---------------------------------------------------------------------------
 
 class TestMultiPromptL1Loop:
-    """Tests for _run_l1_prompts() serial coordinator."""
+    """Tests for _run_l1_prompts() multi-prompt coordinator."""
 
     @pytest.mark.asyncio
     async def test_multi_prompt_fires_all_sector_passes(self, mock_db):
@@ -0,0 +1,190 @@
+"""Tests for the shared outbound HTTP client pool."""
+
+import asyncio
+import http.server
+import socket
+import threading
+
+import httpcore
+import httpx
+import pytest
+
+from app import http_client
+from app.config import settings
+
+
+class _FakeBackend(httpcore.AsyncNetworkBackend):
+    def __init__(self, fail: set[str] | None = None):
+        self.connected: list[str] = []
+        self.fail = fail or set()
+
+    async def connect_tcp(self, host, port, timeout=None, local_address=None, socket_options=None):
+        self.connected.append(host)
+        if host in self.fail:
+            raise httpcore.ConnectError(f"refused: {host}")
+        return object()
+
+    async def connect_unix_socket(self, path, timeout=None, socket_options=None):
+        raise NotImplementedError
+
+    async def sleep(self, seconds):
+        await asyncio.sleep(seconds)
+
+
+@pytest.fixture
+def local_server():
+    """A keep-alive HTTP/1.1 server on localhost; yields its base URL."""
+
+    class Handler(http.server.BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            self.send_response(200)
+            self.send_header("Content-Length", "2")
+            self.end_headers()
+            self.wfile.write(b"ok")
+
+        def log_message(self, *args):
+            pass
+
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+class TestCachingResolver:
+    @pytest.mark.asyncio
+    async def test_lookups_are_cached_within_ttl(self, monkeypatch):
+        backend = http_client._CachingResolverBackend(_FakeBackend(), ttl_seconds=60)
+        lookups = []
+
+        async def fake_getaddrinfo(host, port, **kwargs):
+            lookups.append(host)
+            return [(None, None, None, "", ("192.0.2.10", port))]
+
+        monkeypatch.setattr(asyncio.get_running_loop(), "getaddrinfo", fake_getaddrinfo)
+        await backend.connect_tcp("www.ecfr.gov", 443)
+        await backend.connect_tcp("www.ecfr.gov", 443)
+
+        assert lookups == ["www.ecfr.gov"]
+        assert backend.connections_opened == 2
+        assert backend.cache_size() == 1
+
+    @pytest.mark.asyncio
+    async def test_falls_through_addresses_and_drops_failed_entry(self, monkeypatch):
+        inner = _FakeBackend(fail={"192.0.2.1"})
+        backend = http_client._CachingResolverBackend(inner, ttl_seconds=60)
+
+        async def fake_getaddrinfo(host, port, **kwargs):
+            return [
+                (None, None, None, "", ("192.0.2.1", port)),
+                (None, None, None, "", ("192.0.2.2", port)),
+            ]
+
+        monkeypatch.setattr(asyncio.get_running_loop(), "getaddrinfo", fake_getaddrinfo)
+        await backend.connect_tcp("www.govinfo.gov", 443)
+        assert inner.connected == ["192.0.2.1", "192.0.2.2"]
+
+        inner.fail.add("192.0.2.2")
+        with pytest.raises(httpcore.ConnectError):
+            await backend.connect_tcp("www.govinfo.gov", 443)
+        assert backend.cache_size() == 0
+
+    @pytest.mark.asyncio
+    async def test_ip_literals_skip_resolution(self):
+        inner = _FakeBackend()
+        backend = http_client._CachingResolverBackend(inner, ttl_seconds=60)
+        await backend.connect_tcp("127.0.0.1", 8080)
+        assert inner.connected == ["127.0.0.1"]
+        assert backend.dns_lookups == 0
+
+
+class TestHostLimitedTransport:
+    @pytest.mark.asyncio
+    async def test_per_host_limit_holds_until_body_closed(self, monkeypatch):
+        monkeypatch.setattr(settings, "http_max_connections_per_host", 2)
+        in_flight: dict[str, int] = {}
+        peak: dict[str, int] = {}
+
+        async def handler(request):
+            host = request.url.host
+            in_flight[host] = in_flight.get(host, 0) + 1
+            peak[host] = max(peak.get(host, 0), in_flight[host])
+            await asyncio.sleep(0.02)
+            in_flight[host] -= 1
+            return httpx.Response(200, text=host)
+
+        client = http_client._build_client(inner=httpx.MockTransport(handler))
+        urls = [f"https://busy.gov/{i}" for i in range(5)] + ["https://quiet.gov/"]
+        responses = await asyncio.gather(*(client.get(u) for u in urls))
+        await client.aclose()
+
+        assert all(r.status_code == 200 for r in responses)
+        assert peak["busy.gov"] == 2
+        assert http_client._transport.requests == 6
+        assert http_client._transport.waited >= 3
+
+    @pytest.mark.asyncio
+    async def test_slot_released_when_transport_raises(self, monkeypatch):
+        monkeypatch.setattr(settings, "http_max_connections_per_host", 1)
+
+        def handler(request):
+            if request.url.path == "/boom":
+                raise httpx.ConnectError("refused")
+            return httpx.Response(200)
+
+        client = http_client._build_client(inner=httpx.MockTransport(handler))
+        with pytest.raises(httpx.ConnectError):
+            await client.get("https://a.gov/boom")
+        response = await asyncio.wait_for(client.get("https://a.gov/ok"), timeout=1)
+        await client.aclose()
+        assert response.status_code == 200
+
+
+class TestSharedClient:
+    @pytest.mark.asyncio
+    async def test_one_client_per_event_loop(self):
+        await http_client.close_http_client()
+        client = http_client.get_http_client()
+        assert http_client.get_http_client() is client
+        assert client.follow_redirects
+
+        stats = http_client.pool_stats()
+        assert stats["active"] is True
+        assert stats["requests"] == 0
+        assert stats["reuse_ratio"] == 0.0
+
+        await http_client.close_http_client()
+        assert http_client.pool_stats()["active"] is False
+        assert http_client.get_http_client() is not client
+        await http_client.close_http_client()
+
+    @pytest.mark.asyncio
+    async def test_pool_reuses_connections_and_maps_errors(self, local_server):
+        await http_client.close_http_client()
+        client = http_client.get_http_client()
+
+        for _ in range(3):
+            assert (await client.get(f"{local_server}/a")).text == "ok"
+        stats = http_client.pool_stats()
+        assert stats["requests"] == 3
+        assert stats["connections_opened"] == 1
+
+        with socket.socket() as s:
+            s.bind(("127.0.0.1", 0))
+            closed_port = s.getsockname()[1]
+        with pytest.raises(httpx.ConnectError):
+            await client.get(f"http://127.0.0.1:{closed_port}/")
+        await http_client.close_http_client()
+
+    def test_client_is_closed_with_its_event_loop(self, local_server):
+        async def fetch() -> httpx.AsyncClient:
+            client = http_client.get_http_client()
+            await client.get(local_server)
+            return client
+
+        client = asyncio.run(fetch())
+        assert client.is_closed
+        assert asyncio.run(fetch()) is not client
@@ -0,0 +1,159 @@
+"""Tests for incremental re-ingestion: section hashes and stable chunk IDs."""
+
+import pytest
+from sqlalchemy import select
+
+from app.acquisition import staging
+from app.config import settings
+from app.ingestion import orchestrator
+from app.ingestion.base import ExtractedSection
+from app.ingestion.bulk import write_chunks
+from app.ingestion.chunker import chunk_document, chunk_section
+from app.ingestion.curation import CurationResult
+from app.ingestion.incremental import flatten_sections
+from app.models.acquisition import AcquisitionSource, StagedDocument
+from app.models.ingestion import Chunk, CurationStatus, DocumentSection, IngestionRun
+from tests.conftest import TestSession
+
+_V1 = """TITLE 12 BANKS AND BANKING
+PART 1 GENERAL
+Banks must file quarterly call reports with the agency.
+PART 2 CAPITAL
+Banks must hold tier 1 capital of at least six percent.
+PART 3 LENDING
+Loans to one borrower are limited to fifteen percent of capital.
+"""
+
+_V2 = _V1.replace("six percent", "eight percent")
+
+
+class TestSectionHashes:
+    def test_paths_match_the_chunker(self):
+        sections = [ExtractedSection(
+            id="s0", heading="Part 1", level=1, text="Intro.",
+            children=[ExtractedSection(id="s1", heading="A", level=2, text="Body.")],
+        )]
+        flat = flatten_sections(sections, "doc-1")
+        chunks = chunk_document(sections, "doc-1", min_tokens=1)
+
+        paths = ["Part 1", "Part 1 > A"]
+        assert [f.path for f in flat] == [c.section_path for c in chunks] == paths
+        assert flat[1].parent_id == "doc-1-s0"
+
+    def test_parent_heading_change_changes_child_hash(self):
+        def tree(parent_heading):
+            return [ExtractedSection(
+                id="s0", heading=parent_heading, level=1, text="",
+                children=[ExtractedSection(id="s1", heading="A", level=2, text="Body.")],
+            )]
+
+        before = flatten_sections(tree("Part 1"), "d")
+        after = flatten_sections(tree("Part One"), "d")
+        assert before[1].content_hash != after[1].content_hash
+
+    def test_chunk_section_matches_chunk_document(self):
+        section = ExtractedSection(id="s0", heading="Long", level=1, text="A sentence here. " * 300)
+        whole = chunk_document([section], "d", min_tokens=10, max_tokens=60)
+        alone = chunk_section(section, "Long", min_tokens=10, max_tokens=60)
+        assert [c.text for c in alone] == [c.text for c in whole]
+
+
+async def _ingest(content: bytes, run_no: int) -> list[dict]:
+    result = staging.stage_document(
+        "m-1", "s-1", content, "text/plain", {"source_url": "https://a.gov"}
+    )
+    async with TestSession() as db:
+        db.add(IngestionRun(id=f"ing-{run_no}", acquisition_id=f"acq-{run_no}", manifest_id="m-1"))
+        db.add(StagedDocument(
+            id=f"stg-{run_no}", manifest_id="m-1", source_id="s-1", acquisition_method="download",
+            content_hash=result["content_hash"], content_type="text/plain",
+            raw_content_path=result["raw_content_path"],
+        ))
+        db.add(AcquisitionSource(
+            acquisition_id=f"acq-{run_no}", source_id="s-1", manifest_id="m-1", name="Title 12",
+            regulatory_body="rb", url="https://a.gov", access_method="download",
+            staged_document_id=f"stg-{run_no}",
+        ))
+        await db.commit()
+        return [e async for e in orchestrator.IngestionOrchestrator(db, f"ing-{run_no}").run()]
+
+
+async def _chunks() -> list[Chunk]:
+    async with TestSession() as db:
+        result = await db.execute(select(Chunk).order_by(Chunk.position))
+        return result.scalars().all()
+
+
+@pytest.fixture
+def pipeline(tmp_path, monkeypatch):
+    """Approve every document and record which chunks get embedded."""
+    monkeypatch.setattr(staging, "STAGING_ROOT", tmp_path)
+    embedded: list[list[str]] = []
+
+    async def approve(doc, extracted, source_meta, db):
+        return CurationResult(
+            status=CurationStatus.approved, quality_score=1.0, quality_gates={},
+            curation_notes=[], effective_date=None, cross_references=[],
+            content_hash="h", is_duplicate=False,
+        )
+
+    async def index(doc, db, delta):
+        for chunk in delta.to_embed:
+            chunk.embedding = [0.0] * settings.embedding_dimensions
+        embedded.append(sorted(c.id for c in delta.to_embed))
+        await write_chunks(db, doc.id, delta)
+        doc.status = CurationStatus.indexed
+        return len(delta.to_embed)
+
+    monkeypatch.setattr(orchestrator, "run_curation", approve)
+    monkeypatch.setattr(orchestrator, "index_document", index)
+    return embedded
+
+
+class TestReingestion:
+    @pytest.mark.asyncio
+    async def test_only_changed_section_is_rechunked_and_embedded(self, pipeline):
+        events = await _ingest(_V1.encode(), 1)
+        assert events[-1]["event"] == "complete" and events[-1]["data"]["processed"] == 1
+        first = {c.section_path: c.id for c in await _chunks()}
+        assert len(pipeline[0]) == len(first) == 3
+
+        events = await _ingest(_V2.encode(), 2)
+        done = next(e for e in events if e["event"] == "document_complete")["data"]
+        assert done["reingested"] is True
+        assert done["sections_changed"] == 1
+
+        second = {c.section_path: c.id for c in await _chunks()}
+        capital = "PART 2 CAPITAL"
+        assert second[capital] != first[capital]
+        assert {k: v for k, v in second.items() if k != capital} == {
+            k: v for k, v in first.items() if k != capital
+        }
+        assert pipeline[1] == [second[capital]]
+        assert "eight percent" in next(c.text for c in await _chunks() if c.id == second[capital])
+
+    @pytest.mark.asyncio
+    async def test_unchanged_document_embeds_nothing(self, pipeline):
+        await _ingest(_V1.encode(), 1)
+        before = [c.id for c in await _chunks()]
+
+        await _ingest(_V1.encode(), 2)
+
+        assert pipeline[1] == []
+        assert [c.id for c in await _chunks()] == before
+
+    @pytest.mark.asyncio
+    async def test_removed_section_drops_its_chunks_and_sections_are_replaced(self, pipeline):
+        await _ingest(_V1.encode(), 1)
+        trimmed = _V1.split("PART 3")[0]
+
+        await _ingest(trimmed.encode(), 2)
+
+        chunks = await _chunks()
+        assert [c.position for c in chunks] == [0, 1]
+        assert not any("PART 3" in c.section_path for c in chunks)
+        assert pipeline[1] == []
+        async with TestSession() as db:
+            sections = (await db.execute(select(DocumentSection))).scalars().all()
+        assert len(sections) == 3
+        assert all(s.content_hash.startswith("sha256:") for s in sections)
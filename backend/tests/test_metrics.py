@@ -0,0 +1,104 @@
+"""Tests for the in-process metrics registry and the /metrics endpoint."""
+
+import asyncio
+
+import pytest
+
+from app.agent.discovery_queue import DiscoveryQueue
+from app.ingestion.base import ExtractedSection
+from app.ingestion.chunker import chunk_document
+from app.llm.call_logger import LLMCallRecord, log_llm_call_start, log_llm_call_success
+from app.metrics import (
+    CHUNKER_TOKENS,
+    LLM_CALL_SECONDS,
+    LLM_TOKENS,
+    Counter,
+    Gauge,
+    Histogram,
+    register_sse_queues,
+    render,
+)
+
+
+class TestRegistry:
+    def test_counter_renders_labels(self):
+        c = Counter("t_requests_total", "Requests.", ("route",))
+        c.inc(route="/a")
+        c.inc(2, route='/b"x')
+        lines = c.samples()
+        assert 't_requests_total{route="/a"} 1' in lines
+        assert 't_requests_total{route="/b\\"x"} 2' in lines
+
+    def test_unknown_labels_raise(self):
+        c = Counter("t_labels_total", "Labels.", ("route",))
+        with pytest.raises(ValueError, match="Unknown labels"):
+            c.inc(path="/a")
+
+    def test_histogram_buckets_are_cumulative(self):
+        h = Histogram("t_seconds", "Latency.", buckets=(0.1, 1.0))
+        for value in (0.05, 0.5, 0.5, 5.0):
+            h.observe(value)
+        lines = h.samples()
+        assert 't_seconds_bucket{le="0.1"} 1' in lines
+        assert 't_seconds_bucket{le="1"} 3' in lines
+        assert 't_seconds_bucket{le="+Inf"} 4' in lines
+        assert "t_seconds_count 4" in lines
+        assert "t_seconds_sum 6.05" in lines
+
+    def test_histogram_time_records_on_error(self):
+        h = Histogram("t_timed_seconds", "Timed.", ("leg",))
+        with pytest.raises(RuntimeError), h.time(leg="dense"):
+            raise RuntimeError
+        assert h.count(leg="dense") == 1
+
+    def test_gauge_callback(self):
+        g = Gauge("t_depth", "Depth.", ("state",), callback=lambda: {("pending",): 3})
+        assert g.samples() == ['t_depth{state="pending"} 3']
+
+
+class TestInstrumentation:
+    def test_discovery_and_sse_gauges(self):
+        q = DiscoveryQueue()
+        q.enqueue(target_type="entity", target_id="e1")
+        q.enqueue(target_type="entity", target_id="e2")
+        queues: dict[str, asyncio.Queue] = {"run-1": asyncio.Queue()}
+        queues["run-1"].put_nowait({"event": "progress"})
+        register_sse_queues("test", queues)
+
+        text = render()
+        assert 'raris_sse_queues{stream="test",state="streams"} 1' in text
+        assert 'raris_sse_queues{stream="test",state="pending_events"} 1' in text
+        pending = next(
+            line for line in text.splitlines()
+            if line.startswith('raris_discovery_queue{state="pending"}')
+        )
+        assert int(pending.split()[-1]) >= 2
+
+    def test_chunker_counts_tokens(self):
+        before = CHUNKER_TOKENS.value()
+        sections = [ExtractedSection(id="s", heading="H", level=1, text="A sentence. " * 50)]
+        chunks = chunk_document(sections, "doc-metrics", min_tokens=5, max_tokens=100)
+        assert CHUNKER_TOKENS.value() - before == sum(c.token_count for c in chunks)
+
+    def test_llm_call_observed_with_logging_off(self, monkeypatch):
+        from app.config import settings
+
+        monkeypatch.setattr(settings, "llm_logging", "OFF")
+        record = LLMCallRecord(provider="test", model="m", method="complete", stage="metrics")
+        log_llm_call_start(record)
+        record.set_usage(12, 3)
+        record.finish(response_chars=10)
+        log_llm_call_success(record)
+        assert LLM_CALL_SECONDS.count(provider="test", stage="metrics", outcome="ok") == 1
+        assert LLM_TOKENS.value(provider="test", stage="metrics", direction="completion") == 3
+
+
+@pytest.mark.asyncio
+async def test_metrics_endpoint_labels_route_template(client):
+    await client.get("/api/manifests/does-not-exist")
+    response = await client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert 'route="/api/manifests/{manifest_id}"' in response.text
+    assert "does-not-exist" not in response.text
+    assert "# TYPE raris_http_request_duration_seconds histogram" in response.text
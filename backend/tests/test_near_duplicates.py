@@ -0,0 +1,163 @@
+"""Tests for MinHash near-duplicate detection in curation."""
+
+import pytest
+
+from app.ingestion.base import ExtractedDocument, ExtractedSection
+from app.ingestion.curation import run_curation
+from app.ingestion.near_duplicates import (
+    band_keys,
+    estimate_similarity,
+    find_near_duplicate,
+    minhash_signature,
+    store_fingerprint,
+)
+from app.models.ingestion import CurationStatus, InternalDocument
+from tests.conftest import TestSession
+
+_RULE = " ".join(
+    f"({i}) A covered institution shall maintain records of each transaction under paragraph "
+    f"({i}) of this section for a period of not less than {i + 2} years after consummation."
+    for i in range(40)
+)
+_REPUBLISHED = (
+    "Federal Register Vol. 91 No. 204 Monday October 19 2026 Rules and Regulations\n"
+    + _RULE
+    + "\nPrinted 10/19/2026. For questions contact the agency."
+)
+_UNRELATED = " ".join(
+    f"Item {i}: the commission received comments on liquidity coverage from {i} respondents."
+    for i in range(120)
+)
+
+
+def _extracted(text: str) -> ExtractedDocument:
+    return ExtractedDocument(
+        title="Rule",
+        sections=[ExtractedSection(id="sec-000", heading="Rule", level=1, text=text)],
+        full_text=text,
+        tables=[],
+    )
+
+
+async def _curate(doc_id: str, text: str, status: CurationStatus | None = None):
+    """Curate a new document, or re-curate it if it already exists."""
+    async with TestSession() as db:
+        doc = await db.get(InternalDocument, doc_id)
+        if doc is None:
+            doc = InternalDocument(
+                id=doc_id, ingestion_run_id="ing-1", manifest_id="m-1",
+                source_id=doc_id, staged_document_id=f"stg-{doc_id}", full_text=text,
+            )
+            db.add(doc)
+            await db.flush()
+        result = await run_curation(doc, _extracted(text), {}, db)
+        doc.status = status or result.status
+        doc.content_hash = result.content_hash
+        doc.duplicate_of = result.duplicate_of
+        doc.duplicate_similarity = result.duplicate_similarity
+        await db.commit()
+        return result
+
+
+class TestSignatures:
+    def test_similar_texts_estimate_high_similarity(self):
+        a, b = minhash_signature(_RULE), minhash_signature(_REPUBLISHED)
+        assert estimate_similarity(a, b) >= 0.9
+        assert estimate_similarity(a, minhash_signature(_UNRELATED)) < 0.1
+
+    def test_signature_is_deterministic_and_case_insensitive(self):
+        assert (minhash_signature(_RULE) == minhash_signature(_RULE.upper())).all()
+        assert minhash_signature("   ") is None
+
+    def test_band_keys_cover_the_signature(self):
+        keys = band_keys(minhash_signature(_RULE), bands=16)
+        assert len(keys) == 16
+        assert [k.split(":")[0] for k in keys] == [str(i) for i in range(16)]
+
+    @pytest.mark.asyncio
+    async def test_lookup_goes_through_shared_buckets(self):
+        signature = minhash_signature(_RULE)
+        async with TestSession() as db:
+            for doc_id in ("doc-a", "doc-b", "new"):
+                db.add(InternalDocument(
+                    id=doc_id, ingestion_run_id="ing-1", manifest_id="m-1",
+                    source_id=doc_id, staged_document_id="stg",
+                ))
+            await store_fingerprint(db, "doc-a", signature)
+            await store_fingerprint(db, "doc-b", minhash_signature(_UNRELATED))
+            await db.commit()
+
+            match = await find_near_duplicate(db, minhash_signature(_REPUBLISHED), "new")
+            assert match.document_id == "doc-a"
+            assert await find_near_duplicate(db, signature, "doc-a") is None
+
+
+class TestCuration:
+    @pytest.mark.asyncio
+    async def test_republished_rule_is_held_as_near_duplicate(self):
+        first = await _curate("doc-1", _RULE)
+        assert not first.is_duplicate
+
+        second = await _curate("doc-2", _REPUBLISHED)
+
+        assert second.is_duplicate
+        assert second.status == CurationStatus.raw
+        assert second.duplicate_of == "doc-1"
+        assert 0.9 <= second.duplicate_similarity < 1.0
+        assert any(n.startswith("NEAR-DUPLICATE") for n in second.curation_notes)
+
+    @pytest.mark.asyncio
+    async def test_exact_duplicate_links_to_original(self):
+        await _curate("doc-1", _RULE)
+        result = await _curate("doc-2", _RULE)
+        assert result.duplicate_of == "doc-1"
+        assert result.duplicate_similarity == 1.0
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("copy", [_RULE, _REPUBLISHED], ids=["exact", "near"])
+    async def test_recurated_original_does_not_match_its_copy(self, copy):
+        await _curate("doc-1", _RULE)
+        assert (await _curate("doc-2", copy)).duplicate_of == "doc-1"
+
+        again = await _curate("doc-1", _RULE)
+
+        assert not again.is_duplicate
+        assert again.status != CurationStatus.raw
+        # A later copy still points at the original, not at another copy
+        assert (await _curate("doc-3", copy)).duplicate_of == "doc-1"
+
+    @pytest.mark.asyncio
+    async def test_rejected_documents_are_not_matched(self):
+        await _curate("doc-1", _RULE, status=CurationStatus.rejected)
+        assert not (await _curate("doc-2", _REPUBLISHED)).is_duplicate
+
+    @pytest.mark.asyncio
+    async def test_threshold_is_configurable(self, monkeypatch):
+        from app.ingestion import near_duplicates
+
+        monkeypatch.setattr(near_duplicates.settings, "near_duplicate_threshold", 0.99)
+        await _curate("doc-1", _RULE)
+        assert not (await _curate("doc-2", _REPUBLISHED)).is_duplicate
+
+    @pytest.mark.asyncio
+    async def test_unrelated_document_passes(self):
+        await _curate("doc-1", _RULE)
+        assert not (await _curate("doc-2", _UNRELATED)).is_duplicate
+
+
+@pytest.mark.asyncio
+async def test_duplicate_clusters_endpoint(client):
+    await _curate("doc-1", _RULE)
+    await _curate("doc-2", _REPUBLISHED)
+    await _curate("doc-3", _RULE + " Corrected.")
+    await _curate("doc-4", _UNRELATED)
+
+    resp = await client.get("/api/documents/duplicates")
+
+    assert resp.status_code == 200
+    [cluster] = resp.json()
+    assert cluster["canonical"]["document_id"] == "doc-1"
+    assert [d["document_id"] for d in cluster["duplicates"]] == ["doc-2", "doc-3"]
+
+    detail = (await client.get("/api/documents/doc-2")).json()
+    assert detail["duplicate_of"] == "doc-1"
@@ -0,0 +1,109 @@
+"""Tests for page-wise PDF extraction."""
+
+import pytest
+
+from app.acquisition import staging
+from app.ingestion import pdf_adapter
+from app.ingestion.pdf_adapter import PdfAdapter, PdfPage, iter_pages, iter_sections
+
+
+def _pdf(pages: list[list[str]]) -> bytes:
+    """Minimal text-only PDF, one line per string."""
+
+    def escape(text: str) -> str:
+        return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+    objects = [
+        "<< /Type /Catalog /Pages 2 0 R >>",
+        "",
+        "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    kids = []
+    for lines in pages:
+        shown = " ".join(f"({escape(t)}) Tj T*" for t in lines)
+        stream = f"BT /F1 10 Tf 12 TL 50 780 Td {shown} ET"
+        objects.append(f"<< /Length {len(stream)} >>\nstream\n{stream}\nendstream")
+        objects.append(
+            "<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            f"/Resources << /Font << /F1 3 0 R >> >> /Contents {len(objects)} 0 R >>"
+        )
+        kids.append(f"{len(objects)} 0 R")
+    objects[1] = f"<< /Type /Pages /Kids [{' '.join(kids)}] /Count {len(kids)} >>"
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for i, obj in enumerate(objects, 1):
+        offsets.append(len(out))
+        out += f"{i} 0 obj\n{obj}\nendobj\n".encode("latin-1")
+    xref = len(out)
+    out += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    out += "".join(f"{o:010d} 00000 n \n" for o in offsets).encode()
+    out += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\n".encode()
+    out += f"startxref\n{xref}\n%%EOF\n".encode()
+    return bytes(out)
+
+
+_PAGES = [
+    ["Consumer Handbook", "Introductory remarks."],
+    ["PART 1 SCOPE", "This part applies to banks.", "It also applies to (certain) thrifts."],
+    ["continued scope text", "§ 1.2 Definitions", "Bank means a national bank."],
+    ["PART 2 CAPITAL", "Capital must be maintained."],
+]
+
+
+@pytest.fixture
+def pdf_file(tmp_path):
+    path = tmp_path / "handbook.pdf"
+    path.write_bytes(_pdf(_PAGES * 5))
+    return path
+
+
+class TestPdfStreaming:
+    def test_pages_are_yielded_in_order(self, pdf_file):
+        pages = list(iter_pages(pdf_file))
+        assert [p.number for p in pages] == list(range(1, 21))
+        assert pages[1].text.startswith("PART 1 SCOPE")
+
+    @pytest.mark.asyncio
+    async def test_file_mode_matches_in_memory_mode(self, pdf_file):
+        adapter = PdfAdapter()
+        in_memory = await adapter.ingest(pdf_file.read_bytes())
+        streamed = await adapter.ingest_file(pdf_file)
+
+        assert streamed == in_memory
+        assert streamed.title == "Consumer Handbook"
+        assert streamed.sections == pdf_adapter._build_sections_from_text(streamed.full_text)
+
+    @pytest.mark.asyncio
+    async def test_parallel_extraction_preserves_order(self, pdf_file, monkeypatch):
+        monkeypatch.setattr(pdf_adapter, "_PAGES_PER_TASK", 3)
+        serial = await PdfAdapter().ingest_file(pdf_file)
+        parallel = await PdfAdapter().ingest_file(pdf_file, workers=2)
+        assert parallel == serial
+
+    def test_sections_are_emitted_before_the_document_ends(self):
+        emitted_after: list[int] = []
+        read = 0
+
+        def pages():
+            nonlocal read
+            for i, text in enumerate(["PART 1 A\nalpha", "PART 2 B\nbeta", "PART 3 C\ngamma"], 1):
+                read = i
+                yield PdfPage(number=i, text=text, tables=[])
+
+        for _ in iter_sections(pages()):
+            emitted_after.append(read)
+
+        # Each section is complete once the next page's heading arrives
+        assert emitted_after == [2, 3, 3]
+
+    def test_staged_file_decompresses_to_a_temporary_path(self, tmp_path, monkeypatch):
+        pytest.importorskip("zstandard")
+        monkeypatch.setattr(staging, "STAGING_ROOT", tmp_path)
+        monkeypatch.setattr(staging.settings, "staging_compression", "zstd")
+        body = _pdf(_PAGES)
+        result = staging.stage_document("m-1", "s-1", body, "application/pdf", {})
+
+        with staging.staged_file(result["content_hash"]) as path:
+            assert path.read_bytes() == body
+            assert len(list(iter_pages(path))) == len(_PAGES)
+        assert not path.exists()
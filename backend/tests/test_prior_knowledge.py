@@ -0,0 +1,122 @@
+"""Tests for cross-run knowledge reuse in graph discovery."""
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from app.agent.graph_discovery import DiscoveryGraph
+from app.agent.prior_knowledge import PriorKnowledge
+from app.config import settings
+from app.llm.base import LLMProvider
+from app.models.manifest import Source
+
+_NOW = datetime(2026, 3, 1, tzinfo=UTC)
+
+
+def _prior(*, l1_age_h: float = 1, child_age_h: float = 1, ttl_hours: int = 24) -> PriorKnowledge:
+    child_ts = (_NOW - timedelta(hours=child_age_h)).isoformat()
+    return PriorKnowledge(
+        origin="manifest:prior-001",
+        entities=[
+            {"id": "hud", "name": "HUD", "jurisdiction": "federal"},
+            {"id": "fhfa", "name": "FHFA", "jurisdiction": "federal"},
+        ],
+        sources=[
+            {"id": "src-001", "name": "24 CFR", "regulatory_body": "hud"},
+            {"id": "hud__s1", "name": "Handbook 4000.1", "depth_hint": "leaf",
+             "discovered_at": child_ts},
+        ],
+        programs=[{"name": "FHA Mortgage Insurance", "administering_entity": "HUD",
+                   "confidence": 0.9, "provenance_links": {"reused_from": "manifest:prior-001"}}],
+        l1_discovered_at=_NOW - timedelta(hours=l1_age_h),
+        ttl_hours=ttl_hours,
+        now=_NOW,
+    )
+
+
+class TestPriorKnowledge:
+    def test_children_indexed_by_parent_with_raw_ids(self):
+        prior = _prior()
+        assert [c["id"] for c in prior.children_of("hud")] == ["s1"]
+        assert prior.children_of("fhfa") == []
+
+    def test_freshness_respects_ttl(self):
+        assert _prior().l1_is_fresh()
+        assert _prior().node_is_fresh("hud")
+        assert not _prior(l1_age_h=48).l1_is_fresh()
+        assert not _prior(child_age_h=48).node_is_fresh("hud")
+        # Nodes with no prior children were never expanded
+        assert not _prior().node_is_fresh("fhfa")
+
+    def test_zero_ttl_disables_reuse(self):
+        prior = _prior(ttl_hours=0)
+        assert not prior.l1_is_fresh()
+        assert not prior.node_is_fresh("hud")
+
+
+class _CountingLLM(LLMProvider):
+    def __init__(self):
+        self.prompts: list[str] = []
+
+    async def complete(self, messages, **kwargs):
+        self.prompts.append(messages[-1]["content"])
+        return '{"administering_entities": [], "sources": [], "programs": []}'
+
+    async def stream(self, messages, **kwargs):
+        yield await self.complete(messages, **kwargs)
+
+
+async def _run(prior: PriorKnowledge, llm: LLMProvider, db) -> list[dict]:
+    graph = DiscoveryGraph(llm=llm, db=db, manifest_id="reuse-001")
+    return [
+        e async for e in graph.run(
+            "Reuse", k_depth=2, sectors=[{"key": "federal", "label": "Federal", "priority": 1}],
+            instruction_texts=["INSTRUCTION"], prior=prior,
+        )
+    ]
+
+
+class TestDiscoveryReuse:
+    @pytest.mark.asyncio
+    async def test_fresh_prior_skips_l1_and_replays_nodes(self, monkeypatch, mock_db):
+        monkeypatch.setattr(settings, "l2_sleep_between_calls", 0)
+        llm = _CountingLLM()
+
+        events = await _run(_prior(), llm, mock_db)
+
+        assert any(e["event"] == "l1_reused" for e in events)
+        assert not any(e["event"] == "sector_start" for e in events)
+        # Only FHFA (never expanded before) costs a call; HUD is replayed
+        assert len(llm.prompts) == 1
+        assert "FHFA" in llm.prompts[0]
+        completes = {e["data"]["entity_id"]: e["data"] for e in events
+                     if e["event"] == "entity_expansion_complete"}
+        assert completes["hud"]["reused"] is True
+        assert completes["hud"]["sources_found"] == 1
+        assert completes["fhfa"]["reused"] is False
+
+        persisted = {o.id: o for c in mock_db.add.call_args_list
+                     for o in c.args if isinstance(o, Source)}
+        assert "hud__s1" in persisted
+        # Replayed sources keep their original discovery time
+        assert persisted["hud__s1"].relationships["discovered_at"] == (
+            _NOW - timedelta(hours=1)
+        ).isoformat()
+
+        final = events[-1]["data"]
+        assert final["reuse"]["nodes_reused"] == 1
+        assert final["reuse"]["nodes_expanded"] == 1
+        assert final["total_programs"] == 1
+
+    @pytest.mark.asyncio
+    async def test_stale_prior_seeds_queue_but_calls_llm(self, monkeypatch, mock_db):
+        monkeypatch.setattr(settings, "l2_sleep_between_calls", 0)
+        llm = _CountingLLM()
+
+        events = await _run(_prior(l1_age_h=500, child_age_h=500), llm, mock_db)
+
+        assert not any(e["event"] == "l1_reused" for e in events)
+        # One sector call, then both prior entities are expanded afresh
+        assert len(llm.prompts) == 3
+        assert events[-1]["data"]["reuse"]["nodes_reused"] == 0
+        assert events[-1]["data"]["total_entities"] == 2
@@ -0,0 +1,141 @@
+"""Tests for DiscoveryQueue scheduling policies, eviction and yield curves."""
+
+import pytest
+
+from app.agent.discovery_queue import DiscoveryQueue
+from app.agent.queue_policies import get_policy
+
+
+def _drain(q: DiscoveryQueue) -> list[str]:
+    order = []
+    while (item := q.pop()) is not None:
+        order.append(item.target_id)
+    return order
+
+
+class TestPolicies:
+    def test_default_policy_is_priority_bfs(self):
+        q = DiscoveryQueue(max_depth=3)
+        q.enqueue(target_type="entity", target_id="deep", priority=1, depth=2)
+        q.enqueue(target_type="entity", target_id="low", priority=5, depth=0)
+        q.enqueue(target_type="entity", target_id="shallow", priority=1, depth=0)
+        assert _drain(q) == ["shallow", "deep", "low"]
+
+    def test_depth_first_drills_down(self):
+        q = DiscoveryQueue(max_depth=3, policy=get_policy("depth_first"))
+        q.enqueue(target_type="entity", target_id="root", priority=1, depth=0)
+        q.enqueue(target_type="source_title", target_id="title", priority=2, depth=1)
+        q.enqueue(target_type="source_section", target_id="section", priority=2, depth=2)
+        assert _drain(q) == ["section", "title", "root"]
+
+    def test_value_per_call_learns_from_yields(self):
+        q = DiscoveryQueue(max_depth=3, policy=get_policy("value_per_call"))
+        q.enqueue(target_type="entity", target_id="e1", priority=1, depth=0)
+        q.enqueue(target_type="entity", target_id="e2", priority=1, depth=0)
+        q.enqueue(target_type="source_chapter", target_id="c1", priority=2, depth=1)
+        q.enqueue(target_type="source_chapter", target_id="c2", priority=2, depth=1)
+
+        # Entities yield nothing, chapters yield plenty
+        q.record(q.pop(), sources=0, programs=0)
+        c1 = q.pop()
+        assert c1.target_id == "c1"
+        q.record(c1, sources=12, programs=3)
+        assert q.pop().target_id == "c2"
+
+    def test_best_first_prefers_productive_siblings(self):
+        q = DiscoveryQueue(max_depth=3, policy=get_policy("best_first"))
+        for target_id in ("a1", "b1", "a2", "b2"):
+            q.enqueue(
+                target_type="source_title", target_id=target_id, priority=2, depth=1,
+                discovered_from=target_id[0],
+            )
+
+        a1 = q.pop()
+        q.record(a1, sources=1, new_sources=0)
+        b1 = q.pop()
+        assert b1.target_id == "b1"
+        q.record(b1, sources=8, new_sources=6)
+        assert q.pop().target_id == "b2"
+
+    def test_fair_share_round_robins_sectors(self):
+        q = DiscoveryQueue(max_depth=3, policy=get_policy("fair_share"))
+        for i in range(3):
+            q.enqueue(target_type="entity", target_id=f"fed-{i}", priority=1,
+                      discovered_from="sector:federal", depth=0)
+        q.enqueue(target_type="entity", target_id="state-0", priority=5,
+                  discovered_from="sector:state", depth=0)
+        # Children inherit their parent's lane
+        q.enqueue(target_type="source_title", target_id="state-0__t", priority=9,
+                  discovered_from="state-0", depth=1)
+        order = _drain(q)
+        assert order[:4] == ["fed-0", "state-0", "fed-1", "state-0__t"]
+
+    def test_source_descendants_and_prior_entities_keep_their_sector_lane(self):
+        q = DiscoveryQueue(max_depth=4, policy=get_policy("fair_share"))
+        q.enqueue(target_type="entity", target_id="a", priority=1,
+                  discovered_from="sector:banking", depth=1)
+        q.enqueue(target_type="source_title", target_id="a__t1", priority=2,
+                  discovered_from="entity:a", depth=2)
+        q.enqueue(target_type="source_chapter", target_id="a__t1__c1", priority=3,
+                  discovered_from="source_title:a__t1", depth=3)
+        q.enqueue(target_type="entity", target_id="p1", priority=1,
+                  discovered_from="prior:run-1", depth=1, metadata={"sector_key": "insurance"})
+        q.enqueue(target_type="entity", target_id="p2", priority=1,
+                  discovered_from="prior:run-1", depth=1, metadata={"sector_key": "securities"})
+
+        lanes = {i.target_id: i.lane for _, _, i in q._heap}
+        assert lanes == {
+            "a": "banking", "a__t1": "banking", "a__t1__c1": "banking",
+            "p1": "insurance", "p2": "securities",
+        }
+
+    def test_unknown_policy_raises(self):
+        with pytest.raises(ValueError, match="Unknown queue policy"):
+            get_policy("random")
+
+
+class TestEviction:
+    def test_full_queue_evicts_lowest_value_item(self):
+        q = DiscoveryQueue(max_depth=3, max_size=2)
+        q.enqueue(target_type="entity", target_id="a", priority=1, depth=0)
+        q.enqueue(target_type="entity", target_id="leafy", priority=9, depth=0)
+
+        assert q.enqueue(target_type="entity", target_id="b", priority=2, depth=0)
+        assert not q.enqueue(target_type="entity", target_id="worse", priority=10, depth=0)
+
+        stats = q.stats()
+        assert stats["evicted"] == 1
+        assert stats["rejected_full"] == 1
+        assert _drain(q) == ["a", "b"]
+        # Evicted items can come back once there is room
+        assert not q.is_visited("leafy")
+
+
+class TestYieldCurve:
+    def test_curve_is_cumulative_and_downsampled(self):
+        q = DiscoveryQueue(max_depth=3)
+        for i in range(60):
+            q.enqueue(target_type="entity", target_id=f"e{i}", priority=1, depth=0)
+        for _ in range(60):
+            q.record(q.pop(), sources=2, new_sources=1, programs=1)
+
+        curve = q.stats()["yield_curve"]
+        assert len(curve) <= 26
+        assert curve[-1] == {"api_calls": 60, "sources": 120, "new_sources": 60, "programs": 60}
+        assert all(a["api_calls"] < b["api_calls"] for a, b in zip(curve, curve[1:]))
+
+    def test_replays_do_not_count_as_calls(self):
+        q = DiscoveryQueue(max_depth=3)
+        q.enqueue(target_type="entity", target_id="e", priority=1, depth=0)
+        q.record(q.pop(), sources=3, api_calls=0)
+        assert q.yield_curve()[-1]["api_calls"] == 0
+
+
+def test_snapshot_round_trip_keeps_policy_and_lanes():
+    q = DiscoveryQueue(max_depth=3, policy=get_policy("fair_share"))
+    q.enqueue(target_type="entity", target_id="e", priority=1, discovered_from="sector:federal")
+
+    restored = DiscoveryQueue.from_snapshot(q.to_snapshot())
+    assert restored.policy.name == "fair_share"
+    restored.enqueue(target_type="source_title", target_id="e__t", discovered_from="e", depth=1)
+    assert {i.lane for _, _, i in restored._heap} == {"federal"}
@@ -4,6 +4,8 @@ from unittest.mock import patch
 
 import pytest
 
+from app import rate_limit
+from app.config import settings
 from app.rate_limit import RateLimitResult, check_rate_limit
 
 
@@ -68,3 +70,68 @@ class TestRateLimitHeaders:
         assert result.allowed is False
         assert result.limit == 60
         assert result.retry_after == 45.0
+
+
+@pytest.fixture
+def limiter(monkeypatch):
+    """Fresh local state, 60 rpm, and a stand-in for the Redis script."""
+    monkeypatch.setattr(rate_limit, "_local", rate_limit._LocalLimiter())
+    monkeypatch.setattr(rate_limit, "_counts", dict.fromkeys(rate_limit._counts, 0))
+    monkeypatch.setattr(settings, "rate_limit_rpm", 60)
+    monkeypatch.setattr(settings, "rate_limit_local", True)
+    shared = rate_limit._LocalLimiter()
+    calls = []
+
+    async def _check_redis(key, interval, tolerance):
+        calls.append(key)
+        return shared.check(key, interval, tolerance)
+
+    monkeypatch.setattr(rate_limit, "_check_redis", _check_redis)
+    return {"calls": calls, "shared": shared}
+
+
+class TestGcra:
+    def test_burst_up_to_limit_then_rejects(self):
+        local = rate_limit._LocalLimiter()
+        results = [local.check("k", 1000.0, 60_000.0) for _ in range(61)]
+        assert all(allowed for allowed, _ in results[:60])
+        allowed, offset = results[60]
+        assert not allowed
+        assert offset == pytest.approx(60_000.0, abs=50)
+
+    def test_remaining_and_retry_after(self):
+        assert rate_limit._result(True, 1000.0, 1000.0, 60_000.0, 60).remaining == 59
+        denied = rate_limit._result(False, 60_000.0, 1000.0, 60_000.0, 60)
+        assert (denied.allowed, denied.remaining) == (False, 0)
+        assert denied.retry_after == pytest.approx(1.0)
+
+
+class TestTwoTierLimiter:
+    @pytest.mark.asyncio
+    async def test_one_redis_call_per_allowed_request(self, limiter):
+        results = [await check_rate_limit("client") for _ in range(3)]
+        assert [r.remaining for r in results] == [59, 58, 57]
+        assert limiter["calls"] == ["ratelimit:client"] * 3
+
+    @pytest.mark.asyncio
+    async def test_limited_client_is_rejected_locally(self, limiter):
+        # Another process has used up the client's shared budget
+        for _ in range(60):
+            limiter["shared"].check("ratelimit:client", 1000.0, 60_000.0)
+
+        first = await check_rate_limit("client")
+        second = await check_rate_limit("client")
+
+        assert not first.allowed and not second.allowed
+        assert second.retry_after > 0
+        assert len(limiter["calls"]) == 1
+        stats = rate_limit.limiter_stats()
+        assert (stats["rejected"], stats["local_rejections"]) == (2, 1)
+        assert stats["p99_ms"] >= stats["p50_ms"] >= 0
+
+    @pytest.mark.asyncio
+    async def test_without_local_tier_every_check_goes_to_redis(self, limiter, monkeypatch):
+        monkeypatch.setattr(settings, "rate_limit_local", False)
+        for _ in range(62):
+            await check_rate_limit("client")
+        assert len(limiter["calls"]) == 62
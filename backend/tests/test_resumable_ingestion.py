@@ -0,0 +1,184 @@
+"""Tests for per-document checkpoints and resuming ingestion runs."""
+
+import pytest
+from sqlalchemy import select
+
+from app.acquisition import staging
+from app.config import settings
+from app.ingestion import orchestrator
+from app.ingestion.bulk import write_chunks
+from app.ingestion.curation import CurationResult
+from app.models.acquisition import AcquisitionSource, StagedDocument
+from app.models.ingestion import (
+    Chunk,
+    CurationStatus,
+    DocumentSection,
+    IngestionCheckpoint,
+    IngestionRun,
+    IngestionRunStatus,
+    InternalDocument,
+)
+from app.routers import ingestion as ingestion_router
+from tests.conftest import TestSession
+
+_SOURCES = {
+    "s-1": "PART 1 GENERAL\nBanks must file quarterly call reports with the agency.\n",
+    "s-2": "PART 1 CAPITAL\nBanks must hold tier 1 capital of at least six percent.\n",
+    "s-3": "PART 1 LENDING\nLoans to one borrower are limited to fifteen percent of capital.\n",
+}
+
+
+@pytest.fixture
+async def ingestion_run(tmp_path, monkeypatch):
+    """An ingestion run over three staged sources."""
+    monkeypatch.setattr(staging, "STAGING_ROOT", tmp_path)
+    async with TestSession() as db:
+        db.add(IngestionRun(id="ing-1", acquisition_id="acq-1", manifest_id="m-1"))
+        for source_id, text in _SOURCES.items():
+            staged = staging.stage_document("m-1", source_id, text.encode(), "text/plain", {})
+            db.add(StagedDocument(
+                id=f"stg-{source_id}", manifest_id="m-1", source_id=source_id,
+                acquisition_method="download", content_hash=staged["content_hash"],
+                content_type="text/plain", raw_content_path=staged["raw_content_path"],
+            ))
+            db.add(AcquisitionSource(
+                acquisition_id="acq-1", source_id=source_id, manifest_id="m-1", name=source_id,
+                regulatory_body="rb", url="https://a.gov", access_method="download",
+                staged_document_id=f"stg-{source_id}",
+            ))
+        await db.commit()
+    return "ing-1"
+
+
+@pytest.fixture
+def pipeline(monkeypatch):
+    """Approve every document except the sources listed in ``failing``."""
+    state = {"failing": set(), "indexed": []}
+
+    async def approve(doc, extracted, source_meta, db):
+        if doc.source_id in state["failing"]:
+            raise RuntimeError(f"curation failed for {doc.source_id}")
+        return CurationResult(
+            status=CurationStatus.approved, quality_score=1.0, quality_gates={},
+            curation_notes=[], effective_date=None, cross_references=[],
+            content_hash="h", is_duplicate=False,
+        )
+
+    async def index(doc, db, delta):
+        for chunk in delta.to_embed:
+            chunk.embedding = [0.0] * settings.embedding_dimensions
+        await write_chunks(db, doc.id, delta)
+        doc.status = CurationStatus.indexed
+        state["indexed"].append(doc.source_id)
+        return len(delta.to_embed)
+
+    monkeypatch.setattr(orchestrator, "run_curation", approve)
+    monkeypatch.setattr(orchestrator, "index_document", index)
+    return state
+
+
+async def _run(run_id: str, stop_after: int | None = None) -> list[dict]:
+    """Run ingestion, optionally abandoning it after ``stop_after`` completed documents."""
+    events = []
+    async with TestSession() as db:
+        stream = orchestrator.IngestionOrchestrator(db, run_id).run()
+        async for event in stream:
+            events.append(event)
+            done = sum(e["event"] == "document_complete" for e in events)
+            if stop_after is not None and done == stop_after:
+                await stream.aclose()
+                break
+    return events
+
+
+async def _checkpoints() -> dict[str, str]:
+    async with TestSession() as db:
+        rows = (await db.execute(select(IngestionCheckpoint))).scalars().all()
+    return {c.source_id: c.status for c in rows}
+
+
+class TestCheckpoints:
+    @pytest.mark.asyncio
+    async def test_failed_document_is_rolled_back_and_others_are_kept(
+        self, ingestion_run, pipeline
+    ):
+        pipeline["failing"] = {"s-2"}
+
+        events = await _run(ingestion_run)
+
+        assert events[-1]["data"] == {"run_id": "ing-1", "total": 3, "processed": 2, "failed": 1}
+        assert await _checkpoints() == {"s-1": "complete", "s-2": "failed", "s-3": "complete"}
+        async with TestSession() as db:
+            docs = (await db.execute(select(InternalDocument.source_id))).scalars().all()
+            sections = (await db.execute(select(DocumentSection.document_id))).scalars().all()
+            checkpoint = await db.get(IngestionCheckpoint, ("ing-1", "s-2"))
+        assert sorted(docs) == ["s-1", "s-3"]
+        assert "doc-m-1-s-2" not in sections
+        assert checkpoint.error == "curation failed for s-2"
+
+    @pytest.mark.asyncio
+    async def test_resume_retries_only_failed_documents(self, ingestion_run, pipeline):
+        pipeline["failing"] = {"s-2"}
+        await _run(ingestion_run)
+        pipeline["failing"] = set()
+        pipeline["indexed"].clear()
+
+        events = await _run(ingestion_run)
+
+        assert events[0]["data"]["skipped"] == 2
+        assert pipeline["indexed"] == ["s-2"]
+        assert events[-1]["data"]["processed"] == 3 and events[-1]["data"]["failed"] == 0
+        assert set((await _checkpoints()).values()) == {"complete"}
+        async with TestSession() as db:
+            run = await db.get(IngestionRun, ingestion_run)
+        assert (run.status, run.processed, run.failed) == (IngestionRunStatus.complete, 3, 0)
+
+    @pytest.mark.asyncio
+    async def test_interrupted_run_continues_where_it_stopped(self, ingestion_run, pipeline):
+        await _run(ingestion_run, stop_after=1)
+        async with TestSession() as db:
+            chunk_count = len((await db.execute(select(Chunk.id))).all())
+        assert chunk_count > 0
+        assert list(await _checkpoints()) == ["s-1"]
+
+        events = await _run(ingestion_run)
+
+        assert pipeline["indexed"] == ["s-1", "s-2", "s-3"]
+        completed = [e["data"]["source_id"] for e in events if e["event"] == "document_complete"]
+        assert completed == ["s-2", "s-3"]
+        assert events[-1]["data"]["processed"] == 3
+
+
+class TestResumeEndpoint:
+    @pytest.mark.asyncio
+    async def test_unknown_run_is_404(self, client):
+        resp = await client.post("/api/ingestion/nonexistent/resume")
+        assert resp.status_code == 404
+
+    @pytest.mark.asyncio
+    async def test_resumes_failed_run_and_rejects_clean_one(
+        self, client, ingestion_run, monkeypatch
+    ):
+        started = []
+
+        async def _record(ingestion_id):
+            started.append(ingestion_id)
+
+        monkeypatch.setattr(ingestion_router, "_run_ingestion", _record)
+        async with TestSession() as db:
+            run = await db.get(IngestionRun, ingestion_run)
+            run.status, run.total_documents = IngestionRunStatus.failed, 3
+            await db.commit()
+
+        resp = await client.post(f"/api/ingestion/{ingestion_run}/resume")
+        assert resp.status_code == 202
+        assert resp.json()["stream_url"] == f"/api/ingestion/{ingestion_run}/stream"
+        assert started == [ingestion_run]
+        ingestion_router._event_queues.pop(ingestion_run, None)
+
+        async with TestSession() as db:
+            run = await db.get(IngestionRun, ingestion_run)
+            run.status, run.failed = IngestionRunStatus.complete, 0
+            await db.commit()
+        resp = await client.post(f"/api/ingestion/{ingestion_run}/resume")
+        assert resp.status_code == 409
@@ -1,18 +1,19 @@
 """Tests for scraper rate limiting enforcement."""
 
+import asyncio
 import time
 
 import pytest
 
-from app.acquisition.scraper import _domain_last_request, _enforce_rate_limit
+from app.acquisition.scraper import _enforce_rate_limit, _politeness
 
 
 class TestEnforceRateLimit:
     @pytest.fixture(autouse=True)
     def clear_timestamps(self):
-        _domain_last_request.clear()
+        _politeness.clear()
         yield
-        _domain_last_request.clear()
+        _politeness.clear()
 
     @pytest.mark.asyncio
     async def test_no_delay_on_first_request(self):
@@ -24,8 +25,7 @@ class TestEnforceRateLimit:
     @pytest.mark.asyncio
     async def test_records_domain_timestamp(self):
         await _enforce_rate_limit("https://example.gov/page", 2000)
-        assert "example.gov" in _domain_last_request
-        assert _domain_last_request["example.gov"] > 0
+        assert _politeness.next_start("example.gov") > time.monotonic()
 
     @pytest.mark.asyncio
     async def test_different_domains_no_delay(self):
@@ -50,3 +50,18 @@ class TestEnforceRateLimit:
         await _enforce_rate_limit("https://example.gov/b", 0)
         elapsed = time.monotonic() - start
         assert elapsed < 0.1  # No delay when disabled
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_to_same_domain_are_spaced(self):
+        start = time.monotonic()
+        finished: list[float] = []
+
+        async def _request(path: str) -> None:
+            await _enforce_rate_limit(f"https://example.gov/{path}", 100)
+            finished.append(time.monotonic() - start)
+
+        await asyncio.gather(*(_request(str(i)) for i in range(3)))
+        finished.sort()
+        assert finished[0] < 0.05
+        assert finished[1] >= 0.09
+        assert finished[2] >= 0.19
@@ -0,0 +1,104 @@
+"""Tests for streamed staging and streamed downloads."""
+
+import hashlib
+
+import httpx
+import pytest
+import yaml
+
+from app.acquisition import downloader, staging
+from app.acquisition.staging import compute_hash, stage_stream
+from app.config import settings
+
+
+@pytest.fixture
+def staging_root(tmp_path, monkeypatch):
+    monkeypatch.setattr(staging, "STAGING_ROOT", tmp_path)
+    return tmp_path
+
+
+async def _chunks(*parts: bytes):
+    for part in parts:
+        yield part
+
+
+class TestStageStream:
+    @pytest.mark.asyncio
+    async def test_hash_and_size_match_in_memory_staging(self, staging_root):
+        parts = [b"%PDF-1.7 ", b"x" * 70_000, b" %%EOF"]
+        result = await stage_stream(
+            "m-1", "s-1", _chunks(*parts), "application/pdf", {"source_url": "https://a.gov/r.pdf"},
+        )
+
+        body = b"".join(parts)
+        assert result["content_hash"] == compute_hash(body)
+        assert result["byte_size"] == len(body)
+        assert not result["is_duplicate"]
+        target = staging_root / "m-1" / "s-1"
+        assert staging.read_staged_content(result["content_hash"]) == body
+        assert sorted(p.name for p in target.iterdir()) == ["provenance.yaml"]
+        prov = yaml.safe_load((target / "provenance.yaml").read_text())
+        assert prov["content_hash"] == result["content_hash"]
+        assert prov["byte_size"] == len(body)
+
+    @pytest.mark.asyncio
+    async def test_size_guard_aborts_and_removes_temp_file(self, staging_root):
+        with pytest.raises(ValueError, match="size limit"):
+            await stage_stream(
+                "m-1", "s-big", _chunks(b"a" * 600, b"b" * 600), "application/pdf",
+                {"source_url": "https://a.gov/big.pdf"}, max_bytes=1000,
+            )
+        assert not (staging_root / "m-1" / "s-big").exists()
+        assert list((staging_root / ".blobs" / "tmp").iterdir()) == []
+        assert staging.get_blob_store().stats()["blobs"] == 0
+
+    @pytest.mark.asyncio
+    async def test_duplicate_content_is_stored_once(self, staging_root):
+        await stage_stream("m-1", "s-1", _chunks(b"same"), "text/plain", {})
+        result = await stage_stream("m-2", "s-2", _chunks(b"same"), "text/plain", {})
+
+        assert result["is_duplicate"]
+        store = staging.get_blob_store()
+        assert store.stats()["blobs"] == 1
+        assert store.refs(result["content_hash"]) == [("m-1", "s-1"), ("m-2", "s-2")]
+
+
+def _client_for(handler) -> httpx.AsyncClient:
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler), follow_redirects=True)
+
+
+class TestStreamedDownload:
+    @pytest.mark.asyncio
+    async def test_download_streams_body_into_staging(self, staging_root, monkeypatch):
+        body = b"<xml>" + b"<section/>" * 5000 + b"</xml>"
+
+        def handler(request):
+            return httpx.Response(
+                200, headers={"content-type": "application/xml; charset=utf-8"},
+                stream=httpx.ByteStream(body),
+            )
+
+        monkeypatch.setattr(downloader, "get_http_client", lambda: _client_for(handler))
+        result = await downloader.download_source("m-1", "s-xml", "https://www.govinfo.gov/t.xml")
+
+        assert result["content_type"] == "application/xml"
+        assert result["content_hash"] == f"sha256:{hashlib.sha256(body).hexdigest()}"
+        assert staging.read_staged_content(result["content_hash"]) == body
+        prov = yaml.safe_load((staging_root / "m-1" / "s-xml" / "provenance.yaml").read_text())
+        assert "acquisition_duration_ms" in prov
+
+    @pytest.mark.asyncio
+    async def test_declared_length_over_limit_is_rejected_before_reading(
+        self, staging_root, monkeypatch
+    ):
+        monkeypatch.setattr(settings, "acquisition_max_download_mb", 1)
+
+        def handler(request):
+            headers = {"content-length": str(5 * 1024 * 1024)}
+            return httpx.Response(200, headers=headers, content=b"")
+
+        monkeypatch.setattr(downloader, "get_http_client", lambda: _client_for(handler))
+        with pytest.raises(ValueError, match="declares"):
+            await downloader.download_source("m-1", "s-huge", "https://a.gov/huge.pdf")
+        assert not (staging_root / "m-1" / "s-huge").exists()
+
@@ -0,0 +1,124 @@
+"""Tests for incremental JSON parsing of streamed discovery responses."""
+
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.agent.discovery import _extract_json
+from app.agent.graph_discovery import DiscoveryGraph
+from app.agent.stream_json import StreamingJSONParser
+from app.config import settings
+from app.llm.base import LLMProvider
+
+_RESPONSE = {
+    "sector_key": "federal",
+    "coverage_summary": {"entities_found": 2, "gaps": ["}", "]"]},
+    "administering_entities": [
+        {"id": "hud", "name": "HUD \"Federal\" [US]", "jurisdiction": "federal"},
+        {"id": "fhfa", "name": "FHFA", "jurisdiction": "federal"},
+    ],
+    "sources": [{"id": "src-001", "name": "24 CFR Part 203", "depth_hint": "leaf"}],
+    "programs": [],
+    "confidence": 0.9,
+}
+
+
+def _feed_in_chunks(parser: StreamingJSONParser, text: str, size: int) -> list[tuple[str, object]]:
+    emitted = []
+    for i in range(0, len(text), size):
+        emitted.extend(parser.feed(text[i:i + size]))
+    return emitted
+
+
+class TestStreamingJSONParser:
+    @pytest.mark.parametrize("size", [1, 7, 64, 10_000])
+    def test_matches_extract_json_for_any_chunking(self, size):
+        text = "```json\n" + json.dumps(_RESPONSE, indent=2) + "\n```"
+        parser = StreamingJSONParser()
+        _feed_in_chunks(parser, text, size)
+        assert parser.finish() == _extract_json(text) == _RESPONSE
+
+    def test_elements_emitted_as_they_complete(self):
+        parser = StreamingJSONParser()
+        text = json.dumps(_RESPONSE)
+        cut = text.index('{"id": "fhfa"')
+        first = parser.feed(text[:cut])
+        assert first == [("administering_entities", _RESPONSE["administering_entities"][0])]
+        rest = parser.feed(text[cut:])
+        assert [k for k, _ in rest] == ["administering_entities", "sources"]
+
+    def test_truncated_stream_keeps_completed_elements(self):
+        text = json.dumps(_RESPONSE)
+        cut = text.index('"sources"') + 20
+        parser = StreamingJSONParser()
+        parser.feed(text[:cut])
+        result = parser.finish()
+        assert result["administering_entities"] == _RESPONSE["administering_entities"]
+        assert result["sources"] == []
+
+    def test_non_json_falls_back_to_extract_json(self):
+        parser = StreamingJSONParser()
+        parser.feed("no json object in this response")
+        assert parser.finish() == {}
+
+
+class _StreamingLLM(LLMProvider):
+    """Streams canned sector/expansion responses in small chunks."""
+
+    def __init__(self):
+        self.stream_calls = 0
+
+    async def complete(self, messages, **kwargs):
+        raise AssertionError("complete() must not be used when streaming is enabled")
+
+    async def stream(self, messages, **kwargs):
+        self.stream_calls += 1
+        prompt = messages[-1]["content"]
+        if "NODE EXPANSION" in prompt:
+            body = {
+                "programs": [{"name": "Example Program", "administering_entity": "HUD",
+                              "confidence": 0.8}],
+                "sources": [{"id": "s1", "name": "Handbook 4000.1", "url": "https://hud.gov/4000"}],
+                "administering_entities": [],
+            }
+        else:
+            body = {
+                "administering_entities": [{"id": "hud", "name": "HUD", "jurisdiction": "federal"}],
+                "programs": [],
+                "sources": [],
+            }
+        text = json.dumps(body)
+        for i in range(0, len(text), 5):
+            yield text[i:i + 5]
+
+
+def _make_db_mock():
+    db = AsyncMock()
+    db.add = MagicMock()
+    manifest = MagicMock()
+    db.get = AsyncMock(return_value=manifest)
+    return db
+
+
+class TestStreamedDiscovery:
+    @pytest.mark.asyncio
+    async def test_expansion_uses_stream_and_persists_elements(self, monkeypatch):
+        monkeypatch.setattr(settings, "discovery_stream_json", True)
+        monkeypatch.setattr(settings, "l2_sleep_between_calls", 0)
+        llm = _StreamingLLM()
+        graph = DiscoveryGraph(llm=llm, db=_make_db_mock(), manifest_id="stream-001")
+        sectors = [{"key": "federal", "label": "Federal", "priority": 1}]
+
+        events = [
+            e async for e in graph.run(
+                "Streamed", k_depth=2, sectors=sectors, instruction_texts=["INSTRUCTION"],
+            )
+        ]
+
+        completes = [e for e in events if e["event"] == "entity_expansion_complete"]
+        assert len(completes) == 1
+        assert completes[0]["data"]["programs_found"] == 1
+        assert completes[0]["data"]["sources_found"] == 1
+        assert events[-1]["data"]["total_programs"] == 1
+        assert llm.stream_calls == 2
@@ -0,0 +1,117 @@
+"""Tests for tracing spans and the file exporter."""
+
+import asyncio
+import json
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+
+from app import tracing
+from app.config import settings
+from app.llm.call_logger import LLMCallRecord, log_llm_call_error, log_llm_call_start
+from app.retrieval.agent import RetrievalAgent
+from app.retrieval.search import SearchResult
+
+
+@pytest.fixture
+def traced(tmp_path, monkeypatch):
+    """Export spans to a JSON-lines file; yields a reader for the finished spans."""
+    pytest.importorskip("opentelemetry.sdk")
+    path = tmp_path / "traces.jsonl"
+    monkeypatch.setattr(settings, "tracing_file_path", str(path))
+    assert tracing.configure_tracing("file")
+
+    def finished() -> dict[str, dict]:
+        tracing.shutdown_tracing()
+        lines = path.read_text().splitlines() if path.exists() else []
+        return {s["name"]: s for s in map(json.loads, lines)}
+
+    yield finished
+    tracing.shutdown_tracing()
+
+
+def test_span_is_noop_when_not_configured():
+    tracing.shutdown_tracing()
+    with tracing.span("anything", {"a": 1}) as s:
+        s.set_attribute("b", 2)
+    tracing.start_span("other").end()
+
+
+def test_unknown_exporter_raises():
+    with pytest.raises(ValueError, match="Unknown tracing exporter"):
+        tracing.configure_tracing("zipkin")
+
+
+@pytest.mark.asyncio
+async def test_request_span_carries_route_and_correlation_id(client, traced):
+    resp = await client.get("/api/manifests/missing", headers={"X-Correlation-ID": "corr-123"})
+    assert resp.status_code == 404
+
+    spans = traced()
+    request_span = spans["GET /api/manifests/{manifest_id}"]
+    assert request_span["attributes"]["raris.correlation_id"] == "corr-123"
+    assert request_span["attributes"]["http.response.status_code"] == 404
+
+
+@pytest.mark.asyncio
+async def test_request_span_ends_before_background_tasks(traced):
+    from starlette.background import BackgroundTask
+    from starlette.responses import PlainTextResponse
+
+    from app.middleware import RequestLoggingMiddleware
+
+    async def app(scope, receive, send):
+        task = BackgroundTask(asyncio.sleep, 0.3)
+        await PlainTextResponse("ok", background=task)(scope, receive, send)
+
+    transport = httpx.ASGITransport(app=RequestLoggingMiddleware(app))
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as http:
+        assert (await http.get("/health")).status_code == 200
+
+    request_span = traced()["GET unmatched"]
+    assert request_span["attributes"]["http.response.status_code"] == 200
+    started, ended = (datetime.fromisoformat(request_span[k]) for k in ("start_time", "end_time"))
+    assert (ended - started).total_seconds() < 0.3
+
+
+@pytest.mark.asyncio
+async def test_retrieval_steps_nest_under_query_span(traced):
+    result = SearchResult(
+        chunk_id="c1", document_id="d1", source_id="s1", manifest_id="m1",
+        section_path="§1", text="text", score=1.0,
+    )
+    llm = MagicMock()
+    llm.complete = AsyncMock(return_value="answer")
+    with (
+        patch("app.retrieval.agent.get_provider", return_value=llm),
+        patch("app.retrieval.agent.hybrid_search", AsyncMock(return_value=[result])),
+        patch("app.retrieval.agent.rerank", AsyncMock(return_value=[result])),
+        patch("app.retrieval.agent.build_citations_for_results", AsyncMock(return_value={})),
+        tracing.correlation("corr-456"),
+    ):
+        response = await RetrievalAgent(db=MagicMock()).query("what applies?", depth=2)
+    assert response.response_text == "answer"
+
+    spans = traced()
+    root = spans["retrieval.query"]
+    for step in ("retrieval.retrieve", "retrieval.rerank", "retrieval.citations"):
+        assert spans[step]["parent_id"] == root["context"]["span_id"]
+        assert spans[step]["attributes"]["raris.correlation_id"] == "corr-456"
+    assert spans["retrieval.synthesize"]["parent_id"] == root["context"]["span_id"]
+    assert spans["retrieval.retrieve"]["attributes"]["retrieval.chunks"] == 1
+
+
+def test_llm_call_span_records_error(traced):
+    record = LLMCallRecord(provider="gemini", model="m", method="complete", stage="l2_expand")
+    log_llm_call_start(record)
+    record.finish()
+    record.error_message = "quota"
+    record.error_code = 429
+    log_llm_call_error(record)
+
+    llm_span = traced()["llm.complete"]
+    assert llm_span["attributes"]["llm.provider"] == "gemini"
+    assert llm_span["attributes"]["llm.error_code"] == 429
+    assert llm_span["status"]["status_code"] == "ERROR"
@@ -0,0 +1,166 @@
+"""Tests for single-pass streaming XML extraction."""
+
+from io import BytesIO
+
+import pytest
+from lxml import etree
+
+from app.acquisition import staging
+from app.ingestion import xml_adapter
+from app.ingestion.xml_adapter import XmlAdapter, _parse_tree, _stream_parse
+
+_USLM = b"""<?xml version="1.0" encoding="UTF-8"?>
+<uscDoc xmlns="https://xml.house.gov/schemas/uslm/1.0" xmlns:xlink="http://www.w3.org/1999/xlink">
+  <meta><title>Title 12 Banks and Banking</title></meta>
+    <title>
+      <num>12</num><heading>Banks and <b>Banking</b></heading>
+      <chapter>
+        <num>1</num><heading>Comptroller</heading>
+        <content>Chapter intro, see <ref
+          href="https://uscode.house.gov/12/1">section 1</ref>.</content>
+        <section>
+          <num>1.</num><heading>Office</heading>
+          <content>There is an Office of the Comptroller.</content>
+          <subsection><num>(a)</num> The Comptroller shall <i>supervise</i> banks.</subsection>
+          <paragraph>Trailing paragraph.</paragraph>
+          tail text
+          <table>
+            <tr><th>Tier</th><th>Ratio</th></tr>
+            <tr><td>CET1</td><td>4.5%</td></tr>
+            <tr><td>Nested<table><tr><td>a</td><td>b</td></tr>
+              <tr><td>c</td><td>d</td></tr></table></td><td>x</td></tr>
+            <tr></tr>
+          </table>
+        </section>
+        <section>
+          <num>2.</num><heading>Deputy</heading>
+          <ref xlink:href="http://example.gov/deputy">deputy</ref>
+          <ref href="/relative">ignored</ref>
+          <section><num>2.1</num><heading>Sub</heading>Nested body.</section>
+        </section>
+      </chapter>
+    </title>
+    <content>Content after the title.</content>
+</uscDoc>
+"""
+
+_USLM_BARE_CONTENT = b"""<uscDoc xmlns="https://xml.house.gov/schemas/uslm/1.0">
+  <content>Leading content, no section before it.</content>
+  <section><heading>H</heading>Body</section>
+</uscDoc>
+"""
+
+_AKN = b"""<akomaNtoso xmlns="http://docs.oasis-open.org/legaldocml/ns/akn/3.0">
+  <act>
+    <preface><p><docTitle>Banking <b>Act</b> 2026</docTitle></p></preface>
+    <body>
+      <part><num>Part 1</num>
+        <article><num>Art. 1</num><heading>Scope</heading><p>Applies to banks.</p></article>
+        <article><heading><b>Definitions</b></heading>
+          <p>Bank means <a href="https://eur-lex.europa.eu/x">a bank</a>.</p></article>
+      </part>
+      <chapter>No heading here.</chapter>
+    </body>
+  </act>
+</akomaNtoso>
+"""
+
+_AKN_EMPTY_BODY = b"""<akomaNtoso xmlns="http://docs.oasis-open.org/legaldocml/ns/akn/3.0">
+  <body/>
+  <section><num>1</num>Top level section.</section>
+</akomaNtoso>
+"""
+
+_GENERIC = b"""<document>
+  <meta><name>Ignored name</name></meta>
+  <title>Sample Regulation</title>
+  <section><heading>Part 100</heading><content>Main content.</content></section>
+</document>
+"""
+
+_GENERIC_NAMESPACED = b"""<doc xmlns="urn:example">
+  <info><heading>Namespaced Heading</heading></info>
+  <table><row><c>h1</c><c>h2</c></row><row><c>v1</c><c>v2</c></row></table>
+</doc>
+"""
+
+
+@pytest.mark.parametrize(
+    "xml",
+    [_USLM, _USLM_BARE_CONTENT, _AKN, _AKN_EMPTY_BODY, _GENERIC, _GENERIC_NAMESPACED],
+    ids=["uslm", "uslm-bare-content", "akn", "akn-empty-body", "generic", "generic-namespaced"],
+)
+def test_streaming_matches_tree_walk(xml):
+    assert _stream_parse(BytesIO(xml)) == _parse_tree(etree.fromstring(xml))
+
+
+class TestStreamingExtraction:
+    def test_uslm_structure(self):
+        doc = _stream_parse(BytesIO(_USLM))
+
+        [title] = doc.sections
+        [chapter] = title.children
+        assert title.heading == "Banks and Banking"
+        # Content before any sibling section becomes a section of its own
+        assert [s.heading for s in chapter.children] == ["(content)", "1.", "2."]
+        assert [s.heading for s in chapter.children[1].children] == ["(content)"]
+        assert title.text.endswith("Content after the title.")
+        assert "The Comptroller shall supervise banks." in chapter.children[1].children[0].text
+        assert [t.id for t in doc.tables] == ["tbl-000", "tbl-001"]
+        assert doc.tables[0].headers == ["Tier", "Ratio"]
+        assert sorted(doc.cross_references) == [
+            "http://example.gov/deputy", "https://uscode.house.gov/12/1",
+        ]
+
+    def test_elements_are_cleared_as_they_close(self):
+        seen = []
+        extractor = xml_adapter._StreamExtractor()
+        for event, el in etree.iterparse(BytesIO(_USLM), events=("start", "end")):
+            if event == "start":
+                extractor.start(el)
+            else:
+                extractor.end(el)
+                seen.append(el)
+        assert all(len(el) == 0 and not el.text for el in seen)
+        assert extractor.result() == _parse_tree(etree.fromstring(_USLM))
+
+    def test_comments_are_skipped(self):
+        xml = b"<document><title>T</title><!-- note --><p>Body</p></document>"
+        doc = _stream_parse(BytesIO(xml))
+        assert doc.title == "T"
+        assert "note" not in doc.full_text
+
+
+class TestAdapterRouting:
+    @pytest.mark.asyncio
+    async def test_threshold_selects_streaming(self, monkeypatch):
+        streamed = []
+        real = xml_adapter._stream_parse
+
+        def spy(source):
+            streamed.append(source)
+            return real(source)
+
+        monkeypatch.setattr(xml_adapter, "_stream_parse", spy)
+        monkeypatch.setattr(xml_adapter.settings, "xml_streaming_min_kb", 1)
+        small = await XmlAdapter().ingest(_GENERIC)
+        assert streamed == []
+
+        monkeypatch.setattr(xml_adapter.settings, "xml_streaming_min_kb", 0)
+        assert await XmlAdapter().ingest(_GENERIC) == small
+        assert len(streamed) == 1
+
+    @pytest.mark.asyncio
+    async def test_ingest_file_reads_staged_blob(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(staging, "STAGING_ROOT", tmp_path)
+        monkeypatch.setattr(xml_adapter.settings, "xml_streaming_min_kb", 0)
+        declaration = b'<?xml version="1.0" encoding="ISO-8859-1"?>\n'
+        latin = _GENERIC.replace(b"<document>", declaration + b"<document>")
+        latin = latin.replace(b"Sample Regulation", "Règlement".encode("latin-1"))
+        result = staging.stage_document("m-1", "s-1", latin, "application/xml", {})
+
+        with staging.staged_file(result["content_hash"]) as path:
+            doc = await XmlAdapter().ingest_file(path)
+
+        assert doc.title == "Règlement"
+        assert doc == await XmlAdapter().ingest(latin)
@@ -2,6 +2,7 @@ import { api } from "./client";
 import type {
   DocumentDetail,
   DocumentSummary,
+  DuplicateCluster,
   IndexStats,
   IngestionRunDetail,
   StartIngestionResponse,
@@ -13,6 +14,9 @@ export const ingestionApi = {
       acquisition_id: acquisitionId,
     }),
 
+  resume: (ingestionId: string) =>
+    api.post<StartIngestionResponse>(`/ingestion/${ingestionId}/resume`),
+
   get: (ingestionId: string) =>
     api.get<IngestionRunDetail>(`/ingestion/${ingestionId}`),
 
@@ -22,6 +26,13 @@ export const ingestionApi = {
   getDocument: (docId: string) =>
     api.get<DocumentDetail>(`/documents/${docId}`),
 
+  listDuplicates: (params?: { manifest_id?: string }) => {
+    const searchParams = new URLSearchParams();
+    if (params?.manifest_id) searchParams.set("manifest_id", params.manifest_id);
+    const qs = searchParams.toString();
+    return api.get<DuplicateCluster[]>(`/documents/duplicates${qs ? `?${qs}` : ""}`);
+  },
+
   approveDocument: (docId: string) =>
     api.patch<{ document_id: string; status: string }>(
       `/documents/${docId}/approve`,
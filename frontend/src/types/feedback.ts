@@ -86,11 +86,27 @@ export interface AccuracyTrendPoint {
   resolution_rate: number;
 }
 
+export interface MonitorSweepSummary {
+  id: string;
+  status: string;
+  started_at: string;
+  completed_at: string | null;
+  shard_count: number;
+  shards_complete: number;
+  sources_checked: number;
+  changes_detected: number;
+  not_modified: number;
+  bytes_downloaded: number;
+  duration_s: number;
+  sources_per_sec: number;
+}
+
 export interface AccuracyDashboardData {
   current: AccuracyMetrics;
   trends: AccuracyTrendPoint[];
   by_feedback_type: Record<string, number>;
   by_vertical: Record<string, number>;
+  monitor: MonitorSweepSummary | null;
 }
 
 export const FEEDBACK_TYPES = [
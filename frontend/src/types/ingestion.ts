@@ -65,6 +65,21 @@ export interface DocumentDetail {
   chunk_count: number;
   created_at: string;
   curated_at: string | null;
+  duplicate_of: string | null;
+  duplicate_similarity: number | null;
+}
+
+export interface DuplicateMember {
+  document_id: string;
+  source_id: string;
+  title: string;
+  status: string;
+  similarity: number | null;
+}
+
+export interface DuplicateCluster {
+  canonical: DuplicateMember;
+  duplicates: DuplicateMember[];
 }
 
 export interface IndexStats {
@@ -87,6 +102,9 @@ export interface IngestionSSEEvent {
   total?: number;
   error?: string;
   chunks_indexed?: number;
+  chunks_reused?: number;
+  reingested?: boolean;
+  sections_changed?: number;
   run_id?: string;
   total_documents?: number;
   message?: string;